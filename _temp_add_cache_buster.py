@@ -1,20 +1,7 @@
-import os
-import re
-
-doc_dir = 'docs'
-for root, dirs, files in os.walk(doc_dir):
-    for fn in files:
-        if not fn.endswith('.html'): continue
-            
-        fp = os.path.join(root, fn)
-        try:
-            with open(fp, 'r', encoding='utf-8') as f:
-                html = f.read()
-                
-            # append cache buster to styles.css
-            html = re.sub(r'(href=.*styles\.css)(\?v=\d+)?(\"|\')', r'\1?v=9\3', html)
-            
-            with open(fp, 'w', encoding='utf-8') as f:
-                f.write(html)
-        except Exception as e:
-            pass
+# 已由 mod_網頁後製 之【資源指紋】取代：styles.css 等資源依內容雜湊值另存帶指紋之檔案，
+# 網頁引用改指向該檔，不再需要 ?v= 版本號；本程式僅執行 asset_fingerprint 步驟。
+# 執行完整之網頁後製管線：python mod_網頁後製.py
+from mod_網頁後製 import build_arg_parser, main
+
+if __name__ == '__main__':
+    main(build_arg_parser('Fingerprint docs/assets and rewrite asset references').parse_args(), passes=['asset_fingerprint'])
@@ -67,6 +67,7 @@ except ImportError:
 # 載入自訂模組（用於字典查詢功能）
 from mod_ChhoeTaigi import chhoe_taigi
 from mod_excel_access import get_value_by_name
+from mod_字典聯查 import format_lai_goan, get_lian_ca_ji_tian
 from mod_標音 import (
     PiauIm,
     convert_tl_with_tiau_hu_to_tlpa,
@@ -400,23 +401,33 @@ def query_han_ji_dictionary(sheet, row: int, col: int, piau_im: PiauIm, piau_im_
         print(f"\n查詢漢字：【{han_ji}】")
 
         # 查詢萌典
-        result = chhoe_taigi(han_ji=han_ji)
+        result = chhoe_taigi(han_ji=han_ji) or []
+
+        # 轉換音標
+        piau_im_options = []
+        lai_goan_list = []
+        for tai_lo_ping_im in result:
+            piau_im_options.append(_convert_piau_im(tai_lo_ping_im))
+            lai_goan_list.append("萌典")
+
+        # 聯查本機字典（河洛話、十五音、廣韻），補列萌典未收之讀音
+        for candidate in get_lian_ca_ji_tian().ca(han_ji):
+            if candidate["台語音標"] in [option[0] for option in piau_im_options]:
+                continue
+            piau_im_options.append(_convert_piau_im(candidate["台語音標"]))
+            lai_goan_list.append(format_lai_goan(candidate))
 
         # 查無此字
-        if not result:
+        if not piau_im_options:
             print(f"【{han_ji}】查無此字！")
             return
 
         # 有多個讀音
-        print(f"【{han_ji}】有 {len(result)} 個讀音：")
+        print(f"【{han_ji}】有 {len(piau_im_options)} 個讀音：")
 
         # 顯示所有讀音選項
-        piau_im_options = []
-        for idx, tai_lo_ping_im in enumerate(result):
-            # 轉換音標
-            tai_gi_im_piau, han_ji_piau_im = _convert_piau_im(tai_lo_ping_im)
-            piau_im_options.append((tai_gi_im_piau, han_ji_piau_im))
-            msg = f"{han_ji}： [{tai_gi_im_piau}] /【{han_ji_piau_im}】"
+        for idx, (tai_gi_im_piau, han_ji_piau_im) in enumerate(piau_im_options):
+            msg = f"{han_ji}： [{tai_gi_im_piau}] /【{han_ji_piau_im}】（{lai_goan_list[idx]}）"
             print(f"{idx + 1}. {msg}")
 
         # 讓使用者選擇讀音
@@ -429,7 +440,7 @@ def query_han_ji_dictionary(sheet, row: int, col: int, piau_im: PiauIm, piau_im_
 
         try:
             choice = int(user_input)
-            if 1 <= choice <= len(result):
+            if 1 <= choice <= len(piau_im_options):
                 # 填入選擇的讀音
                 tai_gi_im_piau, han_ji_piau_im = piau_im_options[choice - 1]
                 cell.offset(-2, 0).value = tai_gi_im_piau  # 人工標音
@@ -5,7 +5,6 @@ import argparse
 import logging
 import os
 import re
-import sqlite3
 import sys
 
 import xlwings as xw
@@ -14,6 +13,7 @@ from dotenv import load_dotenv
 # from a240_為漢字標注漢字標音 import han_ji_piau_im  # 依據【台語音標】查找【漢字標音】
 from mod_excel_access import delete_sheet_by_name
 from mod_file_access import save_as_new_file
+from mod_儲存格格式 import StyleJournal
 from mod_字庫 import JiKhooDict  # 漢字字庫物件
 from mod_帶調符音標 import (
     fix_im_piau_spacing,
@@ -30,7 +30,7 @@ from mod_標音 import (
     PiauIm,  # 漢字標音物件
     split_tai_gi_im_piau,  # 分解台語音標
 )
-from mod_河洛話 import han_ji_ca_piau_im
+from mod_ca_ji_tian import HanJiTian
 
 # =========================================================================
 # 常數定義
@@ -159,14 +159,20 @@ def cue_han_ji_piau_im(wb, han_ji_list: list) -> list:
         wb=wb, sheet_name=piau_im_sheet_name, ignore_empty=True
     )
 
+    # 【缺字】儲存格之填滿色，先記入格式日誌，於作業結束時整批套用
+    style_journal = None
     try:
-        # 連接指定資料庫
-        conn = sqlite3.connect(DB_HO_LOK_UE)
-        cursor = conn.cursor()
+        # 整篇文章之漢字讀音，以一次資料庫查詢取得：{漢字: [讀音, ...]}
+        ji_tian = HanJiTian(DB_HO_LOK_UE)
+        piau_im_by_han_ji = ji_tian.han_ji_ca_piau_im_batch(
+            [han_ji for han_ji in han_ji_list if han_ji not in ("φ", "\n") and is_han_ji(han_ji)],
+            ue_im_lui_piat=ue_im_lui_piat,
+        )
 
         # 指定【漢字注音】工作表為【作用工作表】
         sheet = wb.sheets["漢字注音"]
         sheet.activate()
+        style_journal = StyleJournal(sheet)
 
         # 設定起始及結束的【列】位址（【第5列】、【第9列】、【第13列】等列）
         # TOTAL_LINES = int(wb.names['每頁總列數'].refers_to_range.value)
@@ -200,23 +206,21 @@ def cue_han_ji_piau_im(wb, han_ji_list: list) -> list:
                 msg = f"{han_ji}：略過！"
             else:
                 im_piau = ""
-                # 自【漢字庫】查找作業
-                result = han_ji_ca_piau_im(
-                    cursor=cursor, han_ji=han_ji, ue_im_lui_piat=ue_im_lui_piat
-                )
+                # 自【漢字庫】查找結果取得讀音
+                result = piau_im_by_han_ji.get(han_ji)
 
                 # 若【漢字庫】查無此字，登錄至【缺字表】
                 if not result:
                     khuat_ji_piau_ji_khoo.add_or_update_entry(
                         han_ji=han_ji,
                         tai_gi_im_piau="N/A",
-                        kenn_ziann_im_piau="N/A",
+                        hau_ziann_im_piau="N/A",
                         coordinates=(row, col),
                     )
                     im_piau_list.append(im_piau)
                     msg = f"{han_ji}：查無此字！"
                     # 若【漢字】查找不到讀音之【台語音標】，則將【漢字注音】工作表之【漢字】儲存格，設為紅色
-                    sheet.cells(row, col).color = (255, 0, 0)  # 設定儲存格顏色為紅色
+                    style_journal.set_style(row, col, color=(255, 0, 0))  # 設定儲存格顏色為紅色
                 else:
                     # 依【漢字庫】查找結果，輸出【台語音標】和【漢字標音】
                     siann_bu = result[0]["聲母"]
@@ -233,7 +237,7 @@ def cue_han_ji_piau_im(wb, han_ji_list: list) -> list:
                     piau_im_ji_khoo.add_or_update_entry(
                         han_ji=han_ji,
                         tai_gi_im_piau=im_piau,
-                        kenn_ziann_im_piau="N/A",
+                        hau_ziann_im_piau="N/A",
                         coordinates=(row, col),
                     )
                     im_piau_list.append(im_piau)
@@ -259,8 +263,6 @@ def cue_han_ji_piau_im(wb, han_ji_list: list) -> list:
         # ----------------------------------------------------------------------
         # 作業結束前處理
         # ----------------------------------------------------------------------
-        # 關閉資料庫連線
-        conn.close()
         logging_process_step("已完成【漢字】查找標音作業。")
         return im_piau_list
     except Exception as e:
@@ -269,11 +271,12 @@ def cue_han_ji_piau_im(wb, han_ji_list: list) -> list:
         # 再次拋出異常，讓外層函式能捕捉
         raise
     finally:
+        # 套用【缺字】儲存格之填滿色
+        if style_journal is not None:
+            style_journal.flush()
         # 將【標音字庫】、【缺字表】字典，寫入 Excel 工作表
         khuat_ji_piau_ji_khoo.write_to_excel_sheet(wb=wb, sheet_name=khuat_ji_piau_name)
         piau_im_ji_khoo.write_to_excel_sheet(wb=wb, sheet_name=piau_im_sheet_name)
-        # 關閉資料庫連線
-        conn.close()
 
 
 def fill_in_ping_im(
@@ -13,6 +13,8 @@ from dotenv import load_dotenv
 
 from a003_使用漢字注音工作表製作文章純文字 import main as a003_main
 from mod_file_access import save_as_new_file
+from mod_音標轉換 import TIAU_HO, TIAU_HU, TLPA_JI_BU
+from mod_音標轉換 import convert as im_piau_tng_huan
 
 # =========================================================================
 # 常數定義
@@ -117,54 +119,6 @@ def replace_superscript_digits(input_str: str) -> str:
 # 設定標點符號過濾
 PUNCTUATIONS = (",", ".", "?", "!", ":", ";", "\u200B")
 
-# 調符對映表（帶調符之元音/韻化輔音 → 不帶調符之拼音字母、調號數值）
-tiau_hu_mapping = {
-    "á": ("a", "2"), "à": ("a", "3"), "â": ("a", "5"), "ǎ": ("a", "6"), "ā": ("a", "7"), "a̍": ("a", "8"), "a̋": ("a", "9"),
-    "Á": ("A", "2"), "À": ("A", "3"), "Â": ("A", "5"), "Ǎ": ("A", "6"), "Ā": ("A", "7"), "A̍": ("A", "8"), "A̋": ("A", "9"),
-    "é": ("e", "2"), "è": ("e", "3"), "ê": ("e", "5"), "ě": ("e", "6"), "ē": ("e", "7"), "e̍": ("e", "8"), "e̋": ("e", "9"),
-    "É": ("E", "2"), "È": ("E", "3"), "Ê": ("E", "5"), "Ě": ("E", "6"), "Ē": ("E", "7"), "E̍": ("E", "8"), "E̋": ("E", "9"),
-    "í": ("i", "2"), "ì": ("i", "3"), "î": ("i", "5"), "ǐ": ("i", "6"), "ī": ("i", "7"), "i̍": ("i", "8"), "i̋": ("i", "9"),
-    "Í": ("I", "2"), "Ì": ("I", "3"), "Î": ("I", "5"), "Ǐ": ("I", "6"), "Ī": ("I", "7"), "I̍": ("I", "8"), "I̋": ("I", "9"),
-    "ó": ("o", "2"), "ò": ("o", "3"), "ô": ("o", "5"), "ǒ": ("o", "6"), "ō": ("o", "7"), "o̍": ("o", "8"), "ő": ("o", "9"),
-    "Ó": ("O", "2"), "Ò": ("O", "3"), "Ô": ("O", "5"), "Ǒ": ("O", "6"), "Ō": ("O", "7"), "O̍": ("O", "8"), "Ő": ("O", "9"),
-    "ú": ("u", "2"), "ù": ("u", "3"), "û": ("u", "5"), "ǔ": ("u", "6"), "ū": ("u", "7"), "u̍": ("u", "8"), "ű": ("u", "9"),
-    "Ú": ("U", "2"), "Ù": ("U", "3"), "Û": ("U", "5"), "Ǔ": ("U", "6"), "Ū": ("U", "7"), "U̍": ("U", "8"), "Ű": ("U", "9"),
-    "ḿ": ("m", "2"), "m̀": ("m", "3"), "m̂": ("m", "5"), "m̌": ("m", "6"), "m̄": ("m", "7"), "m̍": ("m", "8"), "m̋": ("m", "9"),
-    "Ḿ": ("M", "2"), "M̀": ("M", "3"), "M̂": ("M", "5"), "M̌": ("M", "6"), "M̄": ("M", "7"), "M̍": ("M", "8"), "M̋": ("M", "9"),
-    "ń": ("n", "2"), "ǹ": ("n", "3"), "n̂": ("n", "5"), "ň": ("n", "6"), "n̄": ("n", "7"), "n̍": ("n", "8"), "n̋": ("n", "9"),
-    "Ń": ("N", "2"), "Ǹ": ("N", "3"), "N̂": ("N", "5"), "Ň": ("N", "6"), "N̄": ("N", "7"), "N̍": ("N", "8"), "N̋": ("N", "9"),
-}
-
-# 韻母轉換字典
-un_bu_mapping = {
-    'ee': 'e', 'ei': 'e', 'er': 'e', 'erh': 'eh', 'or': 'o', 'ere': 'ue', 'ereh': 'ueh',
-    'ir': 'i', 'eng': 'ing', 'ek': 'ik', 'oa': 'ua', 'oe': 'ue', 'oai': 'uai',
-    'ou': 'oo', 'onn': 'oonn', 'uei': 'ue', 'ueinn': 'uenn', 'ur': 'u',
-}
-
-# 聲調符號對映調號數值的轉換字典
-tiau_fu_mapping = {
-    "\u0300": "3",   # 3 陰去: ò
-    "\u0301": "2",   # 2 陰上: ó
-    "\u0302": "5",   # 5 陽平: ô
-    "\u0304": "7",   # 7 陽去: ō
-    "\u0306": "9",   # 9 輕声: ő
-    "\u030C": "6",   # 6 陽上: ǒ
-    "\u030D": "8",   # 8 陽入: o̍
-}
-
-# 調號與調符對映轉換字典
-tiau_ho_mapping = {
-    "3": "\u0300",   # 3 陰去: ò
-    "2": "\u0301",   # 2 陰上: ó
-    "5": "\u0302",   # 5 陽平: ô
-    "7": "\u0304",   # 7 陽去: ō
-    "9": "\u030B",   # 9 輕声: ő
-    "6": "\u030C",   # 6 陽上: ǒ
-    "8": "\u030D",   # 8 陽入: o̍
-}
-
-
 # 清理音標：整理音標中的字元組合，只留【拼音字母】，清除：標點符號、控制字元
 def clean_im_piau(im_piau: str) -> str:
     # 移除標點符號
@@ -173,136 +127,10 @@ def clean_im_piau(im_piau: str) -> str:
     im_piau = unicodedata.normalize("NFC", im_piau)
     return im_piau
 
-# ---------------------------------------------------------
-# 韻母轉換
-# ---------------------------------------------------------
-
-def separate_tone(im_piau):
-    """拆解帶調字母為無調字母與調號"""
-    decomposed = unicodedata.normalize('NFD', im_piau)
-    letters = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
-    tones = ''.join(c for c in decomposed if unicodedata.category(c) == 'Mn' and c != '\u0358')
-    return letters, tones
-
-def apply_tone(im_piau, tone):
-    """聲調符號重新加回第一個母音字母上"""
-    vowels = 'aeioumnAEIOUMN'
-    for i, c in enumerate(im_piau):
-        if c in vowels:
-            return unicodedata.normalize('NFC', im_piau[:i+1] + tone + im_piau[i+1:])
-    return unicodedata.normalize('NFC', im_piau[0] + tone + im_piau[1:])
-
-# 處理 o͘ 韻母特殊情況的函數
-def handle_o_dot(im_piau):
-    # 依 Unicode 解構標準（NFD）分解傳入之【音標】，取得解構後之【拼音字母與調符】
-    decomposed = unicodedata.normalize('NFD', im_piau)
-    # 找出 o + 聲調 + 鼻化符號的特殊組合
-    match = re.search(r'(o)([\u0300\u0301\u0302\u0304\u030B\u030C\u030D]?)(\u0358)', decomposed, re.I)
-    if match:
-        # 捕獲【音標】，其【拼音字母】有 o 長音字母，且其右上方帶有圓點調符（\u0358）： o͘
-        letter, tone, nasal = match.groups()
-        # 將 o 長音字母，轉換成【拼音字母】 oo，再附回聲調
-        # replaced = f"{letter}{letter}{tone}"
-        replaced = f"{letter}{tone}{letter}"
-        # 重組字串
-        decomposed = decomposed.replace(match.group(), replaced)
-    # 依 Unicode 組合標準（NFC）重構【拼音字母與調符】，組成轉換後之【音標】
-    return unicodedata.normalize('NFC', decomposed)
-
-def tng_un_bu(im_piau: str) -> str:
-    # 帶調符之白話字韻母 o͘ ，轉換為【帶韻符之 oo 韻母】
-    im_piau = handle_o_dot(im_piau)
-
-    # 解構【帶調符音標】，轉成：【無調符音標】、【聲調符號】
-    letters, tone = separate_tone(im_piau)
-
-    # 以【無調符音標】，轉換【韻母】
-    sorted_keys = sorted(un_bu_mapping, key=len, reverse=True)
-    for key in sorted_keys:
-        if key in letters:
-            letters = letters.replace(key, un_bu_mapping[key])
-            break
-
-    if tone:
-        letters = apply_tone(letters, tone)
-
-    return letters
-
-
 # =========================================================================
-# 【帶調符拼音】轉【帶調號拼音】
+# 【帶調符拼音】轉【帶調號拼音】：由 mod_音標轉換 處理
 # =========================================================================
 
-def tng_im_piau(bo_tiau_hu_im_piau: str, po_ci: bool = True) -> str:
-    """
-    將【帶調符音標】轉換成【帶調號TLPA音標】
-    :param im_piau: str - 帶調符音標
-    :param po_ci: bool - 是否保留【音標】之首字母大寫
-    :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
-    :return: str - 轉換後的【帶調號TLPA音標】
-    """
-    # 遇標點符號，不做轉換處理，直接回傳
-    if bo_tiau_hu_im_piau[-1] in PUNCTUATIONS:
-        return bo_tiau_hu_im_piau
-
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    bo_tiau_hu_im_piau = unicodedata.normalize("NFC", bo_tiau_hu_im_piau)
-
-    #---------------------------------------------------------
-    # 保留【音標】之首字母
-    #---------------------------------------------------------
-    su_ji = bo_tiau_hu_im_piau[0]      # 保存【音標】之拼音首字母
-    bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.lower()
-    #---------------------------------------------------------
-    # 轉換【音標】的【聲母】
-    #---------------------------------------------------------
-    if bo_tiau_hu_im_piau.startswith("tsh"):
-        bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.replace("tsh", "c", 1)
-    elif bo_tiau_hu_im_piau.startswith("chh"):
-        bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.replace("chh", "c", 1)
-    elif bo_tiau_hu_im_piau.startswith("ts"):
-        bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.replace("ts", "z", 1)
-    elif bo_tiau_hu_im_piau.startswith("ch"):
-        bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.replace("ch", "z", 1)
-
-    #---------------------------------------------------------
-    # 轉換【音標】的【韻母】
-    #---------------------------------------------------------
-    # 轉換【鼻音韻母】
-    bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.replace("ⁿ", "nn", 1)
-    # 轉換音標中【韻母】為【o͘】（oo長音）的特殊處理
-    bo_tiau_hu_im_piau = handle_o_dot(bo_tiau_hu_im_piau)
-
-    # 轉換音標中【韻母】部份，不含【o͘】（oo長音）的特殊處理
-    bo_tiau_hu_im_piau, tone = separate_tone(bo_tiau_hu_im_piau)   # 無調符音標：bo_tiau_hu_im_piau
-    sorted_keys = sorted(un_bu_mapping, key=len, reverse=True)
-
-    for key in sorted_keys:
-        if key in bo_tiau_hu_im_piau:
-            bo_tiau_hu_im_piau = bo_tiau_hu_im_piau.replace(key, un_bu_mapping[key])
-            break
-
-    # 如若傳入之【音標】首字母為大寫，則將已轉成 "z" 或 "c" 之拼音字母改為大寫
-    if su_ji.isupper():
-        if bo_tiau_hu_im_piau[0] == "c":
-            bo_tiau_hu_im_piau = "C" + bo_tiau_hu_im_piau[1:]
-        elif bo_tiau_hu_im_piau[0] == "z":
-            bo_tiau_hu_im_piau = "Z" + bo_tiau_hu_im_piau[1:]
-        elif bo_tiau_hu_im_piau[0] == "u":
-            bo_tiau_hu_im_piau = "U" + bo_tiau_hu_im_piau[1:]
-        elif bo_tiau_hu_im_piau[0] == "i":
-            bo_tiau_hu_im_piau = "I" + bo_tiau_hu_im_piau[1:]
-        else:
-            bo_tiau_hu_im_piau = su_ji + bo_tiau_hu_im_piau[1:]
-    # 調符
-    # if tone: print(f"調符：{hex(ord(tone))}")
-    if tone:
-        bo_tiau_hu_im_piau = apply_tone(bo_tiau_hu_im_piau, tone)
-
-    return bo_tiau_hu_im_piau
-
 def tng_tiau_ho(im_piau: str, kan_hua: bool = False) -> str:
     """
     將【帶調符音標】轉換為【帶調號音標】
@@ -310,47 +138,7 @@ def tng_tiau_ho(im_piau: str, kan_hua: bool = False) -> str:
     :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
     :return: str - 帶調號音標
     """
-    # 遇標點符號，不做轉換處理，直接回傳
-    if im_piau[-1] in PUNCTUATIONS:
-        return im_piau
-
-    # 若【音標】末端為數值，表音標已是【帶調號拼音】，直接回傳
-    u_tiau_ho = True if im_piau[-1] in "123456789" else False
-    if u_tiau_ho: return im_piau
-
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    im_piau = unicodedata.normalize("NFC", im_piau)
-
-    #--------------------------------------------------------------------------------
-    # 以【元音及韻化輔音清單】，比對傳入之【音標】，找出對應之【基本拼音字母】與【調號】
-    #--------------------------------------------------------------------------------
-    tone_number = "1"  # 初始化調號為 1
-    number = "1"  # 明確初始化 number 變數，以免未設定而發生錯誤
-    for tone_mark, (base_char, number) in tiau_hu_mapping.items():
-        if tone_mark in im_piau:
-            im_piau = im_piau.replace(tone_mark, base_char)
-            break
-    else:
-        number = "1"  # 若沒有任何調符，number強制為1
-
-    # 依是否要【簡化】之設定，處理【調號】1 或 4 是否要略去
-    if kan_hua and number in ["1", "4"]:
-        # 若是【簡化】，且聲調值為 1 或 4 ，去除調號值
-        tone_number = ""
-    else:
-        # 若未要求【簡化】，聲調值置於【音標】末端
-        if number not in ["1", "4"]:
-            tone_number = number
-        else:
-            if im_piau[-1] in "hptk":
-                # 【音標】末端為【hptk】之一，則為【陰入調】，聲調值為 4
-                tone_number = "4"
-            else:
-                tone_number = "1"
-
-    return im_piau + tone_number
+    return im_piau_tng_huan(im_piau, TIAU_HU, TIAU_HO, kan_hua=kan_hua)
 
 
 # =========================================================================
@@ -420,18 +208,8 @@ def fill_hanzi_and_tlpa(wb, use_tiau_ho=True, filename='tmp.txt', sheet_name='
         # 解構【音標】組成之【句子】，變成單一【帶調符音標】清單
         im_piau_list = [im_piau for im_piau in im_piau_ku_cleaned.split() if im_piau]
 
-        # 轉換成【帶調號拼音】
-        im_piau_zoo = []
-        for im_piau in im_piau_list:
-            # 排除標點符號不進行韻母轉換
-            if im_piau in PUNCTUATIONS:
-                # 若為標點符號，無需轉換
-                tlpa_im_piau = im_piau
-            else:
-                # 符合【帶調符音標】格式者，則進行【帶調號音標】轉換
-                tlpa_im_piau = tng_im_piau(im_piau)    # 完成轉換之音標 = 音標帶調號
-
-            im_piau_zoo.append(tlpa_im_piau)
+        # 轉換成【TLPA音標】：整句音標一次轉換，標點符號保持不變
+        im_piau_zoo = im_piau_tng_huan(im_piau_list, TIAU_HU, TLPA_JI_BU)
 
         #------------------------------------------------------------------------------
         # 填入【音標】
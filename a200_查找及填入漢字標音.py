@@ -1,4 +1,4 @@
-"""a200_查找及填入漢字標音.py v0.2.7
+"""a200_查找及填入漢字標音.py v0.2.10
 
 將【漢字注音】工作表中的【漢字】欄位，依據【人工標音】或【台語音標】查找
 【台語音標】，並填入【台語音標】儲存格及【漢字標音】儲存格。
@@ -9,6 +9,12 @@
     以解決測試過程中無法正確模擬字庫查詢的問題。
  -  v0.2.7 2024-06-12:
     移除 CellProcessor 類別中【方法函數】不必要的參數，如：_process_cell, _process_han_ji, _process_non_han_ji 等。
+ -  v0.2.8 2026-10-18:
+    _process_sheet 改用【漢字注音】工作表快照，不再逐一儲存格 select() 及讀寫。
+ -  v0.2.9 2026-10-18:
+    新增 --backend 及 --file 參數：可改用 openpyxl 後端，不經 Excel 直接處理 .xlsx 檔。
+ -  v0.2.10 2026-10-18:
+    查找讀音時，將【漢字庫】預先載入記憶體（HanJiTian preload 模式），不再逐字查詢資料庫。
 """
 
 # =========================================================================
@@ -29,6 +35,7 @@ from mod_logging import (
     logging_process_step,
     logging_warning,  # noqa: F401
 )
+from mod_活頁簿 import BACKEND_OPENPYXL, add_backend_arguments, open_workbook_by_args
 from mod_程式 import ExcelCell, Program
 
 # =========================================================================
@@ -109,53 +116,50 @@ class CellProcessor(ExcelCell):
         active_cell = sheet.range(f"{xw.utils.col_name(start_col)}{line_start_row}")
         active_cell.select()
 
-        is_eof = False
-        for line_no in range(1, total_lines + 1):
-            # 檢查是否到達結尾
-            if is_eof or line_no > total_lines:
-                break
-
-            # 顯示目前處理【第 n 行】
-            self._show_separtor_line(f"處理第 {line_no} 行...")
-
-            # 調整 row 值至【漢字】儲存格所在列
-            # （每【行（line）】由 4【列（row）】所構成，漢字在第 3 列：5, 9, 13, ... ）
-            row = line_start_row + (line_no - 1) * rows_per_line + han_ji_row_offset
-
-            # ----------------------------------------------------------------------
-            # 處理列中所有欄(col)儲存格
-            # ----------------------------------------------------------------------
-            for c in range(start_col, end_col + 1):
-                # 初始化每列所需使用變數
-                status_code = 0
-
-                # 將目前處理之儲存格，設為作用中儲存格
-                row = row
-                col = c
-                active_cell = sheet.range((row, col))
-                active_cell.select()
-
-                # 顯示正要處理的儲存格座標位置
-                print("-" * 80)
-                print(f"儲存格：{xw.utils.col_name(col)}{row}（{row}, {col}）")
-
-                # ------------------------------------------------------------------
-                # 處理儲存格
-                # ------------------------------------------------------------------
-                # status_code:
-                # 0 = 儲存格內容為：漢字
-                # 1 = 儲存格內容為：文字終結符號
-                # 2 = 儲存格內容為：換行符號
-                # 3 = 儲存格內容為：空白、標點符號等非漢字字元
-                status_code = self._process_cell(active_cell)
-
-                # 檢查是否需因：換行、文章終結，而跳出內層迴圈
-                if status_code == 1:
-                    is_eof = True
-                    break
-                elif status_code == 2:
+        # 載入【漢字注音】工作表快照：各儲存格之讀寫，於記憶體中完成
+        with self.open_han_ji_zu_im_grid(sheet) as grid:
+            is_eof = False
+            for line_no in range(1, total_lines + 1):
+                # 檢查是否到達結尾
+                if is_eof or line_no > total_lines:
                     break
 
+                # 顯示目前處理【第 n 行】
+                self._show_separtor_line(f"處理第 {line_no} 行...")
+
+                # 調整 row 值至【漢字】儲存格所在列
+                # （每【行（line）】由 4【列（row）】所構成，漢字在第 3 列：5, 9, 13, ... ）
+                row = line_start_row + (line_no - 1) * rows_per_line + han_ji_row_offset
+
+                # ----------------------------------------------------------------------
+                # 處理列中所有欄(col)儲存格
+                # ----------------------------------------------------------------------
+                for col in range(start_col, end_col + 1):
+                    # 初始化每列所需使用變數
+                    status_code = 0
+                    active_cell = grid.cell(row, col)
+
+                    # 顯示正要處理的儲存格座標位置
+                    print("-" * 80)
+                    print(f"儲存格：{xw.utils.col_name(col)}{row}（{row}, {col}）")
+
+                    # ------------------------------------------------------------------
+                    # 處理儲存格
+                    # ------------------------------------------------------------------
+                    # status_code:
+                    # 0 = 儲存格內容為：漢字
+                    # 1 = 儲存格內容為：文字終結符號
+                    # 2 = 儲存格內容為：換行符號
+                    # 3 = 儲存格內容為：空白、標點符號等非漢字字元
+                    status_code = self._process_cell(active_cell)
+
+                    # 檢查是否需因：換行、文章終結，而跳出內層迴圈
+                    if status_code == 1:
+                        is_eof = True
+                        break
+                    elif status_code == 2:
+                        break
+
         # 將字庫 dict 回存 Excel 工作表
         self.save_all_piau_im_ji_khoo_dicts()
 
@@ -179,7 +183,7 @@ def process(wb, args) -> int:
         # --------------------------------------------------------------------------
         # 初始化 process config
         # --------------------------------------------------------------------------
-        program = Program(wb, args, hanji_piau_im_sheet_name="漢字注音")
+        program = Program(wb, args, hanji_piau_im_sheet_name="漢字注音", preload_ji_tian=True)
 
         # 建立儲存格處理器
         if args.new:
@@ -248,16 +252,24 @@ def main(args) -> int:
     # =========================================================================
     # 取得【作用中活頁簿】
     wb = None
-    try:
-        # 嘗試從 Excel 呼叫取得（RunPython）
-        wb = xw.Book.caller()
-    except Exception:
-        # 若失敗，則取得作用中的活頁簿
+    if getattr(args, "file", None) or getattr(args, "backend", None) == BACKEND_OPENPYXL:
+        # 依命令列參數開啟活頁簿（--backend openpyxl 時，直接開啟 --file 指定之 .xlsx 檔）
         try:
-            wb = xw.apps.active.books.active
+            wb = open_workbook_by_args(args)
         except Exception as e:
-            logging_exc_error(msg=f"無法找到作用中的 Excel 工作簿！", error=e)
+            logging_exc_error(msg=f"無法開啟活頁簿：{getattr(args, 'file', None)}", error=e)
             return EXIT_CODE_NO_FILE
+    else:
+        try:
+            # 嘗試從 Excel 呼叫取得（RunPython）
+            wb = xw.Book.caller()
+        except Exception:
+            # 若失敗，則取得作用中的活頁簿
+            try:
+                wb = xw.apps.active.books.active
+            except Exception as e:
+                logging_exc_error(msg=f"無法找到作用中的 Excel 工作簿！", error=e)
+                return EXIT_CODE_NO_FILE
 
     # 若無法取得【作用中活頁簿】，則因無法繼續作業，故返回【作業異常終止代碼】結束。
     if not wb:
@@ -358,6 +370,7 @@ if __name__ == "__main__":
   python a200_查找及填入漢字標音.py          # 執行一般模式
   python a200_查找及填入漢字標音.py -new     # 建立新的字庫工作表
   python a200_查找及填入漢字標音.py -test    # 執行測試模式
+  python a200_查找及填入漢字標音.py --backend openpyxl --file Tai_Gi_Zu_Im_Bun.xlsx  # 不經 Excel，直接處理 .xlsx 檔
 """,
     )
     parser.add_argument(
@@ -370,6 +383,7 @@ if __name__ == "__main__":
         action="store_true",
         help="建立新的字庫工作表",
     )
+    add_backend_arguments(parser)
     args = parser.parse_args()
     new_piau_im_sheets = args.new
     test_mode = args.test
@@ -6,6 +6,14 @@
  - v0.2.6 2024-06-17:
     變更程式架構，改成套用類別 CellProcessor，借助物件導向程式之【繼承】與【覆蓋】方法，
     以實現【批次式漢字注音工作表製作】功能。
+ - v0.2.7 2026-10-18:
+    _process_sheet 改用【漢字注音】工作表快照，不再逐一儲存格 select() 及讀寫。
+ - v0.2.8 2026-10-18:
+    新增 --backend 及 --file 參數：可改用 openpyxl 後端，不經 Excel 直接處理 .xlsx 檔。
+ - v0.2.9 2026-10-18:
+    查找讀音時，將【漢字庫】預先載入記憶體（HanJiTian preload 模式），不再逐字查詢資料庫。
+ - v0.2.10 2026-10-18:
+    工作表已存在者，沿用該工作表繼續處理；openpyxl 後端可複製【漢字注音】工作表。
 """
 
 import logging
@@ -21,6 +29,7 @@ from mod_logging import (
     logging_process_step,
     logging_warning,  # noqa: F401
 )
+from mod_活頁簿 import add_backend_arguments, open_workbook_by_args
 from mod_程式 import ExcelCell, Program
 
 # =========================================================================
@@ -84,54 +93,47 @@ class CellProcessor(ExcelCell):
         active_cell.select()
 
         # 調整 row 值至【漢字】列（每 4 列為一組，漢字在第 3 列：5, 9, 13, ... ）
-        is_eof = False
-        for r in range(1, self.program.TOTAL_LINES + 1):
-            if is_eof:
-                break
-            line_no = r
-
-            # 顯示【作用儲存格】位置
-            print("=" * 80)
-            print(f"處理第 {line_no} 行...")
-            row = (
-                self.program.line_start_row
-                + (r - 1) * self.program.ROWS_PER_LINE
-                + self.program.han_ji_row_offset
-            )
-
-            new_line = False
-            for c in range(self.program.start_col, self.program.end_col + 1):
+        # 載入【漢字注音】工作表快照：各儲存格之讀寫，於記憶體中完成
+        with self.open_han_ji_zu_im_grid(sheet) as grid:
+            is_eof = False
+            for r in range(1, self.program.TOTAL_LINES + 1):
                 if is_eof:
                     break
-                if new_line:
-                    break  # 跳出內層迴圈，進入下一行處理
-                row = row
-                col = c
-                active_cell = sheet.range((row, col))
-                active_cell.select()
-
-                # 顯示正要處理的儲存格座標位置
-                print("-" * 60)
-                print(f"儲存格：{xw.utils.col_name(col)}{row}（{row}, {col}）")
-
-                # ------------------------------------------------------------------
-                # 處理儲存格
-                # ------------------------------------------------------------------
-                # status_code:
-                # 0 = 儲存格內容為：漢字
-                # 1 = 儲存格內容為：文字終結符號
-                # 2 = 儲存格內容為：換行符號
-                # 3 = 儲存格內容為：空白、標點符號等非漢字字元
-                status_code = 0
-                status_code = self._process_cell(active_cell)
-
-                # 檢查是否需因：換行、文章終結，而跳出內層迴圈
-                if status_code == 1:
-                    is_eof = True
-                    break
-                elif status_code == 2:
-                    new_line = True
-                    break
+                line_no = r
+
+                # 顯示【作用儲存格】位置
+                print("=" * 80)
+                print(f"處理第 {line_no} 行...")
+                row = (
+                    self.program.line_start_row
+                    + (r - 1) * self.program.ROWS_PER_LINE
+                    + self.program.han_ji_row_offset
+                )
+
+                for col in range(self.program.start_col, self.program.end_col + 1):
+                    active_cell = grid.cell(row, col)
+
+                    # 顯示正要處理的儲存格座標位置
+                    print("-" * 60)
+                    print(f"儲存格：{xw.utils.col_name(col)}{row}（{row}, {col}）")
+
+                    # ------------------------------------------------------------------
+                    # 處理儲存格
+                    # ------------------------------------------------------------------
+                    # status_code:
+                    # 0 = 儲存格內容為：漢字
+                    # 1 = 儲存格內容為：文字終結符號
+                    # 2 = 儲存格內容為：換行符號
+                    # 3 = 儲存格內容為：空白、標點符號等非漢字字元
+                    status_code = 0
+                    status_code = self._process_cell(active_cell)
+
+                    # 檢查是否需因：換行、文章終結，而跳出內層迴圈
+                    if status_code == 1:
+                        is_eof = True
+                        break
+                    elif status_code == 2:
+                        break
 
             # 將字庫 dict 回存 Excel 工作表
             # self.save_all_piau_im_ji_khoo_dicts()
@@ -154,7 +156,7 @@ def process(wb, args) -> int:
 
     try:
         # 初始化 process config
-        program = Program(wb, args, hanji_piau_im_sheet_name="漢字注音")
+        program = Program(wb, args, hanji_piau_im_sheet_name="漢字注音", preload_ji_tian=True)
 
         # 建立儲存格處理器
         if args.new:
@@ -209,6 +211,7 @@ def process(wb, args) -> int:
                     new_sheet = source_sheet.copy(name=sheet_name, after=source_sheet)
                     print(f"✅ 已複製【漢字注音】工作表為 '{sheet_name}'")
                 else:
+                    new_sheet = wb.sheets[sheet_name]
                     print(f"⚠️ 工作表 '{sheet_name}' 已存在")
 
             except Exception as e:
@@ -263,9 +266,9 @@ def main(args) -> int:
     # (2) 設定【作用中活頁簿】：偵測及獲取 Excel 已開啟之活頁簿檔案。
     # =========================================================================
     try:
-        # 取得 Excel 活頁簿
+        # 取得 Excel 活頁簿（--backend openpyxl 時，直接開啟 --file 指定之 .xlsx 檔）
         wb = None
-        wb = xw.apps.active.books.active
+        wb = open_workbook_by_args(args)
     except Exception as e:
         logging.error(f"無法找到作用中的 Excel 工作簿: {e}")
         return EXIT_CODE_NO_FILE
@@ -330,6 +333,7 @@ if __name__ == "__main__":
   python ao00_xyz.py            # 執行一般模式
   python ao00_xyz.py -new       # 建立新的字庫工作表
   python ao00_xyz.py -test      # 執行測試模式
+  python a290_批次式漢字注音工作表製作.py --backend openpyxl --file Tai_Gi_Zu_Im_Bun.xlsx  # 不經 Excel，直接處理 .xlsx 檔
 """,
     )
     parser.add_argument(
@@ -342,6 +346,7 @@ if __name__ == "__main__":
         action="store_true",
         help="建立新的字庫工作表",
     )
+    add_backend_arguments(parser)
     args = parser.parse_args()
     new_piau_im_sheets = args.new
     test_mode = args.test
@@ -133,6 +133,15 @@ except ImportError as e:
     HAS_A260 = False
     print(f"警告：無法載入 a260 模組：{e}")
 
+# 載入字典聯查功能（河洛話、十五音、廣韻）
+try:
+    from mod_字典聯查 import format_lai_goan, get_lian_ca_ji_tian
+
+    HAS_LIAN_CA = True
+except ImportError as e:
+    HAS_LIAN_CA = False
+    print(f"警告：無法載入 mod_字典聯查 模組：{e}")
+
 # =========================================================================
 # 常數定義
 # =========================================================================
@@ -1063,6 +1072,24 @@ class NavigationController:
                 time.sleep(0.3)
             print("✓ 已恢復導航模式\n")
 
+    def print_lian_ca_piau_im(self):
+        """聯查各字典，列出當前漢字之候選讀音及出處"""
+        han_ji = self.sheet.range((self.current_row, self.current_col)).value
+        if not han_ji or not str(han_ji).strip():
+            return
+        han_ji = str(han_ji).strip()
+        try:
+            candidates = get_lian_ca_ji_tian().ca(han_ji)
+        except Exception as e:
+            logging.error(f"字典聯查錯誤：{e}")
+            return
+        if not candidates:
+            print(f"【{han_ji}】各字典查無讀音")
+            return
+        print(f"【{han_ji}】各字典讀音：")
+        for idx, candidate in enumerate(candidates, start=1):
+            print(f"  {idx}. [{candidate['台語音標']}]（{format_lai_goan(candidate)}）")
+
     def query_dictionary_and_assign_han_ji_thok_im(self):
         """查詢字典指定漢字讀音"""
         print("\n" + "=" * 70)
@@ -1086,6 +1113,10 @@ class NavigationController:
                 current_cell = f"{xw.utils.col_name(self.current_col)}{self.current_row}"
                 print(f"當前儲存格：{current_cell}")
 
+                # 列出各字典之讀音，供指定讀音時參考
+                if HAS_LIAN_CA:
+                    self.print_lian_ca_piau_im()
+
                 # 調用查詢函數
                 exit_code = ca_ji_tian_au_thiam_jin_kang_piau_im(
                     wb=self.wb,
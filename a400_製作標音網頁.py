@@ -1,5 +1,5 @@
 """
-a400_製作標音網頁.py V0.2.2.12
+a400_製作標音網頁.py V0.2.2.20
 
 修改紀錄：
 v0.2.2.9 2026-2-25: 自動産生【文章標題】及【作者姓名】的 Ruby Tag。
@@ -9,13 +9,20 @@ v0.2.2.11 2026-3-13:
   - 修復檔名與 meta 標籤中出現 "None" 字串的問題。
   - 恢復完整的進度監控輸出。
 v0.2.2.12 2026-3-20: 改善 html 輸出之格式，確保【內縮】與【換行】的正確顯示。
+v0.2.2.13 2026-10-18: _process_sheet 改用【漢字注音】工作表快照讀取儲存格，不再逐列 select() 及逐格讀取。
+v0.2.2.14 2026-10-18: 新增 --backend 及 --file 參數：可改用 openpyxl 後端，不經 Excel 直接處理 .xlsx 檔。
+v0.2.2.15 2026-10-18: 網頁改由 mod_標音網頁.RubyRenderer 產生：自工作表快照一次讀出文章各行，
+  不重複之音標僅轉換一次，網頁直接寫入檔案；新增 --quiet 參數，關閉逐字進度輸出。
+v0.2.2.16 2026-10-18: 網頁檔名及 <meta> 標籤改由 build_output_file_name()、build_head_extra() 産生，供 a410 共用。
+v0.2.2.17 2026-10-18: 依【網站建置清單】，僅於文章內容或製作設定變更時重新製作網頁；新增 --force 及 --dry-run 參數。
+v0.2.2.18 2026-10-18: 網頁內嵌本頁音標之【標音對照表】，供 phonetic_switcher.js 切換標音方法。
+v0.2.2.19 2026-10-18: 文章圖片改以 <picture>/srcset 引用 WebP/JPEG 衍生檔（mod_網頁圖片），並加註寬高及 loading="lazy"。
+v0.2.2.20 2026-10-18: 新增 --compact 及 --precompress 參數：輸出精簡網頁及 .gz／.br 預先壓縮檔，並列印網頁大小報告。
 """
 
+import io
 import os
 import sys
-from pathlib import Path
-
-import xlwings as xw
 
 from mod_excel_access import get_value_by_name
 from mod_logging import (
@@ -24,8 +31,20 @@ from mod_logging import (
     logging_exception,
     logging_process_step,
 )
-from mod_帶調符音標 import is_han_ji, kam_si_u_tiau_hu, tng_im_piau, tng_tiau_ho
-from mod_標音 import is_punctuation, split_tai_gi_im_piau
+from mod_標音網頁 import (
+    PIAU_IM_TABLE_HUAT,
+    ZU_IM_HUAT_LIST,
+    RubyRenderer,
+    build_pages,
+    iter_han_ji_zu_im_lines,
+    read_han_ji_zu_im_lines,
+    render_title_and_author,
+    split_title_and_author,
+)
+from mod_活頁簿 import add_backend_arguments, open_workbook_by_args
+from mod_網站建置 import BuildManifest, add_build_arguments
+from mod_網頁圖片 import header_image_html
+from mod_網頁壓縮 import add_output_arguments
 from mod_程式 import ExcelCell, Program
 
 EXIT_CODE_SUCCESS = 0
@@ -51,270 +70,94 @@ class CellProcessor(ExcelCell):
         self.siong_pinn_piau_im = get_value_by_name(wb=wb, name="上邊標音")
         self.zian_pinn_piau_im = get_value_by_name(wb=wb, name="右邊標音")
 
-        self.zu_im_huat_list = {
-            "SNI": ["fifteen_yin", "rt", "十五音切語"],
-            "TPS": ["Piau_Im", "rt", "方音符號注音"],
-            "MPS2": ["Piau_Im", "rt", "注音二式"],
-            "POJ": ["pin_yin", "rt", "白話字拼音"],
-            "TL": ["pin_yin", "rt", "台羅拼音"],
-            "BP": ["pin_yin", "rt", "閩拼標音"],
-            "TLPA_Plus": ["pin_yin", "rt", "台羅改良式"],
-            "DBL": ["Siang_Pai", "rtc", "雙排注音"],
-            "雅俗通": ["fifteen_yin", "rt", "十五音切語"],
-            "無預設": ["Siang_Pai", "rtc", "雙排注音"],
-        }
-
-    def _build_ruby_tag(
-        self, han_ji: str, siong_piau_im: str, zian_piau_im: str
-    ) -> str:
-        TAB = "\t"  # t = char(9) 取名 tab
-        LEFT_MARGIN = f"{TAB*5}"  # 左邊距，根據實際需要調整
-        if siong_piau_im != "" and zian_piau_im == "":
-            return f"{LEFT_MARGIN}<ruby>{han_ji}<rt>{siong_piau_im}</rt></ruby>\n"
-        elif siong_piau_im == "" and zian_piau_im != "":
-            return f"{LEFT_MARGIN}<ruby>{han_ji}<rtc>{zian_piau_im}</rtc></ruby>\n"
-        elif siong_piau_im != "" and zian_piau_im != "":
-            return f"{LEFT_MARGIN}<ruby>{han_ji}<rt>{siong_piau_im}</rt><rtc>{zian_piau_im}</rtc></ruby>\n"
-        else:
-            return f"{LEFT_MARGIN}<span>{han_ji}</span>\n"
+        self.zu_im_huat_list = ZU_IM_HUAT_LIST
+        self.renderer = RubyRenderer(
+            piau_im=self.program.piau_im,
+            han_ji_piau_im_format=self.han_ji_piau_im_format,
+            siong_pinn_piau_im=self.siong_pinn_piau_im,
+            zian_pinn_piau_im=self.zian_pinn_piau_im,
+            piau_im_hong_sik=self.piau_im_hong_sik,
+            total_chars_per_line=self.total_chars_per_line,
+            show_progress=not getattr(self.program.args, "quiet", False),
+        )
 
     def generate_ruby_tag(self, han_ji: str, tai_gi_im_piau: str) -> tuple:
-        TAB = "\t"  # t = char(9) 取名 tab
-        LEFT_MARGIN = f"{TAB*5}"  # 左邊距，根據實際需要調整
-        if not tai_gi_im_piau or not str(tai_gi_im_piau).strip():
-            return f"{LEFT_MARGIN}<span>{han_ji}</span>\n", "", ""
-        try:
-            zu_im_list = split_tai_gi_im_piau(tai_gi_im_piau)
-        except Exception:
-            return f"{LEFT_MARGIN}<span>{han_ji}</span>\n", "", ""
-
-        siann_bu = zu_im_list[0] if zu_im_list[0] else "ø"
-        siong, zian = "", ""
-        if self.han_ji_piau_im_format == "無預設":
-            if "上" in str(self.piau_im_hong_sik):
-                siong = self.program.piau_im.han_ji_piau_im_tng_huan(
-                    self.siong_pinn_piau_im, siann_bu, zu_im_list[1], zu_im_list[2]
-                )
-            if "右" in str(self.piau_im_hong_sik):
-                zian = self.program.piau_im.han_ji_piau_im_tng_huan(
-                    self.zian_pinn_piau_im, siann_bu, zu_im_list[1], zu_im_list[2]
-                )
-        else:
-            if self.han_ji_piau_im_format in [
-                "POJ",
-                "TL",
-                "BP",
-                "TLPA_Plus",
-                "SNI",
-                "雅俗通",
-            ]:
-                siong = self.program.piau_im.han_ji_piau_im_tng_huan(
-                    self.siong_pinn_piau_im, siann_bu, zu_im_list[1], zu_im_list[2]
-                )
-            elif self.han_ji_piau_im_format == "TPS":
-                zian = self.program.piau_im.han_ji_piau_im_tng_huan(
-                    self.zian_pinn_piau_im, siann_bu, zu_im_list[1], zu_im_list[2]
-                )
-            elif self.han_ji_piau_im_format == "DBL":
-                siong = self.program.piau_im.han_ji_piau_im_tng_huan(
-                    self.siong_pinn_piau_im, siann_bu, zu_im_list[1], zu_im_list[2]
-                )
-                zian = self.program.piau_im.han_ji_piau_im_tng_huan(
-                    self.zian_pinn_piau_im, siann_bu, zu_im_list[1], zu_im_list[2]
-                )
+        """產生單一漢字之 Ruby Tag：(Ruby Tag, 上邊標音, 右邊標音)"""
+        return self.renderer.ruby_tag(han_ji, tai_gi_im_piau)
 
-        ruby_tag = self._build_ruby_tag(han_ji, siong, zian)
-        if tai_gi_im_piau and "<ruby" in ruby_tag:
-            ruby_tag = ruby_tag.replace("<ruby", f'<ruby data-tlpa="{tai_gi_im_piau}"')
-        return ruby_tag, siong, zian
+    def _get_cell_value(self, sheet, row: int, col: int):
+        """讀取儲存格之值：【漢字注音】工作表快照已載入者，取自快照"""
+        grid = getattr(self, "grid", None)
+        if grid is not None and grid.contains(row, col):
+            return grid.get_value(row, col)
+        return sheet.range((row, col)).value
 
     def generate_title_and_author_with_ruby(self) -> tuple:
         """智慧判定標題與作者"""
         program = self.program
         sheet = program.wb.sheets["漢字注音"]
         start_row = program.line_start_row + program.han_ji_row_offset
-
-        # 1. 讀取第一行第一個漢字
-        first_han_ji = sheet.range((start_row, program.start_col)).value
-        if first_han_ji != "《":
-            # 如果開頭不是《，判定為無標題文章，直接回傳空，並讓指標維持在起始行
+        cols = range(program.start_col, program.end_col + 1)
+
+        # 逐行讀取，讀至標題區之行尾即停止
+        lines = iter_han_ji_zu_im_lines(
+            lambda row: [self._get_cell_value(sheet, row, col) for col in cols],
+            start_row=start_row,
+            end_row=999,
+            rows_per_line=program.ROWS_PER_LINE,
+        )
+        title_cells, author_cells, total_lines = split_title_and_author(lines)
+        if not total_lines:
+            # 開頭不是《，判定為無標題文章，直接回傳空，並讓指標維持在起始行
             return "", "", start_row
 
-        # 2. 既然有《，開始提取
-        han_ji_list, tlpa_list = [], []
-        row = start_row
-        found_line_end = False
-        while row < 1000:
-            for col in range(program.start_col, program.end_col + 1):
-                h = sheet.range((row, col)).value
-                t = sheet.range((row - 1, col)).value
-                if h in ["φ", "\\n", "\n"]:
-                    found_line_end = True
-                    break
-                han_ji_list.append(str(h) if h else "")
-                tlpa_list.append(str(t).strip() if t else "")
-            row += program.ROWS_PER_LINE
-            if found_line_end:
-                break
-
-        html_segments = []
-        for i, han_ji in enumerate(han_ji_list):
-            if not han_ji.strip():
-                continue
-            tag, siong, zian = self.generate_ruby_tag(han_ji, tlpa_list[i])
-            html_segments.append(tag.rstrip() + "\n")
-            print(f"標題處理: {han_ji} [{tlpa_list[i]}] ==》 上：{siong} / 右：{zian}")
-
-        # 3. 根據標點符號拆分
-        title_html, author_html, split_index = "", "", -1
-        for i, seg in enumerate(html_segments):
-            if "》" in seg:
-                split_index = i
-                break
+        title_html, author_html = render_title_and_author(title_cells, author_cells, self.generate_ruby_tag)
+        return title_html, author_html, start_row + total_lines * program.ROWS_PER_LINE
 
-        if split_index != -1:
-            t_parts = html_segments[: split_index + 1]
-            a_parts = html_segments[split_index + 1 :]
-            title_html = "".join(
-                [
-                    (
-                        p.replace("<span>", f'<span class="title_mark">')
-                        if "《" in p or "》" in p
-                        else p
-                    )
-                    for p in t_parts
-                ]
+    def read_lines(self, sheet) -> list:
+        """自【漢字注音】工作表快照，一次讀出文章各行：[[(漢字, 台語音標), ...], ...]"""
+        program = self.program
+        with self.open_han_ji_zu_im_grid(sheet) as grid:
+            return read_han_ji_zu_im_lines(
+                grid,
+                start_row=program.line_start_row + program.han_ji_row_offset,
+                rows_per_line=program.ROWS_PER_LINE,
             )
-            # 檢查後續是否包含作者標記
-            combined_after = "".join(han_ji_list[split_index + 1 :])
-            if "：" in combined_after or ":" in combined_after:
-                author_html = "".join(a_parts)
-            else:
-                # 若無作者標記，則作者留空，且將指標重設回標題後的一行
-                author_html = ""
-                # 注意：這裡 row 已經在提取完畢後指向正確位置
-        else:
-            title_html = "".join(html_segments)
-
-        return (
-            f"{title_html}",
-            f"{author_html}" if author_html else "",
-            row,
-        )
 
     def _process_sheet(self, sheet) -> str:
-        TAB = "\t"  # t = char(9) 取名 tab
-        LEFT_MARGIN = f"{TAB*3}"  # 左邊距，根據實際需要調整
-        title_ruby, author_ruby, next_start_row = (
-            self.generate_title_and_author_with_ruby()
-        )
-        pai_ban = self.zu_im_huat_list.get(self.han_ji_piau_im_format, ["pin_yin"])[0]
-        write_buffer = f"""
-{LEFT_MARGIN}<div class='{pai_ban}'>
-{LEFT_MARGIN}\t<p class='title'>
-{title_ruby}{LEFT_MARGIN}\t</p>
-{LEFT_MARGIN}\t<p class='author'>
-{author_ruby}{LEFT_MARGIN}\t</p>
-{LEFT_MARGIN}\t<p>
-"""
-        program = self.program
-        char_count = 0
-        end_row = program.line_end_row + program.han_ji_row_offset
-
-        for row in range(next_start_row, end_row, program.ROWS_PER_LINE):
-            try:
-                sheet.range((row, program.start_col)).select()
-            except Exception:
-                pass
-
-            for col in range(program.start_col, program.end_col+1):
-                val = sheet.range((row, col)).value
-                addr = f"{xw.utils.col_name(col)}{row}"
-
-                if val == "φ":
-                    char_count += 1
-                    print(f"{char_count}. {addr} ==> 《文章終止》\n" + "=" * 80)
-                    return write_buffer + f"{TAB*4}</p>\n{TAB*3}</div>"
-
-                if val in ["\n", "\\n"]:
-                    char_count += 1
-                    print(f"{char_count}. {addr} ==> 《換換行》\n" + "-" * 80)
-                    write_buffer += f"{TAB*4}</p><p>\n"
-                    char_count = 0
-                    break
+        return self.renderer.render_article(self.read_lines(sheet), io.StringIO()).getvalue()
 
-                str_val = str(val).strip() if val else ""
-                if is_punctuation(str_val):
-                    msg = f"{str_val}【標點符號】"
-                    write_buffer += f"{TAB*5}<span>{str_val}</span>\n"
-                elif not str_val:
-                    msg = "【空白】"
-                    write_buffer += f"{TAB*5}<span>　</span>\n"
-                elif not is_han_ji(val):
-                    msg = f"{str_val}【其他字元】"
-                    write_buffer += f"{TAB*5}<span>{str_val}</span>\n"
-                else:
-                    tlpa = sheet.range((row - 1, col)).value
-                    tlpa = str(tlpa).strip() if tlpa else ""
-                    if not tlpa:
-                        msg = f"{str_val}【無音標】"
-                        write_buffer += f"{TAB*5}<span>{str_val}</span>\n"
-                    else:
-                        if kam_si_u_tiau_hu(tlpa):
-                            tlpa = tng_tiau_ho(tng_im_piau(tlpa))
-                        tag, siong, zian = self.generate_ruby_tag(str_val, tlpa)
-                        write_buffer += tag
-                        msg = f"{str_val} [{tlpa}] ==》 上：{siong} / 右：{zian}"
 
-                char_count += 1
-                print(f"{char_count}. {addr} ==> {msg}")
-                if (
-                    self.total_chars_per_line
-                    and char_count >= self.total_chars_per_line
-                ):
-                    # write_buffer += "<br/>\n"
-                    write_buffer += "</p><p>\n"
-                    char_count = 0
-                    print("《人工斷行》")
+def _bo_none(value) -> str:
+    """None 或 "None" 轉成空字串"""
+    return "" if value is None or str(value) == "None" else str(value)
 
-        # write_buffer += f"\n{TAB*3}</p></div>"
-        # return write_buffer
 
+def build_output_file_name(program, han_ji_piau_im_format, siong_pinn_piau_im, zian_pinn_piau_im) -> str:
+    """網頁檔名：《文章標題》【語音類別】標音方法.html"""
+    siong = _bo_none(siong_pinn_piau_im)
+    zian = _bo_none(zian_pinn_piau_im)
+    if han_ji_piau_im_format == "無預設":
+        im_piau = program.piau_im_huat
+    elif siong and zian:
+        im_piau = f"{siong}＋{zian}"
+    else:
+        im_piau = siong or zian or program.piau_im_huat
+    return f"《{program.title}》【{program.ue_im_lui_piat}】{im_piau}.html"
 
-def _create_html_file(program, output_path, head_extra="", title="", content=""):
-    web_page_stem = Path(output_path).stem
-    img_url = str(program.image_url or "").strip()
-    if img_url == "None" or not img_url:
-        img_url = "king_tian.png"  # 預設圖片
 
-    # 修正：恢復相對路徑，確保 Local 端可瀏覽
-    full_img = img_url if img_url.startswith("http") else f"./assets/images/{img_url}"
-
-    template = f"""<!DOCTYPE html>
-<html lang="zh-TW">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <meta content='https://alanjui.github.io/Piau-Im/{web_page_stem}.html' property='og:url' />
-    {head_extra}
-    <link rel="stylesheet" href="./assets/styles/styles.css">
-    <script type="text/javascript" src="./assets/javascripts/phonetic_switcher.js"></script>
-</head>
-<body>
-    <main class="page">
-        <article class="article_content">
-            <div style='text-align: center'>
-                <img src='{full_img}' width='800' />
-            </div>
-            {content}
-        </article>
-    </main>
-    <a href="index.html" class="floating-home-btn">🏠</a>
-</body>
-</html>"""
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(template)
+def build_head_extra(wb, overrides: dict = None) -> str:
+    """
+    網頁 <head> 之 <meta> 標籤：取自【env】工作表之名稱；
+    overrides 所列者（如：{"上邊標音": "雅俗通"}），以其值取代。
+    """
+    overrides = overrides or {}
+    meta_keys = ["TITLE", "IMAGE_URL", "網頁格式", "上邊標音", "右邊標音"]
+    meta_list = []
+    for k in meta_keys:
+        v = overrides[k] if k in overrides else get_value_by_name(wb, k)
+        meta_list.append(f'<meta name="{k}" content="{_bo_none(v)}" />')
+    return "\n    ".join(meta_list)
 
 
 def process(wb, args) -> int:
@@ -325,50 +168,60 @@ def process(wb, args) -> int:
         sheet = wb.sheets["漢字注音"]
         sheet.activate()
         print("開始製作【漢字注音】網頁！")
-        html_content = xls_cell._process_sheet(sheet)
+        lines = xls_cell.read_lines(sheet)
 
         # 生成輸出檔案名稱 (處理 None)
-        piau_im_huat = program.piau_im_huat
-        ue_im_lui_piat = program.ue_im_lui_piat
-        han_ji_piau_im_format = program.han_ji_piau_im_format
-        siong = (
-            str(program.siong_pinn_piau_im)
-            if program.siong_pinn_piau_im and str(program.siong_pinn_piau_im) != "None"
-            else ""
-        )
-        zian = (
-            str(program.zian_pinn_piau_im)
-            if program.zian_pinn_piau_im and str(program.zian_pinn_piau_im) != "None"
-            else ""
+        output_file = build_output_file_name(
+            program,
+            han_ji_piau_im_format=program.han_ji_piau_im_format,
+            siong_pinn_piau_im=program.siong_pinn_piau_im,
+            zian_pinn_piau_im=program.zian_pinn_piau_im,
         )
-
-        if han_ji_piau_im_format == "無預設":
-            im_piau = piau_im_huat
-        else:
-            if siong and zian:
-                im_piau = f"{siong}＋{zian}"
-            elif siong:
-                im_piau = siong
-            elif zian:
-                im_piau = zian
-            else:
-                im_piau = piau_im_huat
-
-        output_file = f"《{program.title}》【{ue_im_lui_piat}】{im_piau}.html"
         output_path = os.path.join("docs", output_file)
         os.makedirs("docs", exist_ok=True)
+        dry_run = getattr(args, "dry_run", False)
+        task = {
+            "output_path": output_path,
+            "renderer": {
+                "han_ji_piau_im_format": xls_cell.han_ji_piau_im_format,
+                "siong_pinn_piau_im": xls_cell.siong_pinn_piau_im,
+                "zian_pinn_piau_im": xls_cell.zian_pinn_piau_im,
+                "piau_im_hong_sik": xls_cell.piau_im_hong_sik,
+                "total_chars_per_line": xls_cell.total_chars_per_line,
+                "show_progress": xls_cell.renderer.show_progress,
+                "piau_im_table": PIAU_IM_TABLE_HUAT,
+            },
+            "page": {
+                "title": program.title,
+                "image_url": program.image_url,
+                "web_page_stem": os.path.splitext(output_file)[0],
+                "head_extra": build_head_extra(wb),
+                "image_html": header_image_html(program.image_url, alt=program.title, generate=not dry_run),
+            },
+            "output": {
+                "compact": getattr(args, "compact", False),
+                "precompress": getattr(args, "precompress", False),
+            },
+        }
 
-        # 處理 Meta 標籤中的 None
-        meta_keys = ["TITLE", "IMAGE_URL", "網頁格式", "上邊標音", "右邊標音"]
-        meta_list = []
-        for k in meta_keys:
-            v = get_value_by_name(wb, k)
-            if v is None or str(v) == "None":
-                v = ""
-            meta_list.append(f'<meta name="{k}" content="{v}" />')
-        head_extra = "\n    ".join(meta_list)
+        # 依【網站建置清單】，僅於來源內容或製作設定變更時，重新製作網頁
+        with BuildManifest() as manifest:
+            rebuilt = build_pages(
+                program.piau_im,
+                lines,
+                [task],
+                manifest,
+                source=getattr(wb, "fullname", ""),
+                force=getattr(args, "force", False),
+                dry_run=dry_run,
+            )
+        if not rebuilt:
+            print(f"網頁未變更，略過：{output_file}")
+        for path, reason in rebuilt:
+            print(f"{'須重建' if dry_run else '已重建'}：{path}（{reason}）")
+        if dry_run:
+            return EXIT_CODE_SUCCESS
 
-        _create_html_file(program, output_path, head_extra, program.title, html_content)
         program.save_workbook_as_new_file(wb=wb)
         logging_process_step("<=========== 作業結束！==========>")
         return EXIT_CODE_SUCCESS
@@ -379,7 +232,7 @@ def process(wb, args) -> int:
 
 def main(args):
     try:
-        wb = xw.apps.active.books.active
+        wb = open_workbook_by_args(args)
         return process(wb, args)
     except Exception as e:
         logging_exception("無法找到作用中的 Excel 工作簿！", e)
@@ -392,5 +245,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--test", action="store_true")
     parser.add_argument("--new", action="store_true")
+    parser.add_argument("--quiet", action="store_true", help="不逐字列印處理進度")
+    add_backend_arguments(parser)
+    add_build_arguments(parser)
+    add_output_arguments(parser)
     args = parser.parse_args()
     sys.exit(main(args))
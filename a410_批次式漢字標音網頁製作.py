@@ -1,5 +1,5 @@
 """
-a410_批次式漢字標音網頁製作.py v0.0.2
+a410_批次式漢字標音網頁製作.py v0.0.8
 
 功能說明：
 【漢字注音】工作表中，轉成 HTML 網頁檔案，並另存新檔到指定目錄。
@@ -7,15 +7,26 @@ a410_批次式漢字標音網頁製作.py v0.0.2
 變更紀錄：
 - v0.0.1 (2026-03-05): 初始版本。
 - v0.0.2 (2026-03-10): 調整【工作清單】之設定，新增【純閩拼】、【純閩拼調號】兩種標音方法的設定。
+- v0.0.3 (2026-10-18): 新增 --backend 及 --file 參數：可改用 openpyxl 後端，不經 Excel 直接處理 .xlsx 檔。
+- v0.0.4 (2026-10-18): 不再逐一改寫【env】工作表之【標音方式】、【上邊標音】、【右邊標音】並重跑 a400：
+  【漢字注音】工作表僅讀取一次，各音標於每種標音方法僅轉換一次，一次産出【工作清單】所列之各種網頁；
+  新增 --tasks 參數（自 JSON 檔載入工作清單）及 --jobs 參數（以多個工作程序平行輸出網頁）。
+- v0.0.5 (2026-10-18): 依【網站建置清單】，僅重建文章內容或製作設定有變更之網頁；新增 --force 及 --dry-run 參數。
+- v0.0.6 (2026-10-18): 網頁內嵌本頁音標之【標音對照表】；各種標音組合之網頁共用同一份轉換結果。
+- v0.0.7 (2026-10-18): 文章圖片改以 <picture>/srcset 引用 WebP/JPEG 衍生檔；各網頁共用同一份衍生檔。
+- v0.0.8 (2026-10-18): 新增 --compact 及 --precompress 參數：輸出精簡網頁及 .gz／.br 預先壓縮檔。
 """
 
+import json
 import logging
+import os
 import sys
 from pathlib import Path
 
 import xlwings as xw
 
-from a400_製作標音網頁 import process as a400_process
+from a400_製作標音網頁 import build_head_extra, build_output_file_name
+from mod_excel_access import get_value_by_name
 from mod_logging import (
     init_logging,
     logging_exc_error,
@@ -23,7 +34,12 @@ from mod_logging import (
     logging_process_step,
     logging_warning,  # noqa: F401
 )
+from mod_活頁簿 import add_backend_arguments, open_workbook_by_args
 from mod_程式 import ExcelCell, Program
+from mod_標音網頁 import PIAU_IM_TABLE_HUAT, build_pages, read_article_lines
+from mod_網站建置 import BuildManifest, add_build_arguments
+from mod_網頁圖片 import header_image_html
+from mod_網頁壓縮 import add_output_arguments
 
 # =========================================================================
 # 常數定義
@@ -36,12 +52,52 @@ EXIT_CODE_SAVE_FAILURE = 3  # 儲存失敗
 EXIT_CODE_PROCESS_FAILURE = 10  # 過程失敗
 EXIT_CODE_UNKNOWN_ERROR = 99  # 未知錯誤
 
+# 待製作網頁之預設【工作清單】：{名稱: {ruby_format: 標音方式, up: 上邊標音, right: 右邊標音}}
+# 另可加 format（網頁格式）；未設定者，依 ruby_format 推定（見 han_ji_piau_im_format_of()）
+DEFAULT_PIAU_IM_TASK_LIST = {
+    # "純方音符號": {"ruby_format": "右", "up": None, "right": "方音符號"},
+    # "純閩拼": {"ruby_format": "上", "up": "閩拼調符", "right": None},
+    # "純閩拼調號": {"ruby_format": "上", "up": "閩拼調號", "right": None},
+    "雅俗通+方音符號": {"ruby_format": "上及右", "up": "雅俗通", "right": "方音符號"},
+    "閩拼+方音符號": {"ruby_format": "上及右", "up": "閩拼調符", "right": "方音符號"},
+    "台語音標+方音符號": {"ruby_format": "上及右", "up": "台語音標", "right": "方音符號"},
+    "台語音標+十五音": {"ruby_format": "上及右", "up": "台語音標", "right": "雅俗通"},
+}
+
 # =========================================================================
 # 設定日誌
 # =========================================================================
 init_logging()
 
 
+# =========================================================================
+# 工作清單
+# =========================================================================
+def load_piau_im_task_list(file_path: str = None) -> dict:
+    """
+    載入【工作清單】：未指定檔案者，使用 DEFAULT_PIAU_IM_TASK_LIST。
+
+    JSON 檔之格式同 DEFAULT_PIAU_IM_TASK_LIST，如：
+        {"台語音標+方音符號": {"ruby_format": "上及右", "up": "台語音標", "right": "方音符號"}}
+    """
+    if not file_path:
+        return DEFAULT_PIAU_IM_TASK_LIST
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def han_ji_piau_im_format_of(piau_im_task: dict) -> str:
+    """依【標音方式】推定網頁格式：上及右 → 雙排（DBL）；僅右 → 方音符號（TPS）；僅上 → 拼音（TL）"""
+    ruby_format = str(piau_im_task.get("ruby_format") or "")
+    siong = "上" in ruby_format and piau_im_task.get("up")
+    zian = "右" in ruby_format and piau_im_task.get("right")
+    if siong and zian:
+        return "DBL"
+    if zian:
+        return "TPS"
+    return "TL"
+
+
 # =========================================================================
 # 資料類別：儲存處理配置
 # =========================================================================
@@ -181,7 +237,6 @@ def process(wb, args) -> int:
     # 處理作業
     # ------------------------------------------------------------------------------
     try:
-        # 使用【漢字注音】工作表複製新工作表
         try:
             sheet_name = "漢字注音"
             source_sheet = wb.sheets[sheet_name]
@@ -189,86 +244,76 @@ def process(wb, args) -> int:
             raise ValueError(f"無法找到【'{sheet_name}'】工作表：{e}")
 
         # 待製作網頁之【工作清單】
-        piau_im_task_list = {
-            # "純方音符號": {
-            #     "ruby_format": "右",
-            #     "up": None,
-            #     "right": "方音符號",
-            # },
-            # "純閩拼": {
-            #     "ruby_format": "上",
-            #     "up": "閩拼調符",
-            #     "right": None,
-            # },
-            # "純閩拼調號": {
-            #     "ruby_format": "上",
-            #     "up": "閩拼調號",
-            #     "right": None,
-            # },
-            "雅俗通+方音符號": {
-                "ruby_format": "上及右",
-                "up": "雅俗通",
-                "right": "方音符號",
-            },
-            "閩拼+方音符號": {
-                "ruby_format": "上及右",
-                "up": "閩拼調符",
-                "right": "方音符號",
-            },
-            "台語音標+方音符號": {
-                "ruby_format": "上及右",
-                "up": "台語音標",
-                "right": "方音符號",
-            },
-            "台語音標+十五音": {
-                "ruby_format": "上及右",
-                "up": "台語音標",
-                "right": "雅俗通",
-            },
-        }
-
-        # 備份原始的【漢字標章格式】設定值，以便後續還原
-        org_han_ji_piau_im_format = program.han_ji_piau_im_format
-        org_siong_pinn_piau_im = program.siong_pinn_piau_im
-        org_zian_pinn_piau_im = program.zian_pinn_piau_im
-
-        # 開始依【工作清單】之設定産出網頁
-        for piau_im_task in piau_im_task_list.keys():
-            # 取出 piau_im_task_list 之 key 索引值
-            piau_im_task_name = piau_im_task
-
-            # 依據取出之【工作項目】，依其網頁之漢字標章格式設定，變更【env】工作表之設定值，以供【漢字注音】工作表之儲存格處理器使用。
-            program.wb.names["標音方式"].refers_to_range.value = piau_im_task_list[
-                piau_im_task
-            ]["ruby_format"]
-            program.wb.names["上邊標音"].refers_to_range.value = piau_im_task_list[
-                piau_im_task
-            ]["up"]
-            program.wb.names["右邊標音"].refers_to_range.value = piau_im_task_list[
-                piau_im_task
-            ]["right"]
-
-            # 顯示目前處理的標音方法
-            print("=" * 80)
+        piau_im_task_list = load_piau_im_task_list(getattr(args, "tasks", None))
+
+        # 【漢字注音】工作表僅讀取一次，供各標音組合之網頁共用
+        lines = read_article_lines(source_sheet, program)
+        total_chars_per_line = get_value_by_name(wb=wb, name="網頁每列字數")
+        os.makedirs("docs", exist_ok=True)
+        dry_run = getattr(args, "dry_run", False)
+        image_html = header_image_html(program.image_url, alt=program.title, generate=not dry_run)
+
+        tasks = []
+        for piau_im_task_name, piau_im_task in piau_im_task_list.items():
+            han_ji_piau_im_format = piau_im_task.get("format") or han_ji_piau_im_format_of(piau_im_task)
+            siong_pinn_piau_im = piau_im_task.get("up")
+            zian_pinn_piau_im = piau_im_task.get("right")
+            output_file = build_output_file_name(
+                program,
+                han_ji_piau_im_format=han_ji_piau_im_format,
+                siong_pinn_piau_im=siong_pinn_piau_im,
+                zian_pinn_piau_im=zian_pinn_piau_im,
+            )
             print(
-                f"開始製作【{piau_im_task_name}】標音網頁：漢字上方：{program.siong_pinn_piau_im}，漢字右方：{program.zian_pinn_piau_im}..."
+                f"製作【{piau_im_task_name}】標音網頁：漢字上方：{siong_pinn_piau_im}，漢字右方：{zian_pinn_piau_im} ==> {output_file}"
+            )
+            tasks.append(
+                {
+                    "output_path": os.path.join("docs", output_file),
+                    "renderer": {
+                        "han_ji_piau_im_format": han_ji_piau_im_format,
+                        "siong_pinn_piau_im": siong_pinn_piau_im,
+                        "zian_pinn_piau_im": zian_pinn_piau_im,
+                        "piau_im_hong_sik": piau_im_task.get("ruby_format"),
+                        "total_chars_per_line": total_chars_per_line,
+                        "piau_im_table": PIAU_IM_TABLE_HUAT,
+                    },
+                    "page": {
+                        "title": program.title,
+                        "image_url": program.image_url,
+                        "web_page_stem": os.path.splitext(output_file)[0],
+                        "image_html": image_html,
+                        "head_extra": build_head_extra(
+                            wb,
+                            {
+                                "網頁格式": han_ji_piau_im_format,
+                                "上邊標音": siong_pinn_piau_im,
+                                "右邊標音": zian_pinn_piau_im,
+                            },
+                        ),
+                    },
+                    "output": {
+                        "compact": getattr(args, "compact", False),
+                        "precompress": getattr(args, "precompress", False),
+                    },
+                }
             )
 
-            # 處理整張工作表的各個儲存格
-            try:
-                source_sheet.activate()
-                a400_process(wb, args)
-            except Exception as e:
-                logging_exception(
-                    msg=f"在【{sheet_name}】工作表，為【漢字】標注{program.piau_im_huat}【漢字標音】作業，發生例外！",
-                    error=e,
-                )
-                raise
-
-        # 還原【漢字標音格式】設定值
-        program.wb.names["標音方式"].refers_to_range.value = org_han_ji_piau_im_format
-        program.wb.names["上邊標音"].refers_to_range.value = org_siong_pinn_piau_im
-        program.wb.names["右邊標音"].refers_to_range.value = org_zian_pinn_piau_im
+        # 依【網站建置清單】，僅重建來源內容或製作設定有變更之網頁
+        with BuildManifest() as manifest:
+            rebuilt = build_pages(
+                program.piau_im,
+                lines,
+                tasks,
+                manifest,
+                source=getattr(wb, "fullname", ""),
+                force=getattr(args, "force", False),
+                dry_run=dry_run,
+                jobs=getattr(args, "jobs", 1) or 1,
+            )
+        for path, reason in rebuilt:
+            print(f"{'須重建' if dry_run else '已重建'}：{path}（{reason}）")
+        print(f"共 {len(tasks)} 個網頁，{'須' if dry_run else '已'}重建 {len(rebuilt)} 個。")
     except Exception as e:
         logging_exception(
             msg=f"程式：{program.program_name} ，執行時發生異常問題！",
@@ -308,9 +353,9 @@ def main(args) -> int:
     # (2) 設定【作用中活頁簿】：偵測及獲取 Excel 已開啟之活頁簿檔案。
     # =========================================================================
     try:
-        # 取得 Excel 活頁簿
+        # 取得 Excel 活頁簿（--backend openpyxl 時，直接開啟 --file 指定之 .xlsx 檔）
         wb = None
-        wb = xw.apps.active.books.active
+        wb = open_workbook_by_args(args)
     except Exception as e:
         logging.error(f"無法找到作用中的 Excel 工作簿: {e}")
         return EXIT_CODE_NO_FILE
@@ -375,6 +420,8 @@ if __name__ == "__main__":
   python ao00_xyz.py            # 執行一般模式
   python ao00_xyz.py -new       # 建立新的字庫工作表
   python ao00_xyz.py -test      # 執行測試模式
+  python a410_批次式漢字標音網頁製作.py --backend openpyxl --file Tai_Gi_Zu_Im_Bun.xlsx  # 不經 Excel，直接處理 .xlsx 檔
+  python a410_批次式漢字標音網頁製作.py --tasks tasks.json --jobs 4  # 自 JSON 檔載入工作清單，4 個工作程序平行輸出
 """,
     )
     parser.add_argument(
@@ -387,6 +434,19 @@ if __name__ == "__main__":
         action="store_true",
         help="建立新的字庫工作表",
     )
+    parser.add_argument(
+        "--tasks",
+        help="工作清單之 JSON 檔（未指定者，使用預設之工作清單）",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="平行輸出網頁之工作程序數",
+    )
+    add_backend_arguments(parser)
+    add_build_arguments(parser)
+    add_output_arguments(parser)
     args = parser.parse_args()
     new_piau_im_sheets = args.new
     test_mode = args.test
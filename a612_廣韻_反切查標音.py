@@ -4,6 +4,7 @@
 import os
 import sqlite3
 import sys
+from functools import lru_cache
 
 from mod_廣韻 import (  # TL_Tng_Sip_Ngoo_Im,
     Kong_Un_Siann_Tiau_Tng_Tai_Loo,
@@ -13,35 +14,23 @@ from mod_廣韻 import (  # TL_Tng_Sip_Ngoo_Im,
 )
 from mod_標音 import PiauIm
 
-if __name__ == "__main__":
-    # 初始化 PiauIm 類別，産生標音物件
-    # piau_im = PiauIm(han_ji_khoo='廣韻')
-    piau_im = PiauIm()
-
-    # 確認使用者有輸入反切之切語參數
-    if len(sys.argv) != 2:
-        print("請輸入欲查詢讀音之【切語】(反切上字及下字)!")
-        sys.exit(-1)
-
-    ciat_gu = sys.argv[1]
-
-    # 檢查反切拼音是否有兩個字
-    if len(ciat_gu) != 2:
-        print("反切用的切語，必須有兩個漢字！")
-        sys.exit(-1)
-
+def huan_ciat_ca_piau_im(ciat_gu, piau_im, ca_piau_im, ca_siann_bu, ca_un_bu):
+    """
+    依【切語】反切出讀音，並顯示結果。
+
+    :param ciat_gu: 切語（反切上字及下字）
+    :param piau_im: 標音物件
+    :param ca_piau_im: 以漢字查詢讀音之函數
+    :param ca_siann_bu: 以聲母標音查詢聲母其它標音之函數
+    :param ca_un_bu: 以韻母標音查詢韻母其它標音之函數
+    :return: 是否反切出讀音
+    """
     siong_ji, ha_ji = ciat_gu[0], ciat_gu[1]
 
-    # 建立資料庫連線
-    connection = sqlite3.connect('Kong_Un.db')
-    cursor = connection.cursor()
-
-    os.system('cls')
-
-    切語上字 = han_ji_ca_piau_im(cursor, siong_ji)
+    切語上字 = ca_piau_im(siong_ji)
     if not 切語上字:
         print(f"切語上字：【{siong_ji}】找不到，無法反切出讀音！")
-        sys.exit(-1)
+        return False
 
     for record in 切語上字:
         切語上字 = record["漢字"]
@@ -56,7 +45,7 @@ if __name__ == "__main__":
         七聲類 = record['七聲類']
         清濁 = record['清濁']
         發送收 = record['發送收']
-        聲母其它標音 = ca_siann_bu_piau_im(cursor, 聲母標音)
+        聲母其它標音 = ca_siann_bu(聲母標音)
         聲母國際音標 = 聲母其它標音[0]['國際音標']
         聲母方音符號 = 聲母其它標音[0]['方音符號']
         print('\n---------------------------------------')
@@ -67,11 +56,11 @@ if __name__ == "__main__":
             print(f"聲母：{聲母} [{聲母標音}]，國際音標：/{聲母國際音標}/，方音符號：{聲母方音符號}")
         print(f"(發音部位：{七聲類}，清濁：{清濁}，發送收：{發送收})")
 
-        切語下字 = han_ji_ca_piau_im(cursor, ha_ji)
+        切語下字 = ca_piau_im(ha_ji)
         if not 切語下字:
             print('\n---------------------------------------')
             print(f"切語下字：【{ha_ji}】找不到，無法反切出讀音！")
-            sys.exit(-1)
+            return False
 
         for record in 切語下字:
             切語下字 = record["漢字"]
@@ -90,7 +79,7 @@ if __name__ == "__main__":
             等 = record['等']
             呼 = record['呼']
             等呼 = record['等呼']
-            韻母其它標音 = ca_un_bu_piau_im(cursor, 韻母標音)
+            韻母其它標音 = ca_un_bu(韻母標音)
             韻母國際音標 = 韻母其它標音[0]['國際音標']
             韻母方音符號 = 韻母其它標音[0]['方音符號']
             print(f"韻母：{韻母} [{韻母標音}]，國際音標：/{韻母國際音標}/，方音符號：{韻母方音符號}")
@@ -128,5 +117,43 @@ if __name__ == "__main__":
             print(f'方音符號：{聲母方音符號}{韻母方音符號}{方音符號調符}')
             print(f'十五音切韻：{十五音切韻}')
 
+    return True
+
+
+if __name__ == "__main__":
+    # 初始化 PiauIm 類別，産生標音物件
+    # piau_im = PiauIm(han_ji_khoo='廣韻')
+    piau_im = PiauIm()
+
+    # 確認使用者有輸入反切之切語參數（可一次輸入多個切語）
+    if len(sys.argv) < 2:
+        print("請輸入欲查詢讀音之【切語】(反切上字及下字)!")
+        sys.exit(-1)
+
+    切語列表 = sys.argv[1:]
+
+    # 檢查反切拼音是否有兩個字
+    for ciat_gu in 切語列表:
+        if len(ciat_gu) != 2:
+            print(f"反切用的切語，必須有兩個漢字：【{ciat_gu}】")
+            sys.exit(-1)
+
+    # 建立資料庫連線
+    connection = sqlite3.connect('Kong_Un.db')
+    cursor = connection.cursor()
+
+    # 批次查詢時，同一上字、下字、聲母、韻母，僅查詢資料庫一次
+    ca_piau_im = lru_cache(maxsize=None)(lambda han_ji: han_ji_ca_piau_im(cursor, han_ji))
+    ca_siann_bu = lru_cache(maxsize=None)(lambda siann_bu: ca_siann_bu_piau_im(cursor, siann_bu))
+    ca_un_bu = lru_cache(maxsize=None)(lambda un_bu: ca_un_bu_piau_im(cursor, un_bu))
+
+    os.system('cls')
+
+    exit_code = 0
+    for ciat_gu in dict.fromkeys(切語列表):
+        if not huan_ciat_ca_piau_im(ciat_gu, piau_im, ca_piau_im, ca_siann_bu, ca_un_bu):
+            exit_code = -1
+
     # 關閉資料庫連線
-    connection.close()
\ No newline at end of file
+    connection.close()
+    sys.exit(exit_code)
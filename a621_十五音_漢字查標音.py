@@ -5,7 +5,7 @@ import os
 import sqlite3
 import sys
 
-from mod_十五音 import han_ji_ca_piau_im
+from mod_十五音 import ensure_han_ji_piau_soo_in, han_ji_ca_piau_im
 
 if __name__ == "__main__":
     # 確認使用者有輸入反切之切語參數
@@ -19,6 +19,8 @@ if __name__ == "__main__":
     # 建立資料庫連線
     connection = sqlite3.connect('雅俗通十五音字典.db')
     cursor = connection.cursor()
+    # 以【漢字】查詢時使用之涵蓋索引（首次執行時建立）
+    ensure_han_ji_piau_soo_in(cursor)
 
     han_ji_piau_im = han_ji_ca_piau_im(cursor, beh_ca_e_han_ji)
 
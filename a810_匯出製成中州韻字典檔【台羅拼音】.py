@@ -5,16 +5,29 @@
 # 將【Ho_Lok_Ue.db】/【漢字庫】資料表內的漢字讀音紀錄匯出，製成
 # 中州韻輸入方案字典檔（.yaml）檔案：ji_khoo_tl.dict.yaml。
 #
+# 增量匯出：
+# 匯出後，將【漢字庫】之【浮水印】（max(更新時間, 最近揀用時間)、筆數、
+# 最大識別號）及字典檔內容之雜湊值，記錄於【匯出狀態檔】。再次執行時：
+#   - 浮水印未變動，且字典檔內容與記錄相符者：不重新產生字典檔；
+#   - 浮水印已變動者：重新產生字典檔；內容與上次相同者，不覆寫檔案；
+#   - 目標目錄之字典檔，僅於內容不同時才複製。
+# 字典檔之寫入，先寫至暫存檔，再以更名（os.replace）取代原檔。
+# 以 --force 參數執行者，一律重新產生字典檔。
+#
 # =========================================================================
 
 # =========================================================================
 # 載入程式所需套件/模組
 # =========================================================================
+import hashlib
+import json
 import logging
 import os
 import shutil
 import sqlite3
 import sys
+import tempfile
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -44,39 +57,20 @@ EXIT_CODE_INVALID_INPUT = 2
 EXIT_CODE_PROCESS_FAILURE = 3
 EXIT_CODE_UNKNOWN_ERROR = 99
 
-# =========================================================================
-# 功能：將資料庫「漢字庫」資料表匯出為符合 RIME 字典格式的 YAML 檔
-# =========================================================================
-def export_database_to_rime_yaml():
-    r"""
-    從資料庫讀取【漢字庫】資料，產生符合中州韻輸入法引擎字典規格的 YAML 檔，
-    檔名為 tl_ji_khoo_peh_ue.yaml，接著將此檔案複製到下列兩個目錄：
-      - C:\Users\AlanJui\AppData\Roaming\Rime\
-      - Z:\home\alanjui\workspace\rime\rime-tlpa\
-    """
-    conn = None
-    try:
-        # 連接資料庫並讀取資料表內容
-        # 【漢字庫】資料表現行結構：識別號、漢字、台羅音標、常用度、摘要說明、更新時間、最近揀用時間。
-        # 排序規則與查音邏輯（mod_ca_ji_tian.py）一致：同漢字之多筆讀音，
-        # 依【常用度】由大至小；常用度相同時，依【最近揀用時間】由新至舊。
-        conn = sqlite3.connect(DB_HO_LOK_UE)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT 漢字, 台羅音標, 常用度, 摘要說明, 更新時間, 最近揀用時間
-            FROM 漢字庫
-            ORDER BY 漢字 ASC,
-                     COALESCE(常用度, 0) DESC,
-                     COALESCE(最近揀用時間, '') DESC;
-            """
-        )
-        rows = cursor.fetchall()
+# 字典檔
+OUTPUT_FILENAME = "tl_ji_khoo_peh_ue.dict.yaml"
+# 匯出狀態檔：記錄上次匯出之浮水印及字典檔內容雜湊值
+EXPORT_STATE_FILENAME = "tl_ji_khoo_peh_ue.export_state.json"
+# 字典檔複製之目標目錄
+DEST_DIRS = [
+    r"C:\Users\AlanJui\AppData\Roaming\Rime",
+    r"C:\Users\AlanJui\work\rime-tlpa"
+]
 
-        # ---------------------------------------------------------------------
-        # 定義 RIME 字典檔的標頭內容（Header）
-        # ---------------------------------------------------------------------
-        header_content = """# Rime dictionary
+# ---------------------------------------------------------------------
+# RIME 字典檔的標頭內容（Header）
+# ---------------------------------------------------------------------
+HEADER_CONTENT = """# Rime dictionary
 # encoding: utf-8
 #
 # Ho_Lok_Ue.db/漢字庫資料表轉製成中州韻輸入方案字典檔
@@ -98,56 +92,198 @@ import_tables:
   - ji_khoo_su_lui
 ...
 """
+
+
+# =========================================================================
+# 工具函式
+# =========================================================================
+@lru_cache(maxsize=None)
+def tl_tng_tlpa(tai_lo_im_piau: str) -> str:
+    """將【台羅音標】轉換為 TLPA；【漢字庫】僅數千種音節，同一音節只轉換一次"""
+    return convert_tl_to_tlpa(tai_lo_im_piau) or ""
+
+
+def query_watermark(conn) -> dict:
+    """
+    查詢【漢字庫】之浮水印：各筆紀錄 max(更新時間, 最近揀用時間) 之最大值、筆數及最大識別號。
+    新增、更新讀音會令時間推進；刪除紀錄則令筆數或最大識別號改變。
+    """
+    row = conn.execute(
+        """
+        SELECT MAX(MAX(COALESCE(更新時間, ''), COALESCE(最近揀用時間, ''))),
+               COUNT(*),
+               MAX(識別號)
+        FROM 漢字庫;
+        """
+    ).fetchone()
+    return {"更新時間": row[0] or "", "筆數": row[1], "最大識別號": row[2] or 0}
+
+
+def load_export_state(state_filename: str) -> dict:
+    """讀取匯出狀態檔；檔案不存在或格式有誤者，傳回空字典"""
+    try:
+        with open(state_filename, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_file_atomic(filename: str, content: str) -> None:
+    """先寫入同目錄之暫存檔，再以 os.replace 取代原檔，避免讀取端讀到寫到一半的檔案"""
+    dir_name = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        # mkstemp 建立之暫存檔僅限擁有者讀寫；沿用原檔之權限
+        if os.path.exists(filename):
+            shutil.copymode(filename, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_export_state(state_filename: str, state: dict) -> None:
+    write_file_atomic(state_filename, json.dumps(state, ensure_ascii=False, indent=2))
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def file_hash(filename: str):
+    """檔案內容之雜湊值；檔案不存在者，傳回 None"""
+    try:
+        with open(filename, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def build_rime_dict_content(rows) -> str:
+    """
+    將【漢字庫】資料轉換成符合字典檔格式的內容。
+    資料行以 tab 字元分隔各欄： text, code, weight, stem, create
+    """
+    data_lines = []
+    for row in rows:
+        # 查詢結果欄位依序：漢字, 台羅音標, 常用度, 摘要說明, 更新時間, 最近揀用時間
+        han_ji, tai_lo_im_piau, siong_iong_too, zik_iau, kenn_sin_si, kin_king_si = row
+        text = han_ji if han_ji is not None else ""
+        # 將「台羅音標」轉換為 TLPA
+        code = tl_tng_tlpa(tai_lo_im_piau) if tai_lo_im_piau is not None else ""
+        weight = str(siong_iong_too) if siong_iong_too is not None else ""
+        # 摘要說明若為 NULL 或空白，一律填入 'NA' 佔位：避免該欄留空時，
+        # 在無法顯示 Tab 控制字元的文字編輯器中，被誤認為多餘空白而遭刪除，
+        # 破壞 RIME 字典檔以 Tab 分欄的結構。
+        stem = zik_iau if zik_iau is not None and str(zik_iau).strip() != "" else "NA"
+        # create 欄：取【最近揀用時間】（人工揀用之讀音較具參考性），無則取【更新時間】
+        create = kin_king_si or kenn_sin_si or ""
+        # 組成一行（以 tab 分隔）
+        data_lines.append(f"{text}\t{code}\t{weight}\t{stem}\t{create}")
+
+    # header 與資料間需有換行
+    return HEADER_CONTENT + "\n" + "\n".join(data_lines)
+
+
+def copy_to_dest_dirs(output_filename: str, output_hash: str, dest_dirs) -> None:
+    """將字典檔複製到各目標目錄；目標目錄已有相同內容之字典檔者，不再複製"""
+    for dest in dest_dirs:
+        if not os.path.exists(dest):
+            logging.warning("目標目錄不存在: %s", dest)
+            print(f"⚠️ 目標目錄不存在: {dest}")
+            continue
+        dest_file = os.path.join(dest, os.path.basename(output_filename))
+        if file_hash(dest_file) == output_hash:
+            print(f"ℹ️ {dest} 之 RIME 字典檔已是最新，不需複製")
+            continue
+        tmp_file = dest_file + ".tmp"
+        shutil.copy(output_filename, tmp_file)
+        os.replace(tmp_file, dest_file)
+        print(f"✅ RIME 字典檔已複製到 {dest}")
+        logging.info("RIME dictionary copied to: %s", dest_file)
+
+
+# =========================================================================
+# 功能：將資料庫「漢字庫」資料表匯出為符合 RIME 字典格式的 YAML 檔
+# =========================================================================
+def export_database_to_rime_yaml(
+    force: bool = False,
+    db_name: str = DB_HO_LOK_UE,
+    output_filename: str = OUTPUT_FILENAME,
+    state_filename: str = EXPORT_STATE_FILENAME,
+    dest_dirs=None,
+):
+    r"""
+    從資料庫讀取【漢字庫】資料，產生符合中州韻輸入法引擎字典規格的 YAML 檔，
+    檔名為 tl_ji_khoo_peh_ue.yaml，接著將此檔案複製到下列兩個目錄：
+      - C:\Users\AlanJui\AppData\Roaming\Rime\
+      - Z:\home\alanjui\workspace\rime\rime-tlpa\
+
+    【漢字庫】自上次匯出後未曾異動者，不重新產生字典檔（force=True 者除外）。
+    """
+    if dest_dirs is None:
+        dest_dirs = DEST_DIRS
+    conn = None
+    try:
+        conn = sqlite3.connect(db_name)
+        watermark = query_watermark(conn)
+        state = load_export_state(state_filename)
+        output_hash = state.get("內容雜湊")
+
         # ---------------------------------------------------------------------
-        # 處理資料表中每一筆資料，轉換成符合字典檔格式的資料行
-        # 資料行以 tab 字元分隔各欄： text, code, weight, stem, create
+        # 浮水印未變動，且字典檔未遭改動者：不需重新產生
         # ---------------------------------------------------------------------
-        data_lines = []
-        for row in rows:
-            # 查詢結果欄位依序：漢字, 台羅音標, 常用度, 摘要說明, 更新時間, 最近揀用時間
-            han_ji, tai_lo_im_piau, siong_iong_too, zik_iau, kenn_sin_si, kin_king_si = row
-            text = han_ji if han_ji is not None else ""
-            # 將「台羅音標」轉換為 TLPA
-            code = convert_tl_to_tlpa(tai_lo_im_piau) if tai_lo_im_piau is not None else ""
-            weight = str(siong_iong_too) if siong_iong_too is not None else ""
-            # 摘要說明若為 NULL 或空白，一律填入 'NA' 佔位：避免該欄留空時，
-            # 在無法顯示 Tab 控制字元的文字編輯器中，被誤認為多餘空白而遭刪除，
-            # 破壞 RIME 字典檔以 Tab 分欄的結構。
-            stem = zik_iau if zik_iau is not None and str(zik_iau).strip() != "" else "NA"
-            # create 欄：取【最近揀用時間】（人工揀用之讀音較具參考性），無則取【更新時間】
-            create = kin_king_si or kenn_sin_si or ""
-            # 組成一行（以 tab 分隔）
-            line = f"{text}\t{code}\t{weight}\t{stem}\t{create}"
-            data_lines.append(line)
+        if (
+            not force
+            and state.get("浮水印") == watermark
+            and output_hash is not None
+            and file_hash(output_filename) == output_hash
+        ):
+            print(f"ℹ️ 【漢字庫】自上次匯出後未曾異動，RIME 字典檔已是最新: {output_filename}")
+            logging.info("RIME dictionary is up to date: %s", output_filename)
+            copy_to_dest_dirs(output_filename, output_hash, dest_dirs)
+            return EXIT_CODE_SUCCESS
+
+        # 連接資料庫並讀取資料表內容
+        # 【漢字庫】資料表現行結構：識別號、漢字、台羅音標、常用度、摘要說明、更新時間、最近揀用時間。
+        # 排序規則與查音邏輯（mod_ca_ji_tian.py）一致：同漢字之多筆讀音，
+        # 依【常用度】由大至小；常用度相同時，依【最近揀用時間】由新至舊。
+        rows = conn.execute(
+            """
+            SELECT 漢字, 台羅音標, 常用度, 摘要說明, 更新時間, 最近揀用時間
+            FROM 漢字庫
+            ORDER BY 漢字 ASC,
+                     COALESCE(常用度, 0) DESC,
+                     COALESCE(最近揀用時間, '') DESC;
+            """
+        ).fetchall()
 
         # ---------------------------------------------------------------------
-        # 將 header 與資料行寫入檔案
+        # 產生字典檔內容；內容與現有字典檔相同者，不覆寫檔案
         # ---------------------------------------------------------------------
-        output_filename = "tl_ji_khoo_peh_ue.dict.yaml"
-        with open(output_filename, "w", encoding="utf-8") as f:
-            f.write(header_content)
-            f.write("\n")  # 確保 header 與資料間有換行
-            f.write("\n".join(data_lines))
+        content = build_rime_dict_content(rows)
+        output_hash = content_hash(content)
+        if file_hash(output_filename) == output_hash:
+            print("ℹ️ RIME 字典檔內容未變動:", output_filename)
+        else:
+            write_file_atomic(output_filename, content)
+            print("✅ RIME 字典檔已產生:", output_filename)
+            logging.info("RIME dictionary exported: %s", output_filename)
 
-        print("✅ RIME 字典檔已產生:", output_filename)
-        logging.info("RIME dictionary exported: %s", output_filename)
+        save_export_state(
+            state_filename,
+            {"浮水印": watermark, "內容雜湊": output_hash, "字典檔": output_filename},
+        )
 
         # ---------------------------------------------------------------------
         # 將產生的 YAML 檔案複製到指定的兩個目錄
         # ---------------------------------------------------------------------
-        dest_dirs = [
-            r"C:\Users\AlanJui\AppData\Roaming\Rime",
-            r"C:\Users\AlanJui\work\rime-tlpa"
-        ]
-        for dest in dest_dirs:
-            if not os.path.exists(dest):
-                logging.warning("目標目錄不存在: %s", dest)
-                print(f"⚠️ 目標目錄不存在: {dest}")
-                continue
-            dest_file = os.path.join(dest, output_filename)
-            shutil.copy(output_filename, dest_file)
-            print(f"✅ RIME 字典檔已複製到 {dest}")
-            logging.info("RIME dictionary copied to: %s", dest_file)
+        copy_to_dest_dirs(output_filename, output_hash, dest_dirs)
 
         return EXIT_CODE_SUCCESS
 
@@ -169,11 +305,14 @@ def main():
     執行模式預設為 rime（匯出 RIME 字典檔），
     也可從命令列傳入參數來指定模式，例如：
       python this_script.py rime
+      python this_script.py rime --force   # 不論【漢字庫】是否異動，一律重新產生
     """
-    mode = sys.argv[1] if len(sys.argv) > 1 else "rime"
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    force = "--force" in sys.argv[1:]
+    mode = args[0] if args else "rime"
 
     if mode == "rime":
-        return export_database_to_rime_yaml()
+        return export_database_to_rime_yaml(force=force)
     else:
         print("❌ 錯誤：請輸入有效模式 ('rime')")
         return EXIT_CODE_INVALID_INPUT
@@ -1,5 +1,5 @@
 """
-a940_自Excel轉製html檔.py v0.0.6
+a940_自Excel轉製html檔.py v0.0.7
 
 功能：
     參考 a400_製作標音網頁.py 之作法，將 Excel 檔中的【漢字標音】（即：雅俗通十五音）
@@ -15,6 +15,7 @@ a940_自Excel轉製html檔.py v0.0.6
  - v0.0.4 (2026/2/24): 改成使用 Program 類別，套用 mod_程式.py 的架構，並嘗試使用 mod_標音.py 的 PiauIm 物件來進行【台語音標】轉換【漢字標音】的功能。
  - v0.0.5 (2024/2/24): 調整 HTML 結構，將圖片放在標題與內容之間，並修正一些細節。
  - v0.0.6 (2024/2/24): 自Excel工作表讀出的【第一個段落】，會自動切割成兩個段落：標題、作者。
+ - v0.0.7 (2026/10/18): 新增 --compact 及 --precompress 參數：輸出精簡網頁及 .gz／.br 預先壓縮檔，並列印網頁大小報告（mod_網頁壓縮）。
 """
 
 import logging
@@ -31,6 +32,7 @@ from mod_logging import (
 )
 from mod_標音 import format_han_ji_piau_im
 from mod_程式 import Program
+from mod_網頁壓縮 import add_output_arguments, format_size_report, write_html
 
 # 嘗試載入 mod_標音
 try:
@@ -119,7 +121,7 @@ def tai_gi_im_piau_tng_huan(
         return format_han_ji_piau_im(han_ji_piau_im)
 
 
-def export_excel_to_html(program, output_path):
+def export_excel_to_html(program, output_path, compact=False, precompress=False):
     # 連接 Excel
     try:
         wb = program.wb
@@ -448,8 +450,12 @@ def export_excel_to_html(program, output_path):
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_template)
+        if compact or precompress:
+            report = write_html(output_path, html_template, compact=compact, precompress=precompress)
+            print(format_size_report(report))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(html_template)
         print(f"成功輸出 HTML 至: {output_path}")
     except Exception as e:
         print(f"寫入檔案失敗: {e}")
@@ -500,7 +506,12 @@ def process(wb, args) -> int:
     # ------------------------------------------------------------------------------
     try:
         output_file = args.output_file
-        export_excel_to_html(program, output_file)
+        export_excel_to_html(
+            program,
+            output_file,
+            compact=getattr(args, "compact", False),
+            precompress=getattr(args, "precompress", False),
+        )
     except Exception as e:
         logging_exception(
             msg=f"程式：{program.program_name} ，執行時發生異常問題！",
@@ -610,6 +621,7 @@ if __name__ == "__main__":
   python a940.py                                # 執行一般模式
   python a940.py --output_file <output_file>    # 建立新的字庫工作表
   python a940.py --test                         # 執行測試模式
+  python a940.py --compact --precompress        # 輸出精簡網頁及 .gz／.br 預先壓縮檔
 """,
     )
     parser.add_argument(
@@ -626,6 +638,7 @@ if __name__ == "__main__":
         default=output_file,
         help="輸出 HTML 檔案的路徑 (預設: docs/output_from_excel.html)",
     )
+    add_output_arguments(parser)
     args = parser.parse_args()
 
     if args.test:
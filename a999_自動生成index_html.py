@@ -1,81 +1,85 @@
 """
-a999_自動生成index_html.py v0.2.2
+a999_自動生成index_html.py v0.2.4
 
 為 docs 目錄下的 HTML 檔案自動生成 index.html。
 修正：
 1. 更正佔位符名稱為 {articles_placeholder}。
 2. 加入顯式排序邏輯與 card-grid 結構。
+
+v0.2.3 2026-10-18: 依【網站建置清單】，僅於網頁清單、網頁修改時間或模板變更時重建 index.html；
+  新增 --force 及 --dry-run 參數。
+v0.2.4 2026-10-18: 重建 index.html 後，以 mod_網站搜尋 增量製作全文搜尋索引（docs/search/）。
 """
 
 import os
 import re
 
+from mod_網站建置 import BuildManifest, add_build_arguments, file_hash, iter_html_pages
+from mod_網站搜尋 import build_search_index
+
 docs_directory = "docs"
 ignore_dir_list = ["_archived", "_test", "金鋼經", "__bak"]
-ignore_doc_list = ["index.html", "index_bak.html", "_template.html", "output_from_excel.html"]
+ignore_doc_list = ["index.html", "index_bak.html", "_template.html", "output_from_excel.html", "search.html"]
 
 index_file = os.path.join(docs_directory, "index.html")
 template_file = os.path.join(docs_directory, "_template.html")
 
-# 1. 收集所有檔案資訊
-all_files_info = []
-for root, dirs, files in os.walk(docs_directory):
-    dirs[:] = [d for d in dirs if d not in ignore_dir_list]
-    for filename in files:
-        if not filename.endswith(".html") or filename in ignore_doc_list:
-            continue
-        
-        full_path = os.path.join(root, filename)
-        mtime = os.path.getmtime(full_path)
-        rel_dir = os.path.relpath(root, docs_directory)
-        relative_path = filename if rel_dir == "." else os.path.join(rel_dir, filename).replace("\\", "/")
-        
+
+def collect_files_info(pages):
+    """收集所有檔案資訊，依 mtime 倒序排列"""
+    all_files_info = []
+    for full_path, relative_path in pages:
+        rel_dir = os.path.dirname(relative_path) or "."
         all_files_info.append({
-            "filename": filename,
-            "root": root,
-            "mtime": mtime,
+            "filename": os.path.basename(full_path),
+            "root": os.path.dirname(full_path),
+            "mtime": os.path.getmtime(full_path),
             "relative_path": relative_path,
             "rel_dir": rel_dir
         })
+    all_files_info.sort(key=lambda x: (-x["mtime"], x["filename"]))
+    return all_files_info
+
+
+def group_articles(all_files_info):
+    """處理文章字典：{文章: [{method: 標音方法, path: 網頁路徑}, ...]}"""
+    articles = {}
+    for info in all_files_info:
+        filename = info["filename"]
+        article_and_phonetic = os.path.splitext(filename)[0]
 
-# 2. 執行排序 (mtime 倒序)
-all_files_info.sort(key=lambda x: (-x["mtime"], x["filename"]))
-
-# 3. 處理文章字典
-articles = {}
-for info in all_files_info:
-    filename = info["filename"]
-    article_and_phonetic = os.path.splitext(filename)[0]
-    
-    if "_" in article_and_phonetic:
-        parts = article_and_phonetic.split("_")
-        phonetic_method = parts[-1]
-        article = "_".join(parts[:-1])
-    else:
-        match = re.search(r"^(.*【.*?】)(.*)$", article_and_phonetic)
-        if match and match.group(2).strip():
-            article = match.group(1)
-            phonetic_method = match.group(2)
+        if "_" in article_and_phonetic:
+            parts = article_and_phonetic.split("_")
+            phonetic_method = parts[-1]
+            article = "_".join(parts[:-1])
         else:
-            article = article_and_phonetic
-            phonetic_method = "開啟"
+            match = re.search(r"^(.*【.*?】)(.*)$", article_and_phonetic)
+            if match and match.group(2).strip():
+                article = match.group(1)
+                phonetic_method = match.group(2)
+            else:
+                article = article_and_phonetic
+                phonetic_method = "開啟"
 
-    if "None" in phonetic_method:
-        phonetic_method = phonetic_method.replace("None＋", "").replace("＋None", "").replace("None", "").strip()
-        if not phonetic_method: phonetic_method = "開啟"
+        if "None" in phonetic_method:
+            phonetic_method = phonetic_method.replace("None＋", "").replace("＋None", "").replace("None", "").strip()
+            if not phonetic_method: phonetic_method = "開啟"
 
-    if info["rel_dir"] != ".":
-        article = f"[{info['rel_dir']}] {article}"
+        if info["rel_dir"] != ".":
+            article = f"[{info['rel_dir']}] {article}"
 
-    if article not in articles:
-        articles[article] = []
-    articles[article].append({"method": phonetic_method, "path": info["relative_path"]})
+        if article not in articles:
+            articles[article] = []
+        articles[article].append({"method": phonetic_method, "path": info["relative_path"]})
+    return articles
 
-# 4. 生成 HTML 內容 (包含 card-grid 容器)
-cards_html = '<div class="card-grid">\n'
-for article in sorted(articles.keys()):
-    links = "".join([f'<a href="{p["path"]}" class="badge">{p["method"]}</a>' for p in articles[article]])
-    cards_html += f"""
+
+def build_cards_html(articles):
+    """生成 HTML 內容 (包含 card-grid 容器)"""
+    cards_html = '<div class="card-grid">\n'
+    for article in sorted(articles.keys()):
+        links = "".join([f'<a href="{p["path"]}" class="badge">{p["method"]}</a>' for p in articles[article]])
+        cards_html += f"""
     <div class="card">
         <h2 class="card-title">{article}</h2>
         <div class="card-links">
@@ -83,14 +87,54 @@ for article in sorted(articles.keys()):
         </div>
     </div>
     """
-cards_html += '</div>'
+    cards_html += '</div>'
+    return cards_html
+
+
+def build_index(args):
+    if not os.path.exists(template_file):
+        print(f"錯誤：找不到模板檔案 {template_file}")
+        return
+
+    # 1. 收集所有檔案資訊
+    pages = list(iter_html_pages(docs_directory, ignore_dir_list, ignore_doc_list))
 
-# 5. 寫入檔案 (修正替換標記)
-if os.path.exists(template_file):
-    with open(template_file, "r", encoding="utf-8") as t:
-        content = t.read().replace("{articles_placeholder}", cards_html)
+    # 2. 網頁清單、修改時間及模板皆未變更者，無需重建
+    with BuildManifest(docs_dir=docs_directory) as manifest:
+        inputs = {"pages": manifest.page_inputs(pages), "template": file_hash(template_file)}
+        if not manifest.needs_index("index.html", index_file, inputs, force=args.force):
+            print(f"索引未變更，略過：{index_file}")
+            return
+        if args.dry_run:
+            print(f"須重建：{index_file}")
+            return
+
+        # 3. 處理文章字典
+        articles = group_articles(collect_files_info(pages))
+
+        # 4. 寫入檔案 (修正替換標記)
+        with open(template_file, "r", encoding="utf-8") as t:
+            content = t.read().replace("{articles_placeholder}", build_cards_html(articles))
         with open(index_file, "w", encoding="utf-8") as f:
             f.write(content)
+        manifest.record_index("index.html", inputs, index_file)
     print(f"成功生成索引：{index_file}，包含 {len(articles)} 篇文章。")
-else:
-    print(f"錯誤：找不到模板檔案 {template_file}")
+
+
+def main(args):
+    build_index(args)
+
+    # 5. 全文搜尋索引：僅重新擷取新增或變更之網頁
+    pages = list(iter_html_pages(docs_directory, ignore_dir_list + ["assets"], ignore_doc_list))
+    with BuildManifest(docs_dir=docs_directory) as manifest:
+        updated = build_search_index(manifest, pages=pages, force=args.force, dry_run=args.dry_run)
+    action = "須更新" if args.dry_run else "已更新"
+    print(f"全文搜尋索引{action} {len(updated)} 個網頁。")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="為 docs 目錄下的 HTML 檔案自動生成 index.html")
+    add_build_arguments(parser)
+    main(parser.parse_args())
@@ -4,6 +4,8 @@
  * 1. 新增【國際音標 (IPA)】轉換功能。
  * 2. 羅馬拼音調符全效支援 (TL, POJ, BP)。
  * 3. 啟動即修復拉丁調符偏移問題。
+ * 4. 網頁內嵌【標音對照表】（#piau-im-table）者，切換時直接取用，不於瀏覽器轉換；
+ *    對照表未含之標音方法（如國際音標）或舊版網頁，始下載 phonetic_mapping.json。
  */
 document.addEventListener('DOMContentLoaded', function() {
     let phoneticMapping = null;
@@ -58,13 +60,26 @@ document.addEventListener('DOMContentLoaded', function() {
     autoFix();
 
     // --- [2. 資料載入] ---
-    fetch('./assets/javascripts/phonetic_mapping.json')
-        .then(response => response.json())
-        .then(data => {
-            phoneticMapping = data;
-            initSwitcherUI();
-        })
-        .catch(err => console.error('無法載入標音對照表:', err));
+    // 本頁之標音對照表：{huat: [標音方法, ...], im: [[標音, ...], ...]}；<ruby data-im> 為 im 之序號
+    const tableElement = document.getElementById('piau-im-table');
+    const piauImTable = tableElement ? JSON.parse(tableElement.textContent) : null;
+    // 切換器之標音方法名稱 → 對照表（PiauIm）之標音方法名稱
+    const tableHuat = { "閩拼方案": "閩拼調符", "台語注音二式": "注音二式" };
+    const tableColumn = (system) => {
+        if (!piauImTable || !system) return -1;
+        return piauImTable.huat.indexOf(tableHuat[system] || system);
+    };
+
+    let mappingPromise = null;
+    const loadMapping = () => {
+        if (!mappingPromise) {
+            mappingPromise = fetch('./assets/javascripts/phonetic_mapping.json')
+                .then(response => response.json())
+                .then(data => { phoneticMapping = data; })
+                .catch(err => console.error('無法載入標音對照表:', err));
+        }
+        return mappingPromise;
+    };
 
     const schemes = {
         "original": { label: "重設", up: null, right: null },
@@ -77,6 +92,8 @@ document.addEventListener('DOMContentLoaded', function() {
         "台語音標+十五音": { label: "台語音標+十五音", up: "台語音標", right: "十五音" }
     };
 
+    initSwitcherUI();
+
     function initSwitcherUI() {
         const toolbar = document.createElement('div');
         toolbar.className = 'phonetic-switcher-toolbar';
@@ -302,7 +319,16 @@ document.addEventListener('DOMContentLoaded', function() {
         return "\u200B" + result;
     }
 
-    function applyPhonetics(upSystem, rightSystem) {
+    async function applyPhonetics(upSystem, rightSystem) {
+        const upColumn = tableColumn(upSystem);
+        const rightColumn = tableColumn(rightSystem);
+        if ((upSystem && upColumn < 0) || (rightSystem && rightColumn < 0)) await loadMapping();
+        const piauIm = (ruby, tlpa, system, column) => {
+            const imId = ruby.getAttribute('data-im');
+            if (column >= 0 && imId !== null) return '\u200B' + piauImTable.im[imId][column].normalize("NFD");
+            return convertOne(tlpa, system);
+        };
+
         injectLatinFix();
         document.querySelectorAll('article.article_content > div').forEach(div => { div.className = 'Siang_Pai'; div.style.cssText = ""; });
         const latinSystems = ["台語音標", "台羅拼音", "白話字", "閩拼方案", "閩拼調號", "台語注音二式", "國際音標"];
@@ -315,13 +341,13 @@ document.addEventListener('DOMContentLoaded', function() {
             ruby.innerHTML = hanJi;
             if (upSystem) {
                 const rt = document.createElement('rt');
-                rt.textContent = convertOne(tlpa, upSystem);
+                rt.textContent = piauIm(ruby, tlpa, upSystem, upColumn);
                 if (latinSystems.includes(upSystem)) rt.classList.add('latin-phonetic');
                 ruby.appendChild(rt);
             }
             if (rightSystem) {
                 const rtc = document.createElement('rtc');
-                rtc.textContent = convertOne(tlpa, rightSystem);
+                rtc.textContent = piauIm(ruby, tlpa, rightSystem, rightColumn);
                 if (latinSystems.includes(rightSystem)) rtc.classList.add('latin-phonetic');
                 ruby.appendChild(rtc);
             }
@@ -0,0 +1,111 @@
+// 全文搜尋：讀取 mod_網站搜尋.py 製作之 docs/search/ 索引分片，
+// 以漢字（如「春天」）或台語音標（如「cun thian」，調號可省略）搜尋文章。
+(function () {
+    'use strict';
+
+    const SEARCH_DIR = './search/';
+    const jsonCache = {};
+
+    function fetchJson(path) {
+        if (!jsonCache[path]) {
+            jsonCache[path] = fetch(SEARCH_DIR + path).then(function (response) {
+                return response.ok ? response.json() : {};
+            });
+        }
+        return jsonCache[path];
+    }
+
+    // 與 mod_網站搜尋.py 之 is_han_ji()、han_ji_shard()、normalize_tlpa() 一致
+    function isHanJi(ch) {
+        const code = ch.codePointAt(0);
+        return (code >= 0x3400 && code <= 0x9fff) ||
+            (code >= 0xf900 && code <= 0xfaff) ||
+            (code >= 0x20000 && code <= 0x3ffff);
+    }
+
+    function hanJiShard(ch) {
+        return (ch.codePointAt(0) >> 8).toString(16);
+    }
+
+    function normalizeTlpa(syllable) {
+        return syllable.toLowerCase().replace(/[^a-z]/g, '');
+    }
+
+    // 查詢字串 → 依序之索引鍵及其分片檔
+    function parseQuery(query) {
+        const hanJiList = Array.from(query).filter(isHanJi);
+        if (hanJiList.length) {
+            return hanJiList.map(function (ch) {
+                return { key: ch, shard: 'han_ji/' + hanJiShard(ch) + '.json' };
+            });
+        }
+        return query.split(/[\s\-]+/).map(normalizeTlpa).filter(Boolean).map(function (syllable) {
+            return { key: syllable, shard: 'tlpa/' + syllable[0] + '.json' };
+        });
+    }
+
+    // [[網頁編號, 位置, ...], ...] → Map(網頁編號 → Set(位置))
+    function toPostingMap(postings) {
+        const map = new Map();
+        (postings || []).forEach(function (posting) {
+            map.set(posting[0], new Set(posting.slice(1)));
+        });
+        return map;
+    }
+
+    // 各索引鍵之位置須相連，傳回 [{pageId, hits}]，依符合次數排序
+    async function search(query) {
+        const terms = parseQuery(query);
+        if (!terms.length) return [];
+        const shards = await Promise.all(terms.map(function (term) { return fetchJson(term.shard); }));
+        const maps = terms.map(function (term, i) { return toPostingMap(shards[i][term.key]); });
+
+        const results = [];
+        maps[0].forEach(function (starts, pageId) {
+            let hits = 0;
+            starts.forEach(function (start) {
+                const matched = maps.every(function (map, i) {
+                    return map.has(pageId) && map.get(pageId).has(start + i);
+                });
+                if (matched) hits++;
+            });
+            if (hits) results.push({ pageId: pageId, hits: hits });
+        });
+        results.sort(function (a, b) { return b.hits - a.hits || a.pageId - b.pageId; });
+        return results;
+    }
+
+    async function showResults(query) {
+        const list = document.getElementById('search-results');
+        const status = document.getElementById('search-status');
+        list.innerHTML = '';
+        status.textContent = '';
+        if (!query.trim()) return;
+
+        const [pages, results] = await Promise.all([fetchJson('pages.json'), search(query)]);
+        status.textContent = results.length ? '共 ' + results.length + ' 篇文章' : '查無符合之文章';
+        results.forEach(function (result) {
+            const page = pages[result.pageId];
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = './' + page.path;
+            link.textContent = page.title || page.path;
+            item.appendChild(link);
+            item.appendChild(document.createTextNode('（' + result.hits + ' 處）'));
+            list.appendChild(item);
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        const input = document.getElementById('full-text-search');
+        const query = new URLSearchParams(window.location.search).get('q') || '';
+        let timer = null;
+
+        input.value = query;
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () { showResults(input.value); }, 300);
+        });
+        showResults(query);
+    });
+})();
@@ -1,13 +1,15 @@
 import os
 import re
 
+from mod_網站建置 import BuildManifest, add_build_arguments, file_hash
+
 DOCS_DIR = 'docs'
 INDEX_FILE = os.path.join(DOCS_DIR, 'index.html')
 TEMPLATE_FILE = os.path.join(DOCS_DIR, '_template.html')
 # Files to exclude from the index
-EXCLUDE_FILES = {'index.html', '_template.html', '_test.html', '_test2.html'}
+EXCLUDE_FILES = {'index.html', '_template.html', '_test.html', '_test2.html', 'search.html'}
 
-def generate_index():
+def generate_index(force=False, dry_run=False):
     print(f"Scanning directory: {DOCS_DIR}")
     if not os.path.exists(TEMPLATE_FILE):
         print(f"Error: Template file {TEMPLATE_FILE} not found.")
@@ -25,6 +27,16 @@ def generate_index():
     print(f"Found {len(html_files)} HTML files.")
     html_files.sort()
 
+    # The index only depends on the file names and the template: skip when unchanged
+    manifest = BuildManifest(docs_dir=DOCS_DIR)
+    inputs = {"files": html_files, "template": file_hash(TEMPLATE_FILE)}
+    if not manifest.needs_index("generate_docs_index", INDEX_FILE, inputs, force=force):
+        print(f"{INDEX_FILE} is up to date.")
+        return
+    if dry_run:
+        print(f"Would rebuild {INDEX_FILE}.")
+        return
+
     articles = {} # Key: Article Name, Value: List of (Link Text, Filename)
 
     for filename in html_files:
@@ -90,7 +102,15 @@ def generate_index():
     with open(INDEX_FILE, 'w', encoding='utf-8') as f:
         f.write(output)
 
+    manifest.record_index("generate_docs_index", inputs, INDEX_FILE)
+    manifest.save()
+
     print(f"Successfully generated {INDEX_FILE} with {len(articles)} groups.")
 
 if __name__ == "__main__":
-    generate_index()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate docs/index.html")
+    add_build_arguments(parser)
+    args = parser.parse_args()
+    generate_index(force=args.force, dry_run=args.dry_run)
@@ -30,6 +30,7 @@ from mod_logging import (
 )
 from mod_TL_tiau_hu_tng_tiau_ho import tiau_hu_tng_tiau_ho
 from mod_TLPA_tng_BP import convert_tlpa_to_zu_im_by_un_bu
+from mod_音節 import SyllableParser
 
 init_logging()
 
@@ -250,48 +251,18 @@ def get_tlpa_phing_im_kian_from_tiau(tiau_ho):
 #============================================================================
 # 音節尾字為調號（數字）擷取函數
 #============================================================================
-# 常用上標轉換表（補足您可能遇到的上標字元）
-_SUPERSCRIPT_MAP = {
-    '\u2070': '0',  # ⁰
-    '\u00B9': '1',  # ¹
-    '\u00B2': '2',  # ²
-    '\u00B3': '3',  # ³
-    '\u2074': '4',  # ⁴
-    '\u2075': '5',  # ⁵
-    '\u2076': '6',  # ⁶
-    '\u2077': '7',  # ⁷
-    '\u2078': '8',  # ⁸
-    '\u2079': '9',  # ⁹
-}
-_SUPER_TRANS = str.maketrans(_SUPERSCRIPT_MAP)
+# 上標數字調號之轉換，由 mod_音節.SUPERSCRIPT_TRANS 處理
+_syllable_parser = SyllableParser()
 
 def split_tiau_ho(im_piau: str):
     """
     如果尾字是（或是上標）數字，就回傳 (im_piau_without_tiau, tiau_ho)；
     否則回傳 (normalized_im_piau, None)。
 
-    會先把已知上標數字轉為一般數字，再檢查最後一個字元。
+    會先把已知上標數字轉為一般數字，再檢查最後一個字元；
+    由 SyllableParser 解析並快取結果。
     """
-    if not im_piau:
-        return None, None
-
-    # 清除前後【空白】
-    im_piau = im_piau.strip()
-    if not im_piau:
-        return None, None
-
-    # 先把上標數字轉成一般數字（若有）
-    im_piau_norm = im_piau.translate(_SUPER_TRANS)
-
-    # 確認傳入之【閩拚音標】符合格式=聲母+韻母+聲調=羅馬拚音字母+數字
-    u_hap = re.match(r"^([a-z]+)(\d+)$", im_piau_norm)
-    if not u_hap:
-        # 如果不符合「全英文字母+數字」格式，就原樣回傳
-        return [im_piau, None]
-
-    # 提取：【無調音標】（聲母+韻母）和【調號】
-    bo_tiau_piau_im, tiau = u_hap.group(1), u_hap.group(2)
-    return bo_tiau_piau_im, tiau
+    return _syllable_parser.split_tiau_ho(im_piau)
 
 # =========================================================================
 # 將首字母為大寫之羅馬拼音字母轉換為小寫（只處理第一個字母）
@@ -1,5 +1,5 @@
 """
-mod_ca_ji_tian.py V0.2.3
+mod_ca_ji_tian.py V0.2.8
 
 功能說明：
 漢字查字典模組，提供漢字查詢讀音功能
@@ -12,13 +12,211 @@ mod_ca_ji_tian.py V0.2.3
  - v0.2.3 2026-07-15: `han_ji_ca_piau_im()` 新增選用參數 `tai_lo_im_piau`，
     可依【台羅音標】篩選；查詢結果於【常用度】相同時，改依【最近揀用時間】
     （由人工校正程式回寫）由新至舊排序，令最近人工揀用之讀音優先。
+ - v0.2.4 2026-10-18: `HanJiTian` 新增選用參數 `preload`：首次查詢時將【漢字庫】
+    整個載入記憶體，建立【讀音索引】（已排序、已拆分聲母/韻母/聲調、已依常用度
+    分組），之後每次查詢僅需一次 dict 存取；資料庫寫入後，以 `invalidate()` 令
+    索引失效，下次查詢時重新載入。
+ - v0.2.5 2026-10-18: 新增批次查詢方法 `han_ji_ca_piau_im_batch()`：整篇文章之
+    不重複漢字，以一次 SQL 查詢（`IN (...)`，超過參數上限時分段）取得所有讀音，
+    再於 Python 依讀音類型篩選；`han_ji_ca_piau_im_list()` 改用此方法。
+ - v0.2.6 2026-10-18: 改用 mod_database.connection_manager 之共用唯讀連線（不再每次
+    查詢開關連線），查詢經由連線管理器執行，以累計各呼叫處之次數與耗時。
+ - v0.2.7 2026-10-18: 新增【台語音標 → 漢字】反查：【漢字庫】增設反查索引鍵欄位
+    （台語音標鍵、無調音標鍵、聲母鍵、韻母鍵）及其索引；新增方法
+    `im_piau_ca_han_ji()`，支援精確、不分聲調、前綴及韻母反查。索引鍵由
+    `ensure_im_piau_soo_in()` 補算；【台羅音標】遭改動時，由觸發器令該筆索引鍵失效。
+ - v0.2.8 2026-10-18: `im_piau_ca_han_ji()` 不再於查詢時變更資料表結構或補算索引鍵：
+    反查索引改以 `python mod_ca_ji_tian.py --build-im-piau-soo-in` 另行建立；未建立
+    索引，或索引鍵尚待補算之紀錄，於查詢時以 Python 計算索引鍵比對。
 """
 
 import sqlite3
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+from mod_database import connection_manager
 from mod_標音 import split_tai_gi_im_piau
+from mod_音節 import POJ_SIANN_BU_TNG_HUAN
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+# 【常用度】分組：(下限, 上限]
+SIONG_IONG_TOO_BANDS = {
+    "通用音": (0.80, 1.00),
+    "文讀音": (0.60, 0.80),
+    "白話音": (0.40, 0.60),
+    "其它": (0.00, 0.40),
+}
+
+# 各讀音類型所含之【常用度】分組（依常用度由大至小）
+UE_IM_LUI_PIAT_BANDS = {
+    "文讀音": ("通用音", "文讀音"),
+    "白話音": ("通用音", "白話音"),
+    "其它": ("其它",),
+    "全部": ("通用音", "文讀音", "白話音", "其它"),
+}
+
+# SQL 參數個數上限（無法自連線取得時之預設值）
+DEFAULT_MAX_SQL_VARIABLES = 999
+
+# 查詢結果欄位
+PIAU_IM_FIELDS = ["識別號", "漢字", "台語音標", "常用度", "摘要說明"]
+
+# 反查索引鍵欄位（由【台羅音標】計算）：
+#   台語音標鍵：聲母＋韻母＋聲調（如：ziann5）
+#   無調音標鍵：聲母＋韻母（如：ziann）
+#   聲母鍵、韻母鍵：如：z、iann
+IM_PIAU_KIAN_COLUMNS = ("台語音標鍵", "無調音標鍵", "聲母鍵", "韻母鍵")
+
+# 反查方式
+CA_HUAT_CING_KHAK = "exact"  # 精確：聲母＋韻母＋聲調皆相符
+CA_HUAT_BO_TIAU = "toneless"  # 不分聲調：聲母＋韻母相符
+CA_HUAT_TSING_TSUE = "prefix"  # 前綴：無調音標以指定字串起頭
+CA_HUAT_UN_BU = "un_bu"  # 韻母：韻母相符（不分聲母、聲調）
+
+
+def _siong_iong_too_band(siong_iong_too) -> Optional[str]:
+    """取得【常用度】所屬之分組；不在 (0.00, 1.00] 範圍者，傳回 None"""
+    if not isinstance(siong_iong_too, (int, float)):
+        return None
+    for band, (low, high) in SIONG_IONG_TOO_BANDS.items():
+        if low < siong_iong_too <= high:
+            return band
+    return None
+
+
+def _to_piau_im_dict(row) -> Dict[str, Union[str, float]]:
+    """將查詢結果之一筆資料，轉換為讀音字典：台羅音標拆分為聲母、韻母、聲調"""
+    row_dict = dict(zip(PIAU_IM_FIELDS, row))
+    # 取得台羅音標
+    tai_loo_im = row_dict["台語音標"]
+
+    # 將台羅音標轉換為台語音標
+    split_result = split_tai_gi_im_piau(tai_loo_im)
+    row_dict["聲母"] = split_result[0]
+    row_dict["韻母"] = split_result[1]
+    row_dict["聲調"] = split_result[2]
+
+    # 更新 row_dict 中的台語音標
+    row_dict["台語音標"] = f'{row_dict["聲母"]}{row_dict["韻母"]}{row_dict["聲調"]}'
+    return row_dict
+
+
+def im_piau_kian(im_piau: Optional[str]) -> Tuple[str, str, str, str]:
+    """
+    計算反查索引鍵：(台語音標鍵, 無調音標鍵, 聲母鍵, 韻母鍵)。
+    【台羅音標】、【台語音標】或帶調符音標皆可，與查詢結果之【台語音標】同一轉換規則。
+    """
+    if not im_piau or not im_piau.strip():
+        return "", "", "", ""
+    siann_bu, un_bu, tiau = split_tai_gi_im_piau(im_piau.strip())
+    return f"{siann_bu}{un_bu}{tiau}", f"{siann_bu}{un_bu}", siann_bu, un_bu
+
+
+def _im_piau_tsing_tsue(im_piau: str) -> str:
+    """前綴反查之鍵：去除調號，並將聲母 tsh/ts/chh/ch 轉換為 c/z"""
+    im_piau = im_piau.strip().lower().rstrip("0123456789")
+    for old, new in POJ_SIANN_BU_TNG_HUAN:
+        if im_piau.startswith(old):
+            return new + im_piau[len(old) :]
+    return im_piau
+
+
+def _lui_piat_condition(ue_im_lui_piat: str) -> str:
+    """讀音類型所含【常用度】分組之 SQL 篩選條件"""
+    bands = UE_IM_LUI_PIAT_BANDS.get(ue_im_lui_piat, UE_IM_LUI_PIAT_BANDS["全部"])
+    return " OR ".join(f"(常用度 > {SIONG_IONG_TOO_BANDS[band][0]:.2f} AND 常用度 <= {SIONG_IONG_TOO_BANDS[band][1]:.2f})" for band in bands)
+
+
+def _sort_im_piau_results(rows: list) -> list:
+    """反查結果排序，同 SQL：台語音標鍵、常用度（大至小）、排序時間（新至舊）、識別號"""
+    rows.sort(key=lambda row: row[0])
+    rows.sort(key=lambda row: row[5] or "", reverse=True)
+    rows.sort(key=lambda row: row[3] or 0, reverse=True)
+    rows.sort(key=lambda row: row[6])
+    return rows
+
+
+def ensure_im_piau_soo_in(db_path: str) -> int:
+    """
+    確保【漢字庫】具備反查索引：索引鍵欄位、索引，及【台羅音標】改動時令索引鍵失效之觸發器；
+    並補算索引鍵為 NULL 之紀錄（新增之讀音，或【台羅音標】遭改動者）。
+    會變更資料表結構，須另行執行：python mod_ca_ji_tian.py --build-im-piau-soo-in [資料庫檔案]
+
+    Returns:
+        int: 補算索引鍵之筆數
+    """
+    conn = connection_manager.write_connection(db_path)
+    cols = {row[1] for row in connection_manager.fetchall(conn, "PRAGMA table_info(漢字庫)")}
+    with conn:
+        for col in IM_PIAU_KIAN_COLUMNS:
+            if col not in cols:
+                conn.execute(f"ALTER TABLE 漢字庫 ADD COLUMN {col} TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_漢字庫_台語音標鍵 ON 漢字庫(台語音標鍵)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_漢字庫_無調音標鍵 ON 漢字庫(無調音標鍵)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_漢字庫_韻母鍵 ON 漢字庫(韻母鍵, 聲母鍵)")
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_漢字庫_音標鍵失效
+            AFTER UPDATE OF 台羅音標 ON 漢字庫
+            WHEN NEW.台羅音標 IS NOT OLD.台羅音標
+            BEGIN
+                UPDATE 漢字庫
+                SET 台語音標鍵 = NULL, 無調音標鍵 = NULL, 聲母鍵 = NULL, 韻母鍵 = NULL
+                WHERE rowid = NEW.rowid;
+            END;
+            """
+        )
+        rows = connection_manager.fetchall(conn, "SELECT 識別號, 台羅音標 FROM 漢字庫 WHERE 台語音標鍵 IS NULL")
+        conn.executemany(
+            "UPDATE 漢字庫 SET 台語音標鍵 = ?, 無調音標鍵 = ?, 聲母鍵 = ?, 韻母鍵 = ? WHERE 識別號 = ?",
+            [(*im_piau_kian(tai_lo_im_piau), siat_piat_ho) for siat_piat_ho, tai_lo_im_piau in rows],
+        )
+    return len(rows)
+
+
+class _HanJiPiauImIndex:
+    """
+    單一漢字之讀音索引。
+
+    readings 依【常用度】由大至小、【最近揀用時間】由新至舊排序；各【常用度】分組互不重疊，
+    故同一分組之讀音於 readings 中連續排列，以 (起, 迄) 切片記錄於 bands。
+    """
+
+    __slots__ = ("readings", "tai_lo_im_piau", "bands")
+
+    def __init__(self, rows):
+        self.readings = [_to_piau_im_dict(row) for row in rows]
+        # 資料庫原始之【台羅音標】，供依音標篩選
+        self.tai_lo_im_piau = [row[2] for row in rows]
+
+        self.bands: Dict[str, Tuple[int, int]] = {}
+        for i, row in enumerate(rows):
+            band = _siong_iong_too_band(row[3])
+            if band is not None:
+                start = self.bands.get(band, (i, i))[0]
+                self.bands[band] = (start, i + 1)
+
+    def ca_piau_im(self, ue_im_lui_piat: str, tai_lo_im_piau: Optional[str] = None) -> List[Dict]:
+        positions = []
+        for band in UE_IM_LUI_PIAT_BANDS.get(ue_im_lui_piat, UE_IM_LUI_PIAT_BANDS["全部"]):
+            if band in self.bands:
+                positions.extend(range(*self.bands[band]))
+
+        if tai_lo_im_piau:
+            positions = [i for i in positions if self.tai_lo_im_piau[i] == tai_lo_im_piau]
+            # 若於該讀音類別中查無資料，放寬讀音類別限制
+            if not positions:
+                positions = [i for i, im_piau in enumerate(self.tai_lo_im_piau) if im_piau == tai_lo_im_piau]
+
+        # 如果沒有找到符合條件的讀音，則選擇常用度最高者
+        if not positions:
+            positions = range(min(1, len(self.readings)))
+
+        # 傳回複本，以免呼叫端修改查詢結果時，連帶改動索引
+        return [dict(self.readings[i]) for i in positions]
+
 
 # ============================================================================
 # 資料庫連線管理
@@ -28,55 +226,41 @@ from mod_標音 import split_tai_gi_im_piau
 class HanJiTian:
     """漢字字典類別，管理資料庫連線和查詢"""
 
-    def __init__(self, db_path: str = "Ho_Lok_Ue.db"):
+    def __init__(self, db_path: str = "Ho_Lok_Ue.db", preload: bool = False):
         """
         初始化漢字字典
 
         Args:
             db_path: 資料庫檔案路徑
+            preload: 是否將【漢字庫】預先載入記憶體（適用於整篇文章逐字查詢之批次作業）
         """
         self.db_path = db_path
-        self._persistent_conn = None
+        self.preload = preload
         self._time_order_column: Optional[str] = None  # 次要排序鍵欄位名稱（快取）
+        self._piau_im_index: Optional[Dict[str, _HanJiPiauImIndex]] = None  # 讀音索引（preload 模式）
+        self._im_piau_soo_in_ready = False  # 反查索引欄位是否已建立（已建立者方快取）
 
     def connect(self):
-        """建立持續性資料庫連線"""
-        if self._persistent_conn is None:
-            self._persistent_conn = sqlite3.connect(self.db_path)
-            self._persistent_conn.row_factory = sqlite3.Row
+        """預先開啟共用唯讀連線"""
+        connection_manager.read_connection(self.db_path)
 
     def disconnect(self):
-        """關閉持續性資料庫連線"""
-        if self._persistent_conn:
-            self._persistent_conn.close()
-            self._persistent_conn = None
+        """共用唯讀連線由 connection_manager 管理，供其它模組續用，故不在此關閉"""
 
     @contextmanager
     def get_connection(self):
         """
-        取得資料庫連線的 Context Manager
+        取得資料庫連線的 Context Manager（本執行緒之共用唯讀連線）
         使用方式：
             with han_ji_su_tian.get_connection() as conn:
                 # 使用 conn 進行查詢
                 pass
         """
-        # 如果已有持續性連線，則直接使用
-        if self._persistent_conn:
-            yield self._persistent_conn
-            return
-
-        # 否則建立臨時連線
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # 讓查詢結果可以用欄位名稱存取
-            yield conn
+            yield connection_manager.read_connection(self.db_path)
         except sqlite3.Error as e:
             print(f"資料庫錯誤: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
 
     # ==========================================================
     # 用 `漢字` 查詢《台語音標》的讀音資訊
@@ -93,10 +277,90 @@ class HanJiTian:
         若資料庫尚無此欄位，退而使用【更新時間】，以維持向後相容。
         """
         if self._time_order_column is None:
-            cols = [row[1] for row in conn.execute("PRAGMA table_info(漢字庫)").fetchall()]
+            cols = [row[1] for row in connection_manager.fetchall(conn, "PRAGMA table_info(漢字庫)")]
             self._time_order_column = "最近揀用時間" if "最近揀用時間" in cols else "更新時間"
         return self._time_order_column
 
+    def invalidate(self):
+        """令讀音索引失效（資料庫寫入後呼叫），下次查詢時重新載入"""
+        self._piau_im_index = None
+
+    def _fetch_piau_im_index(self, conn, han_ji_list: Optional[List[str]] = None) -> Dict[str, _HanJiPiauImIndex]:
+        """
+        查詢【漢字庫】，建立以【漢字】為鍵之讀音索引。
+
+        Args:
+            han_ji_list: 僅查詢這些漢字（以 IN (...) 一次查詢，超過參數上限時分段）；
+                為 None 時，載入整個【漢字庫】
+        """
+        time_col = self._get_time_order_column(conn)
+        order_by = f"漢字, COALESCE(常用度, 0) DESC, COALESCE({time_col}, '') DESC, 識別號"
+        select = "SELECT 識別號, 漢字, 台羅音標, 常用度, 摘要說明 FROM 漢字庫"
+
+        if han_ji_list is None:
+            rows = connection_manager.fetchall(conn, f"{select} ORDER BY {order_by};")
+        else:
+            try:
+                chunk_size = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+            except AttributeError:  # Python 3.11 以前之 sqlite3 模組
+                chunk_size = DEFAULT_MAX_SQL_VARIABLES
+            rows = []
+            for i in range(0, len(han_ji_list), chunk_size):
+                chunk = han_ji_list[i : i + chunk_size]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(
+                    connection_manager.fetchall(conn, f"{select} WHERE 漢字 IN ({placeholders}) ORDER BY {order_by};", chunk)
+                )
+
+        grouped: Dict[str, list] = {}
+        for row in rows:
+            grouped.setdefault(row[1], []).append(tuple(row))
+        return {han_ji: _HanJiPiauImIndex(han_ji_rows) for han_ji, han_ji_rows in grouped.items()}
+
+    def _load_piau_im_index(self, conn) -> Dict[str, _HanJiPiauImIndex]:
+        """一次載入整個【漢字庫】，建立以【漢字】為鍵之讀音索引"""
+        if self._piau_im_index is None:
+            self._piau_im_index = self._fetch_piau_im_index(conn)
+        return self._piau_im_index
+
+    def han_ji_ca_piau_im_batch(
+        self,
+        han_ji_list: List[str],
+        ue_im_lui_piat: str = "文讀音",
+        display_all_piau_im: bool = False,
+    ) -> Dict[str, Optional[List[Dict[str, Union[str, float]]]]]:
+        """
+        批次查詢整篇文章之漢字讀音：不重複之漢字以一次 SQL 查詢取得所有讀音，
+        再依【讀音類型】篩選（規則同 han_ji_ca_piau_im()）。
+
+        Args:
+            han_ji_list: 欲查詢的漢字（可重複、可含非漢字；僅查詢不重複者）
+            ue_im_lui_piat: 查詢的讀音類型，可以是 "文讀音"、"白話音"、"其它" 或 "全部"
+            display_all_piau_im: 是否不分讀音類型，傳回所有讀音
+
+        Returns:
+            {漢字: 讀音字典列表}；查無資料之漢字，其值為 None
+
+        範例:
+            >>> su_tian = HanJiTian()
+            >>> result = su_tian.han_ji_ca_piau_im_batch(list("東西南北東"), "白話音")
+            >>> print(result["東"][0]["台語音標"])
+        """
+        distinct_han_ji = list(dict.fromkeys(han_ji_list))
+        if self.preload:
+            with self.get_connection() as conn:
+                index = self._load_piau_im_index(conn)
+        else:
+            with self.get_connection() as conn:
+                index = self._fetch_piau_im_index(conn, distinct_han_ji)
+
+        lui_piat = "全部" if display_all_piau_im else ue_im_lui_piat
+        results = {}
+        for han_ji in distinct_han_ji:
+            han_ji_index = index.get(han_ji)
+            results[han_ji] = han_ji_index.ca_piau_im(lui_piat) if han_ji_index else None
+        return results
+
     def han_ji_ca_piau_im(
         self,
         han_ji: str,
@@ -136,9 +400,17 @@ class HanJiTian:
             >>> for item in result:
             >>>     print(f"{item['台語音標']} (常用度: {item['常用度']})")
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if self.preload:
+            if self._piau_im_index is None:
+                with self.get_connection() as conn:
+                    self._load_piau_im_index(conn)
+            han_ji_index = self._piau_im_index.get(han_ji)
+            if han_ji_index is None:
+                return None
+            lui_piat = "全部" if display_all_piau_im else ue_im_lui_piat
+            return han_ji_index.ca_piau_im(lui_piat, tai_lo_im_piau=tai_lo_im_piau) or None
 
+        with self.get_connection() as conn:
             # 將文白通用音視為第一優選
             common_reading_condition = "常用度 > 0.80 AND 常用度 <= 1.0"
 
@@ -188,8 +460,7 @@ class HanJiTian:
                 {order_by};
             """
 
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+            results = connection_manager.fetchall(conn, query, params)
 
             # 若指定【台羅音標】但於該讀音類別中查無資料，放寬讀音類別限制再查一次
             if not results and tai_lo_im_piau:
@@ -207,8 +478,7 @@ class HanJiTian:
                 ORDER BY
                     {order_by};
                 """
-                cursor.execute(query, (han_ji, tai_lo_im_piau))
-                results = cursor.fetchall()
+                results = connection_manager.fetchall(conn, query, (han_ji, tai_lo_im_piau))
 
             # 如果沒有找到符合條件的讀音，則查詢所有讀音，並選擇常用度最高者
             if not results:
@@ -227,37 +497,109 @@ class HanJiTian:
                     {order_by}
                 LIMIT 1;
                 """
-                cursor.execute(query, (han_ji,))
-                results = cursor.fetchall()
+                results = connection_manager.fetchall(conn, query, (han_ji,))
 
             # 若仍無結果，回傳 None
             if not results:
                 return None
 
             # 將結果轉換為字典列表
-            fields = ["識別號", "漢字", "台語音標", "常用度", "摘要說明"]
-
-            data = []
-            for result in results:
-                row_dict = dict(zip(fields, result))
-                # 取得台羅音標
-                tai_loo_im = row_dict["台語音標"]
-
-                # 將台羅音標轉換為台語音標
-                split_result = split_tai_gi_im_piau(tai_loo_im)
-                row_dict["聲母"] = split_result[0]
-                row_dict["韻母"] = split_result[1]
-                row_dict["聲調"] = split_result[2]
-
-                # 更新 row_dict 中的台語音標
-                row_dict["台語音標"] = (
-                    f'{row_dict["聲母"]}{row_dict["韻母"]}{row_dict["聲調"]}'
-                )
+            return [_to_piau_im_dict(result) for result in results]
+
+    # ==========================================================
+    # 用《台語音標》反查 `漢字`
+    # ==========================================================
+    def _has_im_piau_soo_in(self, conn) -> bool:
+        """【漢字庫】是否已具備反查索引鍵欄位（由 ensure_im_piau_soo_in() 建立）"""
+        if not self._im_piau_soo_in_ready:
+            cols = {row[1] for row in connection_manager.fetchall(conn, "PRAGMA table_info(漢字庫)")}
+            self._im_piau_soo_in_ready = set(IM_PIAU_KIAN_COLUMNS) <= cols
+        return self._im_piau_soo_in_ready
+
+    def im_piau_ca_han_ji(
+        self,
+        im_piau: str,
+        ca_huat: str = CA_HUAT_CING_KHAK,
+        ue_im_lui_piat: str = "全部",
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Union[str, float]]]:
+        """
+        以【台語音標】反查漢字（使用【漢字庫】之反查索引，不需掃描整個資料表）。
+        本方法不寫入資料庫：未建立反查索引者（見 ensure_im_piau_soo_in()），逐筆計算
+        索引鍵比對（須掃描整個資料表）；索引鍵尚待補算之紀錄，亦於查詢時計算。
+
+        Args:
+            im_piau: 台語音標；【台羅音標】（如：tsiann5）、【台語音標】（如：ziann5）
+                或帶調符音標（如：tsiânn）皆可
+            ca_huat: 反查方式
+                - "exact"：精確（聲母＋韻母＋聲調）
+                - "toneless"：不分聲調（如：tsiann → 正、成、情…）
+                - "prefix"：無調音標以 im_piau 起頭（如：tsia → 遮、者、正、成…）
+                - "un_bu"：im_piau 為韻母，不分聲母、聲調（如：ian → 煙、天、年…）
+            ue_im_lui_piat: 讀音類型，可以是 "文讀音"、"白話音"、"其它" 或 "全部"
+            limit: 傳回筆數上限；None 表示不限
+
+        Returns:
+            讀音字典列表（欄位同 han_ji_ca_piau_im()），依【台語音標】、【常用度】由大至小排序；
+            查無資料者，傳回空列表
+
+        範例:
+            >>> su_tian = HanJiTian()
+            >>> for item in su_tian.im_piau_ca_han_ji("tsiann", ca_huat="toneless"):
+            >>>     print(item["漢字"], item["台語音標"])
+        """
+        # kian_index：比對 im_piau_kian() 傳回值之第幾個索引鍵；upper：前綴反查之上限
+        upper = None
+        if ca_huat == CA_HUAT_CING_KHAK:
+            kian_index, kian = 0, im_piau_kian(im_piau)[0]
+            condition, params = "台語音標鍵 = ?", (kian,)
+        elif ca_huat == CA_HUAT_BO_TIAU:
+            kian_index, kian = 1, im_piau_kian(im_piau)[1]
+            condition, params = "無調音標鍵 = ?", (kian,)
+        elif ca_huat == CA_HUAT_TSING_TSUE:
+            kian_index, kian = 1, _im_piau_tsing_tsue(im_piau)
+            if not kian:
+                raise ValueError("前綴反查之音標不可為空白")
+            # 以範圍條件取代 LIKE，令查詢可使用索引
+            upper = kian[:-1] + chr(ord(kian[-1]) + 1)
+            condition, params = "無調音標鍵 >= ? AND 無調音標鍵 < ?", (kian, upper)
+        elif ca_huat == CA_HUAT_UN_BU:
+            kian_index, kian = 3, split_tai_gi_im_piau(f"{im_piau.strip().lower()}1")[1]
+            condition, params = "韻母鍵 = ?", (kian,)
+        else:
+            raise ValueError(f"不支援之反查方式：{ca_huat}")
 
-                # 將結果加入列表
-                data.append(row_dict)
+        lui_piat = _lui_piat_condition(ue_im_lui_piat)
+        with self.get_connection() as conn:
+            time_col = self._get_time_order_column(conn)
+            # 各筆：(識別號, 漢字, 台羅音標, 常用度, 摘要說明, 排序時間, 台語音標鍵)
+            columns = f"識別號, 漢字, 台羅音標, 常用度, 摘要說明, {time_col}"
+            if self._has_im_piau_soo_in(conn):
+                query = f"""
+                SELECT {columns}, 台語音標鍵
+                FROM 漢字庫
+                WHERE {condition} AND ({lui_piat})
+                ORDER BY 台語音標鍵, COALESCE(常用度, 0) DESC, COALESCE({time_col}, '') DESC, 識別號
+                """
+                if limit is not None:
+                    query += f" LIMIT {int(limit)}"
+                results = connection_manager.fetchall(conn, query, params)
+                # 索引鍵尚待補算之紀錄（新增之讀音，或【台羅音標】遭改動者）
+                pending_query = f"SELECT {columns} FROM 漢字庫 WHERE 台語音標鍵 IS NULL AND ({lui_piat})"
+            else:
+                results = []
+                pending_query = f"SELECT {columns} FROM 漢字庫 WHERE {lui_piat}"
+            pending = connection_manager.fetchall(conn, pending_query)
 
-            return data
+        pending_results = []
+        for row in pending:
+            kian_list = im_piau_kian(row[2])
+            value = kian_list[kian_index]
+            if (kian <= value < upper) if upper else value == kian:
+                pending_results.append((*row, kian_list[0]))
+        if pending_results:
+            results = _sort_im_piau_results(list(results) + pending_results)[:limit]
+        return [_to_piau_im_dict(result[:5]) for result in results]
 
 
 # ============================================================================
@@ -303,7 +645,7 @@ def han_ji_ca_piau_im_list(
     db_path: str = "Ho_Lok_Ue.db",
 ) -> Dict[str, Optional[List[Dict[str, Union[str, float]]]]]:
     """
-    批次查詢多個漢字的讀音
+    批次查詢多個漢字的讀音（不重複之漢字，以一次 SQL 查詢取得）
 
     Args:
         han_ji_list: 要查詢的漢字列表
@@ -319,12 +661,23 @@ def han_ji_ca_piau_im_list(
         >>>     print(f"{han_ji}: {piau_im_list}")
     """
     ji_tian = HanJiTian(db_path)
-    results = {}
+    return ji_tian.han_ji_ca_piau_im_batch(han_ji_list, ue_im_lui_piat)
 
-    for han_ji in han_ji_list:
-        results[han_ji] = ji_tian.han_ji_ca_piau_im(han_ji, ue_im_lui_piat)
 
-    return results
+def im_piau_ca_han_ji(
+    im_piau: str,
+    ca_huat: str = CA_HUAT_CING_KHAK,
+    ue_im_lui_piat: str = "全部",
+    db_path: str = "Ho_Lok_Ue.db",
+) -> List[Dict[str, Union[str, float]]]:
+    """
+    以【台語音標】反查漢字（獨立函數版本）
+
+    範例:
+        >>> result = im_piau_ca_han_ji("ian", ca_huat="un_bu")
+        >>> print("".join(item["漢字"] for item in result))
+    """
+    return HanJiTian(db_path).im_piau_ca_han_ji(im_piau, ca_huat=ca_huat, ue_im_lui_piat=ue_im_lui_piat)
 
 
 # ============================================================================
@@ -396,4 +749,12 @@ def test():
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+
+    # 建立【台語音標】反查索引：python mod_ca_ji_tian.py --build-im-piau-soo-in [資料庫檔案]
+    if len(sys.argv) > 1 and sys.argv[1] == "--build-im-piau-soo-in":
+        db_path = sys.argv[2] if len(sys.argv) > 2 else "Ho_Lok_Ue.db"
+        total = ensure_im_piau_soo_in(db_path)
+        print(f"【漢字庫】反查索引已建立於 {db_path}：補算 {total} 筆索引鍵")
+    else:
+        test()
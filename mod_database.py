@@ -1,18 +1,166 @@
 """
 資料庫連線管理模組
 提供全域資料庫連線管理功能
+
+更新紀錄：
+v0.2.0 2026-10-18: 新增 SQLiteConnectionManager（全域單例：connection_manager），
+       供 HanJiTian、PiauIm、DatabaseManager 及 mod_廣韻_v5 共用：
+         - 唯讀連線：各執行緒共用一條（mode=ro、mmap_size、cache_size、query_only）；
+         - 寫入連線：每個資料庫一條（synchronous=NORMAL）；
+         - 擴大 SQL 指令快取（cached_statements），並依呼叫處統計查詢次數與耗時。
+v0.2.1 2026-10-18: 寫入連線改回預設之 rollback journal，不再切換成 WAL 模式：
+       WAL 模式會永久寫入資料庫檔，未 checkpoint 之異動留在 -wal 檔中，
+       提交至 git 之 .db 檔可能缺少最近之異動。
 """
 import os
 import sqlite3
+import sys
+import threading
+import time
 from contextlib import contextmanager
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
-from dotenv import load_dotenv
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
 
 # 載入環境變數
-load_dotenv()
+if load_dotenv:
+    load_dotenv()
 DB_PATH = os.getenv('DB_HO_LOK_UE', 'Ho_Lok_Ue.db')
 
+# 唯讀連線之調校參數
+MMAP_SIZE = 256 * 1024 * 1024  # 記憶體映射：256 MB
+CACHE_SIZE_KB = 16 * 1024  # 頁面快取：16 MB（PRAGMA cache_size 以負值表示 KiB）
+CACHED_STATEMENTS = 256  # 每條連線之 SQL 指令快取筆數
+
+
+# =========================================================================
+# 共用連線管理
+# =========================================================================
+class SQLiteConnectionManager:
+    """
+    SQLite 共用連線管理器。
+
+    唯讀連線：以 URI mode=ro 開啟，每個執行緒、每個資料庫共用一條；
+    寫入連線：沿用預設之 rollback journal（synchronous=NORMAL），每個資料庫一條
+    （不限定建立之執行緒）。
+    經由 execute()/fetchone()/fetchall() 執行之查詢，依呼叫處（模組:函式）
+    累計次數與耗時，以 stats() 取得。
+    """
+
+    def __init__(self, mmap_size: int = MMAP_SIZE, cache_size_kb: int = CACHE_SIZE_KB,
+                 cached_statements: int = CACHED_STATEMENTS):
+        self.mmap_size = mmap_size
+        self.cache_size_kb = cache_size_kb
+        self.cached_statements = cached_statements
+        self._lock = threading.Lock()
+        self._read_conns: Dict[tuple, sqlite3.Connection] = {}  # {(執行緒, db_key): 唯讀連線}
+        self._write_conns: Dict[str, sqlite3.Connection] = {}
+        self._stats: Dict[str, list] = {}  # {呼叫處: [次數, 耗時（秒）]}
+
+    @staticmethod
+    def db_key(db_path: str) -> str:
+        return os.path.abspath(db_path)
+
+    def read_connection(self, db_path: str) -> sqlite3.Connection:
+        """取得本執行緒之共用唯讀連線"""
+        key = (threading.get_ident(), self.db_key(db_path))
+        conn = self._read_conns.get(key)
+        if conn is None:
+            # 執行緒識別碼於執行緒結束後可能被重複使用，故不限定建立連線之執行緒
+            uri = f"{Path(key[1]).as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+            conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kb)}")
+            conn.execute("PRAGMA query_only = ON")
+            with self._lock:
+                self._read_conns[key] = conn
+        return conn
+
+    def write_connection(self, db_path: str) -> sqlite3.Connection:
+        """取得資料庫之寫入連線（synchronous=NORMAL）"""
+        db_key = self.db_key(db_path)
+        with self._lock:
+            conn = self._write_conns.get(db_key)
+            if conn is None:
+                conn = sqlite3.connect(db_key, check_same_thread=False,
+                                       cached_statements=self.cached_statements)
+                conn.execute("PRAGMA synchronous = NORMAL")
+                self._write_conns[db_key] = conn
+        return conn
+
+    def close(self, db_path: Optional[str] = None, read: bool = True, write: bool = True) -> None:
+        """關閉指定資料庫（None：全部資料庫）之連線；之後取用時，重新開啟"""
+        db_key = self.db_key(db_path) if db_path else None
+        with self._lock:
+            if read:
+                for key in [k for k in self._read_conns if db_key is None or k[1] == db_key]:
+                    self._read_conns.pop(key).close()
+            if write:
+                for key in [k for k in self._write_conns if db_key is None or k == db_key]:
+                    self._write_conns.pop(key).close()
+
+    # ---------------------------------------------------------------------
+    # 查詢統計
+    # ---------------------------------------------------------------------
+    def execute(self, conn: sqlite3.Connection, sql: str, params=(), call_site: Optional[str] = None):
+        """執行 SQL 指令，並累計呼叫處之次數與耗時"""
+        start = time.perf_counter()
+        try:
+            return conn.execute(sql, params)
+        finally:
+            self._record(call_site or _call_site(), time.perf_counter() - start)
+
+    def fetchone(self, conn: sqlite3.Connection, sql: str, params=(), call_site: Optional[str] = None):
+        start = time.perf_counter()
+        try:
+            return conn.execute(sql, params).fetchone()
+        finally:
+            self._record(call_site or _call_site(), time.perf_counter() - start)
+
+    def fetchall(self, conn: sqlite3.Connection, sql: str, params=(), call_site: Optional[str] = None):
+        start = time.perf_counter()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            self._record(call_site or _call_site(), time.perf_counter() - start)
+
+    def _record(self, call_site: str, elapsed: float) -> None:
+        with self._lock:
+            stat = self._stats.get(call_site)
+            if stat is None:
+                self._stats[call_site] = [1, elapsed]
+            else:
+                stat[0] += 1
+                stat[1] += elapsed
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """各呼叫處之查詢統計：{呼叫處: {"次數": n, "耗時": 秒}}，依耗時由大至小排列"""
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)
+            return {site: {"次數": count, "耗時": elapsed} for site, (count, elapsed) in items}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _call_site() -> str:
+    """呼叫 SQLiteConnectionManager 查詢方法之【模組:函式】"""
+    frame = sys._getframe(2)
+    # 略過 DatabaseManager 等本模組之轉接方法
+    while frame.f_back and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    return f"{Path(frame.f_code.co_filename).stem}:{frame.f_code.co_name}"
+
+
+# 全域共用之連線管理器
+connection_manager = SQLiteConnectionManager()
+
 
 class DatabaseManager:
     """資料庫管理器（單例模式）"""
@@ -22,6 +170,7 @@ class DatabaseManager:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._conn = None
+            cls._instance._db_path = None
         return cls._instance
 
     def connect(self, db_path: Optional[str] = None):
@@ -35,13 +184,19 @@ class DatabaseManager:
             sqlite3.Connection: 資料庫連線物件
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(db_path or DB_PATH)
+            self._db_path = db_path or DB_PATH
+            self._conn = connection_manager.write_connection(self._db_path)
         return self._conn
 
+    @property
+    def db_path(self) -> Optional[str]:
+        """目前連線之資料庫路徑（絕對路徑）；尚未連線者為 None"""
+        return connection_manager.db_key(self._db_path) if self._db_path else None
+
     def disconnect(self):
         """斷開資料庫連線"""
         if self._conn:
-            self._conn.close()
+            connection_manager.close(self._db_path, read=False)
             self._conn = None
 
     @property
@@ -77,9 +232,7 @@ class DatabaseManager:
         Returns:
             sqlite3.Cursor: 游標物件
         """
-        cursor = self.connection.cursor()
-        cursor.execute(sql, params)
-        return cursor
+        return connection_manager.execute(self.connection, sql, params)
 
     def executemany(self, sql: str, params_list: list):
         """
@@ -134,8 +287,7 @@ class DatabaseManager:
         Returns:
             tuple: 查詢結果
         """
-        cursor = self.execute(sql, params)
-        return cursor.fetchone()
+        return connection_manager.fetchone(self.connection, sql, params)
 
     def fetchall(self, sql: str, params: tuple = ()):
         """
@@ -148,8 +300,7 @@ class DatabaseManager:
         Returns:
             list: 查詢結果列表
         """
-        cursor = self.execute(sql, params)
-        return cursor.fetchall()
+        return connection_manager.fetchall(self.connection, sql, params)
 
 
 # =========================================================================
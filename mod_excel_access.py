@@ -1,5 +1,5 @@
 """
-mod_excel_access.py v0.2.2.2
+mod_excel_access.py v0.2.2.4
 提供 Excel 檔案存取相關的輔助函式
 """
 
@@ -14,13 +14,17 @@ from pathlib import Path
 from typing import Optional
 
 # 載入第三方套件
-import win32com.client  # 用於獲取作用中的 Excel 檔案
+try:
+    import win32com.client  # 用於獲取作用中的 Excel 檔案
+except ImportError:  # 非 Windows 環境（如：以 openpyxl 後端執行之批次主機）
+    win32com = None
 
 # 載入第三方套件
 import xlwings as xw
 from dotenv import load_dotenv
 
 from mod_logging import init_logging, logging_exc_error, logging_process_step
+from mod_儲存格格式 import StyleJournal, excel_color_to_rgb
 
 # 載入自訂模組
 from mod_piau_im_tng_huan import _has_meaningful_data
@@ -286,9 +290,10 @@ def get_row_col_from_coordinate(coord_str):
 
 # 定義儲存格格式
 def set_range_format(range_obj, font_name, font_size, font_color, fill_color=None):
-    range_obj.api.Font.Name = font_name
-    range_obj.api.Font.Size = font_size
-    range_obj.api.Font.Color = font_color
+    # font_color 沿用 Excel COM 之 BGR 長整數（如：0x009900），轉為 (r, g, b) 後設定
+    range_obj.font.name = font_name
+    range_obj.font.size = font_size
+    range_obj.font.color = excel_color_to_rgb(font_color)
     if fill_color:
         # range_obj.api.Interior.Color = fill_color
         # range_obj.color = (255, 255, 204)  # 淡黃色
@@ -370,54 +375,73 @@ def reset_cells_format_in_sheet(
         end_col_name = xw.utils.col_name(end_col)  # R
         print(f"重置【{sheet_name}】工作表之儲存格格式，範圍為：{start_col_name}{start_row}:{end_col_name}{end_row}。")
 
-        # 以【區塊】（range）方式設置儲存格格式
+        # 各【行】之格式，先記入格式日誌；待全部記錄完畢，再以【聯集位址】整批套用
+        style_journal = StyleJournal(sheet)
         row = start_row
-        for line in range(1, total_lines + 1):
+        last_row = None
+        total_reset_lines = 0
+        for _ in range(1, total_lines + 1):
             # 判斷是否已經超過結束列位址，若是則跳出迴圈
             if row > end_row:
                 break
-            # 顯示目前處理【狀態】
-            # print(f"重置 {line} 行：【漢字】儲存格位於【 {row} 列 】。")
-            print(f"重置【漢字注音】第 {line} 行 】。")
 
             # 人工標音
-            range_人工標音 = sheet.range((row - 2, start_col), (row - 2, end_col))
-            range_人工標音.value = None
-            set_range_format(
-                range_人工標音,
+            style_journal.set_range_style(
+                row - 2,
+                start_col,
+                row - 2,
+                end_col,
                 font_name="Arial",
                 font_size=24,
                 font_color=0xFF0000,  # 紅色
-                fill_color=(255, 255, 204),
-            )  # 淡黃色
+                color=(255, 255, 204),  # 淡黃色
+            )
 
             # 台語音標
-            range_台語音標 = sheet.range((row - 1, start_col), (row - 1, end_col))
-            range_台語音標.value = None
-            set_range_format(
-                range_台語音標,
+            style_journal.set_range_style(
+                row - 1,
+                start_col,
+                row - 1,
+                end_col,
                 font_name="Sitka Text Semibold",
                 font_size=24,
-                font_color=0xFF9933,
-            )  # 橙色
+                font_color=0xFF9933,  # 橙色
+            )
 
             # 漢字
-            range_漢字 = sheet.range((row, start_col), (row, end_col))
-            range_漢字.value = None
-            set_range_format(
-                range_漢字,
+            style_journal.set_range_style(
+                row,
+                start_col,
+                row,
+                end_col,
                 font_name="吳守禮細明台語注音",
                 font_size=48,
-                font_color=0x000000,
-            )  # 黑色
+                font_color=0x000000,  # 黑色
+            )
 
             # 漢字標音
-            range_漢字標音 = sheet.range((row + 1, start_col), (row + 1, end_col))
-            range_漢字標音.value = None
-            set_range_format(range_漢字標音, font_name="芫荽 0.94", font_size=26, font_color=0x009900)  # 綠色
+            style_journal.set_range_style(
+                row + 1,
+                start_col,
+                row + 1,
+                end_col,
+                font_name="芫荽 0.94",
+                font_size=26,
+                font_color=0x009900,  # 綠色
+            )
 
             # 準備處理下一【行】
+            last_row = row + 1
+            total_reset_lines += 1
             row += rows_per_line
+
+        if last_row is None:
+            return EXIT_CODE_SUCCESS
+
+        # 各【行】之 4 列彼此相連：一次清除整個區塊之內容
+        sheet.range((start_row - 2, start_col), (last_row, end_col)).value = None
+        total_calls = style_journal.flush()
+        print(f"已重置【{sheet_name}】工作表 {total_reset_lines} 行之儲存格格式（套用格式 {total_calls} 次）。")
     except Exception as e:
         logging_exc_error("重設【漢字注音】工作表儲存格格式時，發生錯誤：", e)
         return EXIT_CODE_PROCESS_FAILURE
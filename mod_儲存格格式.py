@@ -0,0 +1,206 @@
+"""
+mod_儲存格格式.py v0.1.0
+
+儲存格格式之【延遲套用日誌】（Style Journal）。
+
+逐一儲存格設定格式（填滿色、字型名稱、字型大小、字型顏色），每項設定即為一次
+Excel COM 呼叫；重置 120 行之【漢字注音】工作表，需數千次呼叫。
+
+StyleJournal 於作業過程中，僅記錄各儲存格最後設定之格式（後設定者覆蓋先設定者）；
+作業結束時，將【相同格式】之儲存格，合併成矩形區塊，再以 Excel【聯集位址】
+（如："D3:R3,D7:R7,D11:R11"）一次套用，令數千次呼叫縮減為數十次。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 StyleJournal 類別。
+"""
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+# 格式項目
+FILL_COLOR = "color"  # 填滿色
+FONT_NAME = "font_name"  # 字型名稱
+FONT_SIZE = "font_size"  # 字型大小
+FONT_COLOR = "font_color"  # 字型顏色
+STYLE_ATTRS = (FILL_COLOR, FONT_NAME, FONT_SIZE, FONT_COLOR)
+
+# Excel Range() 位址字串之長度上限
+MAX_ADDRESS_LENGTH = 255
+
+
+# =========================================================================
+# 工具函式
+# =========================================================================
+def excel_color_to_rgb(color):
+    """
+    將 Excel COM 之色彩值（BGR 長整數，如 .api.Font.Color = 0x009900），
+    轉換為 xlwings 之 (r, g, b)；其餘格式（tuple、"#RRGGBB"、None）原樣傳回。
+    """
+    if isinstance(color, int):
+        return color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF
+    return color
+
+
+def col_name(col: int) -> str:
+    """欄號轉欄名：1 → A、27 → AA"""
+    name = ""
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+def range_address(first_row: int, first_col: int, last_row: int, last_col: int) -> str:
+    """矩形區塊之 Excel 位址：如 "D3:R3"；單一儲存格為 "D3" """
+    first = f"{col_name(first_col)}{first_row}"
+    if (first_row, first_col) == (last_row, last_col):
+        return first
+    return f"{first}:{col_name(last_col)}{last_row}"
+
+
+def coalesce_cells(cells) -> list[tuple[int, int, int, int]]:
+    """
+    將儲存格座標集合，合併成矩形區塊。
+
+    先將同一列之相鄰儲存格合併為【列區段】，再將相鄰列中欄位相同之區段，
+    向下合併為矩形。
+
+    :param cells: [(row, col), ...]
+    :return: [(first_row, first_col, last_row, last_col), ...]，依列、欄排序
+    """
+    by_row: dict[int, list[int]] = {}
+    for row, col in cells:
+        by_row.setdefault(row, []).append(col)
+
+    # 各列之連續欄區段
+    row_runs: dict[int, list[tuple[int, int]]] = {}
+    for row, cols in by_row.items():
+        cols = sorted(set(cols))
+        runs = []
+        first = last = cols[0]
+        for col in cols[1:]:
+            if col == last + 1:
+                last = col
+                continue
+            runs.append((first, last))
+            first = last = col
+        runs.append((first, last))
+        row_runs[row] = runs
+
+    # 欄區段相同且列相鄰者，向下延伸成矩形
+    blocks = []
+    open_blocks: dict[tuple[int, int], list[int]] = {}  # (first_col, last_col) → [first_row, last_row]
+    for row in sorted(row_runs):
+        runs = set(row_runs[row])
+        for run, rows in list(open_blocks.items()):
+            if run in runs and rows[1] == row - 1:
+                rows[1] = row
+                runs.discard(run)
+            else:
+                blocks.append((rows[0], run[0], rows[1], run[1]))
+                del open_blocks[run]
+        for run in runs:
+            open_blocks[run] = [row, row]
+    for run, rows in open_blocks.items():
+        blocks.append((rows[0], run[0], rows[1], run[1]))
+    return sorted(blocks)
+
+
+def union_addresses(blocks, max_length: int = MAX_ADDRESS_LENGTH) -> list[str]:
+    """將矩形區塊組成 Excel 聯集位址字串；超過長度上限者，分成多個字串"""
+    addresses = []
+    current = ""
+    for block in blocks:
+        address = range_address(*block)
+        if current and len(current) + 1 + len(address) > max_length:
+            addresses.append(current)
+            current = address
+        else:
+            current = f"{current},{address}" if current else address
+    if current:
+        addresses.append(current)
+    return addresses
+
+
+# =========================================================================
+# 格式日誌
+# =========================================================================
+class StyleJournal:
+    """
+    延遲套用之儲存格格式日誌。
+
+    Args:
+        sheet: 工作表物件（xlwings Sheet 或 mod_活頁簿.XlsxSheet）
+    """
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+        # {(row, col): {attr: value}}
+        self._styles: dict[tuple[int, int], dict] = {}
+
+    def __len__(self):
+        return len(self._styles)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._styles)
+
+    def set_style(self, row: int, col: int, **style) -> None:
+        """
+        記錄單一儲存格之格式。
+
+        :param style: color（填滿色）、font_name、font_size、font_color；
+                      color 或 font_color 為 None 者，表示【無填滿】或【預設顏色】
+        """
+        for attr in style:
+            if attr not in STYLE_ATTRS:
+                raise ValueError(f"不支援之格式項目：{attr}")
+        self._styles.setdefault((row, col), {}).update(style)
+
+    def set_range_style(self, first_row: int, first_col: int, last_row: int, last_col: int, **style) -> None:
+        """記錄矩形區塊內，所有儲存格之格式"""
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                self.set_style(row, col, **style)
+
+    def get_style(self, row: int, col: int, attr: str, default=None):
+        """取得儲存格尚未套用之格式；未記錄者，傳回 default"""
+        return self._styles.get((row, col), {}).get(attr, default)
+
+    def has_style(self, row: int, col: int, attr: str) -> bool:
+        return attr in self._styles.get((row, col), {})
+
+    def groups(self) -> dict[tuple[str, object], list[tuple[int, int]]]:
+        """依【格式項目 + 設定值】分組：{(attr, value): [(row, col), ...]}"""
+        groups: dict[tuple[str, object], list[tuple[int, int]]] = {}
+        for cell, style in self._styles.items():
+            for attr, value in style.items():
+                key = (attr, tuple(value) if isinstance(value, list) else value)
+                groups.setdefault(key, []).append(cell)
+        return groups
+
+    def flush(self) -> int:
+        """
+        將記錄之格式，以聯集位址整批套用至工作表。
+
+        Returns:
+            int: 套用格式之次數（每個聯集位址、每個格式項目一次）
+        """
+        total_calls = 0
+        for (attr, value), cells in self.groups().items():
+            for address in union_addresses(coalesce_cells(cells)):
+                self._apply(self.sheet.range(address), attr, value)
+                total_calls += 1
+        self._styles.clear()
+        return total_calls
+
+    @staticmethod
+    def _apply(rng, attr: str, value) -> None:
+        if attr == FILL_COLOR:
+            rng.color = excel_color_to_rgb(value)
+        elif attr == FONT_NAME:
+            rng.font.name = value
+        elif attr == FONT_SIZE:
+            rng.font.size = value
+        elif attr == FONT_COLOR:
+            rng.font.color = excel_color_to_rgb(value)
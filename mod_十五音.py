@@ -1,5 +1,43 @@
 import re
 
+from mod_database import connection_manager
+
+# 漢字表查詢結果欄位
+HAN_JI_PIAU_FIELDS = [
+    '識別號', '漢字', '漢字標音', '常用度', '切音', '字韻', '聲調', '舒促聲',
+    '聲', '韻', '調', '雅俗通標音', '十五音標音'
+]
+
+# 【聲調】名稱 → 台語音標調號
+SIANN_TIAU_TIAU_HO = {
+    '上平': 1,
+    '上上': 2,
+    '上去': 3,
+    '上入': 4,
+    '下平': 5,
+    '下上': 6,
+    '下去': 7,
+    '下入': 8,
+}
+
+# 入聲為【促聲】，其餘為【舒聲】
+SIANN_TIAU_SU_CHIOK = {siann_tiau: '促聲' if siann_tiau.endswith('入') else '舒聲' for siann_tiau in SIANN_TIAU_TIAU_HO}
+
+
+def ensure_han_ji_piau_soo_in(cursor):
+    """
+    為【漢字表】建立涵蓋索引（covering index）：以【漢字】或【切語】查詢時，
+    僅需讀取索引，不必回頭讀取資料表。索引已存在者，不重複建立。
+
+    :param cursor: 數據庫游標（須可寫入）
+    """
+    columns = ', '.join(HAN_JI_PIAU_FIELDS[1:] + ['識別號'])
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_漢字表_漢字 ON 漢字表({columns})")
+    ciat_gu_columns = ['字韻', '切音', '聲調'] + [field for field in HAN_JI_PIAU_FIELDS if field not in ('字韻', '切音', '聲調')]
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_漢字表_切語 ON 漢字表({', '.join(ciat_gu_columns)})")
+    cursor.connection.commit()
+
+
 """
 用 `漢字` 查詢《彙集雅俗通十五音》的標音
 """
@@ -86,4 +124,111 @@ def tiau_ho_tng_siann_tiau(調號):
         '七' : '下去',
         '八' : '下入',
     }
-    return 聲調.get(調號, None)
\ No newline at end of file
+    return 聲調.get(調號, None)
+
+
+def ciat_gu_tng_huan(ciat_gu):
+    """
+    將【切語】（如：君五求）拆分為：(字韻, 聲調, 切音)；格式不符者，傳回 None。
+    """
+    if len(ciat_gu) != 3:
+        return None
+    聲調 = tiau_ho_tng_siann_tiau(ciat_gu[1])
+    if 聲調 is None:
+        return None
+    return ciat_gu[0], 聲調, ciat_gu[2]
+
+
+# ==========================================================
+# 反切引擎：一次載入【漢字表】，之後之反切查詢皆於記憶體中完成
+# ==========================================================
+class SipNgooImHuanCiat:
+    """
+    《彙集雅俗通十五音》反切引擎。
+
+    建立時一次讀入【漢字表】，預先建立：
+      - 切音（上字）→ 聲母
+      - (字韻（下字）, 舒促聲) → 韻母
+      - (字韻, 聲調, 切音) → 漢字讀音列表（依常用度由大至小）
+      - 漢字 → 漢字讀音列表
+    切語中無漢字者（韻圖之空格），仍可依聲母、韻母、聲調推得【台語音標】。
+
+    :param cursor: 數據庫游標
+    """
+
+    def __init__(self, cursor):
+        cursor.execute(
+            f"""
+            SELECT {', '.join(HAN_JI_PIAU_FIELDS)}
+            FROM 漢字表
+            ORDER BY COALESCE(常用度, 0) DESC, 識別號;
+            """
+        )
+        self.siann_bu = {}  # 切音 → 聲
+        self.un_bu = {}  # (字韻, 舒促聲) → 韻
+        self.ciat_gu_han_ji = {}  # (字韻, 聲調, 切音) → [資料列, ...]
+        self.han_ji_piau_im = {}  # 漢字 → [資料列, ...]
+        # 資料列維持 tuple，查詢時才轉換為字典，以縮短載入時間
+        for row in cursor.fetchall():
+            _, 漢字, _, _, 切音, 字韻, 聲調, 舒促聲, 聲, 韻, *_ = row
+            self.siann_bu.setdefault(切音, 聲)
+            self.un_bu.setdefault((字韻, 舒促聲), 韻)
+            self.ciat_gu_han_ji.setdefault((字韻, 聲調, 切音), []).append(row)
+            self.han_ji_piau_im.setdefault(漢字, []).append(row)
+
+    def han_ji_ca_piau_im(self, han_ji):
+        """同 han_ji_ca_piau_im()，自記憶體查詢"""
+        return [dict(zip(HAN_JI_PIAU_FIELDS, row)) for row in self.han_ji_piau_im.get(han_ji, [])]
+
+    def huan_ciat_ca_piau_im(self, 字韻, 聲調, 切音):
+        """同 huan_ciat_ca_piau_im()，自記憶體查詢"""
+        return [dict(zip(HAN_JI_PIAU_FIELDS, row)) for row in self.ciat_gu_han_ji.get((字韻, 聲調, 切音), [])]
+
+    def ca_ciat_gu(self, ciat_gu):
+        """
+        反切查詢：依【切語】（如：君五求）推得讀音，並列出同音之漢字。
+
+        :param ciat_gu: 切語：【字韻】【調號】【切音】
+        :return: 讀音字典：切語、字韻、聲調、切音、聲母、韻母、調、台語音標、漢字（讀音字典列表）；
+                 切語格式不符，或字韻、切音不在韻書中者，傳回 None
+        """
+        parsed = ciat_gu_tng_huan(ciat_gu)
+        if parsed is None:
+            return None
+        字韻, 聲調, 切音 = parsed
+        聲母 = self.siann_bu.get(切音)
+        韻母 = self.un_bu.get((字韻, SIANN_TIAU_SU_CHIOK[聲調]))
+        if 聲母 is None or 韻母 is None:
+            return None
+        調 = SIANN_TIAU_TIAU_HO[聲調]
+        return {
+            '切語': ciat_gu,
+            '字韻': 字韻,
+            '聲調': 聲調,
+            '切音': 切音,
+            '聲母': 聲母,
+            '韻母': 韻母,
+            '調': 調,
+            '台語音標': f"{聲母}{韻母}{調}",
+            '漢字': self.huan_ciat_ca_piau_im(字韻, 聲調, 切音),
+        }
+
+    def ca_ciat_gu_batch(self, ciat_gu_list):
+        """
+        批次反切查詢。
+
+        :param ciat_gu_list: 切語列表（可重複；僅查詢不重複者）
+        :return: {切語: ca_ciat_gu() 之結果}
+        """
+        return {ciat_gu: self.ca_ciat_gu(ciat_gu) for ciat_gu in dict.fromkeys(ciat_gu_list)}
+
+
+_huan_ciat_engines = {}
+
+
+def get_huan_ciat(db_path='雅俗通十五音字典.db'):
+    """取得資料庫之反切引擎（每個資料庫於程式執行期間僅載入一次）"""
+    db_key = connection_manager.db_key(db_path)
+    if db_key not in _huan_ciat_engines:
+        _huan_ciat_engines[db_key] = SipNgooImHuanCiat(connection_manager.read_connection(db_path).cursor())
+    return _huan_ciat_engines[db_key]
@@ -0,0 +1,276 @@
+"""
+mod_字典聯查.py v0.1.0
+
+【字典聯查】：同時查詢【河洛話】（Ho_Lok_Ue.db）、【雅俗通十五音】
+（雅俗通十五音字典.db）及【廣韻】（Kong_Un.db）三部字典，將各字典之讀音
+轉換成【台語音標】（TLPA）後合併，依加權分數排序，並註明各讀音之出處。
+
+原 a108、a300 查詢漢字讀音時，僅查一部字典；欲對照他部字典，須另行執行程式。
+LianCaJiTian 之作法：
+  - 每部字典配置一條專屬執行緒（單一工作者之 ThreadPoolExecutor），
+    各字典同時查詢；因執行緒固定，mod_database.connection_manager 為每部字典
+    僅開啟、留存一條唯讀連線；
+  - 各字典之讀音，經既有之音標轉換函式（split_tai_gi_im_piau），統一為【台語音標】；
+  - 相同讀音合併為一筆候選，分數為各字典【權重 × 常用度】之和。
+
+字典檔案不存在者，視為【無法使用】，略過不查（不會建立空白資料庫）。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 LianCaJiTian 類別。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+import mod_十五音
+import mod_廣韻_v5
+from mod_ca_ji_tian import HanJiTian
+from mod_database import connection_manager
+from mod_標音 import split_tai_gi_im_piau
+
+# 載入環境變數
+load_dotenv()
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+# 字典名稱
+HO_LOK_UE = "河洛話"
+SIP_NGOO_IM = "十五音"
+KONG_UN = "廣韻"
+
+# 預設字典檔案（依查詢順序）
+DEFAULT_SOURCES = {
+    HO_LOK_UE: os.getenv("DB_HO_LOK_UE", "Ho_Lok_Ue.db"),
+    SIP_NGOO_IM: os.getenv("DB_SIP_NGOO_IM", "雅俗通十五音字典.db"),
+    KONG_UN: os.getenv("DB_KONG_UN", "Kong_Un.db"),
+}
+
+# 各字典之權重：河洛話字典專為台語文讀/白話音而編，權重最高
+SOURCE_WEIGHTS = {
+    HO_LOK_UE: 1.0,
+    SIP_NGOO_IM: 0.6,
+    KONG_UN: 0.4,
+}
+
+# 字典未載【常用度】者，以此值計分
+DEFAULT_SIONG_IONG_TOO = 0.5
+
+
+# =========================================================================
+# 音標轉換
+# =========================================================================
+def tng_tlpa(im_piau: Optional[str]) -> str:
+    """
+    將字典之標音，轉換成【台語音標】（聲母＋韻母＋調號）。
+
+    《雅俗通十五音》以 q 標示【英】母（零聲母），如：qun1 → un1。
+
+    :param im_piau: 字典之標音（台羅拼音、台語音標，或十五音之漢字標音）
+    :return: 台語音標；標音為空值者，傳回空字串
+    """
+    im_piau = (im_piau or "").strip()
+    if not im_piau:
+        return ""
+    if im_piau[0] == "q":
+        im_piau = im_piau[1:]
+    siann_bu, un_bu, tiau_ho = split_tai_gi_im_piau(im_piau)
+    return f"{siann_bu}{un_bu}{tiau_ho}"
+
+
+# =========================================================================
+# 各字典之查詢函式：傳回 {漢字: [讀音字典, ...]}
+# 讀音字典含：台語音標、常用度、原標音、說明
+# =========================================================================
+def _ca_ho_lok_ue(db_path: str, han_ji_list: List[str]) -> Dict[str, List[Dict]]:
+    ji_tian = HanJiTian(db_path)
+    results = {}
+    for han_ji, piau_im_list in ji_tian.han_ji_ca_piau_im_batch(han_ji_list, display_all_piau_im=True).items():
+        results[han_ji] = [
+            {
+                "台語音標": piau_im["台語音標"],
+                "常用度": piau_im["常用度"],
+                "原標音": piau_im["台語音標"],
+                "說明": piau_im["摘要說明"],
+            }
+            for piau_im in piau_im_list or []
+        ]
+    return results
+
+
+def _ca_sip_ngoo_im(db_path: str, han_ji_list: List[str]) -> Dict[str, List[Dict]]:
+    cursor = connection_manager.read_connection(db_path).cursor()
+    results = {}
+    for han_ji in han_ji_list:
+        results[han_ji] = [
+            {
+                "台語音標": tng_tlpa(row["漢字標音"]),
+                "常用度": row["常用度"],
+                "原標音": row["漢字標音"],
+                "說明": row["十五音標音"],
+            }
+            for row in mod_十五音.han_ji_ca_piau_im(cursor, han_ji)
+        ]
+    return results
+
+
+def _ca_kong_un(db_path: str, han_ji_list: List[str]) -> Dict[str, List[Dict]]:
+    cursor = connection_manager.read_connection(db_path).cursor()
+    results = {}
+    for han_ji in han_ji_list:
+        piau_im_list = []
+        for row in mod_廣韻_v5.han_ji_ca_piau_im(cursor, han_ji):
+            # 台羅聲調：第 6 調，等同第 2 調（同 KongUnHuanCiat.ca_ciat_gu()）
+            tiau = 2 if row["台羅聲調"] == 6 else row["台羅聲調"]
+            siann_bu = "" if row["聲母標音"] == "Ø" else (row["聲母標音"] or "")
+            im_piau = f"{siann_bu}{row['韻母標音'] or ''}{tiau or ''}" if row["韻母標音"] else row["標音"]
+            piau_im_list.append(
+                {
+                    "台語音標": tng_tlpa(im_piau),
+                    "常用度": row["常用度"],
+                    "原標音": row["標音"],
+                    "說明": f"{row['上字']}{row['下字']}切",
+                }
+            )
+        results[han_ji] = piau_im_list
+    return results
+
+
+SOURCE_LOOKUPS = {
+    HO_LOK_UE: _ca_ho_lok_ue,
+    SIP_NGOO_IM: _ca_sip_ngoo_im,
+    KONG_UN: _ca_kong_un,
+}
+
+
+# =========================================================================
+# 字典聯查
+# =========================================================================
+class LianCaJiTian:
+    """
+    多部字典聯查。
+
+    Args:
+        sources: {字典名稱: 資料庫檔案}；字典名稱須為 SOURCE_LOOKUPS 所列者，
+                 預設為 DEFAULT_SOURCES
+        weights: {字典名稱: 權重}；預設為 SOURCE_WEIGHTS
+
+    範例:
+        >>> with LianCaJiTian() as ji_tian:
+        ...     for candidate in ji_tian.ca("東"):
+        ...         print(candidate["台語音標"], [lai_goan["字典"] for lai_goan in candidate["來源"]])
+    """
+
+    def __init__(self, sources: Optional[Dict[str, str]] = None, weights: Optional[Dict[str, float]] = None):
+        self.sources = dict(DEFAULT_SOURCES if sources is None else sources)
+        for name in self.sources:
+            if name not in SOURCE_LOOKUPS:
+                raise ValueError(f"不支援之字典：{name}")
+        self.weights = dict(SOURCE_WEIGHTS if weights is None else weights)
+        # 每部字典一條專屬執行緒，令連線管理器為每部字典僅留存一條唯讀連線
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"字典聯查_{name}")
+            for name in self.sources
+        }
+        self._bo_hoat_su_iong = set()  # 已警告過之無法使用字典
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """結束各字典之查詢執行緒"""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._executors.clear()
+
+    def available_sources(self) -> List[str]:
+        """可使用（資料庫檔案存在）之字典名稱"""
+        return [name for name, db_path in self.sources.items() if os.path.exists(db_path)]
+
+    def ca_batch(self, han_ji_list: List[str]) -> Dict[str, List[Dict]]:
+        """
+        批次聯查：各字典同時查詢不重複之漢字，再逐字合併、排序。
+
+        Args:
+            han_ji_list: 欲查詢的漢字（可重複；僅查詢不重複者）
+
+        Returns:
+            {漢字: 候選讀音列表}；候選讀音依【分數】由大至小排序，各含：
+              漢字、台語音標、分數、來源（[{字典, 台語音標, 常用度, 原標音, 說明}, ...]）
+        """
+        distinct_han_ji = list(dict.fromkeys(han_ji_list))
+        futures = {}
+        for name in self.available_sources():
+            futures[name] = self._executors[name].submit(SOURCE_LOOKUPS[name], self.sources[name], distinct_han_ji)
+        for name in self.sources:
+            if name not in futures and name not in self._bo_hoat_su_iong:
+                self._bo_hoat_su_iong.add(name)
+                logging.warning(f"【{name}】字典檔案不存在：{self.sources[name]}，略過不查。")
+
+        answers = {}
+        for name, future in futures.items():
+            try:
+                answers[name] = future.result()
+            except sqlite3.Error as e:
+                logging.error(f"【{name}】字典查詢失敗：{e}")
+
+        return {han_ji: self._merge(han_ji, answers) for han_ji in distinct_han_ji}
+
+    def ca(self, han_ji: str) -> List[Dict]:
+        """聯查單一漢字；傳回格式同 ca_batch() 之值"""
+        return self.ca_batch([han_ji])[han_ji]
+
+    def _merge(self, han_ji: str, answers: Dict[str, Dict[str, List[Dict]]]) -> List[Dict]:
+        candidates = {}
+        for name in self.sources:
+            weight = self.weights.get(name, DEFAULT_SIONG_IONG_TOO)
+            for piau_im in answers.get(name, {}).get(han_ji, []):
+                if not piau_im["台語音標"]:
+                    continue
+                candidate = candidates.setdefault(
+                    piau_im["台語音標"],
+                    {"漢字": han_ji, "台語音標": piau_im["台語音標"], "分數": 0.0, "來源": []},
+                )
+                siong_iong_too = piau_im["常用度"]
+                if not isinstance(siong_iong_too, (int, float)):
+                    siong_iong_too = DEFAULT_SIONG_IONG_TOO
+                candidate["分數"] += weight * siong_iong_too
+                candidate["來源"].append({"字典": name, **piau_im})
+
+        for candidate in candidates.values():
+            candidate["分數"] = round(candidate["分數"], 4)
+        # 分數相同者，保持字典順序（河洛話 → 十五音 → 廣韻）及各字典之排序
+        return sorted(candidates.values(), key=lambda candidate: candidate["分數"], reverse=True)
+
+
+_lian_ca_ji_tian = None
+
+
+def get_lian_ca_ji_tian() -> LianCaJiTian:
+    """取得預設字典之聯查物件（程式執行期間共用一個）"""
+    global _lian_ca_ji_tian
+    if _lian_ca_ji_tian is None:
+        _lian_ca_ji_tian = LianCaJiTian()
+    return _lian_ca_ji_tian
+
+
+def format_lai_goan(candidate: Dict) -> str:
+    """候選讀音之出處，如：河洛話(0.80)、十五音(君五求)"""
+    parts = []
+    for lai_goan in candidate["來源"]:
+        if lai_goan["字典"] == HO_LOK_UE:
+            parts.append(f"{lai_goan['字典']}({lai_goan['常用度']})")
+        else:
+            parts.append(f"{lai_goan['字典']}({lai_goan['說明']})")
+    return "、".join(parts)
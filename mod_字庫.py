@@ -1,5 +1,5 @@
 """
-mod_字庫.py v0.2.7
+mod_字庫.py v0.2.8
 
 令 Excel 工作表資料，轉換成 dict 資料結構之【字庫】，
 以利程式將 Excel 工作表視同一資料庫內含之【資料表】（Table）
@@ -8,10 +8,19 @@ mod_字庫.py v0.2.7
 更新紀錄：
 v0.2.6 2026-02-26: 變更 create_ji_khoo_dict_from_sheet 類方法，從 Excel 工作表建立字庫物件。
 v0.2.7 2026-02-26: 新增 create_ji_khoo_dict_from_sheet 類方法的 ignore_empty 參數，允許在工作表無資料時回傳空字典而不拋出例外。
+v0.2.8 2026-10-18: 改寫字庫之資料結構，令查詢作業不再逐筆掃描整部字庫：
+    - 資料紀錄改用 JiKhooEntry（__slots__），仍可如 dict 以 entry["coordinates"] 存取；
+    - 【座標】欄改用 Coordinates：依加入順序保存之集合，判斷座標是否存在為 O(1)；
+    - 新增【座標 → 資料紀錄】反查索引；
+    - 維護【列號】索引（Fenwick 樹），其順序與 write_to_excel_sheet 寫入工作表之順序相同；
+    - 快取資料紀錄筆數（len）。
+    另新增 bench_ji_khoo_dict() 效能量測函式（python mod_字庫.py --bench）。
 """
 
 import logging
 import os
+import time
+from collections.abc import Mapping, MutableMapping
 
 from dotenv import load_dotenv
 
@@ -54,22 +63,302 @@ EXIT_CODE_INVALID_INPUT = 2  # 輸入錯誤
 EXIT_CODE_PROCESS_FAILURE = 3  # 過程失敗
 EXIT_CODE_UNKNOWN_ERROR = 99  # 未知錯誤
 
+# 資料紀錄之欄位名稱
+ENTRY_KEYS = ("tai_gi_im_piau", "hau_ziann_im_piau", "coordinates")
+
+
+def _coordinate_key(coordinate) -> tuple:
+    """座標一律以 tuple 保存，令 [row, col] 與 (row, col) 視為同一座標"""
+    return coordinate if type(coordinate) is tuple else tuple(coordinate)
+
+
+# =========================================================================
+# 【座標】欄：依加入順序保存之集合
+# =========================================================================
+class Coordinates:
+    """
+    資料紀錄之【座標】欄。
+
+    以 dict 之鍵保存座標，兼具 list 之加入順序與 set 之 O(1) 查詢；
+    對外提供 list 常用之操作（append、remove、in、索引、迭代）。
+    座標已存在時，append 不會重複加入。
+
+    座標之增刪，會通知所屬之 JiKhooEntry，以維護字庫之反查索引。
+    """
+
+    __slots__ = ("_items", "_entry")
+
+    def __init__(self, coordinates=(), entry=None):
+        self._items = dict.fromkeys(_coordinate_key(coord) for coord in coordinates)
+        self._entry = entry
+
+    def __contains__(self, coordinate):
+        try:
+            return coordinate in self._items
+        except TypeError:
+            return _coordinate_key(coordinate) in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __getitem__(self, index):
+        return list(self._items)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Coordinates):
+            return list(self._items) == list(other._items)
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == [_coordinate_key(coord) for coord in other]
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self._items))
+
+    def __deepcopy__(self, memo):
+        return Coordinates(self._items)
+
+    def append(self, coordinate) -> None:
+        coordinate = _coordinate_key(coordinate)
+        if coordinate in self._items:
+            return
+        self._items[coordinate] = None
+        if self._entry is not None:
+            self._entry._coordinate_added(coordinate)
+
+    def remove(self, coordinate) -> None:
+        coordinate = _coordinate_key(coordinate)
+        if coordinate not in self._items:
+            raise ValueError(f"座標 {coordinate} 不在清單中。")
+        del self._items[coordinate]
+        if self._entry is not None:
+            self._entry._coordinate_removed(coordinate)
+
+    def discard(self, coordinate) -> bool:
+        """移除座標；座標不存在時不拋出例外。傳回：是否確有移除"""
+        if coordinate not in self:
+            return False
+        self.remove(coordinate)
+        return True
+
+
+# =========================================================================
+# 資料紀錄
+# =========================================================================
+class JiKhooEntry(MutableMapping):
+    """
+    字庫之一筆資料紀錄：【漢字】+【台語音標】+【校正音標】+【座標】。
+
+    以 __slots__ 保存欄位；為與舊版相容，仍可如 dict 以
+    entry["tai_gi_im_piau"]、entry.get("coordinates", []) 存取。
+    """
+
+    __slots__ = ("han_ji", "tai_gi_im_piau", "hau_ziann_im_piau", "_coordinates", "_ji_khoo")
+
+    def __init__(self, han_ji: str, tai_gi_im_piau: str, hau_ziann_im_piau: str, coordinates=()):
+        self.han_ji = han_ji
+        self.tai_gi_im_piau = tai_gi_im_piau
+        self.hau_ziann_im_piau = hau_ziann_im_piau
+        self._coordinates = Coordinates(coordinates, entry=self)
+        self._ji_khoo = None  # 所屬之 JiKhooDict
+
+    @property
+    def coordinates(self) -> Coordinates:
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates) -> None:
+        old_coordinates = self._coordinates
+        was_visible = bool(old_coordinates)
+        old_coordinates._entry = None
+        self._coordinates = Coordinates(coordinates, entry=self)
+        ji_khoo = self._ji_khoo
+        if ji_khoo is not None:
+            for coordinate in old_coordinates:
+                ji_khoo._unindex_coordinate(coordinate, self)
+            for coordinate in self._coordinates:
+                ji_khoo._index_coordinate(coordinate, self)
+            if was_visible != bool(self._coordinates):
+                ji_khoo._row_index.add(self.han_ji, 1 if self._coordinates else -1)
+
+    # ---------------------------------------------------------------------
+    # 與 dict 相容之存取介面
+    # ---------------------------------------------------------------------
+    def __getitem__(self, key):
+        if key not in ENTRY_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in ENTRY_KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        raise KeyError(f"資料紀錄之欄位 '{key}' 不可刪除。")
+
+    def __iter__(self):
+        return iter(ENTRY_KEYS)
+
+    def __len__(self):
+        return len(ENTRY_KEYS)
+
+    def __contains__(self, key):
+        return key in ENTRY_KEYS
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        try:
+            return (
+                self.tai_gi_im_piau == other["tai_gi_im_piau"]
+                and self.hau_ziann_im_piau == other["hau_ziann_im_piau"]
+                and self._coordinates == list(other["coordinates"])
+                and len(other) == len(ENTRY_KEYS)
+            )
+        except KeyError:
+            return False
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def __deepcopy__(self, memo):
+        return JiKhooEntry(self.han_ji, self.tai_gi_im_piau, self.hau_ziann_im_piau, self._coordinates)
+
+    def to_dict(self) -> dict:
+        return {
+            "tai_gi_im_piau": self.tai_gi_im_piau,
+            "hau_ziann_im_piau": self.hau_ziann_im_piau,
+            "coordinates": list(self._coordinates),
+        }
+
+    # ---------------------------------------------------------------------
+    # 座標異動通知
+    # ---------------------------------------------------------------------
+    def _coordinate_added(self, coordinate) -> None:
+        ji_khoo = self._ji_khoo
+        if ji_khoo is None:
+            return
+        ji_khoo._index_coordinate(coordinate, self)
+        if len(self._coordinates) == 1:
+            ji_khoo._row_index.add(self.han_ji, 1)
+
+    def _coordinate_removed(self, coordinate) -> None:
+        ji_khoo = self._ji_khoo
+        if ji_khoo is None:
+            return
+        ji_khoo._unindex_coordinate(coordinate, self)
+        if not self._coordinates:
+            ji_khoo._row_index.add(self.han_ji, -1)
+
+
+# =========================================================================
+# 列號索引
+# =========================================================================
+class _RowIndex:
+    """
+    【列號】索引：依【漢字】加入字庫之順序，以 Fenwick 樹（Binary Indexed Tree）
+    累計各【漢字】寫入工作表之資料紀錄筆數（座標非空者）。
+
+    字庫之【漢字】只增不減（資料紀錄清空時，仍保留空清單），故【漢字】之序號固定；
+    新增、移除資料紀錄，或座標清空、復用時，更新及查詢列號皆為 O(log n)。
+    """
+
+    __slots__ = ("_tree", "_keys", "_ordinals")
+
+    def __init__(self):
+        self._tree = [0]  # 1-based
+        self._keys: list[str] = []
+        self._ordinals: dict[str, int] = {}
+
+    def __len__(self):
+        return self._prefix(len(self._keys))
+
+    def _prefix(self, i: int) -> int:
+        total = 0
+        tree = self._tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _ordinal(self, han_ji: str) -> int:
+        i = self._ordinals.get(han_ji)
+        if i is None:
+            self._keys.append(han_ji)
+            i = len(self._keys)
+            self._ordinals[han_ji] = i
+            # 新節點涵蓋 (i - lowbit(i), i] 之區間
+            self._tree.append(self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        return i
+
+    def add(self, han_ji: str, delta: int) -> None:
+        """【漢字】寫入工作表之資料紀錄筆數，增減 delta"""
+        i = self._ordinal(han_ji)
+        tree = self._tree
+        size = len(self._keys)
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def rows_before(self, han_ji: str) -> int:
+        """排在【漢字】之前，寫入工作表之資料紀錄筆數"""
+        return self._prefix(self._ordinal(han_ji) - 1)
+
+    def find(self, index: int) -> tuple[str, int]:
+        """
+        第 index 筆（0 起算）寫入工作表之資料紀錄，屬於哪個【漢字】。
+
+        Returns:
+            tuple: (漢字, 該漢字之第幾筆寫入工作表之資料紀錄（0 起算）)
+        """
+        tree = self._tree
+        size = len(self._keys)
+        pos = 0
+        remaining = index
+        step = 1 << size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] <= remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return self._keys[pos], remaining
+
 
 class JiKhooDict:
     def __init__(self, name: str = ""):
         self.name = name
-        self.ji_khoo_dict = {}
+        # {漢字: [JiKhooEntry, ...]}
+        self.ji_khoo_dict: dict[str, list[JiKhooEntry]] = {}
+        # 反查索引：{座標: [JiKhooEntry, ...]}
+        self._coordinate_index: dict[tuple, list[JiKhooEntry]] = {}
+        # 列號索引
+        self._row_index = _RowIndex()
+        # 迭代順序之快取：[(漢字, JiKhooEntry), ...]
+        self._ordered: list[tuple[str, JiKhooEntry]] | None = []
+        self._len = 0
 
     def __contains__(self, key):
         return key in self.ji_khoo_dict
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            return list(self.__iter__())[key]
+            if self._ordered is None:
+                self._ordered = list(self.items())
+            han_ji, entry = self._ordered[key]
+            return self._as_row_dict(han_ji, entry)
         return self.ji_khoo_dict[key]
 
     def __len__(self):
-        return sum(len(entries) for entries in self.ji_khoo_dict.values())
+        return self._len
 
     def __bool__(self):
         return bool(self.ji_khoo_dict)
@@ -78,20 +367,101 @@ class JiKhooDict:
         """迭代時回傳相容 a501 的 dict 格式，含「漢字」、「台語音標」、「校正音標」、「座標」欄位。"""
         for han_ji, entries in self.ji_khoo_dict.items():
             for entry in entries:
-                coords = entry.get("coordinates", [])
-                zo_piau = "; ".join(f"({r}, {c})" for r, c in coords)
-                yield {
-                    "漢字": han_ji,
-                    "台語音標": entry.get("tai_gi_im_piau", "N/A"),
-                    "校正音標": entry.get("hau_ziann_im_piau", "N/A"),
-                    "座標": zo_piau,
-                }
+                yield self._as_row_dict(han_ji, entry)
 
     def items(self):
         for han_ji, entries in self.ji_khoo_dict.items():
             for entry in entries:
                 yield (han_ji, entry)
 
+    @staticmethod
+    def _as_row_dict(han_ji: str, entry) -> dict:
+        coords = entry.get("coordinates", [])
+        zo_piau = "; ".join(f"({r}, {c})" for r, c in coords)
+        return {
+            "漢字": han_ji,
+            "台語音標": entry.get("tai_gi_im_piau", "N/A"),
+            "校正音標": entry.get("hau_ziann_im_piau", "N/A"),
+            "座標": zo_piau,
+        }
+
+    # =====================================================================
+    # 索引維護
+    # =====================================================================
+    def _index_coordinate(self, coordinate, entry: JiKhooEntry) -> None:
+        entries = self._coordinate_index.setdefault(coordinate, [])
+        if not any(existing is entry for existing in entries):
+            entries.append(entry)
+
+    def _unindex_coordinate(self, coordinate, entry: JiKhooEntry) -> None:
+        entries = self._coordinate_index.get(coordinate)
+        if not entries:
+            return
+        for i, existing in enumerate(entries):
+            if existing is entry:
+                del entries[i]
+                break
+        if not entries:
+            del self._coordinate_index[coordinate]
+
+    def _row_of(self, entry: JiKhooEntry) -> int:
+        """資料紀錄寫入工作表之列號；座標為空者（不寫入工作表），傳回 -1"""
+        if not entry._coordinates:
+            return -1
+        row_no = 2 + self._row_index.rows_before(entry.han_ji)  # 列號從 2 開始（第1列是標題）
+        for existing in self.ji_khoo_dict[entry.han_ji]:
+            if existing is entry:
+                return row_no
+            if existing._coordinates:
+                row_no += 1
+        return -1
+
+    def _attach(self, han_ji: str, entry: JiKhooEntry) -> None:
+        """將新資料紀錄附加至【漢字】之資料紀錄清單末端，並更新各項索引"""
+        # 新紀錄位於整部字庫之末端時（新漢字，或最後一個漢字），迭代順序之快取可直接延伸
+        at_end = han_ji not in self.ji_khoo_dict or next(reversed(self.ji_khoo_dict)) == han_ji
+        self.ji_khoo_dict.setdefault(han_ji, []).append(entry)
+        entry.han_ji = han_ji
+        entry._ji_khoo = self
+        self._len += 1
+        if self._ordered is not None:
+            if at_end:
+                self._ordered.append((han_ji, entry))
+            else:
+                self._ordered = None
+        for coordinate in entry._coordinates:
+            self._index_coordinate(coordinate, entry)
+        self._row_index.add(han_ji, 1 if entry._coordinates else 0)
+
+    def _detach(self, han_ji: str, entry: JiKhooEntry) -> None:
+        """自字庫移除資料紀錄，並更新各項索引"""
+        entries = self.ji_khoo_dict.get(han_ji, [])
+        for i, existing in enumerate(entries):
+            if existing is entry:
+                del entries[i]
+                break
+        else:
+            return
+        for coordinate in entry._coordinates:
+            self._unindex_coordinate(coordinate, entry)
+        entry._ji_khoo = None
+        self._len -= 1
+        self._ordered = None
+        if entry._coordinates:
+            self._row_index.add(han_ji, -1)
+
+    def _entries_at(self, coordinate) -> list[JiKhooEntry]:
+        """反查座標所屬之資料紀錄，依字庫之排列順序"""
+        try:
+            entries = self._coordinate_index.get(coordinate)
+        except TypeError:
+            entries = self._coordinate_index.get(_coordinate_key(coordinate))
+        if not entries:
+            return []
+        if len(entries) > 1:
+            return sorted(entries, key=self._row_of)
+        return entries
+
     @classmethod
     def create_ji_khoo_dict_from_sheet(cls, wb, sheet_name: str, end_col: str = "D", ignore_empty: bool = False):
         """_summary_
@@ -187,26 +557,17 @@ class JiKhooDict:
         if not hau_ziann_im_piau:
             hau_ziann_im_piau = "N/A"
 
-        entry = {
-            "tai_gi_im_piau": tai_gi_im_piau,
-            "hau_ziann_im_piau": hau_ziann_im_piau,
-            "coordinates": [coordinate],
-        }
+        # 若字典中已有相同之【漢字】，則確認【台語音標】是否相同：
+        for existing in self.ji_khoo_dict.get(han_ji, ()):
+            if existing.tai_gi_im_piau == tai_gi_im_piau:
+                # 當【漢字】與【台語音標】相同時，當作【同音漢字】出現在【漢字注音】工作表，
+                # 不同位置處（座標已存在時，不重複加入）
+                existing.coordinates.append(coordinate)
+                return
 
         # 若字典中無此【漢字】，則新增一筆資料錄；
-        if han_ji not in self.ji_khoo_dict:
-            self.ji_khoo_dict[han_ji] = [entry]
-        else:
-            # 若字典中已有相同之【漢字】，則確認【台語音標】是否相同：
-            for existing in self.ji_khoo_dict[han_ji]:
-                if existing["tai_gi_im_piau"] == tai_gi_im_piau:
-                    # 當【漢字】與【台語音標】相同時，當作【同音漢字】出現在【漢字注音】工作表，
-                    # 不同位置處
-                    if coordinate not in existing["coordinates"]:
-                        existing["coordinates"].append(coordinate)
-                    return
-            # 若【漢字】相同但【台語音標】不同，則當作【多音漢字】，首度出現在【漢字注音】工作表。
-            self.ji_khoo_dict[han_ji].append(entry)
+        # 若【漢字】相同但【台語音標】不同，則當作【多音漢字】，首度出現在【漢字注音】工作表。
+        self._attach(han_ji, JiKhooEntry(han_ji, tai_gi_im_piau, hau_ziann_im_piau, [coordinate]))
 
     def update_entry(
         self,
@@ -219,11 +580,10 @@ class JiKhooDict:
             raise ValueError(f"漢字 '{han_ji}' 不存在，請先使用 add_entry 方法新增資料。")
 
         for existing in self.ji_khoo_dict[han_ji]:
-            if existing["tai_gi_im_piau"] == tai_gi_im_piau:
+            if existing.tai_gi_im_piau == tai_gi_im_piau:
                 if hau_ziann_im_piau:
-                    existing["hau_ziann_im_piau"] = hau_ziann_im_piau
-                if coordinates not in existing["coordinates"]:
-                    existing["coordinates"].append(coordinates)
+                    existing.hau_ziann_im_piau = hau_ziann_im_piau
+                existing.coordinates.append(coordinates)
                 return
 
         self.add_entry(han_ji, tai_gi_im_piau, hau_ziann_im_piau, coordinates)
@@ -240,25 +600,10 @@ class JiKhooDict:
         Returns:
             int: 工作表的列號，若無則返回 -1
         """
-        #  列號從 2 開始（第1列是標題）
-        row_no = 2
-
-        # 遍歷所有漢字及其對應的音標項目
-        for current_han_ji, entries in self.ji_khoo_dict.items():
-            for entry in entries:
-                # 跳過沒有座標的項目（這些不會寫入 Excel）
-                if not entry.get("coordinates"):
-                    continue
-
-                # 檢查是否匹配目標漢字和音標
-                if current_han_ji == han_ji and coordinate in entry.get("coordinates", []):
-                    return row_no
-
-                # 每個有效項目佔一行
-                row_no += 1
-
-        # 找不到匹配項目
-        return -1
+        entry = self.get_entry_by_han_ji_and_coordinate(han_ji=han_ji, coordinate=coordinate)
+        if entry is None:
+            return -1
+        return self._row_of(entry)
 
     def add_or_update_entry(
         self,
@@ -276,8 +621,7 @@ class JiKhooDict:
             hau_ziann_im_piau: 要新增或更新的校正音標
             coordinates: 要新增或更新的座標
         """
-        row_no = self.get_row_by_han_ji_and_coordinate(han_ji=han_ji, coordinate=coordinates)
-        if row_no != -1:
+        if self.get_entry_by_han_ji_and_coordinate(han_ji=han_ji, coordinate=coordinates) is not None:
             self.update_entry(
                 han_ji=han_ji,
                 tai_gi_im_piau=tai_gi_im_piau,
@@ -315,7 +659,7 @@ class JiKhooDict:
     def get_value_by_key(self, han_ji: str, tai_gi_im_piau: str, key: str):
         if han_ji in self.ji_khoo_dict:
             for entry in self.ji_khoo_dict[han_ji]:
-                if entry["tai_gi_im_piau"] == tai_gi_im_piau:
+                if entry.tai_gi_im_piau == tai_gi_im_piau:
                     return entry.get(key)
             raise ValueError(f"漢字 '{han_ji}' 中找不到音標 '{tai_gi_im_piau}' 對應的欄位 '{key}'。")
         else:
@@ -324,7 +668,7 @@ class JiKhooDict:
     def update_value_by_key(self, han_ji: str, tai_gi_im_piau: str, key: str, value):
         if han_ji in self.ji_khoo_dict:
             for entry in self.ji_khoo_dict[han_ji]:
-                if entry["tai_gi_im_piau"] == tai_gi_im_piau:
+                if entry.tai_gi_im_piau == tai_gi_im_piau:
                     if key in entry:
                         entry[key] = value
                         return
@@ -348,8 +692,8 @@ class JiKhooDict:
         """
         if han_ji in self.ji_khoo_dict:
             for entry in self.ji_khoo_dict[han_ji]:
-                if entry["tai_gi_im_piau"] == tai_gi_im_piau:
-                    return entry.get("coordinates", [])
+                if entry.tai_gi_im_piau == tai_gi_im_piau:
+                    return entry.coordinates
         return []
 
     def get_row_by_han_ji_and_tai_gi_im_piau(self, han_ji: str, tai_gi_im_piau: str) -> int:
@@ -364,27 +708,15 @@ class JiKhooDict:
         Returns:
             int: 工作表的列號，若無則返回 -1
         """
-        #  列號從 2 開始（第1列是標題）
-        row_no = 2
-
-        # 遍歷所有漢字及其對應的音標項目
-        for current_han_ji, entries in self.ji_khoo_dict.items():
-            for entry in entries:
-                # 跳過沒有座標的項目（這些不會寫入 Excel）
-                if not entry.get("coordinates"):
-                    continue
-
-                # 檢查是否匹配目標漢字和音標
-                if current_han_ji == han_ji and entry.get("tai_gi_im_piau", "") == tai_gi_im_piau:
-                    return row_no
-
-                # 每個有效項目佔一行
-                row_no += 1
+        for entry in self.ji_khoo_dict.get(han_ji, ()):
+            # 跳過沒有座標的項目（這些不會寫入 Excel）
+            if entry.coordinates and entry.tai_gi_im_piau == tai_gi_im_piau:
+                return self._row_of(entry)
 
         # 找不到匹配項目
         return -1
 
-    def get_entry_by_han_ji_and_coordinate(self, han_ji: str, coordinate: tuple[int, int]) -> dict:
+    def get_entry_by_han_ji_and_coordinate(self, han_ji: str, coordinate: tuple[int, int]) -> JiKhooEntry:
         """
         根據漢字與座標查詢對應的音標項目
         若查無結果，返回 None
@@ -394,16 +726,14 @@ class JiKhooDict:
             coordinate: 要查詢的座標
 
         Returns:
-            dict: 音標項目字典，若無則返回 None
+            JiKhooEntry: 音標項目，若無則返回 None
         """
-        if han_ji in self.ji_khoo_dict:
-            entries = self.ji_khoo_dict[han_ji]
-            for entry in entries:
-                if coordinate in entry.get("coordinates", []):
-                    return entry
+        for entry in self._entries_at(coordinate):
+            if entry.han_ji == han_ji:
+                return entry
         return None
 
-    def get_entry_by_coordinate(self, coordinate: tuple[int, int]) -> tuple[str, dict]:
+    def get_entry_by_coordinate(self, coordinate: tuple[int, int]) -> tuple[str, JiKhooEntry]:
         """
         根據工作表座標查詢對應的漢字及其音標項目
         若查無結果，返回 None
@@ -412,20 +742,14 @@ class JiKhooDict:
             coordinate: 要查詢的工作表座標
 
         Returns:
-            tuple: (漢字, 音標項目字典)，若無則返回 None
+            tuple: (漢字, 音標項目)，若無則返回 None
         """
-        for han_ji, entries in self.ji_khoo_dict.items():
-            for entry in entries:
-                # 跳過沒有座標的項目（這些不會寫入 Excel）
-                if not entry.get("coordinates"):
-                    continue
-
-                if coordinate in entry.get("coordinates", []):
-                    return han_ji, entry
+        entries = self._entries_at(coordinate)
+        if not entries:
+            return None
+        return entries[0].han_ji, entries[0]
 
-        return None
-
-    def get_entry_by_row_no(self, row_no: int) -> tuple[str, dict]:
+    def get_entry_by_row_no(self, row_no: int) -> tuple[str, JiKhooEntry]:
         """
         根據工作表列號查詢對應的漢字及其音標項目
         若查無結果，返回 None
@@ -434,21 +758,20 @@ class JiKhooDict:
             row_no: 要查詢的工作表列號
 
         Returns:
-            tuple: (漢字, 音標項目字典)，若無則返回 None
+            tuple: (漢字, 音標項目)，若無則返回 None
         """
-        current_row = 2  # 列號從 2 開始（第1列是標題）
-
-        for han_ji, entries in self.ji_khoo_dict.items():
-            for entry in entries:
-                # 跳過沒有座標的項目（這些不會寫入 Excel）
-                if not entry.get("coordinates"):
-                    continue
-
-                if current_row == row_no:
-                    return han_ji, entry
-
-                current_row += 1
-
+        index = row_no - 2  # 列號從 2 開始（第1列是標題）
+        if not 0 <= index < len(self._row_index):
+            return None
+
+        han_ji, offset = self._row_index.find(index)
+        for entry in self.ji_khoo_dict[han_ji]:
+            # 跳過沒有座標的項目（這些不會寫入 Excel）
+            if not entry._coordinates:
+                continue
+            if offset == 0:
+                return han_ji, entry
+            offset -= 1
         return None
 
     def update_whole_entry(
@@ -461,21 +784,14 @@ class JiKhooDict:
         """
         根據工作表列號更新整筆資料Entry
         """
-        current_row = 2
-        for han_ji, entries in self.ji_khoo_dict.items():
-            for entry in entries:
-                if not entry.get("coordinates"):
-                    continue
-
-                if current_row == row_no:
-                    entry["tai_gi_im_piau"] = tai_gi_im_piau
-                    entry["hau_ziann_im_piau"] = hau_ziann_im_piau
-                    entry["coordinates"] = coordinates
-                    return
+        found = self.get_entry_by_row_no(row_no)
+        if found is None:
+            raise ValueError(f"找不到對應列號 {row_no} 的資料")
 
-                current_row += 1
-
-        raise ValueError(f"找不到對應列號 {row_no} 的資料")
+        _, entry = found
+        entry.tai_gi_im_piau = tai_gi_im_piau
+        entry.hau_ziann_im_piau = hau_ziann_im_piau
+        entry.coordinates = coordinates
 
     def get_tai_gi_im_piau_by_han_ji_and_coordinate(self, han_ji: str, coordinate: tuple[int, int]) -> str:
         """
@@ -490,16 +806,14 @@ class JiKhooDict:
         Returns:
             str: 台語音標，若無則返回空字串
         """
-        if han_ji in self.ji_khoo_dict:
-            entries = self.ji_khoo_dict[han_ji]
-            for entry in entries:
-                if coordinate in entry.get("coordinates", []):
-                    tai_gi_im_piau = entry.get("tai_gi_im_piau", "")
-                    # 若該音標為 N/A 則返回空字串
-                    if tai_gi_im_piau == "N/A":
-                        return ""
-                    return tai_gi_im_piau
-        return ""
+        entry = self.get_entry_by_han_ji_and_coordinate(han_ji=han_ji, coordinate=coordinate)
+        if entry is None:
+            return ""
+        tai_gi_im_piau = entry.tai_gi_im_piau or ""
+        # 若該音標為 N/A 則返回空字串
+        if tai_gi_im_piau == "N/A":
+            return ""
+        return tai_gi_im_piau
 
     def get_tai_gi_im_piau_by_han_ji(self, han_ji: str) -> str:
         """
@@ -539,10 +853,9 @@ class JiKhooDict:
         """
         if han_ji in self.ji_khoo_dict:
             for entry in self.ji_khoo_dict[han_ji]:
-                if entry["tai_gi_im_piau"] == tai_gi_im_piau:
-                    entry["hau_ziann_im_piau"] = hau_ziann_im_piau
-                    if coordinates not in entry["coordinates"]:
-                        entry["coordinates"].append(coordinates)
+                if entry.tai_gi_im_piau == tai_gi_im_piau:
+                    entry.hau_ziann_im_piau = hau_ziann_im_piau
+                    entry.coordinates.append(coordinates)
                     return
         # 若找不到，則新增新項目
         self.add_entry(han_ji, tai_gi_im_piau, hau_ziann_im_piau, coordinates)
@@ -566,7 +879,7 @@ class JiKhooDict:
                 if not isinstance(entries, list):
                     continue
                 for entry in entries:
-                    if not isinstance(entry, dict):
+                    if not isinstance(entry, Mapping):
                         continue
                     tai_gi_im_piau = entry.get("tai_gi_im_piau", "")
                     kau_ziann_im_piau = entry.get("hau_ziann_im_piau", "")
@@ -624,6 +937,23 @@ class JiKhooDict:
             logging_exception(msg="將【字典】存放之資料，更新工作表作業異常！", error=e)
             return EXIT_CODE_PROCESS_FAILURE
 
+    def to_sheet_rows(self) -> list[list]:
+        """依【列號】之順序，產出寫入工作表之資料列（座標為空者，不寫入）"""
+        data = []
+        for han_ji, entry in self.items():
+            if not entry.coordinates:  # 若座標為空，跳過不寫入
+                continue
+            coord_str = "; ".join(f"({r}, {c})" for r, c in entry.coordinates)
+            data.append(
+                [
+                    han_ji,
+                    entry.tai_gi_im_piau,
+                    entry.hau_ziann_im_piau,
+                    coord_str,
+                ]
+            )
+        return data
+
     def write_to_excel_sheet(self, wb, sheet_name: str) -> int:
         sheet_name_to_use = self.name if sheet_name == "" else sheet_name
         try:
@@ -634,22 +964,7 @@ class JiKhooDict:
         headers = ["漢字", "台語音標", "校正音標", "座標"]
         sheet.range("A1").value = headers
 
-        data = []
-        for han_ji, entries in self.ji_khoo_dict.items():
-            for entry in entries:
-                if not entry["coordinates"]:  # 若座標為空，跳過不寫入
-                    continue
-                coord_str = "; ".join(f"({r}, {c})" for r, c in entry["coordinates"])
-                data.append(
-                    [
-                        han_ji,
-                        entry["tai_gi_im_piau"],
-                        entry["hau_ziann_im_piau"],
-                        coord_str,
-                    ]
-                )
-
-        sheet.range("A2").value = data
+        sheet.range("A2").value = self.to_sheet_rows()
         return 0
 
     def write_to_han_ji_zu_im_sheet(self, wb, sheet_name: str):
@@ -679,20 +994,13 @@ class JiKhooDict:
         根據【漢字】與【座標】移除紀錄中，在【座標】欄清單的某【座標】；
         若【座標】欄清空，則移除整筆紀錄。
         """
-        if han_ji not in self.ji_khoo_dict:
+        entry = self.get_entry_by_han_ji_and_coordinate(han_ji=han_ji, coordinate=coordinate)
+        if entry is None:
             return
 
-        entries = self.ji_khoo_dict[han_ji]
-        to_delete = None
-        for entry in entries:
-            if coordinate in entry["coordinates"]:
-                entry["coordinates"].remove(coordinate)
-            if len(entry["coordinates"]) == 0:
-                to_delete = entry
-            break
-
-        if to_delete and entry_to_delete_if_empty:
-            entries.remove(to_delete)
+        entry.coordinates.remove(coordinate)
+        if not entry.coordinates and entry_to_delete_if_empty:
+            self._detach(han_ji, entry)
 
     def remove_coordinate_by_han_ji_and_tai_gi_im_piau(
         self,
@@ -705,62 +1013,35 @@ class JiKhooDict:
         根據【漢字】與【台語音標】移除紀錄中，在【座標】欄清單的某【座標】；
         若【座標】欄清空，則移除整筆紀錄。
         """
-        if han_ji not in self.ji_khoo_dict:
-            return
-
-        entries = self.ji_khoo_dict[han_ji]
-        to_delete = None
-        for entry in entries:
-            if entry["tai_gi_im_piau"] == tai_gi_im_piau:
-                if coordinate in entry["coordinates"]:
-                    entry["coordinates"].remove(coordinate)
-                if len(entry["coordinates"]) == 0:
-                    to_delete = entry
+        for entry in self.ji_khoo_dict.get(han_ji, ()):
+            if entry.tai_gi_im_piau == tai_gi_im_piau:
+                entry.coordinates.discard(coordinate)
+                if not entry.coordinates and entry_to_delete_if_empty:
+                    self._detach(han_ji, entry)
                 break
 
-        if to_delete and entry_to_delete_if_empty:
-            entries.remove(to_delete)
-
     def remove_coordinate_by_han_ji_and_coordinate(self, han_ji: str, coordinate: tuple[int, int]):
         """
         移除指定漢字與音標下的某個座標；若座標清空則移除整筆項目。
         """
-        if han_ji not in self.ji_khoo_dict:
-            return
-
-        entries = self.ji_khoo_dict[han_ji]
-        to_delete = None
-        for entry in entries:
-            for coord in entry["coordinates"]:
-                if coord == coordinate:
-                    entry["coordinates"].remove(coord)
-                    if len(entry["coordinates"]) == 0:
-                        to_delete = entry
-                    break
-
-        if to_delete:
-            entries.remove(to_delete)
+        for entry in list(self._entries_at(coordinate)):
+            if entry.han_ji != han_ji:
+                continue
+            entry.coordinates.remove(coordinate)
+            if not entry.coordinates:
+                self._detach(han_ji, entry)
 
     def remove_coordinate_by_hau_ziann_im_piau(self, han_ji: str, hau_ziann_im_piau: str, coordinate: tuple):
         """
         移除指定漢字與音標下的某個座標；若座標清空則移除整筆項目。
         """
-        if han_ji not in self.ji_khoo_dict:
-            return
-
-        entries = self.ji_khoo_dict[han_ji]
-        to_delete = None
-        for entry in entries:
-            if entry["hau_ziann_im_piau"] == hau_ziann_im_piau:
-                if coordinate in entry["coordinates"]:
-                    entry["coordinates"].remove(coordinate)
-                if len(entry["coordinates"]) == 0:
-                    to_delete = entry
+        for entry in self.ji_khoo_dict.get(han_ji, ()):
+            if entry.hau_ziann_im_piau == hau_ziann_im_piau:
+                entry.coordinates.discard(coordinate)
+                if not entry.coordinates:
+                    self._detach(han_ji, entry)
                 break
 
-        if to_delete:
-            entries.remove(to_delete)
-
     def remove_entry(
         self,
         han_ji: str,
@@ -771,22 +1052,12 @@ class JiKhooDict:
         """
         移除指定漢字與音標下的某個座標；若座標清空則移除整筆項目。
         """
-        if han_ji not in self.ji_khoo_dict:
-            return
-
-        entries = self.ji_khoo_dict[han_ji]
-        to_delete = None
-        for entry in entries:
-            if entry["tai_gi_im_piau"] == tai_gi_im_piau:
-                if entry["hau_ziann_im_piau"] == hau_ziann_im_piau:
-                    if coordinate in entry["coordinates"]:
-                        entry["coordinates"].remove(coordinate)
-                    if len(entry["coordinates"]) == 0:
-                        to_delete = entry
-                    break
-
-        if to_delete:
-            entries.remove(to_delete)
+        for entry in self.ji_khoo_dict.get(han_ji, ()):
+            if entry.tai_gi_im_piau == tai_gi_im_piau and entry.hau_ziann_im_piau == hau_ziann_im_piau:
+                entry.coordinates.discard(coordinate)
+                if not entry.coordinates:
+                    self._detach(han_ji, entry)
+                break
 
     def display_all_values_in_ji_khoo_dict(self):
         """顯示【字庫】中所有的資料內容"""
@@ -803,6 +1074,37 @@ class JiKhooDict:
         print("=== 字庫內容結束 ===")
 
 
+# =========================================================================
+# 效能量測
+# =========================================================================
+def bench_ji_khoo_dict(sizes=(2000, 4000, 8000, 16000), repeat: int = 3) -> list[tuple[int, float]]:
+    """
+    模擬【漢字注音】工作表逐字處理：每個漢字先以 add_or_update_entry 登錄，
+    再以 get_row_by_han_ji_and_coordinate 查詢列號。
+
+    字庫之各項查詢皆經由索引，總耗時應與字數成正比（每字耗時大致不變）。
+
+    Returns:
+        list: [(字數, 每字耗時（微秒）), ...]
+    """
+    results = []
+    for total in sizes:
+        best = None
+        for _ in range(repeat):
+            ji_khoo = JiKhooDict("標音字庫")
+            start = time.perf_counter()
+            for i in range(total):
+                han_ji = chr(0x4E00 + i % 3000)
+                tai_gi_im_piau = f"im{i % 7}"
+                coordinate = (5 + (i // 15) * 4, 4 + i % 15)
+                ji_khoo.add_or_update_entry(han_ji, tai_gi_im_piau, "N/A", coordinate)
+                ji_khoo.get_row_by_han_ji_and_coordinate(han_ji, coordinate)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append((total, best / total * 1_000_000))
+    return results
+
+
 # =========================================================================
 # 測試程式
 # =========================================================================
@@ -817,6 +1119,11 @@ def ut01(wb):
 if __name__ == "__main__":
     import sys
 
+    if "--bench" in sys.argv[1:]:
+        for total, per_char in bench_ji_khoo_dict():
+            print(f"字數：{total:>6}，每字耗時：{per_char:.2f} µs")
+        sys.exit(EXIT_CODE_SUCCESS)
+
     import xlwings as xw
 
     # 取得【作用中活頁簿】
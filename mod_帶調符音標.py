@@ -5,6 +5,18 @@ import re
 import unicodedata
 
 from mod_標音 import is_han_ji
+from mod_音標轉換 import (
+    TIAU_HO,
+    TIAU_HU,
+    TIAU_HU_TNG_TIAU_HO,
+    TLPA,
+    TLPA_JI_BU,
+    apply_tone,
+    handle_o_dot,
+    separate_tone,
+)
+from mod_音標轉換 import convert as im_piau_tng_huan
+from mod_音節 import SyllableParser
 
 # =========================================================================
 # 常數定義
@@ -314,51 +326,6 @@ tiau_hu_mapping = {
     "N̋": ("N", "9"),
 }
 
-# 韻母轉換字典
-un_bu_mapping = {
-    "ee": "e",
-    "ei": "e",
-    "er": "e",
-    "erh": "eh",
-    "or": "o",
-    "ere": "ue",
-    "ereh": "ueh",
-    "ir": "i",
-    "eng": "ing",
-    "ek": "ik",
-    "oa": "ua",
-    "oe": "ue",
-    "oai": "uai",
-    "ou": "oo",
-    "onn": "oonn",
-    "uei": "ue",
-    "ueinn": "uenn",
-    "ur": "u",
-}
-
-# 聲調符號對映調號數值的轉換字典
-tiau_fu_mapping = {
-    "\u0300": "3",  # 3 陰去: ò
-    "\u0301": "2",  # 2 陰上: ó
-    "\u0302": "5",  # 5 陽平: ô
-    "\u0304": "7",  # 7 陽去: ō
-    "\u0306": "9",  # 9 輕声: ő
-    "\u030c": "6",  # 6 陽上: ǒ
-    "\u030d": "8",  # 8 陽入: o̍
-}
-
-# 調號與調符對映轉換字典
-tiau_ho_mapping = {
-    "3": "\u0300",  # 3 陰去: ò
-    "2": "\u0301",  # 2 陰上: ó
-    "5": "\u0302",  # 5 陽平: ô
-    "7": "\u0304",  # 7 陽去: ō
-    "9": "\u030b",  # 9 輕声: ő
-    "6": "\u030c",  # 6 陽上: ǒ
-    "8": "\u030d",  # 8 陽入: o̍
-}
-
-
 # 清理音標：整理音標中的字元組合，只留【拼音字母】，清除：標點符號、控制字元
 def clean_im_piau(im_piau: str) -> str:
     # 移除標點符號
@@ -371,122 +338,12 @@ def clean_im_piau(im_piau: str) -> str:
 # ---------------------------------------------------------
 # 韻母轉換
 # ---------------------------------------------------------
-
-
-def separate_tone(im_piau):
-    """拆解帶調字母為無調字母與調號"""
-    decomposed = unicodedata.normalize("NFD", im_piau)
-    letters = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
-    tones = "".join(
-        c for c in decomposed if unicodedata.category(c) == "Mn" and c != "\u0358"
-    )
-    return letters, tones
-
-
-def apply_tone(im_piau, tone):
-    """
-    根據 TLPA 響度優先規則，將聲調符號 tone 正確標示在母音上。
-    """
-    tone_priority = ["a", "oo", "e", "o", "i", "u", "m"]
-    lower = im_piau.lower()
-
-    # 特例：ere → 最後 e
-    if "ere" in lower:
-        idx = lower.rindex("e")
-        return unicodedata.normalize(
-            "NFC", im_piau[: idx + 1] + tone + im_piau[idx + 1 :]
-        )
-
-    # ✅ 特例：iu / ui 雙母音（不限定結尾）
-    for i in range(len(lower) - 1):
-        if lower[i] == "i" and lower[i + 1] == "u":
-            return unicodedata.normalize(
-                "NFC", im_piau[: i + 2] + tone + im_piau[i + 2 :]
-            )
-        if lower[i] == "u" and lower[i + 1] == "i":
-            return unicodedata.normalize(
-                "NFC", im_piau[: i + 2] + tone + im_piau[i + 2 :]
-            )
-
-    # 特例：oo → 第一個 o
-    if "oo" in lower:
-        idx = lower.index("oo")
-        return unicodedata.normalize(
-            "NFC", im_piau[: idx + 1] + tone + im_piau[idx + 1 :]
-        )
-
-    # 響度優先分析
-    best_idx = -1
-    best_priority = len(tone_priority) + 1
-
-    i = 0
-    while i < len(lower):
-        if lower[i] == "o" and i + 1 < len(lower) and lower[i + 1] == "o":
-            current = "oo"
-            idx = i
-            i += 1
-        else:
-            current = lower[i]
-            idx = i
-
-        if current in tone_priority:
-            pri = tone_priority.index(current)
-            if pri < best_priority:
-                best_idx = idx
-                best_priority = pri
-            elif pri == best_priority and current in ["i", "u"]:
-                best_idx = idx
-        i += 1
-
-    if best_idx != -1:
-        return unicodedata.normalize(
-            "NFC", im_piau[: best_idx + 1] + tone + im_piau[best_idx + 1 :]
-        )
-
-    # fallback
-    return unicodedata.normalize("NFC", im_piau[0] + tone + im_piau[1:])
-
-
-# 處理 o͘ 韻母特殊情況的函數
-def handle_o_dot(im_piau):
-    # 依 Unicode 解構標準（NFD）分解傳入之【音標】，取得解構後之【拼音字母與調符】
-    decomposed = unicodedata.normalize("NFD", im_piau)
-    # 找出 o + 聲調 + 鼻化符號的特殊組合
-    match = re.search(
-        r"(o)([\u0300\u0301\u0302\u0304\u030B\u030C\u030D]?)(\u0358)", decomposed, re.I
-    )
-    if match:
-        # 捕獲【音標】，其【拼音字母】有 o 長音字母，且其右上方帶有圓點調符（\u0358）： o͘
-        letter, tone, nasal = match.groups()
-        # 將 o 長音字母，轉換成【拼音字母】 oo，再附回聲調
-        # replaced = f"{letter}{letter}{tone}"
-        replaced = f"{letter}{tone}{letter}"
-        # 重組字串
-        decomposed = decomposed.replace(match.group(), replaced)
-    # 依 Unicode 組合標準（NFC）重構【拼音字母與調符】，組成轉換後之【音標】
-    return unicodedata.normalize("NFC", decomposed)
-
-
 def tng_un_bu(im_piau: str) -> str:
-    # 轉換【鼻音韻母】
-    im_piau = im_piau.replace("ⁿ", "nn", 1)
-    # 帶調符之白話字韻母 o͘ ，轉換為【帶韻符之 oo 韻母】
-    im_piau = handle_o_dot(im_piau)
-
-    # 解構【帶調符音標】，轉成：【無調符音標】、【聲調符號】
-    letters, tone = separate_tone(im_piau)
-
-    # 以【無調符音標】，轉換【韻母】
-    sorted_keys = sorted(un_bu_mapping, key=len, reverse=True)
-    for key in sorted_keys:
-        if key in letters:
-            letters = letters.replace(key, un_bu_mapping[key])
-            break
+    # 拼音字母改為【台語音標】（如：oa → ua、o͘ → oo），調符保持不變
+    return im_piau_tng_huan(im_piau, TIAU_HU, TLPA_JI_BU)
 
-    if tone:
-        letters = apply_tone(letters, tone)
 
-    return letters
+_syllable_parser = SyllableParser(tng_un_bu=tng_un_bu)
 
 
 # =========================================================================
@@ -497,180 +354,19 @@ def tua_tiau_hu_im_piau_tng_tiau_ho(im_piau: str, po_ci: bool = False) -> str:
     將【帶調符音標】（台羅拼音/台語音標）轉換成【帶調號TLPA音標】
     :param im_piau: str - 帶調符音標
     :param po_ci: bool - 保持【音標】之首字大寫
-    :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
-    :return: str - 轉換後的【帶調號TLPA音標】
+    :return: str - 轉換後的【帶調號TLPA音標】；聲調值為 1 或 4 者，不加調號
     """
-    # 遇標點符號，不做轉換處理，直接回傳
-    if im_piau[-1] in PUNCTUATIONS:
-        return im_piau
-
-    org_im_piau = im_piau
-    siu_ji = org_im_piau[0]  # 保存【音標】之拼音首字母
-    # ---------------------------------------------------------
-    # 更換【音標】之【聲母】
-    # ---------------------------------------------------------
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    im_piau = unicodedata.normalize("NFC", im_piau)
-
-    if im_piau.startswith("tsh"):
-        im_piau = im_piau.replace("tsh", "c", 1)
-    elif im_piau.startswith("Tsh"):
-        im_piau = im_piau.replace("Tsh", "C", 1)
-    elif im_piau.startswith("ts"):
-        im_piau = im_piau.replace("ts", "z", 1)
-    elif im_piau.startswith("Ts"):
-        im_piau = im_piau.replace("Ts", "Z", 1)
-    elif im_piau.startswith("chh"):
-        im_piau = im_piau.replace("chh", "c", 1)
-    elif im_piau.startswith("Chh"):
-        im_piau = im_piau.replace("Chh", "C", 1)
-    elif im_piau.startswith("ch"):
-        im_piau = im_piau.replace("ch", "z", 1)
-    elif im_piau.startswith("Ch"):
-        im_piau = im_piau.replace("Ch", "Z", 1)
-
-    im_piau = im_piau.lower()
-
-    # ---------------------------------------------------------
-    # 更換【音標】之【韻母】
-    # ---------------------------------------------------------
-    # 轉換【鼻音韻母】
-    im_piau = im_piau.replace("ⁿ", "nn", 1)
-
-    # 轉換音標中【韻母】為【o͘】（oo長音）的特殊處理
-    im_piau = handle_o_dot(im_piau)
-
-    # # 聲調符號對映調號數值的轉換字典
-    # tiau_fu_mapping = {
-    #     "\u0300": "3",   # 3 陰去: ò
-    #     "\u0301": "2",   # 2 陰上: ó
-    #     "\u0302": "5",   # 5 陽平: ô
-    #     "\u0304": "7",   # 7 陽去: ō
-    #     "\u0306": "9",   # 9 輕声: ő
-    #     "\u030C": "6",   # 6 陽上: ǒ
-    #     "\u030D": "8",   # 8 陽入: o̍
-    # }
-    # 轉換音標中【韻母】部份，不含【o͘】（oo長音）的特殊處理
-    letters, tone = separate_tone(im_piau)  # 無調符音標：im_piau
-    if tone:
-        tiau_ho = tiau_fu_mapping[tone]
-    else:
-        tiau_ho = ""
-
-    # 以【無調符音標】，轉換【韻母】
-    sorted_keys = sorted(un_bu_mapping, key=len, reverse=True)
-    for key in sorted_keys:
-        if key in letters:
-            letters = letters.replace(key, un_bu_mapping[key])
-            break
-
-    # 如若傳入之【音標】首字母為大寫，則將已轉成 "z" 或 "c" 之拼音字母改為大寫
-    if po_ci:
-        if siu_ji == letters[0].isupper():
-            if letters[0] == "c":
-                letters = "C" + letters[1:]
-            elif letters[0] == "z":
-                letters = "Z" + letters[1:]
-        else:
-            letters = siu_ji + letters[1:]
-
-    # 調符
-    # if tone:
-    #     letters = apply_tone(letters, tone)
-
-    return letters + tiau_ho
+    return im_piau_tng_huan(im_piau, TIAU_HU, TLPA, po_ci=po_ci, kan_hua=True)
 
 
 def tng_im_piau(im_piau: str, po_ci: bool = True) -> str:
     """
-    將【帶調符音標】（台羅拼音/台語音標）轉換成【帶調號TLPA音標】
+    將【帶調符音標】（台羅拼音/台語音標）轉換成【帶調符TLPA音標】
     :param im_piau: str - 帶調符音標
     :param po_ci: bool - 是否保留【音標】之首字母大寫
-    :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
-    :return: str - 轉換後的【帶調號TLPA音標】
+    :return: str - 轉換後的【帶調符TLPA音標】
     """
-    # 遇標點符號，不做轉換處理，直接回傳
-    if im_piau[-1] in PUNCTUATIONS:
-        return im_piau
-
-    # ---------------------------------------------------------
-    # 更換【音標】之【聲母】
-    # ---------------------------------------------------------
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    im_piau = unicodedata.normalize("NFC", im_piau)
-
-    if im_piau.startswith("tsh"):
-        im_piau = im_piau.replace("tsh", "c", 1)
-    elif im_piau.startswith("Tsh"):
-        im_piau = im_piau.replace("Tsh", "C", 1)
-    elif im_piau.startswith("ts"):
-        im_piau = im_piau.replace("ts", "z", 1)
-    elif im_piau.startswith("Ts"):
-        im_piau = im_piau.replace("Ts", "Z", 1)
-    elif im_piau.startswith("chh"):
-        im_piau = im_piau.replace("chh", "c", 1)
-    elif im_piau.startswith("Chh"):
-        im_piau = im_piau.replace("Chh", "C", 1)
-    elif im_piau.startswith("ch"):
-        im_piau = im_piau.replace("ch", "z", 1)
-    elif im_piau.startswith("Ch"):
-        im_piau = im_piau.replace("Ch", "Z", 1)
-
-    # ---------------------------------------------------------
-    # 更換【音標】之【韻母】
-    # ---------------------------------------------------------
-    su_ji = im_piau[0]  # 保存【音標】之拼音首字母
-    org_im_piau = im_piau
-    im_piau = org_im_piau.lower()
-
-    # 轉換【鼻音韻母】
-    im_piau = im_piau.replace("ⁿ", "nn", 1)
-
-    # 轉換音標中【韻母】為【o͘】（oo長音）的特殊處理
-    im_piau = handle_o_dot(im_piau)
-
-    # # 聲調符號對映調號數值的轉換字典
-    # tiau_fu_mapping = {
-    #     "\u0300": "3",   # 3 陰去: ò
-    #     "\u0301": "2",   # 2 陰上: ó
-    #     "\u0302": "5",   # 5 陽平: ô
-    #     "\u0304": "7",   # 7 陽去: ō
-    #     "\u0306": "9",   # 9 輕声: ő
-    #     "\u030C": "6",   # 6 陽上: ǒ
-    #     "\u030D": "8",   # 8 陽入: o̍
-    # }
-    # 轉換音標中【韻母】部份，不含【o͘】（oo長音）的特殊處理
-    letters, tone = separate_tone(im_piau)  # 無調符音標：im_piau
-    if tone:
-        tiau_ho = tiau_fu_mapping[tone]
-    else:
-        tiau_ho = ""  # noqa: F841
-
-    # 以【無調符音標】，轉換【韻母】
-    sorted_keys = sorted(un_bu_mapping, key=len, reverse=True)
-    for key in sorted_keys:
-        if key in letters:
-            letters = letters.replace(key, un_bu_mapping[key])
-            break
-
-    # 如若傳入之【音標】首字母為大寫，則將已轉成 "z" 或 "c" 之拼音字母改為大寫
-    if su_ji.isupper():
-        if letters[0] == "z":
-            letters = "Z" + letters[1:]
-        elif letters[0] == "c":
-            letters = "C" + letters[1:]
-        else:
-            letters = su_ji + letters[1:]
-
-    # 調符
-    if tone:
-        letters = apply_tone(letters, tone)
-
-    return letters
+    return im_piau_tng_huan(im_piau, TIAU_HU, TLPA_JI_BU, po_ci=po_ci)
 
 
 def tng_tiau_ho(im_piau: str, kan_hua: bool = False) -> str:
@@ -680,115 +376,12 @@ def tng_tiau_ho(im_piau: str, kan_hua: bool = False) -> str:
     :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
     :return: str - 帶調號音標
     """
-    if im_piau == "":
-        return ""  # noqa: E701
-    # 遇標點符號，不做轉換處理，直接回傳
-    if im_piau[-1] in PUNCTUATIONS:
-        return im_piau
-
-    # 若【音標】末端為數值，表音標已是【帶調號拼音】，直接回傳
-    u_tiau_ho = True if im_piau[-1] in "123456789" else False
-    if u_tiau_ho:
-        return im_piau  # noqa: E701
-
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    im_piau = unicodedata.normalize("NFC", im_piau)
-
-    # --------------------------------------------------------------------------------
-    # 以【元音及韻化輔音清單】，比對傳入之【音標】，找出對應之【基本拼音字母】與【調號】
-    # --------------------------------------------------------------------------------
-    tone_number = "1"  # 初始化調號為 1
-    number = "1"  # 明確初始化 number 變數，以免未設定而發生錯誤
-    for tone_mark, (base_char, number) in tiau_hu_mapping.items():
-        if tone_mark in im_piau:
-            im_piau = im_piau.replace(tone_mark, base_char)
-            break
-    else:
-        number = "1"  # 若沒有任何調符，number強制為1
-
-    # 依是否要【簡化】之設定，處理【調號】1 或 4 是否要略去
-    if kan_hua and number in ["1", "4"]:
-        # 若是【簡化】，且聲調值為 1 或 4 ，去除調號值
-        tone_number = ""
-    else:
-        # 若未要求【簡化】，聲調值置於【音標】末端
-        if number not in ["1", "4"]:
-            tone_number = number
-        else:
-            if im_piau[-1] in "hptk":
-                # 【音標】末端為【hptk】之一，則為【陰入調】，聲調值為 4
-                tone_number = "4"
-            else:
-                tone_number = "1"
-
-    return im_piau + tone_number
+    return im_piau_tng_huan(im_piau, TIAU_HU, TIAU_HO, kan_hua=kan_hua)
 
 
 def split_tlpa_im_piau(im_piau: str, po_ci: bool = False):
-    # 查檢傳入之【音標】是否為帶調號TLPA音標
-    if im_piau[-1] in "123456789":
-        return im_piau
-    # 將輸入的台語音標轉換為小寫
-    im_piau = im_piau.lower()
-    # 查檢【台語音標】是否符合【標準】=【聲母】+【韻母】+【調號】
-    tiau = im_piau[-1]
-    tiau = replace_superscript_digits(str(tiau))
-
-    # 矯正未標明陰平/陰入調號的情況
-    if tiau in ["p", "t", "k", "h"]:
-        tiau = "4"
-        im_piau += tiau
-    elif tiau in ["a", "e", "i", "o", "u", "m", "n", "g"]:
-        tiau = "1"
-        im_piau += tiau
-
-    # 聲母相容性轉換
-    if im_piau.startswith("tsh"):
-        im_piau = im_piau.replace("tsh", "c", 1)
-    elif im_piau.startswith("ts"):
-        im_piau = im_piau.replace("ts", "z", 1)
-    elif im_piau.startswith("chh"):
-        im_piau = im_piau.replace("chh", "c", 1)
-    elif im_piau.startswith("ch"):
-        im_piau = im_piau.replace("ch", "z", 1)
-
-    # 定義聲母的正規表示式，包括常見的聲母，但不包括 m 和 ng
-    siann_bu_pattern = re.compile(
-        r"(b|c|z|g|h|j|kh|k|l|m(?!\d)|ng(?!\d)|n|ph|p|s|th|t|Ø)"
-    )
-    un_bu_as_m_or_ng_pattern = re.compile(r"(m|ng)\d")
-
-    result = []
-
-    # 首先檢查是否是 m 或 ng 當作韻母的特殊情況
-    if un_bu_as_m_or_ng_pattern.match(im_piau):
-        siann_bu = ""
-        un_bu = im_piau[:-1]
-        tiau = im_piau[-1]
-    else:
-        siann_bu_match = siann_bu_pattern.match(im_piau)
-        if siann_bu_match:
-            siann_bu = siann_bu_match.group()
-            un_bu = im_piau[len(siann_bu) : -1]
-        else:
-            siann_bu = ""
-            un_bu = im_piau[:-1]
-
-    # 轉換韻母
-    un_bu = tng_un_bu(un_bu)
-
-    # 調整聲母大小寫
-    if po_ci:
-        siann_bu = siann_bu.capitalize() if siann_bu else ""
-    else:
-        siann_bu = siann_bu.lower()
-
-    result += [siann_bu]
-    result += [un_bu]
-    result += [tiau]
-    return result
+    # 由 SyllableParser 解析並快取結果；傳入之【音標】已帶調號者，原樣傳回
+    return _syllable_parser.split_tlpa_im_piau(im_piau, po_ci)
 
 
 def kam_si_u_tiau_hu(im_piau: str) -> bool:
@@ -982,7 +575,7 @@ def ut10():
     # 轉換音標中【韻母】部份，不含【o͘】（oo長音）的特殊處理
     letters, tone = separate_tone("Ióng")  # 無調符音標：im_piau
     if tone:
-        tiau_ho = tiau_fu_mapping[tone]
+        tiau_ho = TIAU_HU_TNG_TIAU_HO[tone]
         unicode_code = f"U+{ord(tone):04X}"  # 例如 tone = '́' → 'U+0301'
         print(f"{unicode_code} ==> 調號： {tiau_ho}")
         print("-----------------------------------------------------------")
@@ -2,23 +2,29 @@
 import re
 import sqlite3
 
+from mod_database import connection_manager
+
+# 廣韻漢字庫查詢結果欄位
+KONG_UN_HAN_JI_FIELDS = [
+    '字號', '漢字', '標音', '常用度', '上字', '下字', '上字號', '聲母', '聲母標音', '七聲類',
+    '清濁', '發送收', '下字號', '韻母', '韻母標音', '韻目列號', '攝', '調', '目次',
+    '韻目', '等呼', '等', '呼', '廣韻調名', '台羅聲調', '字義識別號'
+]
+
+# 切語上字決定之欄位：聲母、清濁
+SIONG_JI_FIELDS = ['聲母', '聲母標音', '七聲類', '清濁', '發送收']
+# 切語下字決定之欄位：韻母、四聲
+HA_JI_FIELDS = ['韻母', '韻母標音', '攝', '調', '目次', '韻目', '等呼', '等', '呼']
+
 
 def connect_to_db_by_context_manager_decorator(db_path):
     def connect_to_db(func):
         def wrapper(*args, **kwargs):
-            # 創建數據庫連接
-            conn = sqlite3.connect(db_path)
-
-            # 創建一個游標
-            cursor = conn.cursor()
+            # 取用共用之唯讀連線（由 connection_manager 管理，不於每次呼叫開關）
+            cursor = connection_manager.read_connection(db_path).cursor()
 
             # 執行函數
-            result = func(cursor, *args, **kwargs)
-
-            # 關閉數據庫連接
-            conn.close()
-
-            return result
+            return func(cursor, *args, **kwargs)
 
         return wrapper
 
@@ -150,8 +156,9 @@ def huan_ciat_ca_piau_im(cursor, siong_ji, ha_ji):
     WHERE 上字 = ? AND 下字 = ?;
     """
 
-    query = """
-    SELECT *
+    # 明列欄位，令欄位名稱與查詢結果對應（SELECT * 之欄位順序含【常用度】，與原欄位名稱列表不符）
+    query = f"""
+    SELECT {', '.join(KONG_UN_HAN_JI_FIELDS)}
     FROM 廣韻漢字庫
     WHERE 上字 = ? AND 下字 = ?;
     """
@@ -159,12 +166,114 @@ def huan_ciat_ca_piau_im(cursor, siong_ji, ha_ji):
     results = cursor.fetchall()
 
     # 將結果轉換為字典列表
-    fields = [
-        '字號', '漢字', '標音', '上字', '下字', '上字號', '聲母', '聲母標音', '七聲類',
-        '清濁', '發送收', '下字號', '韻母', '韻母標音', '韻目列號', '攝', '調', '目次',
-        '韻目', '等呼', '等', '呼', '廣韻調名', '台羅聲調', '字義識別號'
-    ]
-    return [dict(zip(fields, result)) for result in results]
+    return [dict(zip(KONG_UN_HAN_JI_FIELDS, result)) for result in results]
+
+
+# ==========================================================
+# 反切引擎：一次載入【廣韻漢字庫】，之後之反切查詢皆於記憶體中完成
+# ==========================================================
+class KongUnHuanCiat:
+    """
+    《廣韻》反切引擎。
+
+    建立時一次讀入【廣韻漢字庫】，預先建立：
+      - 上字 → 聲母（聲母、聲母標音、七聲類、清濁、發送收）
+      - 下字 → 韻母（韻母、韻母標音、攝、調、目次、韻目、等呼、等、呼）
+      - (上字, 下字) → 漢字讀音列表
+      - 漢字 → 漢字讀音列表（依常用度由大至小）
+    上字定聲母及清濁，下字定韻母及四聲，故未見於《廣韻》之切語，亦可推得讀音。
+
+    :param cursor: 數據庫游標
+    """
+
+    def __init__(self, cursor):
+        cursor.execute(
+            f"""
+            SELECT {', '.join(KONG_UN_HAN_JI_FIELDS)}
+            FROM 廣韻漢字庫
+            ORDER BY COALESCE(常用度, 0) DESC, 字號;
+            """
+        )
+        self.siong_ji = {}  # 上字 → [聲母資訊, ...]（不重複）
+        self.ha_ji = {}  # 下字 → [韻母資訊, ...]（不重複）
+        self.ciat_gu_han_ji = {}  # (上字, 下字) → [讀音字典, ...]
+        self.han_ji_piau_im = {}  # 漢字 → [讀音字典, ...]
+        for row in cursor.fetchall():
+            record = dict(zip(KONG_UN_HAN_JI_FIELDS, row))
+            siann_bu = {field: record[field] for field in SIONG_JI_FIELDS}
+            if siann_bu not in self.siong_ji.setdefault(record['上字'], []):
+                self.siong_ji[record['上字']].append(siann_bu)
+            un_bu = {field: record[field] for field in HA_JI_FIELDS}
+            if un_bu not in self.ha_ji.setdefault(record['下字'], []):
+                self.ha_ji[record['下字']].append(un_bu)
+            self.ciat_gu_han_ji.setdefault((record['上字'], record['下字']), []).append(record)
+            self.han_ji_piau_im.setdefault(record['漢字'], []).append(record)
+
+    def han_ji_ca_piau_im(self, han_ji):
+        """同 han_ji_ca_piau_im()，自記憶體查詢"""
+        return [dict(record) for record in self.han_ji_piau_im.get(han_ji, [])]
+
+    def huan_ciat_ca_piau_im(self, siong_ji, ha_ji):
+        """同 huan_ciat_ca_piau_im()，自記憶體查詢"""
+        return [dict(record) for record in self.ciat_gu_han_ji.get((siong_ji, ha_ji), [])]
+
+    def ca_ciat_gu(self, ciat_gu):
+        """
+        反切查詢：上字辨【清濁】、定聲母；下字定【四聲】、韻母。
+
+        :param ciat_gu: 切語（反切上字及下字，如：德紅）
+        :return: 讀音字典列表（上字或下字有多種聲母、韻母者，逐一組合），各含：
+                 切語、上字、下字、聲母資訊、韻母資訊、廣韻調名、台羅聲調、台語音標、漢字（讀音字典列表）；
+                 切語格式不符，或上字、下字不在《廣韻》切語中者，傳回空列表
+        """
+        if len(ciat_gu) != 2:
+            return []
+        siong_ji, ha_ji = ciat_gu[0], ciat_gu[1]
+        han_ji = self.huan_ciat_ca_piau_im(siong_ji, ha_ji)
+
+        results = []
+        for siann_bu in self.siong_ji.get(siong_ji, []):
+            for un_bu in self.ha_ji.get(ha_ji, []):
+                廣韻調名 = f"{(siann_bu['清濁'] or ' ')[-1]}{un_bu['調']}"
+                台羅聲調 = Kong_Un_Tng_Tai_Loo(廣韻調名)
+                # 台羅聲調：第 6 調，等同第 2 調
+                if 台羅聲調 == 6:
+                    台羅聲調 = 2
+                聲母標音 = '' if siann_bu['聲母標音'] == 'Ø' else siann_bu['聲母標音']
+                results.append(
+                    {
+                        '切語': ciat_gu,
+                        '上字': siong_ji,
+                        '下字': ha_ji,
+                        **siann_bu,
+                        **un_bu,
+                        '廣韻調名': 廣韻調名,
+                        '台羅聲調': 台羅聲調,
+                        '台語音標': f"{聲母標音}{un_bu['韻母標音']}{台羅聲調 or ''}",
+                        '漢字': han_ji,
+                    }
+                )
+        return results
+
+    def ca_ciat_gu_batch(self, ciat_gu_list):
+        """
+        批次反切查詢。
+
+        :param ciat_gu_list: 切語列表（可重複；僅查詢不重複者）
+        :return: {切語: ca_ciat_gu() 之結果}
+        """
+        return {ciat_gu: self.ca_ciat_gu(ciat_gu) for ciat_gu in dict.fromkeys(ciat_gu_list)}
+
+
+_huan_ciat_engines = {}
+
+
+def get_huan_ciat(db_path):
+    """取得資料庫之反切引擎（每個資料庫於程式執行期間僅載入一次）"""
+    db_key = connection_manager.db_key(db_path)
+    if db_key not in _huan_ciat_engines:
+        _huan_ciat_engines[db_key] = KongUnHuanCiat(connection_manager.read_connection(db_path).cursor())
+    return _huan_ciat_engines[db_key]
 
 
 def TL_Tng_Zu_Im(siann_bu, un_bu, siann_tiau, cursor):
@@ -1,8 +1,27 @@
 """
-模組名稱：mod_標音.py v0.2.6
+模組名稱：mod_標音.py v0.2.12
 模組：標音處理相關函數
+
+更新紀錄：
+v0.2.12 2026-10-18: hong_im_tng_tai_gi_im_piau() 之聲母＋韻母無法合併解析者，改依舊法
+       分別查對聲母、韻母，有效之聲母不再一併清除。
+v0.2.11 2026-10-18: PiauIm.hong_im_tng_tai_gi_im_piau() 改由 mod_標音反轉換 之
+       PiauImTngTLPA 轉換，不再逐音節查詢資料庫；ㄐ、ㄑ、ㄒ、ㆢ 聲母可正確轉回。
+v0.2.10 2026-10-18: tng_im_piau()、tng_tiau_ho() 及 separate_tone()、apply_tone()、
+       handle_o_dot() 改由 mod_音標轉換 之 Transliterator 處理，移除重複之韻母轉換字典。
+v0.2.9 2026-10-18: PiauIm 改用 mod_database.connection_manager 之共用唯讀連線；
+       同一資料庫之【聲母/韻母對照表】僅查詢一次，後建之 PiauIm 物件取用其複本；
+       【標音轉換表】之寫入，改用共用之寫入連線。
+v0.2.8 2026-10-18: split_tai_gi_im_piau() 改由 mod_音節.SyllableParser 解析並快取結果；
+       kam_si_u_tiau_hu()、tng_im_piau()、tng_tiau_ho() 遇純 ASCII 音標，略過 Unicode
+       標準化；韻母轉換字典之排序鍵，於模組載入時建立一次。
+v0.2.7 2026-10-18: 新增【標音轉換表】：將每個【聲母 × 韻母 × 聲調】音節，預先轉換成各種
+       【標音方法】並存入資料庫；PiauIm.han_ji_piau_im_tng_huan() 優先查表，查無者才
+       呼叫原轉換函數，並將結果留存於記憶體。
 """
 
+import hashlib
+import logging
 import os
 import re
 import sqlite3
@@ -26,12 +45,24 @@ from mod_BP_tng_huan_ping_im import (
 
 # 將 TLPA+ 【台語音標】轉換成 MPS2 【台語注音二式】
 from mod_convert_TLPA_to_MPS2 import convert_TLPA_to_MPS2
+from mod_database import connection_manager
 from mod_logging import (
     init_logging,
     logging_exc_error,
     logging_exception,
     logging_warning,
 )
+from mod_音標轉換 import (  # noqa: F401
+    TIAU_HO,
+    TIAU_HU,
+    TLPA_JI_BU,
+    apply_tone,
+    handle_o_dot,
+    separate_tone,
+)
+from mod_音標轉換 import convert as im_piau_tng_huan
+from mod_標音反轉換 import HONG_IM, PiauImTngTLPA
+from mod_音節 import SyllableParser
 
 # =========================================================================
 # 常數定義
@@ -205,135 +236,26 @@ un_bu_tng_huan_map_dict = {
 }
 
 
-# =========================================================================
-# helper functions:  與 mod_帶調號母音轉換.py 重複，可考慮整合
-# =========================================================================
-# 韻母轉換字典
-un_bu_mapping = {
-    "ee": "e",
-    "ei": "e",
-    "er": "e",
-    "erh": "eh",
-    "or": "o",
-    "ere": "ue",
-    "ereh": "ueh",
-    "ir": "i",
-    "eng": "ing",
-    "ek": "ik",
-    "oa": "ua",
-    "oe": "ue",
-    "oai": "uai",
-    "ou": "oo",
-    "onn": "oonn",
-    "uei": "ue",
-    "ueinn": "uenn",
-    "ur": "u",
-}
-
-# 聲調符號對映調號數值的轉換字典
-tiau_fu_mapping = {
-    "\u0300": "3",  # 3 陰去: ò
-    "\u0301": "2",  # 2 陰上: ó
-    "\u0302": "5",  # 5 陽平: ô
-    "\u0304": "7",  # 7 陽去: ō
-    "\u0306": "9",  # 9 輕声: ő
-    "\u030c": "6",  # 6 陽上: ǒ
-    "\u030d": "8",  # 8 陽入: o̍
-}
-
-
-def separate_tone(im_piau):
-    """拆解帶調字母為無調字母與調號"""
-    decomposed = unicodedata.normalize("NFD", im_piau)
-    letters = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
-    tones = "".join(
-        c for c in decomposed if unicodedata.category(c) == "Mn" and c != "\u0358"
-    )
-    return letters, tones
-
-
-def apply_tone(im_piau, tone):
-    """
-    根據 TLPA 響度優先規則，將聲調符號 tone 正確標示在母音上。
-    """
-    tone_priority = ["a", "oo", "e", "o", "i", "u", "m"]
-    lower = im_piau.lower()
-
-    # 特例：ere → 最後 e
-    if "ere" in lower:
-        idx = lower.rindex("e")
-        return unicodedata.normalize(
-            "NFC", im_piau[: idx + 1] + tone + im_piau[idx + 1 :]
-        )
-
-    # ✅ 特例：iu / ui 雙母音（不限定結尾）
-    for i in range(len(lower) - 1):
-        if lower[i] == "i" and lower[i + 1] == "u":
-            return unicodedata.normalize(
-                "NFC", im_piau[: i + 2] + tone + im_piau[i + 2 :]
-            )
-        if lower[i] == "u" and lower[i + 1] == "i":
-            return unicodedata.normalize(
-                "NFC", im_piau[: i + 2] + tone + im_piau[i + 2 :]
-            )
-
-    # 特例：oo → 第一個 o
-    if "oo" in lower:
-        idx = lower.index("oo")
-        return unicodedata.normalize(
-            "NFC", im_piau[: idx + 1] + tone + im_piau[idx + 1 :]
-        )
-
-    # 響度優先分析
-    best_idx = -1
-    best_priority = len(tone_priority) + 1
-
-    i = 0
-    while i < len(lower):
-        if lower[i] == "o" and i + 1 < len(lower) and lower[i + 1] == "o":
-            current = "oo"
-            idx = i
-            i += 1
-        else:
-            current = lower[i]
-            idx = i
-
-        if current in tone_priority:
-            pri = tone_priority.index(current)
-            if pri < best_priority:
-                best_idx = idx
-                best_priority = pri
-            elif pri == best_priority and current in ["i", "u"]:
-                best_idx = idx
-        i += 1
-
-    if best_idx != -1:
-        return unicodedata.normalize(
-            "NFC", im_piau[: best_idx + 1] + tone + im_piau[best_idx + 1 :]
-        )
-
-    # fallback
-    return unicodedata.normalize("NFC", im_piau[0] + tone + im_piau[1:])
-
-
-def handle_o_dot(im_piau):
-    # 依 Unicode 解構標準（NFD）分解傳入之【音標】，取得解構後之【拼音字母與調符】
-    decomposed = unicodedata.normalize("NFD", im_piau)
-    # 找出 o + 聲調 + 鼻化符號的特殊組合
-    match = re.search(
-        r"(o)([\u0300\u0301\u0302\u0304\u030B\u030C\u030D]?)(\u0358)", decomposed, re.I
-    )
-    if match:
-        # 捕獲【音標】，其【拼音字母】有 o 長音字母，且其右上方帶有圓點調符（\u0358）： o͘
-        letter, tone, nasal = match.groups()
-        # 將 o 長音字母，轉換成【拼音字母】 oo，再附回聲調
-        # replaced = f"{letter}{letter}{tone}"
-        replaced = f"{letter}{tone}{letter}"
-        # 重組字串
-        decomposed = decomposed.replace(match.group(), replaced)
-    # 依 Unicode 組合標準（NFC）重構【拼音字母與調符】，組成轉換後之【音標】
-    return unicodedata.normalize("NFC", decomposed)
+# 【標音轉換表】：音節（聲母 × 韻母 × 聲調）預先轉換成各種【標音方法】之結果
+TNG_HUAN_PIAU = "標音轉換表"
+TNG_HUAN_PIAU_ZU_SIN = "標音轉換表資訊"  # 記錄產生轉換表時之【聲母/韻母對照表】簽章
+TNG_HUAN_PIAU_PAN_PUN = "1"  # 轉換邏輯變更時，遞增此版本，令舊轉換表失效
+PIAU_IM_HUAT_LIST = (
+    "十五音",
+    "方音符號",
+    "注音二式",
+    "雅俗通",
+    "白話字",
+    "台羅拼音",
+    "閩拼調號",
+    "閩拼調符",
+    "閩拼注音",
+    "台語音標",
+)
+TIAU_HO_LIST = ("1", "2", "3", "4", "5", "6", "7", "8")
 
+# 各資料庫已載入之【聲母/韻母對照表】：{資料庫路徑: (Siann_Bu_Dict, Un_Bu_Dict)}
+_piau_im_dict_cache = {}
 
 # =========================================================================
 # helper functions:  與 mod_帶調號母音轉換.py 重複，可考慮整合
@@ -353,6 +275,10 @@ def kam_si_u_tiau_hu(im_piau: str) -> bool:
     if im_piau[-1] in "123456789":
         return False
 
+    # 純 ASCII 音標不含調符，僅需依末端【拼音字母】判斷
+    if im_piau.isascii():
+        return im_piau[-1] in "hptkaeioumngAEIOUMN"
+
     # 將傳入【音標】字串，以標準化組合格式：NFC，將【帶調符拼音字母】標準化；
     # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
     # 不同之 Unicode 編碼
@@ -396,86 +322,8 @@ def tng_im_piau(
     :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
     :return: str - 轉換後的【帶調號TLPA音標】
     """
-    # 遇標點符號，不做轉換處理，直接回傳
-    if im_piau[-1] in PUNCTUATIONS:
-        return im_piau
-
-    # ---------------------------------------------------------
-    # 更換【音標】之【聲母】
-    # ---------------------------------------------------------
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    im_piau = unicodedata.normalize("NFC", im_piau)
-
-    if im_piau.startswith("tsh"):
-        im_piau = im_piau.replace("tsh", "c", 1)
-    elif im_piau.startswith("Tsh"):
-        im_piau = im_piau.replace("Tsh", "C", 1)
-    elif im_piau.startswith("ts"):
-        im_piau = im_piau.replace("ts", "z", 1)
-    elif im_piau.startswith("Ts"):
-        im_piau = im_piau.replace("Ts", "Z", 1)
-    elif im_piau.startswith("chh"):
-        im_piau = im_piau.replace("chh", "c", 1)
-    elif im_piau.startswith("Chh"):
-        im_piau = im_piau.replace("Chh", "C", 1)
-    elif im_piau.startswith("ch"):
-        im_piau = im_piau.replace("ch", "z", 1)
-    elif im_piau.startswith("Ch"):
-        im_piau = im_piau.replace("Ch", "Z", 1)
-
-    # ---------------------------------------------------------
-    # 更換【音標】之【韻母】
-    # ---------------------------------------------------------
-    su_ji = im_piau[0]  # 保存【音標】之拼音首字母
-    org_im_piau = im_piau
-    im_piau = org_im_piau.lower()
-
-    # 轉換【鼻音韻母】
-    im_piau = im_piau.replace("ⁿ", "nn", 1)
-
-    # 轉換音標中【韻母】為【o͘】（oo長音）的特殊處理
-    im_piau = handle_o_dot(im_piau)
-
-    # # 聲調符號對映調號數值的轉換字典
-    # tiau_fu_mapping = {
-    #     "\u0300": "3",   # 3 陰去: ò
-    #     "\u0301": "2",   # 2 陰上: ó
-    #     "\u0302": "5",   # 5 陽平: ô
-    #     "\u0304": "7",   # 7 陽去: ō
-    #     "\u0306": "9",   # 9 輕声: ő
-    #     "\u030C": "6",   # 6 陽上: ǒ
-    #     "\u030D": "8",   # 8 陽入: o̍
-    # }
-    # 轉換音標中【韻母】部份，不含【o͘】（oo長音）的特殊處理
-    letters, tone = separate_tone(im_piau)  # 無調符音標：im_piau
-    # if tone:
-    #     tiau_ho = tiau_fu_mapping[tone]
-    # else:
-    #     tiau_ho = ""
-
-    # 以【無調符音標】，轉換【韻母】
-    sorted_keys = sorted(un_bu_mapping, key=len, reverse=True)
-    for key in sorted_keys:
-        if key in letters:
-            letters = letters.replace(key, un_bu_mapping[key])
-            break
-
-    # 如若傳入之【音標】首字母為大寫，則將已轉成 "z" 或 "c" 之拼音字母改為大寫
-    if su_ji.isupper():
-        if letters[0] == "z":
-            letters = "Z" + letters[1:]
-        elif letters[0] == "c":
-            letters = "C" + letters[1:]
-        else:
-            letters = su_ji + letters[1:]
-
-    # 調符
-    if tone:
-        letters = apply_tone(letters, tone)
-
-    return letters
+    # 聲母、韻母改為【台語音標】拼音字母，調符保持不變（首字母大寫一律保留）
+    return im_piau_tng_huan(im_piau, TIAU_HU, TLPA_JI_BU)
 
 
 def tng_tiau_ho(im_piau: str, kan_hua: bool = False) -> str:
@@ -485,50 +333,7 @@ def tng_tiau_ho(im_piau: str, kan_hua: bool = False) -> str:
     :param kan_hua: bool - 簡化：若是【簡化】，聲調值為 1 或 4 ，去除調號值
     :return: str - 帶調號音標
     """
-    if im_piau == "":
-        return ""  # noqa: E701
-    # 遇標點符號，不做轉換處理，直接回傳
-    if im_piau[-1] in PUNCTUATIONS:
-        return im_piau
-
-    # 若【音標】末端為數值，表音標已是【帶調號拼音】，直接回傳
-    u_tiau_ho = True if im_piau[-1] in "123456789" else False
-    if u_tiau_ho:
-        return im_piau  # noqa: E701
-
-    # 將傳入【音標】字串，以標準化之 NFC 組合格式，調整【帶調符拼音字母】；
-    # 令以下之處理作業，不會發生【看似相同】的【帶調符拼音字母】，其實使用
-    # 不同之 Unicode 編碼
-    im_piau = unicodedata.normalize("NFC", im_piau)
-
-    # --------------------------------------------------------------------------------
-    # 以【元音及韻化輔音清單】，比對傳入之【音標】，找出對應之【基本拼音字母】與【調號】
-    # --------------------------------------------------------------------------------
-    tone_number = "1"  # 初始化調號為 1
-    number = "1"  # 明確初始化 number 變數，以免未設定而發生錯誤
-    for tone_mark, (base_char, number) in tiau_hu_mapping.items():
-        if tone_mark in im_piau:
-            im_piau = im_piau.replace(tone_mark, base_char)
-            break
-    else:
-        number = "1"  # 若沒有任何調符，number強制為1
-
-    # 依是否要【簡化】之設定，處理【調號】1 或 4 是否要略去
-    if kan_hua and number in ["1", "4"]:
-        # 若是【簡化】，且聲調值為 1 或 4 ，去除調號值
-        tone_number = ""
-    else:
-        # 若未要求【簡化】，聲調值置於【音標】末端
-        if number not in ["1", "4"]:
-            tone_number = number
-        else:
-            if im_piau[-1] in "hptk":
-                # 【音標】末端為【hptk】之一，則為【陰入調】，聲調值為 4
-                tone_number = "4"
-            else:
-                tone_number = "1"
-
-    return im_piau + tone_number
+    return im_piau_tng_huan(im_piau, TIAU_HU, TIAU_HO, kan_hua=kan_hua)
 
 
 # ================================================================================
@@ -581,7 +386,12 @@ class PiauIm:
     def __init__(self, han_ji_khoo="漢語標音", cursor=None):
         self.Siann_Bu_Dict = None
         self.Un_Bu_Dict = None
+        self.db_name = None
         self.cursor = cursor  # 將 cursor 存入物件屬性
+        # 各【標音方法】之音節轉換結果：{標音方法: {(聲母, 韻母, 聲調): 漢字標音}}
+        self._tng_huan_piau = {}
+        # 【方音符號】等標音轉回【台語音標】之反轉換物件（首次使用時建立）
+        self._tng_tlpa = None
         self.init_piau_im_dict(han_ji_khoo)
         self.TL_pattern1 = re.compile(r"(uai|uan|uah|ueh|ee|ei|oo)", re.I)
         self.TL_pattern2 = re.compile(r"(o|e|a|u|i|n|m)", re.I)
@@ -663,10 +473,61 @@ class PiauIm:
         :param han_ji_khoo: 標音類型
         """
         db_name = "Ho_Lok_Ue.db" if han_ji_khoo == "河洛話" else "Han_Ji_Piau_Im.db"
-        with sqlite3.connect(db_name) as conn:
-            self.cursor = conn.cursor() if not self.cursor else self.cursor
+        self.db_name = db_name
+        self._tng_huan_piau = {}
+        # 呼叫端自備 cursor 者，自該 cursor 查詢對照表
+        if self.cursor:
             self.Siann_Bu_Dict = self._init_siann_bu_dict()
             self.Un_Bu_Dict = self._init_un_bu_dict()
+            return
+
+        self.cursor = connection_manager.read_connection(db_name).cursor()
+        db_key = connection_manager.db_key(db_name)
+        if db_key not in _piau_im_dict_cache:
+            _piau_im_dict_cache[db_key] = (self._init_siann_bu_dict(), self._init_un_bu_dict())
+        siann_bu_dict, un_bu_dict = _piau_im_dict_cache[db_key]
+        self.Siann_Bu_Dict = dict(siann_bu_dict)
+        self.Un_Bu_Dict = dict(un_bu_dict)
+
+    def tng_huan_piau_ciam_ziong(self) -> str:
+        """
+        【聲母/韻母對照表】之簽章：對照表內容或轉換表版本變更時，簽章隨之改變，
+        據以判斷資料庫中之【標音轉換表】是否仍然有效。
+        """
+        content = repr(
+            (
+                TNG_HUAN_PIAU_PAN_PUN,
+                sorted(self.Siann_Bu_Dict.items()),
+                sorted(self.Un_Bu_Dict.items()),
+            )
+        )
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _load_tng_huan_piau(self, piau_im_huat: str) -> dict:
+        """
+        自資料庫載入某【標音方法】之【標音轉換表】；轉換表不存在或已過期者，傳回空字典。
+        """
+        tng_huan_piau = {}
+        if not self.db_name or not os.path.exists(self.db_name):
+            return tng_huan_piau
+        try:
+            conn = connection_manager.read_connection(self.db_name)
+            row = connection_manager.fetchone(
+                conn, f"SELECT 內容 FROM {TNG_HUAN_PIAU_ZU_SIN} WHERE 項目 = '簽章'"
+            )
+            if not row or row[0] != self.tng_huan_piau_ciam_ziong():
+                return tng_huan_piau
+            rows = connection_manager.fetchall(
+                conn,
+                f"SELECT 聲母, 韻母, 聲調, 漢字標音 FROM {TNG_HUAN_PIAU} WHERE 標音方法 = ?",
+                (piau_im_huat,),
+            )
+            for siann_bu, un_bu, tiau_ho, han_ji_piau_im in rows:
+                tng_huan_piau[(siann_bu, un_bu, tiau_ho)] = han_ji_piau_im
+        except sqlite3.OperationalError:
+            # 資料庫尚未建置【標音轉換表】
+            pass
+        return tng_huan_piau
 
     # ================================================================
     # 在韻母加調號：白話字(POJ)與台羅(TL)同
@@ -1152,7 +1013,29 @@ class PiauIm:
     def han_ji_piau_im_tng_huan(
         self, piau_im_huat: str, siann_bu: str, un_bu: str, tiau_ho: str
     ) -> str:
-        """選擇並執行對應的注音方法"""
+        """
+        選擇並執行對應的注音方法。
+
+        先查【標音轉換表】；查無之音節，才呼叫原轉換函數，並將結果留存，
+        供下次查詢使用（轉換失敗者，例外照常拋出，不留存）。
+        """
+        tng_huan_piau = self._tng_huan_piau.get(piau_im_huat)
+        if tng_huan_piau is None:
+            tng_huan_piau = self._load_tng_huan_piau(piau_im_huat)
+            self._tng_huan_piau[piau_im_huat] = tng_huan_piau
+        key = (siann_bu, un_bu, tiau_ho)
+        han_ji_piau_im = tng_huan_piau.get(key)
+        if han_ji_piau_im is None:
+            han_ji_piau_im = self.han_ji_piau_im_tng_huan_bo_tng_huan_piau(
+                piau_im_huat, siann_bu, un_bu, tiau_ho
+            )
+            tng_huan_piau[key] = han_ji_piau_im
+        return han_ji_piau_im
+
+    def han_ji_piau_im_tng_huan_bo_tng_huan_piau(
+        self, piau_im_huat: str, siann_bu: str, un_bu: str, tiau_ho: str
+    ) -> str:
+        """不查【標音轉換表】，直接以轉換函數，轉換【漢字標音】"""
         if piau_im_huat == "十五音":
             return self.SNI_piau_im(siann_bu, un_bu, tiau_ho)
         elif piau_im_huat == "方音符號":
@@ -1188,20 +1071,16 @@ class PiauIm:
         :param tiau: 聲調 (方音符號)
         :return: (聲母, 韻母, 聲調) 的 tuple
         """
-        if not self.cursor:
-            raise ValueError("資料庫 cursor 未設定，無法執行查詢")
-
-        # 查詢【聲母對照表】轉換【聲母】
-        self.cursor.execute(
-            "SELECT 台語音標 FROM 聲母對照表 WHERE 方音符號 = ?", (siann,)
-        )
-        siann_result = self.cursor.fetchone()
-        tai_gi_siann = siann_result[0] if siann_result else ""
-
-        # 查詢【韻母對照表】轉換【韻母】
-        self.cursor.execute("SELECT 台語音標 FROM 韻母對照表 WHERE 方音符號 = ?", (un,))
-        un_result = self.cursor.fetchone()
-        tai_gi_un = un_result[0] if un_result else ""
+        # 以記憶體中之【聲母/韻母對照表】字首樹解析，不查詢資料庫
+        if self._tng_tlpa is None:
+            self._tng_tlpa = PiauImTngTLPA.from_piau_im(self)
+        siann_un = self._tng_tlpa.kai_sik_siann_un(f"{siann}{un}", HONG_IM, str(tiau))
+        if siann_un:
+            tai_gi_siann, tai_gi_un = siann_un
+        else:
+            # 無法合併解析者，分別查對【聲母】及【韻母】；查無者為空字串
+            tai_gi_siann = self._tng_tlpa.siann_bu[HONG_IM].get(siann, "")
+            tai_gi_un = (self._tng_tlpa.un_bu[HONG_IM].get(un) or [""])[0]
 
         # 聲調不變，直接回傳
         tai_gi_tiau = tiau
@@ -1215,6 +1094,81 @@ class PiauIm:
         }
 
 
+# =========================================================================
+# 產生【標音轉換表】
+# =========================================================================
+def iter_im_ziat(piau_im: PiauIm):
+    """列舉【聲母對照表 × 韻母對照表 × 聲調】所有音節：(聲母, 韻母, 聲調)"""
+    siann_bu_list = [""] + [siann_bu for siann_bu in piau_im.Siann_Bu_Dict if siann_bu]
+    for siann_bu in siann_bu_list:
+        for un_bu in piau_im.Un_Bu_Dict:
+            for tiau_ho in TIAU_HO_LIST:
+                yield siann_bu, un_bu, tiau_ho
+
+
+def build_tng_huan_piau(piau_im: PiauIm, piau_im_huat_list=PIAU_IM_HUAT_LIST) -> dict:
+    """
+    將所有音節，依各【標音方法】轉換：{(標音方法, 聲母, 韻母, 聲調): 漢字標音}。
+    轉換失敗之音節（無效組合），略過不收。
+    """
+    tng_huan_piau = {}
+    # 無效組合之警告訊息，於產生轉換表時無參考價值
+    logging.disable(logging.WARNING)
+    try:
+        for piau_im_huat in piau_im_huat_list:
+            for siann_bu, un_bu, tiau_ho in iter_im_ziat(piau_im):
+                try:
+                    han_ji_piau_im = piau_im.han_ji_piau_im_tng_huan_bo_tng_huan_piau(
+                        piau_im_huat, siann_bu, un_bu, tiau_ho
+                    )
+                except Exception:
+                    continue
+                if han_ji_piau_im is None:
+                    continue
+                tng_huan_piau[(piau_im_huat, siann_bu, un_bu, tiau_ho)] = han_ji_piau_im
+    finally:
+        logging.disable(logging.NOTSET)
+    return tng_huan_piau
+
+
+def save_tng_huan_piau(piau_im: PiauIm, db_name: Optional[str] = None) -> int:
+    """
+    產生【標音轉換表】，並存入資料庫（預設為 PiauIm 載入對照表之資料庫）。
+
+    :return: 轉換表筆數
+    """
+    db_name = db_name or piau_im.db_name
+    tng_huan_piau = build_tng_huan_piau(piau_im)
+    conn = connection_manager.write_connection(db_name)
+    with conn:
+        conn.execute(f"DROP TABLE IF EXISTS {TNG_HUAN_PIAU}")
+        conn.execute(
+            f"""
+            CREATE TABLE {TNG_HUAN_PIAU} (
+                標音方法 TEXT NOT NULL,
+                聲母 TEXT NOT NULL,
+                韻母 TEXT NOT NULL,
+                聲調 TEXT NOT NULL,
+                漢字標音 TEXT NOT NULL,
+                PRIMARY KEY (標音方法, 聲母, 韻母, 聲調)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.executemany(
+            f"INSERT INTO {TNG_HUAN_PIAU} VALUES (?, ?, ?, ?, ?)",
+            (key + (value,) for key, value in tng_huan_piau.items()),
+        )
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {TNG_HUAN_PIAU_ZU_SIN} (項目 TEXT PRIMARY KEY, 內容 TEXT)"
+        )
+        conn.execute(
+            f"INSERT OR REPLACE INTO {TNG_HUAN_PIAU_ZU_SIN} VALUES ('簽章', ?)",
+            (piau_im.tng_huan_piau_ciam_ziong(),),
+        )
+    piau_im._tng_huan_piau = {}
+    return len(tng_huan_piau)
+
+
 # =========================================================================
 # 將【漢字庫】查詢所得結果，解析出【台語音標】，並依據使用者設定輸出【漢字標音】
 # =========================================================================
@@ -1721,67 +1675,22 @@ def split_tai_lo(input_str):
         return None, None, None
 
 
-# ============================================================================
-# 將【台語音標】分解為【聲母】、【韻母】、【調號】
-# ============================================================================
-def split_tai_gi_im_piau(im_piau: str, po_ci: bool = False):
-    # 如果輸入之【音標】為【帶調符音標】，則需確保轉換為【帶調號TLPA音標】
+def tng_tiau_hu_im_piau(im_piau: str) -> str:
+    """【帶調符音標】轉換為【帶調號TLPA音標】；其它音標原樣傳回"""
     if kam_si_u_tiau_hu(im_piau):
         im_piau = tng_im_piau(im_piau)
         im_piau = tng_tiau_ho(im_piau)
-    # 將輸入的台語音標轉換為小寫
-    im_piau = im_piau.lower()
-    # 查檢【台語音標】是否符合【標準】=【聲母】+【韻母】+【調號】
-    tiau = im_piau[-1]
-    tiau = replace_superscript_digits(str(tiau))
+    return im_piau
 
-    # 矯正未標明陰平/陰入調號的情況
-    if tiau in ["p", "t", "k", "h"]:
-        tiau = "4"
-        im_piau += tiau
-    elif tiau in ["a", "e", "i", "o", "u", "m", "n", "g"]:
-        tiau = "1"
-        im_piau += tiau
-
-    # 聲母相容性轉換
-    if im_piau.startswith("tsh"):
-        im_piau = im_piau.replace("tsh", "c", 1)
-    elif im_piau.startswith("ts"):
-        im_piau = im_piau.replace("ts", "z", 1)
 
-    # 定義聲母的正規表示式，包括常見的聲母，但不包括 m 和 ng
-    siann_bu_pattern = re.compile(
-        r"(b|c|z|g|h|j|kh|k|l|m(?!\d)|ng(?!\d)|n|ph|p|s|th|t|Ø)"
-    )
-    un_bu_as_m_or_ng_pattern = re.compile(r"(m|ng)\d")
+_syllable_parser = SyllableParser(tng_un_bu=un_bu_tng_huan, tng_tiau_hu=tng_tiau_hu_im_piau)
 
-    result = []
 
-    # 首先檢查是否是 m 或 ng 當作韻母的特殊情況
-    if un_bu_as_m_or_ng_pattern.match(im_piau):
-        siann_bu = ""
-        un_bu = im_piau[:-1]
-        tiau = im_piau[-1]
-    else:
-        siann_bu_match = siann_bu_pattern.match(im_piau)
-        if siann_bu_match:
-            siann_bu = siann_bu_match.group()
-            un_bu = im_piau[len(siann_bu) : -1]
-        else:
-            siann_bu = ""
-            un_bu = im_piau[:-1]
-
-    # 轉換韻母
-    un_bu = un_bu_tng_huan(un_bu)
-
-    # 調整聲母大小寫
-    if po_ci:
-        siann_bu = siann_bu[0].upper() + siann_bu[1:] if siann_bu else ""
-
-    result += [siann_bu]
-    result += [un_bu]
-    result += [tiau]
-    return result
+# ============================================================================
+# 將【台語音標】分解為【聲母】、【韻母】、【調號】
+# ============================================================================
+def split_tai_gi_im_piau(im_piau: str, po_ci: bool = False):
+    return _syllable_parser.split_tai_gi_im_piau(im_piau, po_ci)
 
 
 def split_hong_im_hu_ho(hong_im_piau_im):
@@ -2129,6 +2038,16 @@ def ut005():
 
 
 if __name__ == "__main__":
+    import sys
+
+    # 產生【標音轉換表】：python mod_標音.py --build-tng-huan-piau [河洛話|漢語標音]
+    if len(sys.argv) > 1 and sys.argv[1] == "--build-tng-huan-piau":
+        han_ji_khoo = sys.argv[2] if len(sys.argv) > 2 else "河洛話"
+        piau_im = PiauIm(han_ji_khoo)
+        total = save_tng_huan_piau(piau_im)
+        print(f"【{TNG_HUAN_PIAU}】已寫入 {piau_im.db_name}：共 {total} 筆")
+        sys.exit(EXIT_CODE_SUCCESS)
+
     # # 測試：將【雞】kere1 轉換為【kue1】
     # print('==================================================================')
     # ut001()
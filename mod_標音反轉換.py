@@ -0,0 +1,381 @@
+"""
+mod_標音反轉換.py v0.1.0
+
+【標音反轉換】：將【方音符號】、【注音二式（MPS2）】、【閩拼方案（BP）】之標音，
+轉回【台語音標（TLPA）】。
+
+原 PiauIm.hong_im_tng_tai_gi_im_piau() 每個音節查詢資料庫兩次（聲母對照表、韻母對照表），
+convert_MPS2_to_TLPA()、split_bp_im_piau() 則每次以正規表示式解析。
+PiauImTngTLPA 之作法：
+  - 依【聲母對照表】、【韻母對照表】、【聲調對照表】，為各標音方法建立一次【聲母字首樹】
+    及【韻母】、【調符】查對表，之後轉換不再查詢資料庫；
+  - 解析音節時，沿聲母字首樹列出所有相符之聲母，由長而短，取餘下部份為有效韻母者；
+  - 可轉換以空白或連字號分隔之整句標音；
+  - verify_round_trip()：將對照表中每個音節，以 PiauIm 轉成各標音方法後再轉回，核對能否
+    還原，並列出【歧義】（不同台語音標轉成同一標音）及【不符】之音節。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 PiauImTngTLPA 類別。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import mod_BP_tng_huan_ping_im
+import mod_convert_TLPA_to_MPS2
+from mod_音標轉換 import BP_TIAU_HU_TNG_TIAU_HO, build_trie
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+# 標音方法（名稱同 PiauIm.han_ji_piau_im_tng_huan()）
+HONG_IM = "方音符號"
+MPS2 = "注音二式"
+BP = "閩拼調號"
+BP_TIAU_HU = "閩拼調符"
+PIAU_IM_HUAT_LIST = (HONG_IM, MPS2, BP, BP_TIAU_HU)
+
+# 快取筆數上限
+DEFAULT_CACHE_SIZE = 8192
+
+# 【齒音聲母】遇韻首 ㄧ、ㆪ（或 i）時之變體 → 台語音標聲母（TPS_piau_im()、convert_TLPA_to_MPS2()）
+HONG_IM_CI_IM = {"ㄐ": "z", "ㄑ": "c", "ㄒ": "s", "ㆢ": "j"}
+HONG_IM_CI_IM_UN_THAU = ("ㄧ", "ㆪ")
+MPS2_CI_IM = {"j": "z", "ch": "c", "sh": "s", "jj": "j"}
+MPS2_CI_IM_UN_THAU = ("i",)
+
+# 方音符號輕聲調符（PiauIm.Hong_Im_Tiau_Hu_Dict）
+HONG_IM_KHIN_SIANN = "⁰"
+
+# 聲調對照表查無資料時之預設值：{台羅調號: (閩拼八聲調, 方音符號調符)}
+DEFAULT_SIANN_TIAU = {
+    "1": ("1", ""),
+    "2": ("3", "ˋ"),
+    "3": ("5", "˪"),
+    "4": ("7", ""),
+    "5": ("2", "ˊ"),
+    "6": ("4", ""),
+    "7": ("6", "˫"),
+    "8": ("8", "˙"),
+}
+
+# 台語音標調號
+TIAU_HO_LIST = ("0", "1", "2", "3", "4", "5", "6", "7", "8")
+
+# 入聲韻尾（台語音標）
+JIP_SIANN_BUE = ("p", "t", "k", "h")
+
+# 音節之分隔：空白、連字號及標點符號
+IM_ZIAT_PATTERN = re.compile(r"[^\s\-,.?!:;，。？！：；、​]+")
+
+
+# =========================================================================
+# 標音反轉換
+# =========================================================================
+class PiauImTngTLPA:
+    """
+    將【方音符號】、【注音二式】、【閩拼】標音轉回【台語音標】。
+
+    Args:
+        siann_bu_dict: 聲母對照表（PiauIm.Siann_Bu_Dict）
+        un_bu_dict: 韻母對照表（PiauIm.Un_Bu_Dict）
+        siann_tiau_rows: 聲調對照表之 [(台羅調號, 閩拼八聲調, 方音符號調符), ...]；
+                         預設為 DEFAULT_SIANN_TIAU
+        maxsize: 音節解析結果之快取筆數上限
+
+    範例:
+        >>> tng_tlpa = PiauImTngTLPA.from_piau_im(PiauIm("河洛話"))
+        >>> tng_tlpa.convert("ㄐㄧㆩ ㄏㄠˋ", HONG_IM)
+        'ziann1 hau2'
+    """
+
+    def __init__(self, siann_bu_dict: Dict, un_bu_dict: Dict, siann_tiau_rows=None, maxsize: int = DEFAULT_CACHE_SIZE):
+        if siann_tiau_rows is None:
+            siann_tiau_rows = [(tiau_ho, bp, hong_im) for tiau_ho, (bp, hong_im) in DEFAULT_SIANN_TIAU.items()]
+
+        # 各標音方法之聲母查對表：{標音方法: {標音: 台語音標}}
+        self.siann_bu = {}
+        # 各標音方法之韻母查對表：{標音方法: {標音: [台語音標, ...]}}；
+        # 不同台語音標轉成同一標音者（如閩拼 ee、ei → e），拼寫相同者列首，其餘依對照表順序
+        self.un_bu = {}
+        # 聲母變體之韻首限定：{標音方法: {標音聲母: 韻首}}
+        self._han_ting = {huat: {} for huat in PIAU_IM_HUAT_LIST}
+        # 調號查對表
+        self.hong_im_tiau_hu = {HONG_IM_KHIN_SIANN: "0"}
+        self.bp_tiau_ho = {"0": "0"}
+
+        self._build_siann_un(siann_bu_dict, un_bu_dict)
+        for tiau_ho, bp_tiau_ho, hong_im_tiau_hu in siann_tiau_rows:
+            tiau_ho = str(tiau_ho)
+            if hong_im_tiau_hu and hong_im_tiau_hu not in self.hong_im_tiau_hu:
+                self.hong_im_tiau_hu[hong_im_tiau_hu] = tiau_ho
+            # 閩拼八聲調：台語音標第 6 調（陽上）歸入第 7 調，與 PiauIm.BP_piau_im() 一致
+            if bp_tiau_ho not in (None, "") and tiau_ho != "6":
+                self.bp_tiau_ho[str(bp_tiau_ho)] = tiau_ho
+
+        self._siann_bu_trie = {huat: build_trie(siann_bu) for huat, siann_bu in self.siann_bu.items()}
+        self._kai_sik = lru_cache(maxsize=maxsize)(self._parse)
+
+    @classmethod
+    def from_piau_im(cls, piau_im, maxsize: int = DEFAULT_CACHE_SIZE) -> "PiauImTngTLPA":
+        """以 PiauIm 物件已載入之聲母/韻母對照表，及其資料庫之【聲調對照表】建立"""
+        piau_im.cursor.execute("SELECT 台羅調號, 閩拼八聲調, 方音符號調符 FROM 聲調對照表")
+        siann_tiau_rows = [tuple(row) for row in piau_im.cursor.fetchall()]
+        return cls(piau_im.Siann_Bu_Dict, piau_im.Un_Bu_Dict, siann_tiau_rows or None, maxsize)
+
+    def _build_siann_un(self, siann_bu_dict: Dict, un_bu_dict: Dict) -> None:
+        # 閩拼調號依對照表之【閩拼方案】欄；閩拼調符、注音二式則依其轉換函式所用之對照表
+        mps2_siann_bu = mod_convert_TLPA_to_MPS2.SIANN_BU_TNG_UANN_PIAU
+        mps2_un_bu = mod_convert_TLPA_to_MPS2.UN_BU_TNG_UANN_PIAU
+        bp_siann_bu = mod_BP_tng_huan_ping_im.SIANN_BU_TNG_UANN_PIAU
+        bp_un_bu = mod_BP_tng_huan_ping_im.UN_BU_TNG_UANN_PIAU
+
+        for huat in PIAU_IM_HUAT_LIST:
+            self.siann_bu[huat] = {}
+            self.un_bu[huat] = {}
+
+        for tlpa, row in siann_bu_dict.items():
+            if not tlpa or tlpa in ("ø", "Ø"):
+                continue
+            for huat, piau_im in (
+                (HONG_IM, row["方音符號"]),
+                (MPS2, mps2_siann_bu.get(tlpa, tlpa)),
+                (BP, row["閩拼方案"]),
+                (BP_TIAU_HU, bp_siann_bu.get(tlpa, tlpa)),
+            ):
+                if piau_im and (piau_im not in self.siann_bu[huat] or piau_im == tlpa):
+                    self.siann_bu[huat][piau_im] = tlpa
+
+        for tlpa, row in un_bu_dict.items():
+            for huat, piau_im in (
+                (HONG_IM, row["方音符號"]),
+                (MPS2, mps2_un_bu.get(tlpa, tlpa)),
+                (BP, row["閩拼方案"]),
+                (BP_TIAU_HU, bp_un_bu.get(tlpa, tlpa)),
+            ):
+                if not piau_im:
+                    continue
+                tlpa_list = self.un_bu[huat].setdefault(piau_im, [])
+                if piau_im == tlpa:
+                    tlpa_list.insert(0, tlpa)
+                else:
+                    tlpa_list.append(tlpa)
+
+        for huat, ci_im, un_thau in ((HONG_IM, HONG_IM_CI_IM, HONG_IM_CI_IM_UN_THAU), (MPS2, MPS2_CI_IM, MPS2_CI_IM_UN_THAU)):
+            for piau_im, tlpa in ci_im.items():
+                self.siann_bu[huat].setdefault(piau_im, tlpa)
+                self._han_ting[huat][piau_im] = un_thau
+
+    # ---------------------------------------------------------------------
+    # 對外介面
+    # ---------------------------------------------------------------------
+    def kai_sik(self, im_piau: str, piau_im_huat: str) -> Optional[tuple]:
+        """
+        解析單一音節之標音。
+
+        :param im_piau: 標音（方音符號、注音二式，或帶調號/帶調符之閩拼）
+        :param piau_im_huat: 標音方法：方音符號、注音二式、閩拼調號、閩拼調符
+        :return: (聲母, 韻母, 調號)，皆為台語音標；無法解析者，傳回 None
+        """
+        if piau_im_huat not in PIAU_IM_HUAT_LIST:
+            raise ValueError(f"不支援之標音方法：{piau_im_huat}")
+        if not im_piau:
+            return None
+        return self._kai_sik(im_piau, piau_im_huat)
+
+    def tng_tlpa(self, im_piau: str, piau_im_huat: str) -> Optional[str]:
+        """將單一音節之標音轉成【台語音標】；無法解析者，傳回 None"""
+        result = self.kai_sik(im_piau, piau_im_huat)
+        return None if result is None else "".join(result)
+
+    def convert(self, text_or_list, piau_im_huat: str):
+        """
+        將標音（單一音節、整句或清單）轉成【台語音標】。
+        音節間之空白、連字號及標點符號保持原樣；無法解析之音節，原樣保留。
+
+        :return: 與輸入同型態之轉換結果（str 或 list）
+        """
+        if piau_im_huat not in PIAU_IM_HUAT_LIST:
+            raise ValueError(f"不支援之標音方法：{piau_im_huat}")
+
+        def tng_im_ziat(u_hap) -> str:
+            im_piau = u_hap.group()
+            result = self._kai_sik(im_piau, piau_im_huat)
+            return im_piau if result is None else "".join(result)
+
+        if isinstance(text_or_list, str):
+            return IM_ZIAT_PATTERN.sub(tng_im_ziat, text_or_list)
+        return [IM_ZIAT_PATTERN.sub(tng_im_ziat, text) for text in text_or_list]
+
+    def cache_info(self):
+        return self._kai_sik.cache_info()
+
+    # ---------------------------------------------------------------------
+    # 解析作業
+    # ---------------------------------------------------------------------
+    def _parse(self, im_piau: str, piau_im_huat: str) -> Optional[tuple]:
+        if piau_im_huat == HONG_IM:
+            body, tiau_ho = self._hong_im_tiau(im_piau)
+        elif piau_im_huat == MPS2:
+            body, tiau_ho = self._sou_ji_tiau(im_piau.lower())
+        else:
+            body, tiau_ho = self._bp_tiau(im_piau.lower(), piau_im_huat)
+            if body is None:
+                return None
+            # 閩拼零聲母：韻首 i、u 寫作 y、w（yi、yin、yao；wu、wan），還原之
+            if body[:1] in ("y", "w"):
+                guan_im = "i" if body[0] == "y" else "u"
+                body = body[1:] if body[1:2] == guan_im else guan_im + body[1:]
+            if tiau_ho is not None and tiau_ho not in BP_TIAU_HU_TNG_TIAU_HO:
+                tiau_ho = self.bp_tiau_ho.get(tiau_ho)
+                if tiau_ho is None:
+                    return None
+
+        siann_un = self.kai_sik_siann_un(body, piau_im_huat, tiau_ho)
+        if siann_un is None:
+            return None
+        siann_bu, un_bu = siann_un
+
+        if tiau_ho is None:
+            tiau_ho = "4" if un_bu.endswith(JIP_SIANN_BUE) else "1"
+        elif tiau_ho in BP_TIAU_HU_TNG_TIAU_HO:
+            su_siann, jip_siann = BP_TIAU_HU_TNG_TIAU_HO[tiau_ho]
+            tiau_ho = self.bp_tiau_ho.get(jip_siann if un_bu.endswith(JIP_SIANN_BUE) else su_siann)
+            if tiau_ho is None:
+                return None
+        return siann_bu, un_bu, tiau_ho
+
+    def kai_sik_siann_un(self, body: str, piau_im_huat: str, tiau_ho: Optional[str] = None) -> Optional[tuple]:
+        """
+        解析不含調符/調號之標音（聲母 + 韻母）：沿聲母字首樹列出相符之聲母，
+        由長而短，取餘下部份為有效韻母者。
+
+        :param tiau_ho: 台語音標調號；同一標音對映多個韻母時，第 4、8 調取入聲韻，其餘取舒聲韻
+        :return: (聲母, 韻母)，皆為台語音標；無法解析者，傳回 None
+        """
+        un_bu_piau = self.un_bu[piau_im_huat]
+        han_ting = self._han_ting[piau_im_huat]
+        candidates = [(0, "")]
+        node = self._siann_bu_trie[piau_im_huat]
+        for idx, ji in enumerate(body):
+            node = node.get(ji)
+            if node is None:
+                break
+            if None in node:
+                candidates.append((idx + 1, body[: idx + 1]))
+
+        for length, siann in reversed(candidates):
+            un = body[length:]
+            un_bu_list = un_bu_piau.get(un)
+            if un_bu_list is None:
+                continue
+            if siann in han_ting and not un.startswith(han_ting[siann]):
+                continue
+            un_bu = un_bu_list[0]
+            if len(un_bu_list) > 1 and tiau_ho in TIAU_HO_LIST:
+                jip_siann = tiau_ho in ("4", "8")
+                un_bu = next((un_bu for un_bu in un_bu_list if un_bu.endswith(JIP_SIANN_BUE) == jip_siann), un_bu)
+            return (self.siann_bu[piau_im_huat][siann] if siann else ""), un_bu
+        return None
+
+    def _hong_im_tiau(self, im_piau: str):
+        tiau_ho = self.hong_im_tiau_hu.get(im_piau[-1])
+        return (im_piau[:-1], tiau_ho) if tiau_ho else (im_piau, None)
+
+    @staticmethod
+    def _sou_ji_tiau(im_piau: str):
+        if im_piau[-1].isdigit():
+            return im_piau[:-1], im_piau[-1]
+        return im_piau, None
+
+    def _bp_tiau(self, im_piau: str, piau_im_huat: str):
+        # 帶調號之閩拼（閩拼調符之字串以數字結尾者，亦視為帶調號）
+        if im_piau[-1].isdigit() or piau_im_huat == BP:
+            return self._sou_ji_tiau(im_piau)
+        decomposed = unicodedata.normalize("NFD", im_piau)
+        tiau_hu = [ji for ji in decomposed if ji in BP_TIAU_HU_TNG_TIAU_HO]
+        if len(tiau_hu) != 1:
+            return None, None
+        return decomposed.replace(tiau_hu[0], ""), tiau_hu[0]
+
+
+# =========================================================================
+# 來回轉換核對
+# =========================================================================
+def iter_tlpa_im_ziat(siann_bu_dict: Dict, un_bu_dict: Dict):
+    """
+    列舉對照表中之音節：(聲母, 韻母, 調號)。舒聲韻配第 1、2、3、5、7 調；
+    促聲韻配第 4、8 調（第 6 調各標音方法皆歸入第 7 調，不列舉）。
+    """
+    siann_bu_list = [""] + [siann_bu for siann_bu in siann_bu_dict if siann_bu and siann_bu not in ("ø", "Ø")]
+    for siann_bu in siann_bu_list:
+        for un_bu, row in un_bu_dict.items():
+            tiau_ho_list = ("4", "8") if row.get("十五音舒促聲") == "促聲" else ("1", "2", "3", "5", "7")
+            for tiau_ho in tiau_ho_list:
+                yield siann_bu, un_bu, tiau_ho
+
+
+def verify_round_trip(piau_im, piau_im_huat_list=PIAU_IM_HUAT_LIST, tng_tlpa: Optional[PiauImTngTLPA] = None) -> Dict[str, Dict]:
+    """
+    來回轉換核對：對照表中每個音節，以 PiauIm 轉成各標音方法，再以 PiauImTngTLPA 轉回。
+
+    :param piau_im: PiauIm 物件
+    :param piau_im_huat_list: 欲核對之標音方法
+    :param tng_tlpa: 反轉換物件；預設依 piau_im 建立
+    :return: {標音方法: {"音節數", "相符", "歧義": [(標音, [台語音標, ...])], "不符": [(台語音標, 標音, 轉回)]}}
+    """
+    tng_tlpa = tng_tlpa or PiauImTngTLPA.from_piau_im(piau_im)
+    im_ziat_list = list(iter_tlpa_im_ziat(piau_im.Siann_Bu_Dict, piau_im.Un_Bu_Dict))
+
+    results = {}
+    for piau_im_huat in piau_im_huat_list:
+        # 標音 → 轉成此標音之台語音標
+        piau_im_tlpa: Dict[str, List[str]] = {}
+        for siann_bu, un_bu, tiau_ho in im_ziat_list:
+            try:
+                han_ji_piau_im = piau_im.han_ji_piau_im_tng_huan_bo_tng_huan_piau(piau_im_huat, siann_bu, un_bu, tiau_ho)
+            except (KeyError, TypeError, ValueError):
+                han_ji_piau_im = ""
+            piau_im_tlpa.setdefault(han_ji_piau_im or "", []).append(f"{siann_bu}{un_bu}{tiau_ho}")
+
+        siong_hu = 0
+        ki_gi = []
+        put_hu = []
+        for han_ji_piau_im, tlpa_list in piau_im_tlpa.items():
+            if not han_ji_piau_im:
+                put_hu.extend((tlpa, "", None) for tlpa in tlpa_list)
+                continue
+            tng_hue = tng_tlpa.tng_tlpa(han_ji_piau_im, piau_im_huat)
+            if len(tlpa_list) > 1:
+                ki_gi.append((han_ji_piau_im, tlpa_list))
+                siong_hu += tng_hue in tlpa_list
+            elif tng_hue == tlpa_list[0]:
+                siong_hu += 1
+            else:
+                put_hu.append((tlpa_list[0], han_ji_piau_im, tng_hue))
+
+        results[piau_im_huat] = {"音節數": len(im_ziat_list), "相符": siong_hu, "歧義": ki_gi, "不符": put_hu}
+    return results
+
+
+# =========================================================================
+# 主程式：核對【河洛話】資料庫之對照表
+# =========================================================================
+if __name__ == "__main__":
+    import sys
+
+    from mod_標音 import PiauIm
+
+    piau_im = PiauIm(sys.argv[1] if len(sys.argv) > 1 else "河洛話")
+    for huat, result in verify_round_trip(piau_im).items():
+        print(
+            f"{huat}：{result['音節數']} 個音節；還原 {result['相符']}；"
+            f"歧義 {len(result['歧義'])} 組；不符 {len(result['不符'])}"
+        )
+        for tlpa, han_ji_piau_im, tng_hue in result["不符"][:10]:
+            print(f"    {tlpa} → {han_ji_piau_im or '（無法轉換）'} → {tng_hue}")
@@ -0,0 +1,649 @@
+"""
+mod_標音網頁.py v0.1.5
+
+【標音網頁】渲染器：將【漢字注音】工作表之內容，轉成以 Ruby Tag 標音之 HTML 網頁。
+
+原 a400 之作法：逐一儲存格以 sheet.range() 讀取【漢字】及【台語音標】，每個漢字
+皆呼叫 PiauIm 轉換標音，並以字串串接（write_buffer +=）組成網頁；每處理一字，
+即列印一行進度訊息。
+
+RubyRenderer 之作法：
+  - 輸入為記憶體中之【行】串列，每行為 [(漢字, 台語音標), ...]（由
+    read_han_ji_zu_im_lines() 自工作表快照一次讀出），渲染期間不再存取 Excel；
+  - 文章中不重複之【台語音標】，於渲染前一次轉換完畢（prepare()），重複出現之
+    音標直接取用轉換結果；
+  - 網頁內容依序寫入串流（io.StringIO 或已開啟之檔案），不再串接字串；
+  - 進度訊息預設關閉（show_progress=False）。
+
+render_variants()：同一篇文章，一次産出多種標音組合之網頁（如：a410 之
+【雅俗通＋方音符號】、【台語音標＋十五音】等）；各渲染器共用標音轉換結果，
+同一音標於每種標音方法僅轉換一次；各網頁可交由多個工作程序平行輸出。
+
+build_pages()：依【網站建置清單】（mod_網站建置.BuildManifest），僅重建來源內容或
+製作設定有變更之網頁。
+
+【標音對照表】（piau_im_table）：網頁中不重複之音標，預先以 PiauIm 轉換成
+PIAU_IM_TABLE_HUAT 所列之各種標音方法，以 JSON 內嵌於網頁
+（<script id="piau-im-table">）；各 <ruby> 以 data-im 屬性標示其於對照表之序號。
+phonetic_switcher.js 切換標音方法時，直接取用對照表，無需下載 phonetic_mapping.json
+並於瀏覽器逐字轉換。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 RubyRenderer 類別及 read_han_ji_zu_im_lines() 函式。
+v0.1.1 2026-10-18: 標音轉換結果改以 (標音方法, 台語音標) 為鍵，可由多個渲染器共用；
+  新增 read_article_lines() 及 render_variants() 函式。
+v0.1.2 2026-10-18: 新增 build_pages() 函式：依網站建置清單，僅重建輸入有變更之網頁。
+v0.1.3 2026-10-18: RubyRenderer 新增 piau_im_table 參數：網頁內嵌本頁音標之【標音對照表】，
+  <ruby> 加註 data-im 序號。
+v0.1.4 2026-10-18: render_page() 新增 image_html 參數：文章圖片可改用 <picture>/srcset 標籤
+  （見 mod_網頁圖片.header_image_html()）。
+v0.1.5 2026-10-18: 網頁設定新增 output 項（compact、precompress）：輸出精簡網頁及 .gz／.br
+  預先壓縮檔，並列印大小報告（見 mod_網頁壓縮）。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from mod_帶調符音標 import is_han_ji, kam_si_u_tiau_hu, tng_im_piau, tng_tiau_ho
+from mod_標音 import is_punctuation, split_tai_gi_im_piau
+from mod_漢字注音表 import HanJiZuImGrid
+from mod_網站建置 import BuildManifest, content_hash
+from mod_網頁壓縮 import format_size_report, refresh_precompressed, write_html
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+TAB = "\t"
+
+# 【文章終止】及【換行】控制字元
+BUN_TSIONG_TSI = "φ"
+UANN_HANG = ("\n", "\\n")
+HANG_BUE = (BUN_TSIONG_TSI,) + UANN_HANG
+
+# 網頁格式：[排版樣式（div class）, 標音標籤, 說明]
+ZU_IM_HUAT_LIST = {
+    "SNI": ["fifteen_yin", "rt", "十五音切語"],
+    "TPS": ["Piau_Im", "rt", "方音符號注音"],
+    "MPS2": ["Piau_Im", "rt", "注音二式"],
+    "POJ": ["pin_yin", "rt", "白話字拼音"],
+    "TL": ["pin_yin", "rt", "台羅拼音"],
+    "BP": ["pin_yin", "rt", "閩拼標音"],
+    "TLPA_Plus": ["pin_yin", "rt", "台羅改良式"],
+    "DBL": ["Siang_Pai", "rtc", "雙排注音"],
+    "雅俗通": ["fifteen_yin", "rt", "十五音切語"],
+    "無預設": ["Siang_Pai", "rtc", "雙排注音"],
+}
+
+# 僅標示【上邊標音】之網頁格式
+SIONG_PINN_FORMATS = ("POJ", "TL", "BP", "TLPA_Plus", "SNI", "雅俗通")
+
+DEFAULT_IMAGE_URL = "king_tian.png"
+
+# 【標音對照表】預先轉換之標音方法（PiauIm 之標音方法名稱）
+PIAU_IM_TABLE_HUAT = ("十五音", "方音符號", "台語音標", "台羅拼音", "白話字", "閩拼調符", "閩拼調號", "注音二式")
+
+PAGE_HEAD_TEMPLATE = """<!DOCTYPE html>
+<html lang="zh-TW">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <meta content='https://alanjui.github.io/Piau-Im/{web_page_stem}.html' property='og:url' />
+    {head_extra}
+    <link rel="stylesheet" href="./assets/styles/styles.css">
+    <script type="text/javascript" src="./assets/javascripts/phonetic_switcher.js"></script>
+</head>
+<body>
+    <main class="page">
+        <article class="article_content">
+            <div style='text-align: center'>
+                {image_html}
+            </div>
+            """
+
+PAGE_TAIL_TEMPLATE = """
+        </article>
+    </main>
+    <a href="index.html" class="floating-home-btn">🏠</a>
+</body>
+</html>"""
+
+HanJiHang = List[Tuple[str, str]]
+
+
+# =========================================================================
+# 讀取【漢字注音】工作表
+# =========================================================================
+def iter_han_ji_zu_im_lines(
+    get_row_values: Callable[[int], list],
+    start_row: int,
+    end_row: int,
+    rows_per_line: int,
+    tlpa_row_offset: int = -1,
+) -> Iterator[HanJiHang]:
+    """
+    逐行取出【漢字注音】工作表之 [(漢字, 台語音標), ...]。
+
+    每行遇【換行】或【文章終止】控制字元即結束，控制字元本身亦列入該行之末；
+    遇【文章終止】者，不再讀取後續各行。
+
+    :param get_row_values: 傳回某一列（start_col ~ end_col）所有儲存格值之函式
+    :param start_row: 第一行【漢字】所在列號
+    :param end_row: 最後一行【漢字】所在列號之上限（含）
+    :param rows_per_line: 每行所佔列數
+    :param tlpa_row_offset: 【台語音標】列與【漢字】列之距離
+    """
+    for row in range(start_row, end_row + 1, rows_per_line):
+        han_ji_values = get_row_values(row)
+        tlpa_values = get_row_values(row + tlpa_row_offset)
+        line = []
+        for han_ji, tlpa in zip(han_ji_values, tlpa_values):
+            if han_ji in HANG_BUE:
+                line.append((han_ji, ""))
+                break
+            line.append(
+                (
+                    str(han_ji).strip() if han_ji else "",
+                    str(tlpa).strip() if tlpa else "",
+                )
+            )
+        yield line
+        if line and line[-1][0] == BUN_TSIONG_TSI:
+            return
+
+
+def read_han_ji_zu_im_lines(grid, start_row: int, rows_per_line: int) -> List[HanJiHang]:
+    """
+    自【漢字注音】工作表快照（HanJiZuImGrid），讀出文章之所有行。
+
+    :param grid: 已載入之 HanJiZuImGrid
+    :param start_row: 第一行【漢字】所在列號
+    :param rows_per_line: 每行所佔列數
+    """
+    return list(iter_han_ji_zu_im_lines(grid.row_values, start_row, grid.end_row, rows_per_line))
+
+
+def read_article_lines(sheet, program) -> List[HanJiHang]:
+    """
+    以單次 Range.value 載入【漢字注音】工作表快照，讀出文章之所有行（唯讀，不寫回工作表）。
+
+    :param sheet: 【漢字注音】工作表
+    :param program: Program 物件（提供工作表之行、列、欄配置）
+    """
+    grid = HanJiZuImGrid.from_program(sheet=sheet, program=program)
+    return read_han_ji_zu_im_lines(
+        grid,
+        start_row=program.line_start_row + program.han_ji_row_offset,
+        rows_per_line=program.ROWS_PER_LINE,
+    )
+
+
+def split_title_and_author(lines: Iterable[HanJiHang]) -> Tuple[list, list, int]:
+    """
+    自文章開頭，分出【文章標題】及【作者姓名】。
+
+    文章首字為《者，視為有標題：首行起至第一個行尾控制字元之前，皆為標題區；
+    》之前（含）為標題，之後含有冒號（：）者為作者，否則捨去。
+
+    :return: (標題之 [(漢字, 台語音標), ...], 作者之 [...], 標題區所佔行數)；
+             無標題者，傳回 ([], [], 0)
+    """
+    cells, total_lines = [], 0
+    for line in lines:
+        if total_lines == 0 and (not line or line[0][0] != "《"):
+            return [], [], 0
+        total_lines += 1
+        if line and line[-1][0] in HANG_BUE:
+            cells.extend(line[:-1])
+            break
+        cells.extend(line)
+
+    cells = [(han_ji, tlpa) for han_ji, tlpa in cells if han_ji]
+    split_index = next((i for i, (han_ji, _) in enumerate(cells) if "》" in han_ji), -1)
+    if split_index == -1:
+        return cells, [], total_lines
+
+    title_cells, author_cells = cells[: split_index + 1], cells[split_index + 1 :]
+    combined_after = "".join(han_ji for han_ji, _ in author_cells)
+    if "：" not in combined_after and ":" not in combined_after:
+        author_cells = []
+    return title_cells, author_cells, total_lines
+
+
+def normalize_tlpa(tlpa: str) -> str:
+    """帶調符之音標，轉成帶調號之【台語音標】"""
+    if tlpa and kam_si_u_tiau_hu(tlpa):
+        return tng_tiau_ho(tng_im_piau(tlpa))
+    return tlpa
+
+
+def render_title_and_author(
+    title_cells: HanJiHang,
+    author_cells: HanJiHang,
+    ruby_tag: Callable[[str, str], tuple],
+    progress: Optional[Callable[[str], None]] = None,
+) -> Tuple[str, str]:
+    """
+    產生【文章標題】及【作者姓名】之 Ruby Tag；《》以 title_mark 樣式標示。
+
+    :param ruby_tag: 產生 Ruby Tag 之函式：ruby_tag(漢字, 台語音標) → (Ruby Tag, 上邊標音, 右邊標音)
+    :param progress: 列印進度訊息之函式；None 表不列印
+    :return: (標題 HTML, 作者 HTML)
+    """
+    parts = []
+    for cells in (title_cells, author_cells):
+        segments = []
+        for han_ji, tlpa in cells:
+            tlpa = normalize_tlpa(tlpa)
+            tag, siong, zian = ruby_tag(han_ji, tlpa)
+            tag = tag.rstrip() + "\n"
+            if cells is title_cells and ("《" in tag or "》" in tag):
+                tag = tag.replace("<span>", '<span class="title_mark">')
+            segments.append(tag)
+            if progress:
+                progress(f"標題處理: {han_ji} [{tlpa}] ==》 上：{siong} / 右：{zian}")
+        parts.append("".join(segments))
+    return parts[0], parts[1]
+
+
+# =========================================================================
+# 渲染器
+# =========================================================================
+class RubyRenderer:
+    """
+    將【行】串列渲染成以 Ruby Tag 標音之 HTML 網頁。
+
+    Args:
+        piau_im: PiauIm 物件，用以將【台語音標】轉換成各種標音方法
+        han_ji_piau_im_format: 網頁格式（ZU_IM_HUAT_LIST 之鍵）
+        siong_pinn_piau_im: 上邊標音之標音方法
+        zian_pinn_piau_im: 右邊標音之標音方法
+        piau_im_hong_sik: 標音方式（網頁格式為【無預設】時，依其是否含【上】、【右】決定標音位置）
+        total_chars_per_line: 網頁每列字數；0 表不人工斷行
+        show_progress: 是否逐字列印進度訊息
+        piau_im_cache: 標音轉換結果 {(標音方法, 台語音標): 標音}；多個渲染器共用同一
+                       dict 者，同一音標於每種標音方法僅轉換一次
+        piau_im_table: 【標音對照表】之標音方法（如 PIAU_IM_TABLE_HUAT）；None 表網頁
+                       不內嵌標音對照表
+
+    範例:
+        >>> renderer = RubyRenderer(piau_im, "DBL", "台語音標", "方音符號")
+        >>> renderer.render_page(lines, out, title="咱的故鄉")
+    """
+
+    def __init__(
+        self,
+        piau_im,
+        han_ji_piau_im_format: str,
+        siong_pinn_piau_im: Optional[str] = None,
+        zian_pinn_piau_im: Optional[str] = None,
+        piau_im_hong_sik: Optional[str] = None,
+        total_chars_per_line: int = 0,
+        show_progress: bool = False,
+        piau_im_cache: Optional[dict] = None,
+        piau_im_table: Optional[Sequence[str]] = None,
+    ):
+        self.piau_im = piau_im
+        self.han_ji_piau_im_format = han_ji_piau_im_format
+        self.siong_pinn_piau_im = siong_pinn_piau_im
+        self.zian_pinn_piau_im = zian_pinn_piau_im
+        self.piau_im_hong_sik = piau_im_hong_sik
+        self.total_chars_per_line = int(total_chars_per_line or 0)
+        self.show_progress = show_progress
+        self.siong_pinn_huat, self.zian_pinn_huat = self._piau_im_huat()
+        # 標音轉換結果：{(標音方法, 台語音標): 標音}；音標無法解析者，標音為 None
+        self.piau_im_cache = {} if piau_im_cache is None else piau_im_cache
+        self.piau_im_table = tuple(piau_im_table or ())
+        # 【標音對照表】之序號：{台語音標: 序號}，由 prepare() 依音標首次出現之順序編號
+        self.im_ids: Dict[str, int] = {}
+
+    def _piau_im_huat(self) -> Tuple[Optional[str], Optional[str]]:
+        """依網頁格式，決定上邊及右邊之標音方法（不標示者為 None）"""
+        siong, zian = self.siong_pinn_piau_im, self.zian_pinn_piau_im
+        if self.han_ji_piau_im_format == "無預設":
+            hong_sik = str(self.piau_im_hong_sik)
+            return (siong if "上" in hong_sik else None, zian if "右" in hong_sik else None)
+        if self.han_ji_piau_im_format in SIONG_PINN_FORMATS:
+            return siong, None
+        if self.han_ji_piau_im_format == "TPS":
+            return None, zian
+        if self.han_ji_piau_im_format == "DBL":
+            return siong, zian
+        return None, None
+
+    @property
+    def pai_ban(self) -> str:
+        """網頁排版樣式（div class）"""
+        return ZU_IM_HUAT_LIST.get(self.han_ji_piau_im_format, ["pin_yin"])[0]
+
+    # ---------------------------------------------------------------------
+    # 標音轉換
+    # ---------------------------------------------------------------------
+    def _tng_huan(self, piau_im_huat: str, tlpa: str) -> Optional[str]:
+        """將【台語音標】轉換成某一標音方法；同一音標僅轉換一次"""
+        key = (piau_im_huat, tlpa)
+        if key in self.piau_im_cache:
+            return self.piau_im_cache[key]
+        try:
+            siann_bu, un_bu, tiau_ho = split_tai_gi_im_piau(tlpa)
+        except Exception:
+            result = None
+        else:
+            result = self.piau_im.han_ji_piau_im_tng_huan(piau_im_huat, siann_bu or "ø", un_bu, tiau_ho)
+        self.piau_im_cache[key] = result
+        return result
+
+    def tng_huan_piau_im(self, tlpa: str) -> Optional[Tuple[str, str]]:
+        """
+        將【台語音標】轉換成 (上邊標音, 右邊標音)。
+
+        :return: 音標無法解析者，傳回 None
+        """
+        result = []
+        for huat in (self.siong_pinn_huat, self.zian_pinn_huat):
+            piau_im = self._tng_huan(huat, tlpa) if huat else ""
+            if piau_im is None:
+                return None
+            result.append(piau_im)
+        return tuple(result)
+
+    def prepare(self, lines: Iterable[HanJiHang]) -> int:
+        """
+        渲染前，將文章中所有不重複之【台語音標】一次轉換完畢（含【標音對照表】之
+        各種標音方法），並為各音標編定對照表之序號。
+
+        :return: 本次轉換之次數（每種標音方法各計一次）
+        """
+        distinct = dict.fromkeys(
+            normalize_tlpa(tlpa) for line in lines for _, tlpa in line if tlpa
+        )
+        if self.piau_im_table:
+            self.im_ids = {tlpa: im_id for im_id, tlpa in enumerate(distinct)}
+        total = 0
+        for huat in dict.fromkeys((self.siong_pinn_huat, self.zian_pinn_huat) + self.piau_im_table):
+            if not huat:
+                continue
+            for tlpa in distinct:
+                if (huat, tlpa) not in self.piau_im_cache:
+                    try:
+                        self._tng_huan(huat, tlpa)
+                    except Exception:
+                        # 僅供【標音對照表】之標音方法，轉換失敗者，對照表中留空
+                        if huat in (self.siong_pinn_huat, self.zian_pinn_huat):
+                            raise
+                        self.piau_im_cache[(huat, tlpa)] = None
+                    total += 1
+        return total
+
+    # ---------------------------------------------------------------------
+    # Ruby Tag
+    # ---------------------------------------------------------------------
+    @staticmethod
+    def build_ruby_tag(han_ji: str, siong_piau_im: str, zian_piau_im: str) -> str:
+        left_margin = TAB * 5
+        if siong_piau_im and not zian_piau_im:
+            return f"{left_margin}<ruby>{han_ji}<rt>{siong_piau_im}</rt></ruby>\n"
+        if zian_piau_im and not siong_piau_im:
+            return f"{left_margin}<ruby>{han_ji}<rtc>{zian_piau_im}</rtc></ruby>\n"
+        if siong_piau_im and zian_piau_im:
+            return f"{left_margin}<ruby>{han_ji}<rt>{siong_piau_im}</rt><rtc>{zian_piau_im}</rtc></ruby>\n"
+        return f"{left_margin}<span>{han_ji}</span>\n"
+
+    def ruby_tag(self, han_ji: str, tlpa: str) -> Tuple[str, str, str]:
+        """
+        產生單一漢字之 Ruby Tag。
+
+        :return: (Ruby Tag, 上邊標音, 右邊標音)
+        """
+        if not tlpa or not str(tlpa).strip():
+            return f"{TAB * 5}<span>{han_ji}</span>\n", "", ""
+        piau_im = self.tng_huan_piau_im(tlpa)
+        if piau_im is None:
+            return f"{TAB * 5}<span>{han_ji}</span>\n", "", ""
+        siong, zian = piau_im
+        tag = self.build_ruby_tag(han_ji, siong, zian)
+        if "<ruby" in tag:
+            im_id = self.im_ids.get(tlpa)
+            data_im = "" if im_id is None else f' data-im="{im_id}"'
+            tag = tag.replace("<ruby", f'<ruby data-tlpa="{tlpa}"{data_im}', 1)
+        return tag, siong, zian
+
+    def render_piau_im_table(self, out: io.TextIOBase) -> io.TextIOBase:
+        """
+        將【標音對照表】以 JSON 寫入串流 out：
+        {"huat": [標音方法, ...], "im": [[各標音方法之標音, ...], ...]}；im 之序號即 data-im。
+        """
+        im = [
+            [self.piau_im_cache.get((huat, tlpa)) or "" for huat in self.piau_im_table]
+            for tlpa in self.im_ids
+        ]
+        data = json.dumps({"huat": self.piau_im_table, "im": im}, ensure_ascii=False, separators=(",", ":"))
+        data = data.replace("</", "<\\/")
+        out.write(f'\n{TAB * 2}<script type="application/json" id="piau-im-table">{data}</script>')
+        return out
+
+    # ---------------------------------------------------------------------
+    # 渲染
+    # ---------------------------------------------------------------------
+    def _progress(self, msg: str) -> None:
+        if self.show_progress:
+            print(msg)
+
+    def render_article(self, lines: List[HanJiHang], out: io.TextIOBase) -> io.TextIOBase:
+        """
+        將文章（含標題及作者）渲染成 <div> 區塊，寫入串流 out。
+
+        :param lines: 文章之行串列，每行為 [(漢字, 台語音標), ...]
+        :param out: 可寫入之文字串流（io.StringIO 或已開啟之檔案）
+        """
+        self.prepare(lines)
+        title_cells, author_cells, total_title_lines = split_title_and_author(lines)
+        title_html, author_html = render_title_and_author(
+            title_cells, author_cells, self.ruby_tag, progress=self._progress
+        )
+
+        left_margin = TAB * 3
+        out.write(
+            f"\n{left_margin}<div class='{self.pai_ban}'>\n"
+            f"{left_margin}\t<p class='title'>\n{title_html}{left_margin}\t</p>\n"
+            f"{left_margin}\t<p class='author'>\n{author_html}{left_margin}\t</p>\n"
+            f"{left_margin}\t<p>\n"
+        )
+        self._render_body(lines[total_title_lines:], out)
+        out.write(f"{TAB * 4}</p>\n{TAB * 3}</div>")
+        return out
+
+    def _render_body(self, lines: List[HanJiHang], out: io.TextIOBase) -> None:
+        write = out.write
+        char_count = 0
+        for line_no, line in enumerate(lines, start=1):
+            for col_no, (han_ji, tlpa) in enumerate(line, start=1):
+                if han_ji == BUN_TSIONG_TSI:
+                    self._progress(f"{char_count + 1}. ({line_no}, {col_no}) ==> 《文章終止》\n" + "=" * 80)
+                    return
+                if han_ji in UANN_HANG:
+                    self._progress(f"{char_count + 1}. ({line_no}, {col_no}) ==> 《換換行》\n" + "-" * 80)
+                    write(f"{TAB * 4}</p><p>\n")
+                    char_count = 0
+                    break
+
+                if is_punctuation(han_ji):
+                    msg = f"{han_ji}【標點符號】"
+                    write(f"{TAB * 5}<span>{han_ji}</span>\n")
+                elif not han_ji:
+                    msg = "【空白】"
+                    write(f"{TAB * 5}<span>　</span>\n")
+                elif not is_han_ji(han_ji):
+                    msg = f"{han_ji}【其他字元】"
+                    write(f"{TAB * 5}<span>{han_ji}</span>\n")
+                elif not tlpa:
+                    msg = f"{han_ji}【無音標】"
+                    write(f"{TAB * 5}<span>{han_ji}</span>\n")
+                else:
+                    tlpa = normalize_tlpa(tlpa)
+                    tag, siong, zian = self.ruby_tag(han_ji, tlpa)
+                    write(tag)
+                    msg = f"{han_ji} [{tlpa}] ==》 上：{siong} / 右：{zian}"
+
+                char_count += 1
+                self._progress(f"{char_count}. ({line_no}, {col_no}) ==> {msg}")
+                if self.total_chars_per_line and char_count >= self.total_chars_per_line:
+                    write("</p><p>\n")
+                    char_count = 0
+                    self._progress("《人工斷行》")
+
+    def render_page(
+        self,
+        lines: List[HanJiHang],
+        out: io.TextIOBase,
+        title: str = "",
+        image_url: Optional[str] = None,
+        web_page_stem: str = "",
+        head_extra: str = "",
+        image_html: Optional[str] = None,
+    ) -> io.TextIOBase:
+        """
+        將整個網頁（HTML 樣版＋文章）寫入串流 out。
+
+        :param image_url: 文章圖片；非 http 網址者，取自 ./assets/images/
+        :param web_page_stem: 網頁檔名（不含副檔名），用於 og:url
+        :param head_extra: 附加於 <head> 之標籤（如：<meta>）
+        :param image_html: 文章圖片之標籤（如：<picture>）；None 表以 <img> 引用 image_url
+        """
+        if not image_html:
+            image_url = str(image_url or "").strip()
+            if not image_url or image_url == "None":
+                image_url = DEFAULT_IMAGE_URL
+            if not image_url.startswith("http"):
+                image_url = f"./assets/images/{image_url}"
+            image_html = f"<img src='{image_url}' width='800' />"
+
+        out.write(
+            PAGE_HEAD_TEMPLATE.format(
+                title=title, web_page_stem=web_page_stem, head_extra=head_extra, image_html=image_html
+            )
+        )
+        self.render_article(lines, out)
+        if self.piau_im_table:
+            self.render_piau_im_table(out)
+        out.write(PAGE_TAIL_TEMPLATE)
+        return out
+
+    def render_to_string(self, lines: List[HanJiHang], **kwargs) -> str:
+        """渲染整個網頁，傳回 HTML 字串"""
+        return self.render_page(lines, io.StringIO(), **kwargs).getvalue()
+
+
+# =========================================================================
+# 多種標音組合之網頁
+# =========================================================================
+def _write_variant_page(task: Dict, lines: List[HanJiHang], piau_im_cache: dict) -> str:
+    """
+    輸出單一標音組合之網頁；標音皆取自 piau_im_cache，無需 PiauIm 物件
+    （供工作程序執行）。
+    """
+    renderer = RubyRenderer(None, piau_im_cache=piau_im_cache, **task["renderer"])
+    output = task.get("output", {})
+    if output.get("compact") or output.get("precompress"):
+        html = renderer.render_to_string(lines, **task.get("page", {}))
+        print(format_size_report(write_html(task["output_path"], html, **output)))
+        return task["output_path"]
+    with open(task["output_path"], "w", encoding="utf-8") as f:
+        renderer.render_page(lines, f, **task.get("page", {}))
+    # 先前輸出之預先壓縮檔，須隨網頁更新
+    refresh_precompressed(task["output_path"])
+    return task["output_path"]
+
+
+def render_variants(piau_im, lines: List[HanJiHang], tasks: List[Dict], jobs: int = 1) -> List[str]:
+    """
+    同一篇文章，一次輸出多種標音組合之網頁。
+
+    先以各組合之渲染器，將文章中不重複之音標轉換成所需之各種標音方法（共用
+    轉換結果，同一音標於每種標音方法僅轉換一次），再逐一輸出網頁。
+
+    Args:
+        piau_im: PiauIm 物件
+        lines: 文章之行串列，每行為 [(漢字, 台語音標), ...]
+        tasks: 各網頁之設定，每項為：
+               {"output_path": 網頁檔路徑,
+                "renderer": RubyRenderer 之參數（不含 piau_im）,
+                "page": render_page() 之參數（title、image_url、web_page_stem、head_extra、image_html）,
+                "output": 輸出模式（選用）：{"compact": 精簡網頁, "precompress": 另存預先壓縮檔}}
+        jobs: 平行輸出網頁之工作程序數；1 表於本程序依序輸出
+
+    Returns:
+        已輸出之網頁檔路徑（依 tasks 之順序）
+    """
+    piau_im_cache = {}
+    for task in tasks:
+        RubyRenderer(piau_im, piau_im_cache=piau_im_cache, **task["renderer"]).prepare(lines)
+
+    if jobs <= 1 or len(tasks) <= 1:
+        return [_write_variant_page(task, lines, piau_im_cache) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        futures = [executor.submit(_write_variant_page, task, lines, piau_im_cache) for task in tasks]
+        return [future.result() for future in futures]
+
+
+# =========================================================================
+# 增量建置
+# =========================================================================
+# 網頁樣版之雜湊值：樣版變更者，所有網頁皆須重建
+PAGE_TEMPLATE_HASH = content_hash([PAGE_HEAD_TEMPLATE, PAGE_TAIL_TEMPLATE])
+
+
+def page_settings(task: Dict) -> Dict:
+    """網頁之製作設定（不含進度輸出等不影響網頁內容者），供建置清單比對"""
+    renderer = {k: v for k, v in task["renderer"].items() if k != "show_progress"}
+    settings = {"renderer": renderer, "page": task.get("page", {}), "template": PAGE_TEMPLATE_HASH}
+    if any(task.get("output", {}).values()):
+        settings["output"] = task["output"]
+    return settings
+
+
+def build_pages(
+    piau_im,
+    lines: List[HanJiHang],
+    tasks: List[Dict],
+    manifest: BuildManifest,
+    source: str = "",
+    force: bool = False,
+    dry_run: bool = False,
+    jobs: int = 1,
+) -> List[Tuple[str, str]]:
+    """
+    依網站建置清單，僅製作來源內容或製作設定有變更之網頁。
+
+    Args:
+        piau_im, lines, tasks, jobs: 同 render_variants()
+        manifest: 網站建置清單
+        source: 來源活頁簿（記入建置清單）
+        force: 不論建置清單，全部重建
+        dry_run: 僅列出須重建之網頁，不寫入檔案
+
+    Returns:
+        須重建（dry_run 時）或已重建之網頁：[(網頁檔路徑, 原因), ...]
+    """
+    source_hash = content_hash(lines)
+    stale = []
+    for task in tasks:
+        settings = page_settings(task)
+        needs_render, reason = manifest.needs_render(task["output_path"], source_hash, settings, force=force)
+        if needs_render:
+            stale.append((task, settings, reason))
+
+    if dry_run or not stale:
+        return [(task["output_path"], reason) for task, _, reason in stale]
+
+    render_variants(piau_im, lines, [task for task, _, _ in stale], jobs=jobs)
+    for task, settings, _ in stale:
+        manifest.record_render(task["output_path"], source, source_hash, settings)
+    manifest.save()
+    return [(task["output_path"], reason) for task, _, reason in stale]
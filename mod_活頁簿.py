@@ -0,0 +1,831 @@
+"""
+mod_活頁簿.py v0.1.2
+
+活頁簿存取之【後端】（Backend）抽象層。
+
+本系統各程式，僅使用 xlwings 介面之一小部份：
+  - wb.names["名稱"].refers_to_range.value
+  - wb.sheets["工作表"]、wb.sheets.add()、sheet.copy()
+  - sheet.range(...).value、.offset()、.color、.font
+  - wb.fullname、wb.save()
+
+本模組提供兩種【後端】：
+  - xlwings：透過 Excel（COM）存取作用中或指定之活頁簿（原有作法）；
+  - openpyxl：直接讀寫 .xlsx 檔案，無需安裝 Excel，可於 Linux 批次主機上執行，
+    亦可多個程序平行處理不同檔案。
+
+openpyxl 後端之物件（XlsxBook、XlsxSheet、XlsxRange），模擬上述 xlwings 介面，
+令 Program、ExcelCell、JiKhooDict 等既有程式碼，無需修改即可使用。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 xlwings 及 openpyxl 兩種活頁簿後端，以及 --backend 命令列參數。
+v0.1.1 2026-10-18: openpyxl 後端支援聯集位址（如："D3:R3,D7:R7"），供格式日誌整批套用格式。
+v0.1.2 2026-10-18: 新增 XlsxSheet.copy()，供 a290 以 openpyxl 後端複製【漢字注音】工作表。
+"""
+
+import re
+from copy import copy
+from pathlib import Path
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+BACKEND_XLWINGS = "xlwings"
+BACKEND_OPENPYXL = "openpyxl"
+BACKENDS = (BACKEND_XLWINGS, BACKEND_OPENPYXL)
+
+# Excel 工作表之最大列數與欄數
+MAX_ROWS = 1048576
+MAX_COLS = 16384
+
+_ADDRESS_PATTERN = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+
+# =========================================================================
+# 工具函式
+# =========================================================================
+def col_name(col: int) -> str:
+    """欄號轉欄名：1 → A、27 → AA"""
+    name = ""
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+def col_index(name: str) -> int:
+    """欄名轉欄號：A → 1、AA → 27"""
+    index = 0
+    for ch in name.upper():
+        index = index * 26 + (ord(ch) - 64)
+    return index
+
+
+def parse_address(address: str) -> tuple[int, int, int, int]:
+    """
+    解析 Excel 儲存格位址。
+
+    :param address: 如 "A1"、"$C$3"、"A2:D10"
+    :return: (first_row, first_col, last_row, last_col)
+    """
+    parts = address.replace(" ", "").split(":")
+    coords = []
+    for part in parts:
+        match = _ADDRESS_PATTERN.match(part)
+        if not match:
+            raise ValueError(f"無效的儲存格位址：{address}")
+        coords.append((int(match.group(2)), col_index(match.group(1))))
+    (r1, c1), (r2, c2) = coords[0], coords[-1]
+    return min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2)
+
+
+def _rgb_to_argb(color) -> str | None:
+    """xlwings 色彩（(r, g, b) 或 "#RRGGBB"）轉 openpyxl 之 ARGB 字串"""
+    if color is None:
+        return None
+    if isinstance(color, str):
+        return "FF" + color.lstrip("#").upper()
+    r, g, b = color
+    return f"FF{r:02X}{g:02X}{b:02X}"
+
+
+def _argb_to_rgb(color) -> tuple[int, int, int] | None:
+    """openpyxl Color 物件轉 xlwings 色彩 (r, g, b)；佈景主題色等無法換算者，傳回 None"""
+    if color is None or color.type != "rgb" or not isinstance(color.rgb, str):
+        return None
+    rgb = color.rgb[-6:]
+    return int(rgb[0:2], 16), int(rgb[2:4], 16), int(rgb[4:6], 16)
+
+
+# =========================================================================
+# openpyxl 後端
+# =========================================================================
+class XlsxFont:
+    """模擬 xlwings Font 物件：設定值套用至範圍（或聯集範圍之各區塊）內之所有儲存格"""
+
+    def __init__(self, *ranges: "XlsxRange"):
+        self._ranges = ranges
+
+    def _first_font(self):
+        first = self._ranges[0]
+        return first.sheet.ws.cell(first.row, first.column).font
+
+    def _apply(self, **kwargs):
+        for rng in self._ranges:
+            for cell in rng._iter_openpyxl_cells():
+                font = copy(cell.font)
+                for key, value in kwargs.items():
+                    setattr(font, key, value)
+                cell.font = font
+
+    @property
+    def color(self):
+        return _argb_to_rgb(self._first_font().color)
+
+    @color.setter
+    def color(self, value):
+        from openpyxl.styles.colors import Color
+
+        argb = _rgb_to_argb(value)
+        self._apply(color=Color(rgb=argb) if argb else None)
+
+    @property
+    def name(self):
+        return self._first_font().name
+
+    @name.setter
+    def name(self, value):
+        self._apply(name=value)
+
+    @property
+    def size(self):
+        return self._first_font().size
+
+    @size.setter
+    def size(self, value):
+        self._apply(size=value)
+
+    @property
+    def bold(self):
+        return self._first_font().bold
+
+    @bold.setter
+    def bold(self, value):
+        self._apply(bold=value)
+
+    @property
+    def italic(self):
+        return self._first_font().italic
+
+    @italic.setter
+    def italic(self, value):
+        self._apply(italic=value)
+
+
+class XlsxRange:
+    """
+    模擬 xlwings Range 物件。
+
+    讀取 value 時，依 xlwings 之慣例傳回：單一儲存格 → 純量值；單列或單欄 → 一維串列；
+    多列多欄 → 二維串列。options(ndim=2) 則一律傳回二維串列。
+    """
+
+    def __init__(self, sheet: "XlsxSheet", row: int, column: int, last_row: int = None, last_column: int = None, ndim: int = None):
+        self.sheet = sheet
+        self.row = row
+        self.column = column
+        self.last_row = row if last_row is None else last_row
+        self.last_column = column if last_column is None else last_column
+        self._ndim = ndim
+
+    def __repr__(self):
+        return f"<XlsxRange [{self.sheet.book.name}]{self.sheet.name}!{self.address}>"
+
+    def __call__(self, row: int, column: int = 1) -> "XlsxRange":
+        """以範圍左上角為 (1, 1) 之相對座標，取得儲存格（如 sheet.cells(row, col)）"""
+        return XlsxRange(self.sheet, self.row + row - 1, self.column + column - 1)
+
+    def __iter__(self):
+        for row in range(self.row, self.last_row + 1):
+            for col in range(self.column, self.last_column + 1):
+                yield XlsxRange(self.sheet, row, col)
+
+    def __len__(self):
+        return self.count
+
+    # ------------------------------------------------------------------
+    # 範圍資訊
+    # ------------------------------------------------------------------
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.last_row - self.row + 1, self.last_column - self.column + 1
+
+    @property
+    def count(self) -> int:
+        rows, cols = self.shape
+        return rows * cols
+
+    @property
+    def address(self) -> str:
+        return self.get_address()
+
+    def get_address(self, row_absolute=True, column_absolute=True) -> str:
+        r = "$" if row_absolute else ""
+        c = "$" if column_absolute else ""
+        first = f"{c}{col_name(self.column)}{r}{self.row}"
+        if self.shape == (1, 1):
+            return first
+        return f"{first}:{c}{col_name(self.last_column)}{r}{self.last_row}"
+
+    @property
+    def last_cell(self) -> "XlsxRange":
+        return XlsxRange(self.sheet, self.last_row, self.last_column)
+
+    @property
+    def api(self):
+        raise NotImplementedError("openpyxl 後端不支援 .api（Excel COM 物件）。")
+
+    # ------------------------------------------------------------------
+    # 範圍變換
+    # ------------------------------------------------------------------
+    def options(self, ndim: int = None, **kwargs) -> "XlsxRange":
+        return XlsxRange(self.sheet, self.row, self.column, self.last_row, self.last_column, ndim=ndim)
+
+    def offset(self, row_offset: int = 0, column_offset: int = 0) -> "XlsxRange":
+        return XlsxRange(
+            self.sheet,
+            self.row + row_offset,
+            self.column + column_offset,
+            self.last_row + row_offset,
+            self.last_column + column_offset,
+        )
+
+    def resize(self, row_size: int = None, column_size: int = None) -> "XlsxRange":
+        rows, cols = self.shape
+        rows = rows if row_size is None else row_size
+        cols = cols if column_size is None else column_size
+        return XlsxRange(self.sheet, self.row, self.column, self.row + rows - 1, self.column + cols - 1)
+
+    def end(self, direction: str) -> "XlsxRange":
+        """
+        模擬 Ctrl + 方向鍵：自範圍左上角，沿指定方向移至資料區邊界。
+
+        :param direction: "up"、"down"、"left" 或 "right"
+        """
+        dr, dc = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}[direction.lower()]
+        max_row, max_col = self.sheet.ws.max_row, self.sheet.ws.max_column
+        row, col = self.row, self.column
+        if not self._in_sheet(row + dr, col + dc):
+            return XlsxRange(self.sheet, row, col)
+
+        if self._is_occupied(row, col) and self._is_occupied(row + dr, col + dc):
+            # 連續資料區之內：移至資料區之最後一格
+            while self._is_occupied(row + dr, col + dc):
+                row, col = row + dr, col + dc
+            return XlsxRange(self.sheet, row, col)
+
+        # 移至下一個有資料之儲存格；皆無資料者，停在工作表之邊界
+        row, col = row + dr, col + dc
+        while not self._is_occupied(row, col) and self._in_sheet(row + dr, col + dc):
+            if dr > 0 and row > max_row:
+                row = MAX_ROWS
+            elif dc > 0 and col > max_col:
+                col = MAX_COLS
+            elif dr < 0 and row > max_row:
+                # 已使用範圍之外，均為空白：直接跳至已使用範圍之邊界
+                row = max_row
+                continue
+            elif dc < 0 and col > max_col:
+                col = max_col
+                continue
+            else:
+                row, col = row + dr, col + dc
+                continue
+            break
+        return XlsxRange(self.sheet, row, col)
+
+    def expand(self, mode: str = "table") -> "XlsxRange":
+        """自範圍左上角，向下（down）、向右（right）或兩者（table）延伸至連續資料區之邊界"""
+        last_row, last_col = self.row, self.column
+        if mode in ("table", "down"):
+            while not self._is_empty(last_row + 1, self.column):
+                last_row += 1
+        if mode in ("table", "right"):
+            while not self._is_empty(self.row, last_col + 1):
+                last_col += 1
+        return XlsxRange(self.sheet, self.row, self.column, last_row, last_col)
+
+    def _in_sheet(self, row: int, col: int) -> bool:
+        return 1 <= row <= MAX_ROWS and 1 <= col <= MAX_COLS
+
+    def _is_occupied(self, row: int, col: int) -> bool:
+        return self._in_sheet(row, col) and not self._is_empty(row, col)
+
+    def _is_empty(self, row: int, col: int) -> bool:
+        if row > self.sheet.ws.max_row or col > self.sheet.ws.max_column:
+            return True
+        return self.sheet.get_cell_value(row, col) in (None, "")
+
+    def _iter_openpyxl_cells(self):
+        ws = self.sheet.ws
+        for row in range(self.row, self.last_row + 1):
+            for col in range(self.column, self.last_column + 1):
+                yield ws.cell(row, col)
+
+    # ------------------------------------------------------------------
+    # 儲存格值
+    # ------------------------------------------------------------------
+    @property
+    def value(self):
+        rows, cols = self.shape
+        # 超出工作表已使用範圍者，均為空白，不必逐格建立 openpyxl 儲存格
+        max_row, max_col = self.sheet.ws.max_row, self.sheet.ws.max_column
+        block = [
+            [self.sheet.get_cell_value(r, c) if r <= max_row and c <= max_col else None for c in range(self.column, self.last_column + 1)]
+            for r in range(self.row, self.last_row + 1)
+        ]
+        if self._ndim == 2:
+            return block
+        if rows == 1 and cols == 1:
+            return block[0][0]
+        if rows == 1:
+            return block[0]
+        if cols == 1:
+            return [row[0] for row in block]
+        return block
+
+    @value.setter
+    def value(self, data):
+        if isinstance(data, (list, tuple)):
+            # 一維串列寫入一列；二維串列自左上角起，依列寫入
+            rows = data if data and isinstance(data[0], (list, tuple)) else [data]
+            for i, row_values in enumerate(rows):
+                for j, cell_value in enumerate(row_values):
+                    self.sheet.set_cell_value(self.row + i, self.column + j, cell_value)
+            return
+        # 純量值：寫入範圍內之每一儲存格
+        for row in range(self.row, self.last_row + 1):
+            for col in range(self.column, self.last_column + 1):
+                self.sheet.set_cell_value(row, col, data)
+
+    def clear_contents(self):
+        self.value = None
+
+    def clear_formats(self):
+        from openpyxl.styles import Font, PatternFill
+
+        for cell in self._iter_openpyxl_cells():
+            cell.font = Font()
+            cell.fill = PatternFill(fill_type=None)
+
+    def clear(self):
+        self.clear_contents()
+        self.clear_formats()
+
+    # ------------------------------------------------------------------
+    # 格式
+    # ------------------------------------------------------------------
+    @property
+    def color(self):
+        fill = self.sheet.ws.cell(self.row, self.column).fill
+        if fill is None or fill.fill_type != "solid":
+            return None
+        return _argb_to_rgb(fill.fgColor)
+
+    @color.setter
+    def color(self, value):
+        from openpyxl.styles import PatternFill
+
+        argb = _rgb_to_argb(value)
+        fill = PatternFill(fill_type="solid", fgColor=argb, bgColor=argb) if argb else PatternFill(fill_type=None)
+        for cell in self._iter_openpyxl_cells():
+            cell.fill = fill
+
+    @property
+    def font(self) -> XlsxFont:
+        return XlsxFont(self)
+
+    # ------------------------------------------------------------------
+    # 介面操作：檔案後端無作用中儲存格，均不需處理
+    # ------------------------------------------------------------------
+    def select(self):
+        pass
+
+    def activate(self):
+        pass
+
+
+class XlsxAreas:
+    """模擬 xlwings 之聯集範圍（如 sheet.range("D3:R3,D7:R7")）：各項操作套用至每一區塊"""
+
+    def __init__(self, sheet: "XlsxSheet", areas: list[XlsxRange]):
+        self.sheet = sheet
+        self.areas = areas
+
+    def __repr__(self):
+        return f"<XlsxAreas [{self.sheet.book.name}]{self.sheet.name}!{self.address}>"
+
+    @property
+    def address(self) -> str:
+        return ",".join(area.address for area in self.areas)
+
+    @property
+    def row(self) -> int:
+        return self.areas[0].row
+
+    @property
+    def column(self) -> int:
+        return self.areas[0].column
+
+    @property
+    def value(self):
+        return [area.value for area in self.areas]
+
+    @value.setter
+    def value(self, data):
+        for area in self.areas:
+            area.value = data
+
+    @property
+    def color(self):
+        return self.areas[0].color
+
+    @color.setter
+    def color(self, value):
+        for area in self.areas:
+            area.color = value
+
+    @property
+    def font(self) -> XlsxFont:
+        return XlsxFont(*self.areas)
+
+    def clear_contents(self):
+        self.value = None
+
+    def select(self):
+        pass
+
+
+class XlsxName:
+    """模擬 xlwings Name 物件（具名範圍）"""
+
+    def __init__(self, book: "XlsxBook", defined_name, sheet: "XlsxSheet" = None):
+        self.book = book
+        self.defined_name = defined_name
+        self._sheet = sheet
+
+    def __repr__(self):
+        return f"<XlsxName '{self.name}': {self.refers_to}>"
+
+    @property
+    def name(self) -> str:
+        return self.defined_name.name
+
+    @property
+    def refers_to(self) -> str:
+        return f"={self.defined_name.attr_text}"
+
+    @property
+    def refers_to_range(self) -> XlsxRange:
+        for sheet_title, coord in self.defined_name.destinations:
+            sheet = self.book.sheets[sheet_title] if sheet_title else self._sheet
+            return sheet.range(coord)
+        raise ValueError(f"具名範圍【{self.name}】未指向任何儲存格：{self.refers_to}")
+
+
+class XlsxNames:
+    """模擬 xlwings Names 集合（活頁簿或工作表之具名範圍）"""
+
+    def __init__(self, book: "XlsxBook", defined_names, sheet: "XlsxSheet" = None):
+        self.book = book
+        self._defined_names = defined_names
+        self._sheet = sheet
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._defined_names
+
+    def __getitem__(self, name: str) -> XlsxName:
+        if name not in self._defined_names:
+            raise KeyError(f"找不到具名範圍：{name}")
+        return XlsxName(self.book, self._defined_names[name], sheet=self._sheet)
+
+    def __iter__(self):
+        for name in list(self._defined_names):
+            yield self[name]
+
+    def __len__(self):
+        return len(self._defined_names)
+
+    def add(self, name: str, refers_to: str) -> XlsxName:
+        from openpyxl.workbook.defined_name import DefinedName
+
+        self._defined_names[name] = DefinedName(name, attr_text=refers_to.lstrip("="))
+        return self[name]
+
+
+class XlsxSheet:
+    """模擬 xlwings Sheet 物件"""
+
+    def __init__(self, book: "XlsxBook", ws):
+        self.book = book
+        self.ws = ws
+        # 本次作業中寫入之公式儲存格：其值無快取結果，應直接傳回公式字串
+        self._written_formulas: set[tuple[int, int]] = set()
+        # 複製而得之工作表：公式之計算結果，取自來源工作表
+        self._cached_sheet_name: str = None
+
+    def __repr__(self):
+        return f"<XlsxSheet [{self.book.name}]{self.name}>"
+
+    def __getitem__(self, address) -> XlsxRange:
+        return self.range(address)
+
+    @property
+    def name(self) -> str:
+        return self.ws.title
+
+    @name.setter
+    def name(self, value: str):
+        self.ws.title = value
+
+    @property
+    def index(self) -> int:
+        """工作表序號（由 1 起算）"""
+        return self.book.wb.worksheets.index(self.ws) + 1
+
+    @property
+    def names(self) -> XlsxNames:
+        return XlsxNames(self.book, self.ws.defined_names, sheet=self)
+
+    @property
+    def cells(self) -> XlsxRange:
+        return XlsxRange(self, 1, 1, MAX_ROWS, MAX_COLS)
+
+    @property
+    def used_range(self) -> XlsxRange:
+        ws = self.ws
+        return XlsxRange(self, ws.min_row, ws.min_column, ws.max_row, ws.max_column)
+
+    @property
+    def api(self):
+        raise NotImplementedError("openpyxl 後端不支援 .api（Excel COM 物件）。")
+
+    def range(self, cell1, cell2=None) -> XlsxRange:
+        """
+        取得儲存格範圍。
+
+        :param cell1: (row, col)、"A1"、"A1:D10"、聯集位址 "D3:R3,D7:R7" 或 XlsxRange
+        :param cell2: (選用) 範圍右下角，格式同 cell1
+        """
+        if cell2 is None and isinstance(cell1, str) and "," in cell1:
+            return XlsxAreas(self, [self.range(address) for address in cell1.split(",")])
+        r1, c1, r2, c2 = self._to_bounds(cell1)
+        if cell2 is not None:
+            s1, d1, s2, d2 = self._to_bounds(cell2)
+            r1, c1, r2, c2 = min(r1, s1), min(c1, d1), max(r2, s2), max(c2, d2)
+        return XlsxRange(self, r1, c1, r2, c2)
+
+    @staticmethod
+    def _to_bounds(cell) -> tuple[int, int, int, int]:
+        if isinstance(cell, XlsxRange):
+            return cell.row, cell.column, cell.last_row, cell.last_column
+        if isinstance(cell, str):
+            return parse_address(cell)
+        row, col = cell
+        return row, col, row, col
+
+    def get_cell_value(self, row: int, col: int):
+        cell = self.ws.cell(row, col)
+        if cell.data_type == "f" and (row, col) not in self._written_formulas:
+            # 公式儲存格：傳回 Excel 最後一次計算之結果（與 xlwings 相同）
+            return self.book.cached_value(self._cached_sheet_name or self.name, row, col)
+        return cell.value
+
+    def set_cell_value(self, row: int, col: int, value):
+        cell = self.ws.cell(row, col)
+        cell.value = value
+        if cell.data_type == "f":
+            self._written_formulas.add((row, col))
+        else:
+            self._written_formulas.discard((row, col))
+
+    def activate(self):
+        self.book.wb.active = self.ws
+
+    def select(self):
+        self.activate()
+
+    def clear_contents(self):
+        for row in self.ws.iter_rows():
+            for cell in row:
+                cell.value = None
+        self._written_formulas.clear()
+
+    def clear(self):
+        """清除工作表之內容及格式"""
+        self.book.clear_sheet(self)
+
+    def delete(self):
+        self.book.remove_sheet(self)
+
+    def copy(self, name: str = None, before=None, after=None) -> "XlsxSheet":
+        """
+        複製工作表（儲存格之值及格式、欄寬、列高、合併儲存格）；同 xlwings，
+        未指定位置者，置於所有工作表之後。
+
+        :param name: 新工作表名稱；未指定者，由 openpyxl 命名（如："漢字注音 Copy"）
+        :param before: 置於此工作表（物件、名稱或序號）之前
+        :param after: 置於此工作表之後
+        """
+        wb = self.book.wb
+        if name is not None and name in wb.sheetnames:
+            raise ValueError(f"工作表已存在：{name}")
+        ws = wb.copy_worksheet(self.ws)
+        if name is not None:
+            ws.title = name
+        sheets = self.book.sheets
+        if after is not None:
+            index = wb.worksheets.index(sheets._ws_of(after)) + 1
+        elif before is not None:
+            index = wb.worksheets.index(sheets._ws_of(before))
+        else:
+            index = len(wb.worksheets) - 1
+        wb.move_sheet(ws, offset=index - wb.worksheets.index(ws))
+        sheet = self.book.sheet_for(ws)
+        sheet._cached_sheet_name = self._cached_sheet_name or self.name
+        sheet._written_formulas = set(self._written_formulas)
+        return sheet
+
+
+class XlsxSheets:
+    """模擬 xlwings Sheets 集合"""
+
+    def __init__(self, book: "XlsxBook"):
+        self.book = book
+
+    def __getitem__(self, key) -> XlsxSheet:
+        """依工作表名稱，或序號（由 0 起算）取得工作表"""
+        if isinstance(key, int):
+            return self.book.sheet_for(self.book.wb.worksheets[key])
+        if key not in self.book.wb.sheetnames:
+            raise KeyError(f"找不到工作表：{key}")
+        return self.book.sheet_for(self.book.wb[key])
+
+    def __call__(self, key) -> XlsxSheet:
+        """依工作表名稱，或序號（由 1 起算，同 xlwings）取得工作表"""
+        if isinstance(key, int):
+            return self[key - 1]
+        return self[key]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.book.wb.sheetnames
+
+    def __iter__(self):
+        for ws in list(self.book.wb.worksheets):
+            yield self.book.sheet_for(ws)
+
+    def __len__(self):
+        return len(self.book.wb.worksheets)
+
+    @property
+    def active(self) -> XlsxSheet:
+        return self.book.sheet_for(self.book.wb.active)
+
+    def add(self, name: str = None, before=None, after=None) -> XlsxSheet:
+        """新增工作表；未指定位置者，同 Excel 置於作用中工作表之前"""
+        wb = self.book.wb
+        if after is not None:
+            index = wb.worksheets.index(self._ws_of(after)) + 1
+        elif before is not None:
+            index = wb.worksheets.index(self._ws_of(before))
+        else:
+            index = wb.worksheets.index(wb.active)
+        ws = wb.create_sheet(title=name, index=index)
+        wb.active = ws
+        return self.book.sheet_for(ws)
+
+    def _ws_of(self, sheet):
+        return self[sheet].ws if isinstance(sheet, (str, int)) else sheet.ws
+
+
+class XlsxBook:
+    """
+    以 openpyxl 讀寫 .xlsx 檔案之活頁簿，模擬 xlwings Book 物件。
+
+    公式儲存格讀取時，傳回 Excel 最後一次存檔時之計算結果（自另一份 data_only
+    活頁簿取得，首次需要時才載入）；以 openpyxl 存檔後，該結果將不復存在，
+    需以 Excel 開啟並重新計算。
+    """
+
+    def __init__(self, file_path):
+        from openpyxl import load_workbook
+
+        path = Path(file_path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"找不到活頁簿檔案：{path}")
+        self.fullname = str(path)
+        self.wb = load_workbook(path, keep_vba=path.suffix.lower() == ".xlsm")
+        self._cached_wb = None
+        self._sheets: dict[int, XlsxSheet] = {}
+
+    def __repr__(self):
+        return f"<XlsxBook [{self.name}]>"
+
+    @property
+    def name(self) -> str:
+        return Path(self.fullname).name
+
+    @property
+    def names(self) -> XlsxNames:
+        return XlsxNames(self, self.wb.defined_names)
+
+    @property
+    def sheets(self) -> XlsxSheets:
+        return XlsxSheets(self)
+
+    @property
+    def app(self):
+        return None
+
+    def sheet_for(self, ws) -> XlsxSheet:
+        """同一 openpyxl 工作表，固定對映同一 XlsxSheet 物件"""
+        sheet = self._sheets.get(id(ws))
+        if sheet is None or sheet.ws is not ws:
+            sheet = XlsxSheet(self, ws)
+            self._sheets[id(ws)] = sheet
+        return sheet
+
+    def cached_value(self, sheet_name: str, row: int, col: int):
+        if self._cached_wb is None:
+            from openpyxl import load_workbook
+
+            self._cached_wb = load_workbook(self.fullname, data_only=True, read_only=False)
+        if sheet_name not in self._cached_wb.sheetnames:
+            return None
+        return self._cached_wb[sheet_name].cell(row, col).value
+
+    def clear_sheet(self, sheet: XlsxSheet):
+        """清除工作表：以同名、同位置之空白工作表取代（保留具名範圍）"""
+        wb = self.wb
+        old_ws = sheet.ws
+        index = wb.worksheets.index(old_ws)
+        title = old_ws.title
+        defined_names = old_ws.defined_names
+        was_active = wb.active is old_ws
+        wb.remove(old_ws)
+        new_ws = wb.create_sheet(title=title, index=index)
+        new_ws.defined_names = defined_names
+        if was_active:
+            wb.active = new_ws
+        self._sheets.pop(id(old_ws), None)
+        sheet.ws = new_ws
+        sheet._written_formulas.clear()
+        self._sheets[id(new_ws)] = sheet
+
+    def remove_sheet(self, sheet: XlsxSheet):
+        self._sheets.pop(id(sheet.ws), None)
+        self.wb.remove(sheet.ws)
+
+    def activate(self):
+        pass
+
+    def save(self, path=None):
+        """儲存活頁簿；指定 path 者，同 Excel【另存新檔】，其後 fullname 改指向新檔"""
+        target = Path(path).resolve() if path else Path(self.fullname)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self.wb.save(target)
+        self.fullname = str(target)
+
+    def close(self):
+        self.wb.close()
+        if self._cached_wb is not None:
+            self._cached_wb.close()
+
+
+# =========================================================================
+# 開啟活頁簿
+# =========================================================================
+def open_workbook(file_path=None, backend: str = BACKEND_XLWINGS):
+    """
+    依指定之後端，開啟活頁簿。
+
+    :param file_path: 活頁簿檔案路徑；xlwings 後端未指定者，取 Excel 作用中之活頁簿
+    :param backend: "xlwings" 或 "openpyxl"
+    :return: xlwings.Book 或 XlsxBook 物件
+    """
+    if backend == BACKEND_OPENPYXL:
+        if not file_path:
+            raise ValueError("使用 openpyxl 後端，須以 --file 指定活頁簿檔案。")
+        return XlsxBook(file_path)
+    if backend != BACKEND_XLWINGS:
+        raise ValueError(f"不支援之活頁簿後端：{backend}（可用：{', '.join(BACKENDS)}）")
+
+    import xlwings as xw
+
+    if file_path:
+        return xw.Book(file_path)
+    return xw.apps.active.books.active
+
+
+def open_workbook_by_args(args):
+    """依命令列參數（--backend、--file）開啟活頁簿；args 未含該等參數者，取 Excel 作用中之活頁簿"""
+    return open_workbook(
+        file_path=getattr(args, "file", None),
+        backend=getattr(args, "backend", None) or BACKEND_XLWINGS,
+    )
+
+
+def add_backend_arguments(parser):
+    """為命令列解析器，加入活頁簿後端參數：--backend、--file"""
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=BACKEND_XLWINGS,
+        help="活頁簿後端：xlwings（Excel，預設）或 openpyxl（直接讀寫 .xlsx 檔，無需 Excel）",
+    )
+    parser.add_argument(
+        "--file",
+        default=None,
+        help="活頁簿檔案路徑（openpyxl 後端必須指定）",
+    )
+    return parser
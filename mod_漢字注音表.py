@@ -0,0 +1,241 @@
+"""
+mod_漢字注音表.py v0.1.1
+
+【漢字注音】工作表之【記憶體快照】（Snapshot）。
+
+【漢字注音】工作表每一【行】由 4【列】構成：人工標音、台語音標、漢字、漢字標音。
+逐一儲存格以 sheet.range((row, col)) 讀寫，每個【漢字】至少需 3 次 COM 呼叫；
+本模組改以【一次】Range.value 讀入整個區塊（line_start_row ~ line_end_row,
+start_col ~ end_col），令儲存格處理器（ExcelCell 及其子類別）直接存取 Python
+串列；處理完畢後，僅將【有變更】之儲存格，依列合併為連續區段，整批寫回工作表。
+儲存格之格式（填滿色、字型），亦先記入格式日誌（StyleJournal），於寫回時整批套用。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 HanJiZuImGrid 及 HanJiZuImCell 類別。
+v0.1.1 2026-10-18: 儲存格格式改記入 StyleJournal，延遲至 flush() 時整批套用。
+"""
+
+from mod_儲存格格式 import FILL_COLOR, FONT_COLOR, FONT_NAME, FONT_SIZE, StyleJournal
+
+
+class HanJiZuImFont:
+    """快照儲存格之字型：設定值記入格式日誌；讀取時，優先傳回尚未套用之設定值"""
+
+    __slots__ = ("cell",)
+
+    def __init__(self, cell: "HanJiZuImCell"):
+        self.cell = cell
+
+    def _get(self, attr: str, name: str):
+        grid, row, col = self.cell.grid, self.cell.row, self.cell.column
+        if grid.styles.has_style(row, col, attr):
+            return grid.styles.get_style(row, col, attr)
+        return getattr(self.cell.range.font, name)
+
+    def _set(self, attr: str, value):
+        self.cell.grid.set_style(self.cell.row, self.cell.column, **{attr: value})
+
+    @property
+    def color(self):
+        return self._get(FONT_COLOR, "color")
+
+    @color.setter
+    def color(self, value):
+        self._set(FONT_COLOR, value)
+
+    @property
+    def name(self):
+        return self._get(FONT_NAME, "name")
+
+    @name.setter
+    def name(self, value):
+        self._set(FONT_NAME, value)
+
+    @property
+    def size(self):
+        return self._get(FONT_SIZE, "size")
+
+    @size.setter
+    def size(self, value):
+        self._set(FONT_SIZE, value)
+
+
+class HanJiZuImCell:
+    """
+    【漢字注音】工作表快照中的單一儲存格。
+
+    模擬 xlwings Range 物件常用之介面（value、row、column、offset、select、
+    color、font），令既有以 cell.offset(-2, 0).value 存取儲存格之程式碼，
+    無需修改即可改用快照。【格式】（color、font）之設定，記入快照之格式日誌。
+    """
+
+    __slots__ = ("grid", "row", "column")
+
+    def __init__(self, grid: "HanJiZuImGrid", row: int, column: int):
+        self.grid = grid
+        self.row = row
+        self.column = column
+
+    def __repr__(self):
+        return f"<HanJiZuImCell ({self.row}, {self.column}) = {self.value!r}>"
+
+    @property
+    def value(self):
+        return self.grid.get_value(self.row, self.column)
+
+    @value.setter
+    def value(self, new_value):
+        self.grid.set_value(self.row, self.column, new_value)
+
+    @property
+    def range(self):
+        """取得工作表中對映之 Range 物件（會引發 COM 呼叫）"""
+        return self.grid.sheet.range((self.row, self.column))
+
+    def offset(self, row_offset: int = 0, column_offset: int = 0):
+        return self.grid.cell(self.row + row_offset, self.column + column_offset)
+
+    def select(self):
+        self.range.select()
+
+    @property
+    def color(self):
+        if self.grid.styles.has_style(self.row, self.column, FILL_COLOR):
+            return self.grid.styles.get_style(self.row, self.column, FILL_COLOR)
+        return self.range.color
+
+    @color.setter
+    def color(self, new_color):
+        self.grid.set_style(self.row, self.column, color=new_color)
+
+    @property
+    def font(self) -> HanJiZuImFont:
+        return HanJiZuImFont(self)
+
+
+class HanJiZuImGrid:
+    """
+    【漢字注音】工作表區塊之記憶體快照。
+
+    Args:
+        sheet: 【漢字注音】工作表物件
+        start_row: 區塊起始列號（第 1 行【人工標音】所在列）
+        end_row: 區塊結束列號（含）
+        start_col: 區塊起始欄號
+        end_col: 區塊結束欄號（含）
+    """
+
+    def __init__(self, sheet, start_row: int, end_row: int, start_col: int, end_col: int):
+        self.sheet = sheet
+        self.start_row = start_row
+        self.end_row = end_row
+        self.start_col = start_col
+        self.end_col = end_col
+        self.values: list[list] = []
+        # 有變更之儲存格：{row: {col, ...}}
+        self._dirty: dict[int, set[int]] = {}
+        # 尚未套用之儲存格格式
+        self.styles = StyleJournal(sheet)
+
+    @classmethod
+    def from_program(cls, sheet, program) -> "HanJiZuImGrid":
+        """依 Program 之【漢字注音】工作表配置，建立並載入快照"""
+        grid = cls(
+            sheet=sheet,
+            start_row=program.line_start_row,
+            end_row=program.line_end_row - 1,
+            start_col=program.start_col,
+            end_col=program.end_col,
+        )
+        grid.load()
+        return grid
+
+    def load(self) -> "HanJiZuImGrid":
+        """以單次 Range.value 讀取整個區塊"""
+        total_rows = self.end_row - self.start_row + 1
+        total_cols = self.end_col - self.start_col + 1
+        block = self.sheet.range((self.start_row, self.start_col), (self.end_row, self.end_col)).options(ndim=2).value
+        values = [list(row) for row in (block or [])]
+        # 確保快照大小與區塊一致（工作表底端空白列，或讀取結果不足時補齊）
+        for row in values:
+            if len(row) < total_cols:
+                row.extend([None] * (total_cols - len(row)))
+        while len(values) < total_rows:
+            values.append([None] * total_cols)
+        self.values = values
+        self._dirty.clear()
+        return self
+
+    def contains(self, row: int, col: int) -> bool:
+        return self.start_row <= row <= self.end_row and self.start_col <= col <= self.end_col
+
+    def cell(self, row: int, col: int):
+        """取得儲存格；落在快照區塊外者，直接傳回工作表之 Range 物件"""
+        if self.contains(row, col):
+            return HanJiZuImCell(self, row, col)
+        return self.sheet.range((row, col))
+
+    def get_value(self, row: int, col: int):
+        if not self.contains(row, col):
+            return self.sheet.range((row, col)).value
+        return self.values[row - self.start_row][col - self.start_col]
+
+    def set_value(self, row: int, col: int, value) -> None:
+        if not self.contains(row, col):
+            self.sheet.range((row, col)).value = value
+            return
+        row_values = self.values[row - self.start_row]
+        idx = col - self.start_col
+        old_value = row_values[idx]
+        # None 與空字串，在 Excel 儲存格中同為【空白】，視作未變更
+        if old_value == value or (old_value in (None, "") and value in (None, "")):
+            return
+        row_values[idx] = value
+        self._dirty.setdefault(row, set()).add(col)
+
+    def set_style(self, row: int, col: int, **style) -> None:
+        """設定儲存格格式（color、font_name、font_size、font_color）；區塊外者直接套用"""
+        if self.contains(row, col):
+            self.styles.set_style(row, col, **style)
+            return
+        journal = StyleJournal(self.sheet)
+        journal.set_style(row, col, **style)
+        journal.flush()
+
+    def row_values(self, row: int) -> list:
+        """取得某一列（start_col ~ end_col）之所有儲存格值"""
+        return self.values[row - self.start_row]
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._dirty) or self.styles.is_dirty
+
+    def dirty_blocks(self) -> list[tuple[int, int, int]]:
+        """將變更之儲存格，依列合併成連續區段：[(row, first_col, last_col), ...]"""
+        blocks = []
+        for row in sorted(self._dirty):
+            cols = sorted(self._dirty[row])
+            first = last = cols[0]
+            for col in cols[1:]:
+                if col == last + 1:
+                    last = col
+                    continue
+                blocks.append((row, first, last))
+                first = last = col
+            blocks.append((row, first, last))
+        return blocks
+
+    def flush(self) -> int:
+        """
+        將變更之儲存格整批寫回工作表，並套用格式日誌中之格式。
+
+        Returns:
+            int: 寫回工作表之次數（每個連續區段一次，每個格式聯集位址一次）
+        """
+        blocks = self.dirty_blocks()
+        for row, first_col, last_col in blocks:
+            row_values = self.row_values(row)
+            data = row_values[first_col - self.start_col : last_col - self.start_col + 1]
+            self.sheet.range((row, first_col), (row, last_col)).value = [data]
+        self._dirty.clear()
+        return len(blocks) + self.styles.flush()
@@ -1,5 +1,5 @@
 """
-mod_程式.py V0.2.15
+mod_程式.py V0.2.19
 
 本系統各功能之程式架構模版。
 模版中包含程式配置類別 Program 及儲存格處理器類別 ExcelCell。
@@ -13,6 +13,11 @@ mod_程式.py V0.2.15
 然後再新增紀錄，確保【人工標音字庫】工作表中，不會出現同【漢字】、所處【座標】的資料，發生重複且資料內容不一致之問題。
 - v0.2.13 2026-03-18: 改善 _bo_thok_im() 方法，當【台語音標】或【漢字標音】為空值時，均屬標音異常，很可能起因於字典當無該漢字之讀音資料，或其它原因，故要求使用者重新輸入。
 - v0.2.14 2026-03-21: 修正 end_col 的計算方式，原為 start_col + CHARS_PER_ROW，修正為 start_col + CHARS_PER_ROW - 1，以確保 end_col 為最後一個字的正確欄位。
+- v0.2.15 2026-10-18: _process_sheet 改用【漢字注音】工作表快照（HanJiZuImGrid）：整個區塊一次讀入，處理完畢後僅將變更之儲存格整批寫回。
+- v0.2.16 2026-10-18: save_workbook_as_new_file 改以 pathlib 組合另存新檔之路徑，以支援 openpyxl 活頁簿後端（mod_活頁簿）於非 Windows 環境執行。
+- v0.2.17 2026-10-18: 【人工標音】'=' 之處理，改以 Mapping 判斷字庫資料紀錄，以相容 mod_字庫 v0.2.8 之 JiKhooEntry。
+- v0.2.18 2026-10-18: Program 新增 preload_ji_tian 參數，供整篇文章逐字查詢之批次作業，將【漢字庫】預先載入記憶體；insert_or_update_to_db 寫入資料庫後，令讀音索引失效。
+- v0.2.19 2026-10-18: 新增 upsert_readings()：以單一交易、INSERT ... ON CONFLICT(漢字, 台羅音標) DO UPDATE 整批寫入【漢字庫】，傳回新增/更新筆數；【漢字庫】資料表結構之檢查，每個程式執行期間僅一次；依工作表更新【漢字庫】之作業，改為讀完工作表後整批寫入。
 """
 
 # =========================================================================
@@ -22,6 +27,8 @@ import logging
 import os
 import re
 import sys
+from collections.abc import Mapping
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple
@@ -54,6 +61,7 @@ from mod_logging import (  # 設定日誌
     logging_warning,
 )
 from mod_字庫 import JiKhooDict
+from mod_漢字注音表 import HanJiZuImGrid
 from mod_帶調符音標 import kam_si_u_tiau_hu, tng_im_piau, tng_tiau_ho
 from mod_標音 import (  # 台語音標轉台語音標; 漢字標音物件
     PiauIm,
@@ -91,6 +99,12 @@ EXIT_CODE_SAVE_FAILURE = 3  # 儲存失敗
 EXIT_CODE_PROCESS_FAILURE = 10  # 過程失敗
 EXIT_CODE_UNKNOWN_ERROR = 99  # 未知錯誤
 
+# upsert_readings() 查詢既有讀音時，每次 IN (...) 之漢字數
+UPSERT_CHUNK_SIZE = 500
+
+# 已檢查過資料表結構之【漢字庫】：{(資料庫路徑, 資料表名稱)}
+_han_ji_khoo_schema_kiam_ca: set = set()
+
 
 # =========================================================================
 # 資料層類別：存放配置參數(configurations)
@@ -98,7 +112,7 @@ EXIT_CODE_UNKNOWN_ERROR = 99  # 未知錯誤
 class Program:
     """處理配置資料類別"""
 
-    def __init__(self, wb, args, hanji_piau_im_sheet_name: str = "漢字注音"):
+    def __init__(self, wb, args, hanji_piau_im_sheet_name: str = "漢字注音", preload_ji_tian: bool = False):
         self.wb = wb
         self.args = args
         # =========================================================================
@@ -117,7 +131,8 @@ class Program:
         # 兩個資料庫中，存放漢字讀音的資料表，名稱皆固定為【漢字庫】，切勿誤用字典名稱當資料表名稱。
         # self.table_name = wb.names["漢字庫"].refers_to_range.value # 不要指定為【河洛話】
         self.table_name = "漢字庫"
-        self.ji_tian = HanJiTian(self.db_name)
+        # preload_ji_tian：整篇文章逐字查詢時，將【漢字庫】預先載入記憶體
+        self.ji_tian = HanJiTian(self.db_name, preload=preload_ji_tian)
         self.piau_im = PiauIm(han_ji_khoo=self.han_ji_khoo_name)
         # 【漢字注音】工作表描述
         self.hanji_piau_im_sheet_name = hanji_piau_im_sheet_name
@@ -263,14 +278,8 @@ class Program:
                 current_dir = Program.get_current_dir_from_wb(wb)
                 parent_dir = str(Path(current_dir).parent)
                 output_dir = wb.names["OUTPUT_PATH"].refers_to_range.value
-                new_dir_path = f"{parent_dir}\\{output_dir}"
-
-                # new_file_path = os.path.join(
-                #     ".\\{0}".format(new_dir_path),
-                #     f"{new_excel_file_name}",
-                # )
-                # new_file_path = current_dir / f"{new_excel_file_name}"
-                new_file_path = r"{0}\{1}".format(new_dir_path, new_excel_file_name)
+                # 以 pathlib 組合路徑，令 Windows（xlwings）及 Linux（openpyxl）後端皆適用
+                new_file_path = str(Path(parent_dir) / str(output_dir) / new_excel_file_name)
 
             wb.save(new_file_path)
             logging_process_step(f"已將活頁簿另存為新檔：{new_file_path}")
@@ -339,6 +348,8 @@ class ExcelCell:
         new_khuat_ji_piau_sheet: bool = False,
     ):
         self.program = program
+        # 【漢字注音】工作表快照：僅於 _process_sheet 處理期間有效
+        self.grid: HanJiZuImGrid | None = None
         # 初始化資料庫管理器
         self.db_manager = DatabaseManager()
         self.db_manager.connect(program.db_name)
@@ -852,10 +863,10 @@ class ExcelCell:
 
                 if piau_im_variants:
                     # 策略：取用第一個找到的音標 (或可依需求改為取用頻率最高的)
-                    # piau_im_variants 為 list of dict, e.g. [{'tai_gi_im_piau': '...', ...}, ...]
+                    # piau_im_variants 為 list of JiKhooEntry（可如 dict 存取）, e.g. [{'tai_gi_im_piau': '...', ...}, ...]
                     first_entry = piau_im_variants[0]
 
-                    if isinstance(first_entry, dict) and "tai_gi_im_piau" in first_entry:
+                    if isinstance(first_entry, Mapping) and "tai_gi_im_piau" in first_entry:
                         target_piau_im = first_entry["tai_gi_im_piau"]
                     else:
                         # Fallback for unexpected structure
@@ -1216,7 +1227,7 @@ class ExcelCell:
             i = 1
             for coordinate in entry["coordinates"]:
                 row, col = coordinate
-                target_cell = sheet.range((row, col))
+                target_cell = self.get_han_ji_zu_im_cell(sheet, row, col)
                 # target_cell.select()
                 target_cell.offset(-1, 0).value = tai_gi_im_piau  # 台語音標
                 target_cell.offset(1, 0).value = han_ji_piau_im  # 漢字標音
@@ -1617,7 +1628,7 @@ class ExcelCell:
         # -------------------------------------------------------------------------
         sheet_name = self.program.hanji_piau_im_sheet_name
         source_sheet = self.program.wb.sheets(sheet_name)
-        han_ji_cell = source_sheet.range((row, col))
+        han_ji_cell = self.get_han_ji_zu_im_cell(source_sheet, row, col)
         han_ji_cell.offset(-2, 0).value = jin_kang_piau_im  # 人工標音
         han_ji_cell.offset(-1, 0).value = tai_gi_im_piau  # 台語音標
         han_ji_cell.offset(1, 0).value = han_ji_piau_im  # 漢字標音
@@ -2038,6 +2049,36 @@ class ExcelCell:
         :param tai_gi_im_piau: 台語音標。
         :param ue_im_lui_piat: 標音方法（用於設定常用度）。
         """
+        # Determine 常用度 based on 標音方法 if not provided
+        if siong_iong_too is None:
+            siong_iong_too_to_use = 0.8 if ue_im_lui_piat == "文讀音" else 0.6
+        else:
+            siong_iong_too_to_use = siong_iong_too
+
+        # 資料庫存放之音標：【台羅拼音（TL）】（僅供訊息顯示；實際轉換於 upsert_readings 進行）
+        tl_im_piau = convert_tlpa_to_tl(tng_tiau_ho(tai_gi_im_piau).lower())
+        try:
+            inserted, _ = self.upsert_readings(
+                [(han_ji, tai_gi_im_piau, siong_iong_too_to_use)],
+                table_name=table_name,
+            )
+        except Exception as e:
+            print(f"  ❌ 資料庫操作失敗：{han_ji} - {tl_im_piau}（原【台語音標】：{tai_gi_im_piau}），錯誤：{e}")
+            raise
+        if inserted:
+            print(f"  ✅ 已新增：{han_ji} -  {tl_im_piau}（原【台語音標】：{tai_gi_im_piau}），常用度：{siong_iong_too_to_use}")
+        else:
+            print(f"  ✅ 已更新：{han_ji} - {tl_im_piau}（原【台語音標】：{tai_gi_im_piau}），常用度：{siong_iong_too_to_use}")
+
+    def _ensure_han_ji_khoo_schema(self, table_name: str) -> None:
+        """
+        確保【漢字庫】資料表之結構（資料表、【最近揀用時間】欄位、索引）；
+        每個資料庫之每個資料表，於程式執行期間僅檢查一次。
+        """
+        schema_key = (self.db_manager.db_path, table_name)
+        if schema_key in _han_ji_khoo_schema_kiam_ca:
+            return
+
         # 確保資料表存在
         self.db_manager.execute(
             f"""
@@ -2061,61 +2102,70 @@ class ExcelCell:
             self.db_manager.commit()
             print(f"  ℹ️ 已為【{table_name}】資料表自動新增【最近揀用時間】欄位。")
         self.db_manager.execute(f"CREATE INDEX IF NOT EXISTS idx_漢字庫_查音 ON {table_name}(漢字, 常用度 DESC, 最近揀用時間 DESC)")
+        # UPSERT（ON CONFLICT）所需之唯一索引
+        self.db_manager.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_漢字_台羅音標 ON {table_name}(漢字, 台羅音標)")
         self.db_manager.commit()
+        _han_ji_khoo_schema_kiam_ca.add(schema_key)
 
-        # ---------------------------------------------------------------------------------------------------------
-        # 插入或更新資料
-        # ---------------------------------------------------------------------------------------------------------
-        # Determine 常用度 based on 標音方法 if not provided
-        if siong_iong_too is None:
-            siong_iong_too_to_use = 0.8 if ue_im_lui_piat == "文讀音" else 0.6
-        else:
-            siong_iong_too_to_use = siong_iong_too
+    def upsert_readings(self, rows, table_name: str | None = None) -> tuple[int, int]:
+        """
+        整批新增或更新【漢字庫】之讀音：以單一交易，執行 INSERT ... ON CONFLICT(漢字, 台羅音標) DO UPDATE。
+        已存在之讀音，更新其【常用度】、【更新時間】及【最近揀用時間】。
 
-        # 將【台語音標】轉換成【台羅拼音（TL）】（TLPA 調號）
-        tai_gi_im_piau_cleanned = tng_tiau_ho(tai_gi_im_piau).lower()  # 將【音標調符號】轉換成【數值調號】
-        tl_im_piau = convert_tlpa_to_tl(tai_gi_im_piau_cleanned)  # 使用轉換後的【台羅拼音】作為資料庫存放的音標
+        :param rows: [(漢字, 台語音標, 常用度), ...]；台語音標可為帶調符音標，存入前轉換為【台羅拼音（TL）】
+        :param table_name: 資料表名稱；未指定者，使用 Program.table_name
+        :return: (新增筆數, 更新筆數)
+        """
+        table_name = table_name or self.program.table_name
+        now_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        records = []
+        for han_ji, tai_gi_im_piau, siong_iong_too in rows:
+            # 將【台語音標】轉換成【台羅拼音（TL）】（TLPA 調號）
+            tl_im_piau = convert_tlpa_to_tl(tng_tiau_ho(tai_gi_im_piau).lower())
+            records.append((han_ji, tl_im_piau, siong_iong_too, now_time, now_time))
+        if not records:
+            return 0, 0
 
-        # 檢查是否已存在該漢字和音標的組合。
-        # 【注意】需以「轉換後」的台羅音標查對，因資料庫存放者為轉換後之音標；
-        # 若以原始輸入（可能帶調符）查對，將因查不到既有紀錄而重複新增。
-        row = self.db_manager.fetchone(
-            f"SELECT 識別號 FROM {table_name} WHERE 漢字 = ? AND 台羅音標 = ?",
-            (han_ji, tl_im_piau),
-        )
+        self._ensure_han_ji_khoo_schema(table_name)
         try:
             with self.db_manager.transaction():
-                now_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                if row:
-                    # 更新資料（同步更新【最近揀用時間】：此讀音最近一次被人工揀用/校正之時間，
-                    # 供查音時於常用度相同之讀音間排定優先順序）
-                    self.db_manager.execute(
-                        f"""
-                    UPDATE {table_name}
-                    SET 常用度 = ?, 更新時間 = ?, 最近揀用時間 = ?
-                    WHERE 識別號 = ?;
-                    """,
-                        (
-                            siong_iong_too_to_use,
-                            now_time,
-                            now_time,
-                            row[0],
-                        ),
-                    )
-                    print(f"  ✅ 已更新：{han_ji} - {tl_im_piau}（原【台語音標】：{tai_gi_im_piau}），常用度：{siong_iong_too_to_use}")
-                else:
-                    # 新增資料
-                    self.db_manager.execute(
-                        f"""
-                    INSERT INTO {table_name} (漢字, 台羅音標, 常用度, 摘要說明, 最近揀用時間)
-                    VALUES (?, ?, ?, NULL, ?);
-                    """,
-                        (han_ji, tl_im_piau, siong_iong_too_to_use, now_time),
+                # 依交易內之既有讀音，統計新增/更新筆數（同批重複者，第二筆起計為更新）
+                existing = set()
+                han_ji_list = list({record[0] for record in records})
+                for i in range(0, len(han_ji_list), UPSERT_CHUNK_SIZE):
+                    chunk = han_ji_list[i : i + UPSERT_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    existing.update(
+                        self.db_manager.fetchall(
+                            f"SELECT 漢字, 台羅音標 FROM {table_name} WHERE 漢字 IN ({placeholders})",
+                            tuple(chunk),
+                        )
                     )
-                    print(f"  ✅ 已新增：{han_ji} -  {tl_im_piau}（原【台語音標】：{tai_gi_im_piau}），常用度：{siong_iong_too_to_use}")
-        except Exception as e:
-            print(f"  ❌ 資料庫操作失敗：{han_ji} - {tl_im_piau}（原【台語音標】：{tai_gi_im_piau}），錯誤：{e}")
-            raise
+                inserted = updated = 0
+                for han_ji, tl_im_piau, *_ in records:
+                    if (han_ji, tl_im_piau) in existing:
+                        updated += 1
+                    else:
+                        inserted += 1
+                        existing.add((han_ji, tl_im_piau))
+
+                # 更新時，同步更新【最近揀用時間】：此讀音最近一次被人工揀用/校正之時間，
+                # 供查音時於常用度相同之讀音間排定優先順序
+                self.db_manager.executemany(
+                    f"""
+                INSERT INTO {table_name} (漢字, 台羅音標, 常用度, 摘要說明, 更新時間, 最近揀用時間)
+                VALUES (?, ?, ?, NULL, ?, ?)
+                ON CONFLICT(漢字, 台羅音標) DO UPDATE SET
+                    常用度 = excluded.常用度,
+                    更新時間 = excluded.更新時間,
+                    最近揀用時間 = excluded.最近揀用時間;
+                """,
+                    records,
+                )
+        finally:
+            # 資料庫已異動：令預先載入之讀音索引失效，下次查詢時重新載入
+            self.program.ji_tian.invalidate()
+        return inserted, updated
 
     def update_han_ji_khoo_db_by_ji_khoo_worksheet(
         self,
@@ -2149,6 +2199,8 @@ class ExcelCell:
         # -------------------------------------------------------------------------
         # source_sheet.activate()
         source_sheet.select()
+        readings = []  # 待寫入【漢字庫】之讀音：[(漢字, 台語音標, 常用度), ...]
+        siong_iong_too_to_use = 0.8 if self.program.ue_im_lui_piat == "文讀音" else 0.6  # 根據語音類型設定常用度
         row = 2  # 從第 2 列開始（跳過標題列）
         while True:
             source_sheet.range(f"A{row}").api.Select()  # 選取目前處理的列
@@ -2185,21 +2237,17 @@ class ExcelCell:
             coord_list_str = source_sheet.range(f"D{row}").value
             print("\n")
             print(f"{row - 1}. (A{row}) 【{han_ji}】：台語音標：{org_tai_gi_im_piau}，校正音標：{hau_ziann_im_piau}，座標：{coord_list_str}")
-            # -------------------------------------------------------------------------
-            # 更新資料庫中【漢字庫】資料表
-            # -------------------------------------------------------------------------
-            tai_gi_im_piau = tlpa_im_piau
-            siong_iong_too_to_use = 0.8 if self.program.ue_im_lui_piat == "文讀音" else 0.6  # 根據語音類型設定常用度
-            self.insert_or_update_to_db(
-                table_name=self.program.table_name,
-                han_ji=han_ji,
-                tai_gi_im_piau=tai_gi_im_piau,
-                ue_im_lui_piat=self.program.ue_im_lui_piat,
-                siong_iong_too=siong_iong_too_to_use,
-            )
+            # 待更新至資料庫中【漢字庫】資料表
+            readings.append((han_ji, tlpa_im_piau, siong_iong_too_to_use))
             # 讀取下一列
             row += 1
 
+        # -------------------------------------------------------------------------
+        # 更新資料庫中【漢字庫】資料表（整批寫入）
+        # -------------------------------------------------------------------------
+        inserted, updated = self.upsert_readings(readings)
+        print(f"  ✅ 【漢字庫】已新增 {inserted} 筆、更新 {updated} 筆讀音。")
+
         return EXIT_CODE_SUCCESS
 
     def update_han_ji_khoo_db_by_sheet(self, sheet_name: str) -> int:
@@ -2228,6 +2276,7 @@ class ExcelCell:
             data = [data]
 
         idx = 0
+        readings = []  # 待寫入【漢字庫】之讀音：[(漢字, 台語音標, 常用度), ...]
         for row in data:
             han_ji = row[0]  # 漢字
             org_tai_gi_im_piau = row[1]  # 台語音標
@@ -2240,18 +2289,14 @@ class ExcelCell:
                 tlpa_im_piau_cleanned = tng_tiau_ho(tlpa_im_piau).lower()  # 將【音標調符】轉換成【數值調號】
                 tl_im_piau = convert_tlpa_to_tl(tlpa_im_piau_cleanned)
 
-                self.insert_or_update_to_db(
-                    table_name=table_name,
-                    han_ji=han_ji,
-                    tai_gi_im_piau=tl_im_piau,
-                    ue_im_lui_piat=ue_im_lui_piat,
-                    siong_iong_too=siong_iong_too,
-                )
+                readings.append((han_ji, tl_im_piau, siong_iong_too))
                 print(
                     f"\n📌 {idx + 1}. 【{han_ji}】：台語音標=【{org_tai_gi_im_piau}】，台羅音標：【{tl_im_piau}】，校正音標：【{hau_ziann_im_piau}】，座標：{zo_piau}"
                 )
                 idx += 1
 
+        inserted, updated = self.upsert_readings(readings, table_name=table_name)
+        print(f"  ✅ 【{table_name}】已新增 {inserted} 筆、更新 {updated} 筆讀音。")
         logging_process_step(f"\n【{sheet_name}】中的資料已成功回填至資料庫： {db_path} 的【{table_name}】資料表中。")
         return EXIT_CODE_SUCCESS
 
@@ -2364,6 +2409,8 @@ class ExcelCell:
         # -------------------------------------------------------------------------
         # source_sheet.activate()
         source_sheet.select()
+        readings = []  # 待寫入【漢字庫】之讀音：[(漢字, 台語音標, 常用度), ...]
+        siong_iong_too_to_use = 0.8 if self.program.ue_im_lui_piat == "文讀音" else 0.6  # 根據語音類型設定常用度
         row = 2  # 從第 2 列開始（跳過標題列）
         while True:
             source_sheet.range(f"A{row}").api.Select()  # 選取目前處理的列
@@ -2441,17 +2488,14 @@ class ExcelCell:
                     target_sheet.range(han_ji_cell).color = None
 
             row += 1  # 讀取下一列
-            # -------------------------------------------------------------------------
-            # 更新資料庫中【漢字庫】資料表
-            # -------------------------------------------------------------------------
-            siong_iong_too_to_use = 0.8 if self.program.ue_im_lui_piat == "文讀音" else 0.6  # 根據語音類型設定常用度
-            self.insert_or_update_to_db(
-                table_name=self.program.table_name,
-                han_ji=han_ji,
-                tai_gi_im_piau=tai_gi_im_piau,
-                ue_im_lui_piat=self.program.ue_im_lui_piat,
-                siong_iong_too=siong_iong_too_to_use,
-            )
+            # 待更新至資料庫中【漢字庫】資料表
+            readings.append((han_ji, tai_gi_im_piau, siong_iong_too_to_use))
+
+        # -------------------------------------------------------------------------
+        # 更新資料庫中【漢字庫】資料表（整批寫入）
+        # -------------------------------------------------------------------------
+        inserted, updated = self.upsert_readings(readings)
+        print(f"  ✅ 【漢字庫】已新增 {inserted} 筆、更新 {updated} 筆讀音。")
 
         return EXIT_CODE_SUCCESS
 
@@ -2897,6 +2941,34 @@ class ExcelCell:
                 coordinates.append(row_col)
         return coordinates
 
+    @contextmanager
+    def open_han_ji_zu_im_grid(self, sheet):
+        """
+        載入【漢字注音】工作表快照，供處理期間以 Python 串列存取儲存格；
+        離開時（含發生例外），將變更之儲存格整批寫回工作表。
+
+        用例：
+            with self.open_han_ji_zu_im_grid(sheet) as grid:
+                cell = grid.cell(row, col)
+        """
+        self.grid = HanJiZuImGrid.from_program(sheet=sheet, program=self.program)
+        try:
+            yield self.grid
+        finally:
+            grid, self.grid = self.grid, None
+            total_writes = grid.flush()
+            logging.debug(f"【{sheet.name}】工作表快照寫回：{total_writes} 個區段。")
+
+    def get_han_ji_zu_im_cell(self, sheet, row: int, col: int):
+        """
+        取得【漢字注音】工作表之儲存格：若快照已載入，則取自快照；
+        否則直接取用工作表之 Range 物件。
+        """
+        grid = self.grid
+        if grid is not None and grid.sheet.name == sheet.name and grid.contains(row, col):
+            return grid.cell(row, col)
+        return sheet.range((row, col))
+
     def _process_sheet(self, sheet, show_cell_address: bool = False):
         """處理整個工作表"""
         # 初始化變數
@@ -2916,52 +2988,50 @@ class ExcelCell:
         active_cell = sheet.range(f"{xw.utils.col_name(start_col)}{line_start_row}")
         active_cell.select()
 
-        is_eof = False
-        for line_no in range(1, total_lines + 1):
-            # 檢查是否到達結尾
-            if is_eof or line_no > total_lines:
-                break
-
-            # 顯示目前處理【第 n 行】
-            self._show_separtor_line(f"處理第 {line_no} 行...")
-
-            # 調整 row 值至【漢字】儲存格所在列
-            # （每【行（line）】由 4【列（row）】所構成，漢字在第 3 列：5, 9, 13, ... ）
-            row = line_start_row + (line_no - 1) * rows_per_line + han_ji_row_offset
-
-            # ----------------------------------------------------------------------
-            # 處理列中所有欄(col)儲存格
-            # ----------------------------------------------------------------------
-            for c in range(start_col, end_col + 1):
-                # 將目前處理之儲存格，設為作用中儲存格
-                row = row
-                col = c
-                active_cell = sheet.range((row, col))
-                active_cell.select()
-
-                # 顯示正要處理的儲存格座標位置
-                if show_cell_address:
-                    print("-" * 80)
-                    print(f"儲存格：{xw.utils.col_name(col)}{row}（{row}, {col}）")
-
-                # ------------------------------------------------------------------
-                # 處理儲存格
-                # ------------------------------------------------------------------
-                # status_code:
-                # 0 = 儲存格內容為：漢字
-                # 1 = 儲存格內容為：文字終結符號
-                # 2 = 儲存格內容為：換行符號
-                # 3 = 儲存格內容為：空白、標點符號等非漢字字元
-                status_code = 0
-                status_code = self._process_cell(active_cell)
-
-                # 檢查是否需因：換行、文章終結，而跳出內層迴圈
-                if status_code == 1:
-                    is_eof = True
-                    break
-                elif status_code == 2:
+        # 載入【漢字注音】工作表快照：各儲存格之讀寫，於記憶體中完成
+        with self.open_han_ji_zu_im_grid(sheet) as grid:
+            is_eof = False
+            for line_no in range(1, total_lines + 1):
+                # 檢查是否到達結尾
+                if is_eof or line_no > total_lines:
                     break
 
+                # 顯示目前處理【第 n 行】
+                self._show_separtor_line(f"處理第 {line_no} 行...")
+
+                # 調整 row 值至【漢字】儲存格所在列
+                # （每【行（line）】由 4【列（row）】所構成，漢字在第 3 列：5, 9, 13, ... ）
+                row = line_start_row + (line_no - 1) * rows_per_line + han_ji_row_offset
+
+                # ----------------------------------------------------------------------
+                # 處理列中所有欄(col)儲存格
+                # ----------------------------------------------------------------------
+                for col in range(start_col, end_col + 1):
+                    active_cell = grid.cell(row, col)
+
+                    # 顯示正要處理的儲存格座標位置
+                    if show_cell_address:
+                        print("-" * 80)
+                        print(f"儲存格：{xw.utils.col_name(col)}{row}（{row}, {col}）")
+
+                    # ------------------------------------------------------------------
+                    # 處理儲存格
+                    # ------------------------------------------------------------------
+                    # status_code:
+                    # 0 = 儲存格內容為：漢字
+                    # 1 = 儲存格內容為：文字終結符號
+                    # 2 = 儲存格內容為：換行符號
+                    # 3 = 儲存格內容為：空白、標點符號等非漢字字元
+                    status_code = 0
+                    status_code = self._process_cell(active_cell)
+
+                    # 檢查是否需因：換行、文章終結，而跳出內層迴圈
+                    if status_code == 1:
+                        is_eof = True
+                        break
+                    elif status_code == 2:
+                        break
+
         # 將字庫 dict 回存 Excel 工作表
         self.save_all_piau_im_ji_khoo_dicts()
 
@@ -0,0 +1,320 @@
+"""
+mod_網站建置.py v0.1.1
+
+【網站建置清單】（Build Manifest）：記錄 docs/ 目錄下各網頁之建置資訊，
+令網頁製作、網頁後製及 index.html 之重建，僅處理輸入有變更之網頁。
+
+原作法：a400/a410 每次皆重新製作網頁；_temp_* 後製程式逐一改寫 docs/ 下所有
+HTML 檔；a999 每次皆走訪整個 docs/ 目錄並重建 index.html。
+
+建置清單（JSON 檔）為每個網頁記錄：
+  - source：來源活頁簿；
+  - source_hash：來源內容（漢字注音工作表讀出之文章各行）之雜湊值；
+  - settings_hash：製作設定（網頁格式、上/右邊標音、標題、樣版等）之雜湊值；
+  - output_hash、mtime、size：網頁檔最後一次由建置程式寫入後之雜湊值、修改時間及大小；
+  - steps：已套用之後製步驟及其版本。
+另為 index.html 等彙整檔，記錄其輸入（網頁清單、修改時間、樣版）之雜湊值。
+
+網頁檔之修改時間及大小與記錄相同者，視為未變更，不重新計算雜湊值。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 BuildManifest 類別、iter_html_pages() 及 run_post_processor() 函式。
+v0.1.1 2026-10-18: run_post_processor() 改寫網頁後，一併重新製作其 .gz／.br 預先壓縮檔。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from mod_網頁壓縮 import refresh_precompressed
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+DOCS_DIR = "docs"
+MANIFEST_FILE = "docs.build_manifest.json"
+MANIFEST_VERSION = 1
+
+# 不列入網站網頁之目錄及檔案
+IGNORE_DIR_LIST = ["_archived", "_test", "金鋼經", "__bak", "assets"]
+IGNORE_DOC_LIST = ["index.html", "index_bak.html", "_template.html", "output_from_excel.html", "search.html"]
+
+
+# =========================================================================
+# 雜湊值
+# =========================================================================
+def file_hash(path: str) -> str:
+    """檔案內容之 SHA-256 雜湊值"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_hash(value) -> str:
+    """可序列化成 JSON 之資料（dict、list、str 等）之 SHA-256 雜湊值"""
+    data = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+# =========================================================================
+# 網頁清單
+# =========================================================================
+def iter_html_pages(
+    docs_dir: str = DOCS_DIR,
+    ignore_dirs: Optional[List[str]] = None,
+    ignore_files: Optional[List[str]] = None,
+) -> Iterator[Tuple[str, str]]:
+    """
+    逐一取出 docs_dir 下之網頁：(檔案路徑, 相對於 docs_dir 之路徑)。
+
+    :param ignore_dirs: 不走訪之子目錄，預設為 IGNORE_DIR_LIST
+    :param ignore_files: 不列入之檔名，預設為 IGNORE_DOC_LIST
+    """
+    ignore_dirs = IGNORE_DIR_LIST if ignore_dirs is None else ignore_dirs
+    ignore_files = IGNORE_DOC_LIST if ignore_files is None else ignore_files
+    for root, dirs, files in os.walk(docs_dir):
+        dirs[:] = sorted(d for d in dirs if d not in ignore_dirs)
+        for filename in sorted(files):
+            if not filename.endswith(".html") or filename in ignore_files:
+                continue
+            full_path = os.path.join(root, filename)
+            yield full_path, os.path.relpath(full_path, docs_dir).replace("\\", "/")
+
+
+# =========================================================================
+# 建置清單
+# =========================================================================
+class BuildManifest:
+    """
+    網站建置清單。
+
+    Args:
+        path: 建置清單檔案（JSON）；預設為 MANIFEST_FILE
+        docs_dir: 網站目錄；網頁以相對於此目錄之路徑為鍵
+
+    範例:
+        >>> with BuildManifest() as manifest:
+        ...     stale, reason = manifest.needs_render(output_path, source_hash, settings)
+        ...     if stale:
+        ...         ...  # 製作網頁
+        ...         manifest.record_render(output_path, source, source_hash, settings)
+    """
+
+    def __init__(self, path: str = MANIFEST_FILE, docs_dir: str = DOCS_DIR):
+        self.path = path
+        self.docs_dir = docs_dir
+        self.pages: Dict[str, dict] = {}
+        self.indexes: Dict[str, dict] = {}
+        self._dirty = False
+        self.load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+    def load(self) -> "BuildManifest":
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.pages = data.get("pages", {})
+                self.indexes = data.get("indexes", {})
+        return self
+
+    def save(self) -> bool:
+        """建置清單有變更者，寫回檔案；傳回是否已寫入"""
+        if not self._dirty:
+            return False
+        data = {"version": MANIFEST_VERSION, "pages": self.pages, "indexes": self.indexes}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        return True
+
+    def key(self, output_path: str) -> str:
+        """網頁於建置清單中之鍵：相對於 docs_dir 之路徑"""
+        return os.path.relpath(output_path, self.docs_dir).replace("\\", "/")
+
+    def page(self, output_path: str) -> Optional[dict]:
+        return self.pages.get(self.key(output_path))
+
+    # ---------------------------------------------------------------------
+    # 網頁檔狀態
+    # ---------------------------------------------------------------------
+    def is_output_changed(self, output_path: str) -> bool:
+        """網頁檔不存在，或於最後一次建置後被修改者，傳回 True"""
+        entry = self.page(output_path)
+        if entry is None or not os.path.exists(output_path):
+            return True
+        stat = os.stat(output_path)
+        if stat.st_mtime == entry.get("mtime") and stat.st_size == entry.get("size"):
+            return False
+        return file_hash(output_path) != entry.get("output_hash")
+
+    def _record_output(self, output_path: str, entry: dict) -> None:
+        stat = os.stat(output_path)
+        entry["output_hash"] = file_hash(output_path)
+        entry["mtime"] = stat.st_mtime
+        entry["size"] = stat.st_size
+        self.pages[self.key(output_path)] = entry
+        self._dirty = True
+
+    # ---------------------------------------------------------------------
+    # 網頁製作
+    # ---------------------------------------------------------------------
+    def needs_render(
+        self, output_path: str, source_hash: str, settings: dict, force: bool = False
+    ) -> Tuple[bool, str]:
+        """
+        判斷網頁是否須重新製作。
+
+        :return: (是否須重新製作, 原因)
+        """
+        entry = self.page(output_path)
+        if force:
+            return True, "強制重建"
+        if entry is None or "source_hash" not in entry:
+            return True, "新網頁"
+        if not os.path.exists(output_path):
+            return True, "網頁檔不存在"
+        if entry["source_hash"] != source_hash:
+            return True, "來源內容變更"
+        if entry.get("settings_hash") != content_hash(settings):
+            return True, "製作設定變更"
+        if self.is_output_changed(output_path):
+            return True, "網頁檔已被修改"
+        return False, "未變更"
+
+    def record_render(self, output_path: str, source: str, source_hash: str, settings: dict) -> None:
+        """記錄網頁已製作完成；已套用之後製步驟一併清除"""
+        entry = {
+            "source": source,
+            "source_hash": source_hash,
+            "settings_hash": content_hash(settings),
+            "steps": {},
+        }
+        self._record_output(output_path, entry)
+
+    # ---------------------------------------------------------------------
+    # 網頁後製
+    # ---------------------------------------------------------------------
+    def needs_step(self, output_path: str, step: str, version: str = "1", force: bool = False) -> bool:
+        """判斷網頁是否須套用某一後製步驟（未曾套用、版本變更，或網頁檔於建置後被修改）"""
+        if force:
+            return True
+        entry = self.page(output_path)
+        if entry is None or entry.get("steps", {}).get(step) != version:
+            return True
+        return self.is_output_changed(output_path)
+
+    def record_step(self, output_path: str, step: str, version: str = "1", keep_steps: bool = True) -> None:
+        """
+        記錄網頁已套用某一後製步驟。
+
+        :param keep_steps: 保留先前已套用之後製步驟；網頁檔於建置程式之外被修改者，
+                           先前之後製記錄已不可靠，應傳入 False
+        """
+        entry = dict(self.page(output_path) or {})
+        steps = dict(entry.get("steps", {})) if keep_steps else {}
+        steps[step] = version
+        entry["steps"] = steps
+        self._record_output(output_path, entry)
+
+    # ---------------------------------------------------------------------
+    # index.html 等彙整檔
+    # ---------------------------------------------------------------------
+    def needs_index(self, name: str, index_path: str, inputs, force: bool = False) -> bool:
+        """
+        判斷彙整檔是否須重建：輸入（網頁清單、修改時間、樣版等）有變更，
+        或彙整檔不存在、已被其他程式改寫。
+        """
+        if force or not os.path.exists(index_path):
+            return True
+        entry = self.indexes.get(name) or {}
+        return entry.get("inputs_hash") != content_hash(inputs) or entry.get("output_hash") != file_hash(index_path)
+
+    def record_index(self, name: str, inputs, index_path: str) -> None:
+        self.indexes[name] = {"inputs_hash": content_hash(inputs), "output_hash": file_hash(index_path)}
+        self._dirty = True
+
+    def page_inputs(self, pages: List[Tuple[str, str]]) -> List[list]:
+        """彙整檔之輸入：各網頁之 [相對路徑, 修改時間]"""
+        return [[rel_path, os.path.getmtime(full_path)] for full_path, rel_path in pages]
+
+
+def run_post_processor(
+    step: str,
+    transform: Callable[[str, str], str],
+    version: str = "1",
+    manifest: Optional[BuildManifest] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    pages: Optional[List[Tuple[str, str]]] = None,
+) -> List[str]:
+    """
+    對網站之網頁套用後製步驟：僅處理未曾套用該步驟（或其版本），或網頁檔已變更者。
+
+    :param step: 後製步驟名稱
+    :param transform: 後製函式：transform(html, 相對路徑) → 新 html
+    :param version: 後製步驟之版本；變更版本者，所有網頁重新套用
+    :param manifest: 建置清單；None 表使用預設之建置清單
+    :param force: 不論建置清單，處理所有網頁
+    :param dry_run: 僅列出須處理之網頁，不修改檔案
+    :param pages: 待處理之網頁 [(檔案路徑, 相對路徑), ...]；預設為 iter_html_pages()
+    :return: 須處理（dry_run 時）或已處理之網頁檔路徑
+    """
+    manifest = manifest or BuildManifest()
+    pages = list(iter_html_pages(manifest.docs_dir)) if pages is None else pages
+    touched = []
+    for full_path, rel_path in pages:
+        if not manifest.needs_step(full_path, step, version, force=force):
+            continue
+        touched.append(full_path)
+        if dry_run:
+            continue
+        keep_steps = not manifest.is_output_changed(full_path)
+        with open(full_path, "r", encoding="utf-8") as f:
+            html = f.read()
+        new_html = transform(html, rel_path)
+        if new_html != html:
+            with open(full_path, "w", encoding="utf-8") as f:
+                f.write(new_html)
+            refresh_precompressed(full_path)
+        manifest.record_step(full_path, step, version, keep_steps=keep_steps)
+    if not dry_run:
+        manifest.save()
+    return touched
+
+
+def add_build_arguments(parser):
+    """為命令列解析器，加入建置參數：--force、--dry-run"""
+    parser.add_argument("--force", action="store_true", help="不論網站建置清單，全部重建")
+    parser.add_argument("--dry-run", action="store_true", help="僅列出須重建之網頁，不寫入檔案")
+    return parser
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="列出網站建置清單中，於建置後被修改之網頁")
+    parser.add_argument("--docs", default=DOCS_DIR)
+    parser.add_argument("--manifest", default=MANIFEST_FILE)
+    cli_args = parser.parse_args()
+
+    manifest = BuildManifest(cli_args.manifest, cli_args.docs)
+    for full_path, rel_path in iter_html_pages(cli_args.docs):
+        entry = manifest.page(full_path)
+        if entry is None:
+            print(f"未列入建置清單：{rel_path}")
+        elif manifest.is_output_changed(full_path):
+            print(f"建置後被修改：{rel_path}")
@@ -0,0 +1,309 @@
+"""
+mod_網站搜尋.py v0.1.1
+
+為 docs/ 網站製作【全文搜尋索引】（倒排索引，Inverted Index），供 docs/search.html
+於瀏覽器中搜尋漢字或台語音標（TLPA）。
+
+原作法：網站無全文搜尋，讀者僅能於 index.html 之文章卡片中，以標題篩選。
+
+索引之內容取自 a400 製作之網頁：<article> 中各 <ruby> 之漢字及其 data-tlpa 屬性、
+各 <span> 中之標點符號等。每個字於文章中依序編號（位置），據此產生：
+  - 漢字 → [[網頁編號, 位置, 位置, ...], ...]
+  - 不含調號之 TLPA 音節（如 cun1 → cun）→ [[網頁編號, 位置, ...], ...]
+位置相連者，即為連續之詞句，故可搜尋「春天」或「cun thian」。
+
+索引檔輸出於 docs/search/ 目錄：
+  - pages.json：網頁清單 [{"path": 相對路徑, "title": 標題}, ...]，索引中之網頁編號即其序號；
+  - han_ji/<分片>.json：漢字索引，依漢字 Unicode 碼位之高位元組分片（如「春」U+6625 → 66.json）；
+  - tlpa/<分片>.json：音標索引，依音節之首字母分片（如 cun → c.json）。
+瀏覽器僅需下載查詢字詞所在之分片。
+
+索引之製作為逐頁增量：各網頁擷取之文字存於快取檔（SEARCH_CACHE_FILE），並以
+【網站建置清單】之後製步驟（SEARCH_STEP）判斷網頁是否變更；未變更之網頁不重新讀取。
+快取另記錄擷取時網頁之 output_hash：網頁經其他後製步驟改寫者（建置清單保留已套用之
+後製步驟），output_hash 與建置清單不符，亦重新擷取。
+分片內容未變更者，不重寫檔案。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 extract_page_text()、build_postings() 及 build_search_index() 函式。
+v0.1.1 2026-10-18: 快取記錄網頁之 output_hash；網頁經後製改寫者，重新擷取。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import json
+import os
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+from mod_網站建置 import DOCS_DIR, BuildManifest, add_build_arguments, iter_html_pages
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+SEARCH_DIR = "search"
+SEARCH_CACHE_FILE = "docs.search_cache.json"
+SEARCH_CACHE_VERSION = 2
+# 建置清單中之後製步驟名稱及版本；擷取規則變更時，應變更版本，令所有網頁重新擷取
+SEARCH_STEP = "search_index"
+SEARCH_STEP_VERSION = "1"
+
+JSON_SEPARATORS = (",", ":")
+
+
+# =========================================================================
+# 索引鍵
+# =========================================================================
+def is_han_ji(ch: str) -> bool:
+    """是否為 CJK 漢字（含擴充區）"""
+    code = ord(ch)
+    return (
+        0x3400 <= code <= 0x9FFF
+        or 0xF900 <= code <= 0xFAFF
+        or 0x20000 <= code <= 0x3FFFF
+    )
+
+
+def normalize_tlpa(tlpa: str) -> str:
+    """音標正規化：轉小寫、去除調號（如 Cun1 → cun）"""
+    return re.sub(r"[^a-z]", "", tlpa.lower())
+
+
+def han_ji_shard(han_ji: str) -> str:
+    """漢字索引之分片名稱：Unicode 碼位除以 256 之十六進位（如「春」U+6625 → 66）"""
+    return format(ord(han_ji) >> 8, "x")
+
+
+def tlpa_shard(syllable: str) -> str:
+    """音標索引之分片名稱：音節之首字母"""
+    return syllable[:1]
+
+
+# =========================================================================
+# 擷取網頁文字
+# =========================================================================
+class _ArticleTextParser(HTMLParser):
+    """
+    擷取網頁 <title> 及 <article> 中之文字：<ruby> 之漢字（不含 <rt>、<rtc>、<rp> 之標音）
+    及其 data-tlpa 屬性；其他文字（標點符號等）逐字列入，音標為空字串。
+    """
+
+    SKIP_TAGS = ("rt", "rtc", "rp", "script", "style")
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.chars: List[str] = []
+        self.tlpa: List[str] = []
+        self._in_title = False
+        self._in_article = 0
+        self._skip = 0
+        self._ruby_tlpa: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag == "article":
+            self._in_article += 1
+        elif tag in self.SKIP_TAGS:
+            self._skip += 1
+        elif tag == "ruby":
+            self._ruby_tlpa = dict(attrs).get("data-tlpa") or ""
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag == "article":
+            self._in_article = max(0, self._in_article - 1)
+        elif tag in self.SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag == "ruby":
+            self._ruby_tlpa = None
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+            return
+        if not self._in_article or self._skip:
+            return
+        if self._ruby_tlpa is not None:
+            text = data.strip()
+            if text:
+                # 一個 <ruby> 為一個字：音標僅標於第一個字
+                self.chars.append(text[0])
+                self.tlpa.append(self._ruby_tlpa)
+                self._ruby_tlpa = ""
+            return
+        for ch in data:
+            if not ch.isspace():
+                self.chars.append(ch)
+                self.tlpa.append("")
+
+
+def extract_page_text(html: str) -> dict:
+    """
+    擷取網頁之標題及文章文字。
+
+    :return: {"title": 標題, "text": 文章各字（一字一位置）, "tlpa": 各字之音標（無者為空字串）}
+    """
+    parser = _ArticleTextParser()
+    parser.feed(html)
+    parser.close()
+    return {"title": parser.title.strip(), "text": "".join(parser.chars), "tlpa": parser.tlpa}
+
+
+# =========================================================================
+# 倒排索引
+# =========================================================================
+def build_postings(page_texts: List[dict]) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """
+    依各網頁擷取之文字，製作漢字索引及音標索引，並依分片歸類。
+
+    :param page_texts: 各網頁之 extract_page_text() 結果；串列序號即網頁編號
+    :return: (漢字索引分片, 音標索引分片)；皆為 {分片名稱: {索引鍵: [[網頁編號, 位置, ...], ...]}}
+    """
+    han_ji_index: Dict[str, Dict[int, List[int]]] = {}
+    tlpa_index: Dict[str, Dict[int, List[int]]] = {}
+    for page_id, page_text in enumerate(page_texts):
+        for position, (ch, tlpa) in enumerate(zip(page_text["text"], page_text["tlpa"])):
+            if is_han_ji(ch):
+                han_ji_index.setdefault(ch, {}).setdefault(page_id, []).append(position)
+            syllable = normalize_tlpa(tlpa)
+            if syllable:
+                tlpa_index.setdefault(syllable, {}).setdefault(page_id, []).append(position)
+
+    def shard(index, shard_of):
+        shards: Dict[str, dict] = {}
+        for key in sorted(index):
+            postings = [[page_id] + positions for page_id, positions in sorted(index[key].items())]
+            shards.setdefault(shard_of(key), {})[key] = postings
+        return shards
+
+    return shard(han_ji_index, han_ji_shard), shard(tlpa_index, tlpa_shard)
+
+
+# =========================================================================
+# 索引檔
+# =========================================================================
+def _load_cache(cache_path: str) -> Dict[str, dict]:
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == SEARCH_CACHE_VERSION:
+            return data.get("pages", {})
+    return {}
+
+
+def _save_cache(cache_path: str, pages: Dict[str, dict]) -> None:
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": SEARCH_CACHE_VERSION, "pages": pages}, f, ensure_ascii=False, separators=JSON_SEPARATORS)
+    os.replace(tmp_path, cache_path)
+
+
+def _write_json_if_changed(path: str, value) -> bool:
+    """內容與既有檔案不同者，始寫入檔案；傳回是否已寫入"""
+    data = json.dumps(value, ensure_ascii=False, separators=JSON_SEPARATORS)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == data:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data)
+    return True
+
+
+def _write_shards(shard_dir: str, shards: Dict[str, dict]) -> List[str]:
+    """寫入有變更之分片，並刪除已無索引鍵之分片；傳回已寫入或刪除之檔案"""
+    written = []
+    for name, postings in shards.items():
+        path = os.path.join(shard_dir, f"{name}.json")
+        if _write_json_if_changed(path, postings):
+            written.append(path)
+    if os.path.isdir(shard_dir):
+        for filename in sorted(os.listdir(shard_dir)):
+            if filename.endswith(".json") and filename[:-5] not in shards:
+                path = os.path.join(shard_dir, filename)
+                os.remove(path)
+                written.append(path)
+    return written
+
+
+def build_search_index(
+    manifest: Optional[BuildManifest] = None,
+    cache_path: str = SEARCH_CACHE_FILE,
+    pages: Optional[List[Tuple[str, str]]] = None,
+    force: bool = False,
+    dry_run: bool = False,
+) -> List[str]:
+    """
+    製作網站之全文搜尋索引：僅重新擷取新增或變更之網頁。
+
+    :param manifest: 建置清單；None 表使用預設之建置清單
+    :param cache_path: 各網頁擷取文字之快取檔
+    :param pages: 列入索引之網頁 [(檔案路徑, 相對路徑), ...]；預設為 iter_html_pages()
+    :param force: 不論建置清單，重新擷取所有網頁
+    :param dry_run: 僅列出須重新擷取之網頁，不寫入檔案
+    :return: 須重新擷取（dry_run 時）或已重新擷取之網頁檔路徑
+    """
+    manifest = manifest or BuildManifest()
+    pages = list(iter_html_pages(manifest.docs_dir)) if pages is None else pages
+    cache = _load_cache(cache_path)
+
+    def is_stale(full_path, rel_path):
+        if rel_path not in cache or manifest.needs_step(full_path, SEARCH_STEP, SEARCH_STEP_VERSION, force=force):
+            return True
+        # 擷取後，網頁經其他後製步驟改寫
+        return cache[rel_path].get("output_hash") != (manifest.page(full_path) or {}).get("output_hash")
+
+    stale = [(full_path, rel_path) for full_path, rel_path in pages if is_stale(full_path, rel_path)]
+    removed = set(cache) - {rel_path for _, rel_path in pages}
+    if dry_run:
+        return [full_path for full_path, _ in stale]
+    if not stale and not removed and not force:
+        return []
+
+    for full_path, rel_path in stale:
+        keep_steps = not manifest.is_output_changed(full_path)
+        with open(full_path, "r", encoding="utf-8") as f:
+            page_text = extract_page_text(f.read())
+        manifest.record_step(full_path, SEARCH_STEP, SEARCH_STEP_VERSION, keep_steps=keep_steps)
+        page_text["output_hash"] = manifest.page(full_path)["output_hash"]
+        cache[rel_path] = page_text
+    for rel_path in removed:
+        del cache[rel_path]
+
+    page_texts = [cache[rel_path] for _, rel_path in pages]
+    han_ji_shards, tlpa_shards = build_postings(page_texts)
+
+    search_dir = os.path.join(manifest.docs_dir, SEARCH_DIR)
+    _write_json_if_changed(
+        os.path.join(search_dir, "pages.json"),
+        [{"path": rel_path, "title": cache[rel_path]["title"]} for _, rel_path in pages],
+    )
+    _write_shards(os.path.join(search_dir, "han_ji"), han_ji_shards)
+    _write_shards(os.path.join(search_dir, "tlpa"), tlpa_shards)
+
+    _save_cache(cache_path, cache)
+    manifest.save()
+    return [full_path for full_path, _ in stale]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="製作 docs 網站之全文搜尋索引")
+    parser.add_argument("--docs", default=DOCS_DIR)
+    add_build_arguments(parser)
+    cli_args = parser.parse_args()
+
+    updated = build_search_index(
+        manifest=BuildManifest(docs_dir=cli_args.docs), force=cli_args.force, dry_run=cli_args.dry_run
+    )
+    action = "須重新擷取" if cli_args.dry_run else "已重新擷取"
+    for path in updated:
+        print(f"{action}：{path}")
+    print(f"共 {len(updated)} 個網頁{action}。")
@@ -0,0 +1,328 @@
+"""
+mod_網頁匯入.py v0.1.0
+
+【網頁匯入】：自標音網頁讀回漢字及其標音，供 a409（回填【漢字注音】工作表）及
+a930（匯入【網頁匯入】工作表）使用。
+
+原作法：以 BeautifulSoup 解析整份網頁、遞迴走訪各節點後，逐一儲存格寫入 Excel
+（每個漢字 3 次 COM 呼叫）；a930 之 process_phonetic() 每次呼叫皆重建其聲母、韻母、
+調號對照表。
+
+本模組之作法：
+  - RubyHtmlParser：以事件驅動之 HTMLParser，分段讀入網頁檔（iter_html_items()），
+    邊讀邊産出網頁項目（RubyItem）：<ruby> 之漢字、<rt>、<rtc>（或 <crt>）及 data-tlpa
+    屬性，<span> 及一般文字，<br> 及段落結尾；<head> 中之 <meta name=... content=...>
+    記入 parser.meta；
+  - HanJiZuImLayout：將網頁項目依【漢字注音】工作表之配置（每行 4 列：人工標音、
+    台語音標、漢字、漢字標音）排入記憶體中之區塊，讀取工作表一次、寫回一次。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 RubyHtmlParser、HanJiZuImLayout 類別及 iter_html_items() 函式。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+# 網頁項目之種類
+RUBY = "ruby"
+SPAN = "span"
+TEXT = "text"
+LINE_BREAK = "line_break"
+P_END = "p_end"
+
+# 文章內容所在之 <div class=...>：a400 網頁為 Siang_Pai；a930 匯入之網頁為 title-page、content-box
+ROOT_CLASSES_SIANG_PAI = ("Siang_Pai",)
+ROOT_CLASSES_TITLE_CONTENT = ("title-page", "content-box")
+
+# <ruby> 中之標音標籤：<rt> 為上方標音，<rtc>（或 <crt>）為右方標音，<rp> 略過
+RUBY_RT_TAGS = ("rt",)
+RUBY_RTC_TAGS = ("rtc", "crt")
+RUBY_SKIP_TAGS = ("rp",)
+SKIP_TAGS = ("script", "style")
+
+# 分段讀入網頁檔之大小（字元數）
+CHUNK_SIZE = 64 * 1024
+
+# 【漢字注音】工作表之配置（與 a400 匯出時之設定一致）
+START_ROW = 5  # 第 1 行【漢字】所在列
+START_COL = 4  # 漢字起始欄（D）
+ROWS_PER_LINE = 4  # 每行 4 列：人工標音、台語音標、漢字、漢字標音
+DEFAULT_CHARS_PER_ROW = 15
+# 段落結尾填入之公式，及【文章終結符號】
+PARAGRAPH_END_FORMULA = "=CHAR(10)"
+END_OF_TEXT = "φ"
+
+
+class RubyItem(NamedTuple):
+    """
+    網頁項目。
+
+    kind: RUBY、SPAN、TEXT、LINE_BREAK 或 P_END
+    text: <ruby> 之漢字（<rb> 或 <ruby> 中標音標籤以外之文字）、<span> 或一般文字
+    rt: <rt> 之標音
+    rtc: <rtc>（或 <crt>）之標音
+    tlpa: <ruby> 之 data-tlpa 屬性（a400 網頁之台語音標）
+    """
+
+    kind: str
+    text: str = ""
+    rt: str = ""
+    rtc: str = ""
+    tlpa: str = ""
+
+
+# =========================================================================
+# 解析網頁
+# =========================================================================
+class RubyHtmlParser(HTMLParser):
+    """
+    事件驅動之標音網頁解析器：僅處理 <div> 之 class 屬於 root_classes 者之內容。
+
+    Args:
+        root_classes: 文章內容所在之 <div> 之 class
+        paragraphs_only: 為 True 者，僅處理 <p> 中之內容（a409 原作法）
+    """
+
+    def __init__(self, root_classes: Iterable[str] = ROOT_CLASSES_SIANG_PAI, paragraphs_only: bool = False):
+        super().__init__(convert_charrefs=True)
+        self.root_classes = set(root_classes)
+        self.paragraphs_only = paragraphs_only
+        self.meta: Dict[str, str] = {}
+        self.items: List[RubyItem] = []
+        self._root_depth = 0  # 文章內容 <div> 之巢狀深度；0 表不在文章內容中
+        self._p_depth = 0
+        self._skip_depth = 0
+        self._span_depth = 0
+        self._span_text: List[str] = []
+        self._ruby: Optional[dict] = None  # 讀取中之 <ruby>：{"text", "rt", "rtc", "tlpa", "part"}
+
+    # ---------------------------------------------------------------------
+    def pop_items(self) -> List[RubyItem]:
+        """取出已解析之網頁項目"""
+        items, self.items = self.items, []
+        return items
+
+    @property
+    def _active(self) -> bool:
+        return self._root_depth > 0 and not self._skip_depth and (self._p_depth > 0 or not self.paragraphs_only)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            attrs = dict(attrs)
+            if attrs.get("name") and attrs.get("content") is not None:
+                self.meta[attrs["name"]] = attrs["content"]
+            return
+        if tag == "div":
+            if self._root_depth:
+                self._root_depth += 1
+            elif self.root_classes & set((dict(attrs).get("class") or "").split()):
+                self._root_depth = 1
+            return
+        if not self._root_depth:
+            return
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "p":
+            self._p_depth += 1
+        elif not self._active:
+            return
+        elif self._ruby is not None:
+            if tag in RUBY_RT_TAGS:
+                self._ruby["part"] = "rt"
+            elif tag in RUBY_RTC_TAGS:
+                self._ruby["part"] = "rtc"
+            elif tag in RUBY_SKIP_TAGS:
+                self._ruby["part"] = None
+        elif tag == "ruby":
+            self._ruby = {"text": [], "rt": [], "rtc": [], "tlpa": dict(attrs).get("data-tlpa") or "", "part": "text"}
+        elif tag == "span":
+            self._span_depth += 1
+        elif tag == "br" and not self._span_depth:
+            self.items.append(RubyItem(LINE_BREAK))
+
+    def handle_endtag(self, tag):
+        if not self._root_depth:
+            return
+        if tag == "div":
+            self._root_depth -= 1
+        elif tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "p":
+            if self._p_depth:
+                self._p_depth -= 1
+                self.items.append(RubyItem(P_END))
+        elif self._ruby is not None:
+            if tag in RUBY_RT_TAGS + RUBY_RTC_TAGS + RUBY_SKIP_TAGS:
+                self._ruby["part"] = "text"
+            elif tag == "ruby":
+                ruby, self._ruby = self._ruby, None
+                self.items.append(
+                    RubyItem(
+                        RUBY,
+                        "".join(ruby["text"]).strip(),
+                        "".join(ruby["rt"]).strip(),
+                        "".join(ruby["rtc"]).strip(),
+                        ruby["tlpa"],
+                    )
+                )
+        elif tag == "span" and self._span_depth:
+            self._span_depth -= 1
+            if not self._span_depth:
+                self.items.append(RubyItem(SPAN, "".join(self._span_text).strip()))
+                self._span_text = []
+
+    def handle_data(self, data):
+        if not self._active:
+            return
+        if self._ruby is not None:
+            part = self._ruby["part"]
+            if part:
+                self._ruby[part].append(data)
+        elif self._span_depth:
+            self._span_text.append(data)
+        else:
+            text = data.strip()
+            if text:
+                self.items.append(RubyItem(TEXT, text))
+
+
+def iter_html_items(path: str, parser: RubyHtmlParser, chunk_size: int = CHUNK_SIZE) -> Iterator[RubyItem]:
+    """
+    分段讀入網頁檔，邊讀邊産出網頁項目；<meta> 記入 parser.meta。
+
+    範例:
+        >>> parser = RubyHtmlParser()
+        >>> for item in iter_html_items("docs/《春》.html", parser):
+        ...     print(item.kind, item.text, item.tlpa)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from parser.pop_items()
+    parser.close()
+    yield from parser.pop_items()
+
+
+def parse_html_items(html: str, parser: Optional[RubyHtmlParser] = None) -> List[RubyItem]:
+    """解析整份網頁字串，傳回網頁項目"""
+    parser = parser or RubyHtmlParser()
+    parser.feed(html)
+    parser.close()
+    return parser.pop_items()
+
+
+# =========================================================================
+# 【漢字注音】工作表之配置
+# =========================================================================
+class HanJiZuImLayout:
+    """
+    將網頁項目依【漢字注音】工作表之配置，排入記憶體中之區塊：
+      - <ruby>：漢字列填入漢字，台語音標列填入 data-tlpa（無者取 <rt>），漢字標音列填入 <rtc>；
+      - <span>、一般文字：漢字列填入其文字；
+      - 段落結尾：填入 =CHAR(10) 後換行；<br>：換行；
+      - 每行填滿 chars_per_row 個字後，自動換行；最後填入【文章終結符號】。
+
+    Args:
+        chars_per_row: 每行字數（env 工作表之【每列總字數】）
+        start_row: 第 1 行【漢字】所在列
+        start_col: 漢字起始欄
+    """
+
+    def __init__(self, chars_per_row: int = DEFAULT_CHARS_PER_ROW, start_row: int = START_ROW, start_col: int = START_COL):
+        self.chars_per_row = chars_per_row
+        self.start_row = start_row
+        self.start_col = start_col
+        # 各行之 [台語音標列, 漢字列, 漢字標音列]
+        self.lines: List[List[list]] = []
+        self.line = 0
+        self.col = 0
+        self.count = 0  # 已填入之項目數
+
+    def _cells(self, offset: int) -> list:
+        while len(self.lines) <= self.line:
+            self.lines.append([[None] * self.chars_per_row for _ in range(3)])
+        return self.lines[self.line][offset]
+
+    def _new_line(self) -> None:
+        self.line += 1
+        self.col = 0
+
+    def add(self, item: RubyItem) -> None:
+        """依序排入一個網頁項目"""
+        if item.kind in (LINE_BREAK, P_END):
+            if item.kind == P_END:
+                self._cells(1)[self.col] = PARAGRAPH_END_FORMULA
+                self.count += 1
+            self._new_line()
+            return
+        if item.kind == RUBY:
+            self._cells(0)[self.col] = item.tlpa or item.rt
+            self._cells(1)[self.col] = item.text
+            self._cells(2)[self.col] = item.rtc
+        else:
+            self._cells(1)[self.col] = item.text
+        self.count += 1
+        self.col += 1
+        if self.col >= self.chars_per_row:
+            self._new_line()
+
+    def extend(self, items: Iterable[RubyItem]) -> "HanJiZuImLayout":
+        for item in items:
+            self.add(item)
+        return self
+
+    def finish(self) -> None:
+        """填入【文章終結符號】"""
+        self._cells(1)[self.col] = END_OF_TEXT
+
+    # ---------------------------------------------------------------------
+    @property
+    def first_row(self) -> int:
+        """區塊起始列：第 1 行【人工標音】所在列"""
+        return self.start_row - 2
+
+    @property
+    def last_row(self) -> int:
+        """區塊結束列：最末行【漢字標音】所在列"""
+        return self.start_row + (len(self.lines) - 1) * ROWS_PER_LINE + 1
+
+    @property
+    def last_col(self) -> int:
+        return self.start_col + self.chars_per_row - 1
+
+    def block(self, existing: Optional[List[list]] = None) -> List[list]:
+        """
+        區塊之儲存格值（first_row ~ last_row, start_col ~ last_col）：人工標音列取自 existing
+        （工作表原有之值），其餘各列為排入之值。
+        """
+        rows = []
+        for index, (tlpa_row, han_ji_row, piau_im_row) in enumerate(self.lines):
+            jin_kang = existing[index * ROWS_PER_LINE] if existing and index * ROWS_PER_LINE < len(existing) else None
+            jin_kang = list(jin_kang or [])[: self.chars_per_row]
+            jin_kang += [None] * (self.chars_per_row - len(jin_kang))
+            rows.extend([jin_kang, list(tlpa_row), list(han_ji_row), list(piau_im_row)])
+        return rows
+
+    def write(self, sheet) -> int:
+        """
+        讀取工作表之區塊一次（保留人工標音列），再整批寫回一次。
+
+        Returns:
+            int: 寫入之儲存格數
+        """
+        if not self.lines:
+            return 0
+        cell_range = sheet.range((self.first_row, self.start_col), (self.last_row, self.last_col))
+        existing = cell_range.options(ndim=2).value
+        rows = self.block(existing)
+        cell_range.value = rows
+        return sum(len(row) for row in rows)
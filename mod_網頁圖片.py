@@ -0,0 +1,285 @@
+"""
+mod_網頁圖片.py v0.1.0
+
+【網頁圖片】衍生檔：為 docs/assets/images/ 下之文章圖片，製作數種寬度之 WebP 及 JPEG
+縮圖，供網頁以 <picture>/srcset 依螢幕寬度選用。
+
+原作法：網頁直接引用原始圖片（多為數 MB 之 PNG/JPG 檔），手機瀏覽時，下載圖片之時間
+遠多於文字。
+
+衍生檔存於 docs/assets/images/responsive/，檔名含原圖內容之雜湊值及寬度（如
+Liok-Kok-Lun.1a2b3c4d.800w.webp）；各原圖之雜湊值、尺寸及衍生檔清單，記錄於同目錄之
+images.json。原圖內容未變更者（修改時間及大小相同，或雜湊值相同），不重新製作。
+
+衍生檔以 Pillow 套件製作，完全於本機執行；未安裝 Pillow 者，不製作衍生檔，網頁仍可
+引用已製作之衍生檔，或改用原圖。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 build_responsive_images()、picture_html() 及 header_image_html() 函式。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import json
+import os
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from mod_網站建置 import DOCS_DIR, add_build_arguments, file_hash
+
+try:
+    from PIL import Image, ImageOps
+
+    HAS_PILLOW = True
+except ImportError:
+    HAS_PILLOW = False
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+IMAGE_DIR = os.path.join(DOCS_DIR, "assets", "images")
+IMAGE_URL_PREFIX = "./assets/images/"
+RESPONSIVE_DIR = "responsive"
+IMAGE_MANIFEST_FILE = "images.json"
+IMAGE_MANIFEST_VERSION = 1
+
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+# 衍生檔之寬度（像素）；原圖較窄者，另以原圖寬度製作一份
+IMAGE_WIDTHS = (480, 800, 1200)
+# 網頁中圖片之顯示寬度
+DISPLAY_WIDTH = 800
+HASH_LENGTH = 8
+
+# 衍生檔格式：{格式: (副檔名, Pillow 格式, 存檔參數)}；picture_html() 依此順序列出 <source>
+DERIVATIVE_FORMATS = {
+    "webp": (".webp", "WEBP", {"quality": 80, "method": 6}),
+    "jpeg": (".jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+MIME_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+
+# =========================================================================
+# 衍生檔清單
+# =========================================================================
+def _manifest_path(image_dir: str) -> str:
+    return os.path.join(image_dir, RESPONSIVE_DIR, IMAGE_MANIFEST_FILE)
+
+
+def load_image_manifest(image_dir: str = IMAGE_DIR) -> Dict[str, dict]:
+    """
+    讀取衍生檔清單：{原圖檔名: {"hash", "mtime", "size", "width", "height",
+    "variants": {格式: [[寬度, 衍生檔路徑（相對於 image_dir）], ...]}}}
+    """
+    path = _manifest_path(image_dir)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == IMAGE_MANIFEST_VERSION:
+            return data.get("images", {})
+    return {}
+
+
+def _save_image_manifest(image_dir: str, images: Dict[str, dict]) -> None:
+    path = _manifest_path(image_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": IMAGE_MANIFEST_VERSION, "images": images}, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def list_source_images(image_dir: str = IMAGE_DIR) -> List[str]:
+    """image_dir 下（不含子目錄）之原圖檔名"""
+    if not os.path.isdir(image_dir):
+        return []
+    return sorted(
+        name
+        for name in os.listdir(image_dir)
+        if os.path.isfile(os.path.join(image_dir, name)) and os.path.splitext(name)[1].lower() in SOURCE_EXTENSIONS
+    )
+
+
+def _variant_paths(entry: dict) -> List[str]:
+    return [path for variants in entry.get("variants", {}).values() for _, path in variants]
+
+
+def _is_up_to_date(image_dir: str, entry: Optional[dict], path: str) -> bool:
+    """原圖未變更（修改時間及大小相同，或雜湊值相同），且衍生檔皆存在"""
+    if not entry or not all(os.path.exists(os.path.join(image_dir, p)) for p in _variant_paths(entry)):
+        return False
+    stat = os.stat(path)
+    if stat.st_mtime == entry.get("mtime") and stat.st_size == entry.get("size"):
+        return True
+    if file_hash(path) != entry.get("hash"):
+        return False
+    entry["mtime"], entry["size"] = stat.st_mtime, stat.st_size
+    return True
+
+
+# =========================================================================
+# 製作衍生檔
+# =========================================================================
+def derivative_widths(width: int) -> List[int]:
+    """原圖寬度為 width 者，須製作之衍生檔寬度"""
+    widths = [w for w in IMAGE_WIDTHS if w < width]
+    if width <= IMAGE_WIDTHS[-1]:
+        widths.append(width)
+    return widths
+
+
+def _make_derivatives(image_dir: str, name: str) -> dict:
+    path = os.path.join(image_dir, name)
+    stat = os.stat(path)
+    digest = file_hash(path)
+    stem = os.path.splitext(name)[0]
+    with Image.open(path) as im:
+        im = ImageOps.exif_transpose(im)
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "A" in im.mode or "transparency" in im.info else "RGB")
+        width, height = im.size
+        # JPEG 不支援透明：以白色為底
+        if im.mode == "RGBA":
+            opaque = Image.new("RGB", im.size, (255, 255, 255))
+            opaque.paste(im, mask=im.getchannel("A"))
+        else:
+            opaque = im
+
+        variants: Dict[str, list] = {}
+        for fmt, (ext, pil_format, save_kwargs) in DERIVATIVE_FORMATS.items():
+            source = opaque if pil_format == "JPEG" else im
+            for w in derivative_widths(width):
+                rel_path = f"{RESPONSIVE_DIR}/{stem}.{digest[:HASH_LENGTH]}.{w}w{ext}"
+                resized = source if w == width else source.resize((w, round(height * w / width)), Image.LANCZOS)
+                resized.save(os.path.join(image_dir, rel_path), pil_format, **save_kwargs)
+                variants.setdefault(fmt, []).append([w, rel_path])
+    return {
+        "hash": digest,
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "width": width,
+        "height": height,
+        "variants": variants,
+    }
+
+
+def build_responsive_images(
+    image_dir: str = IMAGE_DIR,
+    sources: Optional[List[str]] = None,
+    force: bool = False,
+    dry_run: bool = False,
+) -> List[str]:
+    """
+    為原圖製作衍生檔：僅處理新增或內容已變更之原圖，並刪除已無原圖之衍生檔。
+
+    :param sources: 待處理之原圖檔名；None 表 image_dir 下所有原圖
+    :param force: 不論衍生檔清單，全部重新製作
+    :param dry_run: 僅列出須製作之原圖，不寫入檔案
+    :return: 須製作（dry_run 時）或已製作之原圖檔名
+    """
+    images = load_image_manifest(image_dir)
+    names = list_source_images(image_dir) if sources is None else sources
+    stale = [
+        name
+        for name in names
+        if os.path.exists(os.path.join(image_dir, name))
+        and (force or not _is_up_to_date(image_dir, images.get(name), os.path.join(image_dir, name)))
+    ]
+    if dry_run:
+        return stale
+    if stale and not HAS_PILLOW:
+        print("警告：未安裝 Pillow 套件，無法製作圖片衍生檔")
+        print("可執行：pip install Pillow")
+        return []
+
+    os.makedirs(os.path.join(image_dir, RESPONSIVE_DIR), exist_ok=True)
+    for name in stale:
+        images[name] = _make_derivatives(image_dir, name)
+    if sources is None:
+        for name in set(images) - set(names):
+            del images[name]
+
+    # 刪除已不在清單中之衍生檔（原圖已變更或已刪除者）
+    in_use = {os.path.basename(p) for entry in images.values() for p in _variant_paths(entry)}
+    responsive_dir = os.path.join(image_dir, RESPONSIVE_DIR)
+    for filename in os.listdir(responsive_dir):
+        if filename != IMAGE_MANIFEST_FILE and filename not in in_use:
+            os.remove(os.path.join(responsive_dir, filename))
+
+    _save_image_manifest(image_dir, images)
+    return stale
+
+
+# =========================================================================
+# <picture> 標籤
+# =========================================================================
+def picture_html(
+    name: str,
+    image_dir: str = IMAGE_DIR,
+    url_prefix: str = IMAGE_URL_PREFIX,
+    alt: str = "",
+    display_width: int = DISPLAY_WIDTH,
+) -> Optional[str]:
+    """
+    產生原圖之 <picture> 標籤：WebP 及 JPEG 衍生檔之 srcset、明確之寬高及 loading="lazy"。
+
+    :param name: 原圖檔名（相對於 image_dir）
+    :return: 原圖尚無衍生檔者，傳回 None
+    """
+    entry = load_image_manifest(image_dir).get(name)
+    if not entry or not entry.get("variants"):
+        return None
+
+    width = min(display_width, entry["width"])
+    height = round(entry["height"] * width / entry["width"])
+    sizes = f"(max-width: {width}px) 100vw, {width}px"
+
+    def url(rel_path):
+        return url_prefix + quote(rel_path, safe="/")
+
+    def srcset(variants):
+        return ", ".join(f"{url(path)} {w}w" for w, path in variants)
+
+    sources = [
+        f'<source type="{MIME_TYPES[fmt]}" srcset="{srcset(entry["variants"][fmt])}" sizes="{sizes}">'
+        for fmt in DERIVATIVE_FORMATS
+        if fmt != "jpeg" and fmt in entry["variants"]
+    ]
+    fallback = entry["variants"].get("jpeg") or next(iter(entry["variants"].values()))
+    src = next((path for w, path in fallback if w >= width), fallback[-1][1])
+    alt = alt.replace('"', "&quot;")
+    img = (
+        f'<img src="{url(src)}" srcset="{srcset(fallback)}" sizes="{sizes}" '
+        f'width="{width}" height="{height}" loading="lazy" decoding="async" alt="{alt}">'
+    )
+    return "<picture>" + "".join(sources) + img + "</picture>"
+
+
+def header_image_html(image_url, alt: str = "", image_dir: str = IMAGE_DIR, generate: bool = True) -> Optional[str]:
+    """
+    文章圖片（env 工作表之【IMAGE_URL】）之 <picture> 標籤；generate 為 True 者，先為該圖
+    製作衍生檔。
+
+    :return: 外部網址、無此原圖或尚無衍生檔者，傳回 None（網頁改用原圖）
+    """
+    name = str(image_url or "").strip()
+    if not name or name == "None" or name.lower().startswith(("http://", "https://")):
+        return None
+    if generate:
+        build_responsive_images(image_dir, sources=[name])
+    return picture_html(name, image_dir, alt=alt)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="為 docs/assets/images 下之圖片製作 WebP/JPEG 衍生檔")
+    parser.add_argument("--images", default=IMAGE_DIR)
+    add_build_arguments(parser)
+    cli_args = parser.parse_args()
+
+    updated = build_responsive_images(cli_args.images, force=cli_args.force, dry_run=cli_args.dry_run)
+    action = "須製作" if cli_args.dry_run else "已製作"
+    for name in updated:
+        print(f"{action}：{name}")
+    print(f"共 {len(updated)} 張圖片{action}衍生檔。")
@@ -0,0 +1,174 @@
+"""
+mod_網頁壓縮.py v0.1.1
+
+【精簡網頁】輸出模式：去除標音網頁之縮排及標籤間之空白、合併相鄰之純文字 <span>，
+並另存 .html.gz／.html.br 預先壓縮檔，供支援預先壓縮檔之靜態網站主機直接傳送。
+
+原作法：a400 及 a940 每個漢字輸出一個 <ruby>，其前有五個 Tab 字元、其後有換行；
+每個標點符號各自包在一個 <span> 中；長篇文章之網頁，未壓縮前即達數百 KB。
+
+<script>、<style>、<pre>、<textarea> 之內容不予更動。標籤間之空白，鄰接區塊層級標籤或
+<ruby>、<rt> 等標籤者方去除；二行內標籤（如：</b> <i>）間之空白，瀏覽器會顯示，故縮成一個空格。
+
+.br 檔須安裝 brotli 套件；未安裝者，僅輸出 .gz 檔（並刪除過時之 .br 檔）。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 compact_html()、write_html() 及 write_precompressed() 函式。
+v0.1.1 2026-10-18: 行內標籤間之空白縮成一個空格，不再一律去除，以免改變網頁之顯示。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import gzip
+import os
+import re
+from typing import Dict, Optional
+
+try:
+    import brotli
+
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+GZIP_EXTENSION = ".gz"
+BROTLI_EXTENSION = ".br"
+
+# 內容不可更動之區塊
+_RAW_BLOCK = re.compile(r"<(script|style|pre|textarea)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+# 標籤間之空白：group(1)、group(3) 為前、後標籤之名稱（"!" 表註解或 <!DOCTYPE>）
+_BETWEEN_TAGS = re.compile(r"<(!|/?[A-Za-z][\w-]*)[^>]*>(\s+)(?=<(!|/?[A-Za-z][\w-]*))")
+# 鄰接下列標籤之空白，不影響顯示，可去除
+_STRIP_SPACE_TAGS = frozenset(
+    "! html head body title meta link base script style noscript template "
+    "div p h1 h2 h3 h4 h5 h6 ul ol li dl dt dd table caption thead tbody tfoot tr th td "
+    "section article aside header footer nav main figure figcaption picture source "
+    "blockquote pre form fieldset legend hr br address details summary "
+    "ruby rb rt rtc rp".split()
+)
+_LEADING_SPACE = re.compile(r"^\s+(?=<)")
+_TRAILING_SPACE = re.compile(r"(?<=>)\s+$")
+# 相鄰之純文字（無屬性）<span>；其間之空格併入文字
+_PLAIN_SPAN_RUN = re.compile(r"<span>[^<]*</span>(?: ?<span>[^<]*</span>)+")
+_PLAIN_SPAN_JOINT = re.compile(r"</span>( ?)<span>")
+
+
+# =========================================================================
+# 精簡網頁
+# =========================================================================
+def _compact_gap(match) -> str:
+    tag = match.group(0)[: match.start(2) - match.start()]
+    names = (match.group(1).lstrip("/").lower(), match.group(3).lstrip("/").lower())
+    return tag if any(name in _STRIP_SPACE_TAGS for name in names) else tag + " "
+
+
+def _compact_markup(text: str) -> str:
+    text = _BETWEEN_TAGS.sub(_compact_gap, text)
+    text = _TRAILING_SPACE.sub("", _LEADING_SPACE.sub("", text))
+    return _PLAIN_SPAN_RUN.sub(lambda m: _PLAIN_SPAN_JOINT.sub(r"\1", m.group(0)), text)
+
+
+def compact_html(html: str) -> str:
+    """
+    精簡網頁：去除標籤間之空白（縮排、換行；行內標籤間者縮成一個空格），並將相鄰之
+    純文字 <span> 合併成一個。
+
+    範例:
+        >>> compact_html("<p>\\n\\t<ruby>春<rt>cun1</rt></ruby>\\n\\t<span>，</span><span>「</span>\\n</p>")
+        '<p><ruby>春<rt>cun1</rt></ruby><span>，「</span></p>'
+        >>> compact_html("<p><b>春</b>\\n\\t<i>天</i></p>")
+        '<p><b>春</b> <i>天</i></p>'
+    """
+    parts = []
+    pos = 0
+    for match in _RAW_BLOCK.finditer(html):
+        parts.append(_compact_markup(html[pos : match.start()]))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(_compact_markup(html[pos:]))
+    return "".join(parts)
+
+
+# =========================================================================
+# 預先壓縮檔
+# =========================================================================
+def write_precompressed(path: str, data: Optional[bytes] = None) -> Dict[str, int]:
+    """
+    為 path 另存 .gz（及 .br）預先壓縮檔。
+
+    :param data: path 之內容；None 表自 path 讀取
+    :return: 各壓縮檔之大小：{"gzip": 位元組數, "brotli": 位元組數}
+    """
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    sizes = {}
+    # mtime=0：內容未變更者，壓縮檔亦不變
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(path + GZIP_EXTENSION, "wb") as f:
+        f.write(compressed)
+    sizes["gzip"] = len(compressed)
+
+    br_path = path + BROTLI_EXTENSION
+    if HAS_BROTLI:
+        compressed = brotli.compress(data, quality=11)
+        with open(br_path, "wb") as f:
+            f.write(compressed)
+        sizes["brotli"] = len(compressed)
+    elif os.path.exists(br_path):
+        os.remove(br_path)
+    return sizes
+
+
+def refresh_precompressed(path: str) -> bool:
+    """path 已有預先壓縮檔者（如網頁經後製改寫），重新製作；傳回是否已重新製作"""
+    if any(os.path.exists(path + ext) for ext in (GZIP_EXTENSION, BROTLI_EXTENSION)):
+        write_precompressed(path)
+        return True
+    return False
+
+
+def write_html(path: str, html: str, compact: bool = False, precompress: bool = False) -> Dict:
+    """
+    寫入網頁檔（UTF-8），並傳回大小報告。
+
+    :param compact: 以 compact_html() 精簡網頁
+    :param precompress: 另存 .gz／.br 預先壓縮檔
+    :return: {"path", "original": 原網頁大小, "output": 寫入之大小, "gzip", "brotli"}（位元組數）
+    """
+    report = {"path": path, "original": len(html.encode("utf-8"))}
+    if compact:
+        html = compact_html(html)
+    data = html.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    report["output"] = len(data)
+    if precompress:
+        report.update(write_precompressed(path, data))
+    return report
+
+
+def format_size_report(report: Dict) -> str:
+    """大小報告之文字，如：《春》.html：412.3 KB → 188.0 KB（-54.4%），gzip 21.5 KB，brotli 17.9 KB"""
+
+    def kb(size):
+        return f"{size / 1024:.1f} KB"
+
+    original, output = report["original"], report["output"]
+    saved = (original - output) / original * 100 if original else 0.0
+    text = f"{os.path.basename(report['path'])}：{kb(original)} → {kb(output)}（-{saved:.1f}%）"
+    for key in ("gzip", "brotli"):
+        if key in report:
+            text += f"，{key} {kb(report[key])}"
+    return text
+
+
+def add_output_arguments(parser):
+    """為命令列解析器，加入輸出模式參數：--compact、--precompress"""
+    parser.add_argument("--compact", action="store_true", help="輸出精簡網頁（去除縮排、合併相鄰之 <span>）")
+    parser.add_argument("--precompress", action="store_true", help="另存 .html.gz／.html.br 預先壓縮檔")
+    return parser
@@ -0,0 +1,414 @@
+"""
+mod_網頁後製.py v0.1.1
+
+【網頁後製】管線（Post-processing Pipeline）：每個網頁僅讀取一次，依序套用已登錄之
+各後製步驟（pass），輸出內容有變更者始寫回檔案。
+
+原作法：各後製程式各自走訪並改寫整個 docs/ 目錄：
+  - _temp_add_cache_buster.py：為 styles.css 加上 ?v= 版本號；
+  - _temp_inject_inline_style.py：於 </head> 前加入導覽列之內嵌樣式；
+  - _temp_add_article_nav.py：於文章網頁之頁首及頁尾加入導覽列；
+  - patch_docs_phonetics.py：加入 phonetic_switcher.js，並為 <ruby> 補上 data-tlpa。
+以上各程式現皆改為以本管線執行，且僅登錄其對應之後製步驟（見 PASS_NAMES）。
+
+【資源指紋】（Asset Fingerprinting）：docs/assets/ 下之 CSS 及 JavaScript 檔，依其內容
+之雜湊值另存一份帶指紋之檔案（如 styles.css → styles.1a2b3c4d.css），網頁中之引用
+一併改寫；資源內容未變更者，檔名不變，瀏覽器快取持續有效，不再需要人工調整 ?v= 版本號。
+
+管線以【網站建置清單】之單一後製步驟（POST_PROCESS_STEP）記錄：各步驟之版本及資源
+指紋皆未變更者，已處理過且未被修改之網頁不再讀取。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 PostProcessPipeline 類別、fingerprint_assets() 及 default_pipeline() 函式。
+v0.1.1 2026-10-18: default_pipeline() 及 main() 新增 passes 參數：僅登錄所列之後製步驟；
+  _temp_* 及 patch_docs_phonetics.py 不再執行整個管線。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import os
+import re
+import sqlite3
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from mod_網站建置 import (
+    DOCS_DIR,
+    BuildManifest,
+    add_build_arguments,
+    content_hash,
+    file_hash,
+    iter_html_pages,
+    run_post_processor,
+)
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+POST_PROCESS_STEP = "post_process"
+# 預設管線之後製步驟，依套用順序
+PASS_NAMES = ("phonetic_patch", "article_nav", "nav_inline_style", "asset_fingerprint")
+
+# 加上指紋之資源：docs/assets/ 下之子目錄及副檔名
+ASSET_DIRS = ("styles", "javascripts")
+ASSET_EXTENSIONS = (".css", ".js")
+FINGERPRINT_LENGTH = 8
+
+# 文章網頁（加入導覽列、標音切換器者）之範圍
+ARTICLE_IGNORE_DIRS = ["_test", "_archived", "金鋼經", "assets"]
+ARTICLE_IGNORE_FILES = ["index.html", "_template.html", "output_from_excel.html", "search.html"]
+
+# 補上 data-tlpa 時，查詢漢字讀音之資料庫
+HO_LOK_UE_DB = "Ho_Lok_Ue.db"
+
+Transform = Callable[[str, str], str]
+
+
+# =========================================================================
+# 後製管線
+# =========================================================================
+class PostProcessPass:
+    """
+    後製步驟。
+
+    Args:
+        name: 步驟名稱
+        transform: 後製函式：transform(html, 相對路徑) → 新 html；須可重複套用（冪等）
+        version: 步驟之版本；變更者，所有網頁重新套用管線
+        ignore_dirs: 不套用本步驟之目錄（相對路徑之任一層）
+        ignore_files: 不套用本步驟之檔名
+    """
+
+    def __init__(
+        self,
+        name: str,
+        transform: Transform,
+        version: str = "1",
+        ignore_dirs: Sequence[str] = (),
+        ignore_files: Sequence[str] = (),
+    ):
+        self.name = name
+        self.transform = transform
+        self.version = version
+        self.ignore_dirs = tuple(ignore_dirs)
+        self.ignore_files = tuple(ignore_files)
+
+    def applies_to(self, rel_path: str) -> bool:
+        parts = rel_path.split("/")
+        if parts[-1] in self.ignore_files:
+            return False
+        return not any(part in self.ignore_dirs for part in parts[:-1])
+
+
+class PostProcessPipeline:
+    """
+    網頁後製管線：各網頁讀取一次，依登錄順序套用各後製步驟。
+
+    範例:
+        >>> pipeline = PostProcessPipeline()
+        >>> pipeline.register("article_nav", add_article_nav, ignore_files=["index.html"])
+        >>> pipeline.run()
+    """
+
+    def __init__(self, docs_dir: str = DOCS_DIR, step: str = POST_PROCESS_STEP):
+        self.docs_dir = docs_dir
+        self.step = step
+        self.passes: List[PostProcessPass] = []
+
+    def register(self, name: str, transform: Transform, version: str = "1", **kwargs) -> "PostProcessPipeline":
+        """登錄後製步驟（參數同 PostProcessPass）"""
+        self.passes.append(PostProcessPass(name, transform, version, **kwargs))
+        return self
+
+    @property
+    def version(self) -> str:
+        """管線之版本：各步驟名稱及版本之雜湊值"""
+        return content_hash([[p.name, p.version] for p in self.passes])[:16]
+
+    def transform(self, html: str, rel_path: str) -> str:
+        for p in self.passes:
+            if p.applies_to(rel_path):
+                html = p.transform(html, rel_path)
+        return html
+
+    def run(
+        self,
+        manifest: Optional[BuildManifest] = None,
+        force: bool = False,
+        dry_run: bool = False,
+        pages: Optional[List[Tuple[str, str]]] = None,
+    ) -> List[str]:
+        """
+        對網站之網頁套用管線。
+
+        :param pages: 待處理之網頁；預設為 docs_dir 下所有 HTML 檔
+        :return: 須處理（dry_run 時）或已處理之網頁檔路徑
+        """
+        manifest = manifest or BuildManifest(docs_dir=self.docs_dir)
+        if pages is None:
+            pages = list(iter_html_pages(self.docs_dir, ignore_dirs=[], ignore_files=[]))
+        return run_post_processor(
+            self.step,
+            self.transform,
+            version=self.version,
+            manifest=manifest,
+            force=force,
+            dry_run=dry_run,
+            pages=pages,
+        )
+
+
+# =========================================================================
+# 資源指紋
+# =========================================================================
+_FINGERPRINTED_NAME = re.compile(rf"^(?P<stem>.+)\.[0-9a-f]{{{FINGERPRINT_LENGTH}}}(?P<ext>\.css|\.js)$")
+
+_ASSET_REF = re.compile(
+    r"""(?P<head>(?:href|src)\s*=\s*(?P<q>["'])[^"']*?assets/)(?P<dir>styles|javascripts)/"""
+    rf"""(?P<name>[^"'?#/]+?)(?:\.[0-9a-f]{{{FINGERPRINT_LENGTH}}})?(?P<ext>\.css|\.js)(?:\?[^"']*)?(?P=q)"""
+)
+
+
+def fingerprint_assets(docs_dir: str = DOCS_DIR, dry_run: bool = False) -> Dict[str, str]:
+    """
+    為 docs/assets/ 下之 CSS 及 JavaScript 檔，另存帶內容指紋之檔案，並刪除過時之指紋檔。
+
+    :return: {原資源路徑: 指紋檔路徑}，路徑相對於 docs/assets/，如
+             {"styles/styles.css": "styles/styles.1a2b3c4d.css"}
+    """
+    asset_map = {}
+    for asset_dir in ASSET_DIRS:
+        full_dir = os.path.join(docs_dir, "assets", asset_dir)
+        if not os.path.isdir(full_dir):
+            continue
+        filenames = set(os.listdir(full_dir))
+        current = set()
+        for filename in sorted(filenames):
+            stem, ext = os.path.splitext(filename)
+            match = _FINGERPRINTED_NAME.match(filename)
+            if ext not in ASSET_EXTENSIONS or (match and match["stem"] + match["ext"] in filenames):
+                continue
+            source = os.path.join(full_dir, filename)
+            fingerprinted = f"{stem}.{file_hash(source)[:FINGERPRINT_LENGTH]}{ext}"
+            asset_map[f"{asset_dir}/{filename}"] = f"{asset_dir}/{fingerprinted}"
+            current.add(fingerprinted)
+            if not dry_run and fingerprinted not in filenames:
+                with open(source, "rb") as src, open(os.path.join(full_dir, fingerprinted), "wb") as dst:
+                    dst.write(src.read())
+        if dry_run:
+            continue
+        for filename in sorted(filenames - current):
+            match = _FINGERPRINTED_NAME.match(filename)
+            if match and match["stem"] + match["ext"] in filenames:
+                os.remove(os.path.join(full_dir, filename))
+    return asset_map
+
+
+def make_asset_fingerprint_pass(asset_map: Dict[str, str]) -> Transform:
+    """改寫網頁中之資源引用（含 ?v= 版本號），改指向帶指紋之檔案"""
+
+    def rewrite(match):
+        fingerprinted = asset_map.get(f"{match['dir']}/{match['name']}{match['ext']}")
+        if fingerprinted is None:
+            return match.group(0)
+        return f"{match['head']}{fingerprinted}{match['q']}"
+
+    def transform(html: str, rel_path: str) -> str:
+        return _ASSET_REF.sub(rewrite, html)
+
+    return transform
+
+
+# =========================================================================
+# 後製步驟
+# =========================================================================
+NAV_TEMPLATE = """<nav class="main-nav">
+  <ul>
+    <li><a href="{rel_path}">回到首頁</a></li>
+  </ul>
+</nav>"""
+
+
+def add_article_nav(html: str, rel_file_path: str) -> str:
+    """於 <body> 後及 </body> 前加入導覽列；舊之導覽列及浮動【回首頁】按鈕一併移除"""
+    nav_html = NAV_TEMPLATE.replace("{rel_path}", "../" * rel_file_path.count("/") + "index.html")
+
+    html = re.sub(r'<a href="[^"]*index.html" class="floating-home-btn"[^>]*>.*?</a>', "", html, flags=re.DOTALL)
+    html = re.sub(r'\n?<nav class="main-nav">.*?</nav>', "", html, flags=re.DOTALL)
+    if "<body" in html:
+        html = re.sub(r"(<body[^>]*>)", lambda m: m.group(1) + "\n" + nav_html, html, count=1)
+        html = re.sub(r"(</body>)", lambda m: nav_html + "\n" + m.group(1), html, count=1)
+    return html
+
+
+NAV_INLINE_STYLE = """
+<style id="nav-horizontal-fix">
+/* 絕對橫向排列與防跑版 */
+nav.main-nav {
+    display: flex !important;
+    flex-direction: row !important;
+    justify-content: flex-start !important;
+    align-items: center !important;
+    flex-wrap: nowrap !important; /* 絕對不換行 */
+    overflow-x: auto !important; /* 允許橫向捲動 */
+    overflow-y: hidden !important;
+    width: 100% !important;
+    max-width: 100vw !important;
+    background: #f8f9fa !important;
+    padding: 15px 20px !important;
+    margin: 20px 0 !important;
+    border-radius: 10px !important;
+    box-sizing: border-box !important;
+    -webkit-overflow-scrolling: touch !important;
+}
+
+nav.main-nav ul {
+    display: flex !important;
+    flex-direction: row !important;
+    flex-wrap: nowrap !important; /* 絕對不換行 */
+    justify-content: flex-start !important;
+    align-items: center !important;
+    width: max-content !important; /* 讓 ul 自適應內容長度 */
+    max-width: none !important;
+    padding: 0 !important;
+    margin: 0 !important;
+    list-style: none !important;
+    gap: 15px !important;
+}
+
+nav.main-nav ul li {
+    display: flex !important;
+    flex-direction: row !important;
+    align-items: center !important;
+    margin: 0 !important;
+    padding: 0 !important;
+    white-space: nowrap !important; /* 單一按鈕不折行 */
+    flex-shrink: 0 !important;      /* 防止按鈕被擠壓 */
+}
+
+nav.main-nav ul li a,
+nav.main-nav ul li span {
+    display: inline-block !important;
+    white-space: nowrap !important;
+}
+
+/* 如果是手機螢幕太小，強制消除 body 被限制寬度造成的影響 */
+body {
+    max-width: 100% !important;
+}
+</style>
+"""
+
+
+def inject_nav_style(html: str, rel_path: str) -> str:
+    """於 </head> 前加入導覽列之內嵌樣式（先移除舊者）"""
+    html = re.sub(r'\n?<style id="nav-horizontal-fix">.*?</style>\n*', "", html, flags=re.DOTALL)
+    return html.replace("</head>", NAV_INLINE_STYLE + "\n</head>", 1)
+
+
+def load_tlpa_mapping(db_path: str = HO_LOK_UE_DB) -> Dict[str, List[str]]:
+    """自【漢字庫】讀出各漢字之讀音：{漢字: [台語音標, ...]}"""
+    conn = sqlite3.connect(db_path)
+    try:
+        mapping: Dict[str, List[str]] = {}
+        for han_ji, tlpa in conn.execute("SELECT 漢字, 台羅音標 FROM 漢字庫"):
+            mapping.setdefault(han_ji, []).append(tlpa)
+        return mapping
+    finally:
+        conn.close()
+
+
+def make_phonetic_patch_pass(db_path: str = HO_LOK_UE_DB) -> Transform:
+    """
+    加入 phonetic_switcher.js，並為未標 data-tlpa 之 <ruby> 補上讀音（依 <rt> 之標音或
+    資料庫之第一個讀音）；資料庫僅於遇到須補 data-tlpa 之網頁時才載入。
+    """
+    mapping: Dict[str, List[str]] = {}
+    loaded = []
+
+    def ruby_replacer(match):
+        full_ruby = match.group(0)
+        han_ji_match = re.search(r"<ruby>\s*([^<>\s\n]+)", full_ruby)
+        if not han_ji_match:
+            return full_ruby
+        tlpas = mapping.get(han_ji_match.group(1).strip())
+        if not tlpas:
+            return full_ruby
+        rt_match = re.search(r"<rt>([^<>]+)</rt>", full_ruby)
+        curr_rt = rt_match.group(1).strip() if rt_match else ""
+        tlpa = curr_rt if curr_rt in tlpas else tlpas[0]
+        return full_ruby.replace("<ruby>", f'<ruby data-tlpa="{tlpa}">', 1)
+
+    def transform(html: str, rel_path: str) -> str:
+        if "phonetic_switcher" not in html:
+            src = "../" * rel_path.count("/") + "assets/javascripts/phonetic_switcher.js"
+            html = html.replace("</head>", f'    <script type="text/javascript" src="{src}"></script>\n</head>', 1)
+        if "<ruby>" not in html:
+            return html
+        if not loaded:
+            if os.path.exists(db_path):
+                mapping.update(load_tlpa_mapping(db_path))
+            loaded.append(True)
+        return re.sub(r"<ruby>.*?</ruby>", ruby_replacer, html, flags=re.DOTALL)
+
+    return transform
+
+
+def default_pipeline(
+    docs_dir: str = DOCS_DIR, dry_run: bool = False, passes: Optional[Sequence[str]] = None
+) -> PostProcessPipeline:
+    """
+    網站之預設後製管線：
+      1. phonetic_patch：加入標音切換器，補上 data-tlpa（文章網頁）；
+      2. article_nav：加入導覽列（文章網頁）；
+      3. nav_inline_style：導覽列之內嵌樣式；
+      4. asset_fingerprint：資源引用改指向帶指紋之檔案。
+
+    :param passes: 僅登錄所列之步驟；None 表全部。未列 asset_fingerprint 者，不製作指紋檔；
+                   僅列部份步驟者，以另一後製步驟名稱記入建置清單，與完整管線互不影響
+    """
+    passes = PASS_NAMES if passes is None else tuple(passes)
+    unknown = [name for name in passes if name not in PASS_NAMES]
+    if unknown:
+        raise ValueError(f"不明之後製步驟：{', '.join(unknown)}（可用：{', '.join(PASS_NAMES)}）")
+    selected = [name for name in PASS_NAMES if name in passes]
+    step = POST_PROCESS_STEP if len(selected) == len(PASS_NAMES) else f"{POST_PROCESS_STEP}:{'+'.join(selected)}"
+
+    pipeline = PostProcessPipeline(docs_dir, step=step)
+    article_scope = {"ignore_dirs": ARTICLE_IGNORE_DIRS, "ignore_files": ARTICLE_IGNORE_FILES}
+    if "phonetic_patch" in selected:
+        pipeline.register("phonetic_patch", make_phonetic_patch_pass(), **article_scope)
+    if "article_nav" in selected:
+        pipeline.register("article_nav", add_article_nav, **article_scope)
+    if "nav_inline_style" in selected:
+        pipeline.register("nav_inline_style", inject_nav_style)
+    if "asset_fingerprint" in selected:
+        asset_map = fingerprint_assets(docs_dir, dry_run=dry_run)
+        pipeline.register(
+            "asset_fingerprint", make_asset_fingerprint_pass(asset_map), version=content_hash(asset_map)[:16]
+        )
+    return pipeline
+
+
+def main(args, passes: Optional[Sequence[str]] = None) -> List[str]:
+    """執行網頁後製；passes 見 default_pipeline()"""
+    pipeline = default_pipeline(args.docs, dry_run=args.dry_run, passes=passes)
+    touched = pipeline.run(BuildManifest(docs_dir=args.docs), force=args.force, dry_run=args.dry_run)
+    action = "須後製" if args.dry_run else "已後製"
+    for path in touched:
+        print(f"{action}：{path}")
+    print(f"共 {len(touched)} 個網頁{action}。")
+    return touched
+
+
+def build_arg_parser(description: str = "docs 網站之網頁後製：導覽列、標音切換器、資源指紋"):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--docs", default=DOCS_DIR)
+    add_build_arguments(parser)
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_arg_parser().parse_args())
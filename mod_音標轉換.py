@@ -0,0 +1,587 @@
+"""
+mod_音標轉換.py v0.1.2
+
+【音標轉換引擎】（Transliterator）：將台羅拼音（TL）、白話字（POJ）、台語音標（TLPA）、
+閩拼（BP）之【帶調符】或【帶調號】音標，轉換成【台語音標】。
+
+原 tng_im_piau、tng_tiau_ho、separate_tone、apply_tone、handle_o_dot，於 mod_標音、
+mod_帶調符音標、a121 各有一份近乎相同之複本：每轉換一個音標，需做數次 Unicode
+標準化（NFC/NFD），以 str.replace 逐一試換聲母，再依序比對【韻母轉換字典】之各鍵。
+
+Transliterator 之改善：
+  - 聲母、韻母轉換表，於模組載入時編成【字首樹】（trie），以最長比對一次掃描完成；
+  - 帶調符音標僅做一次 NFD 解構，同時取得：拼音字母、調符、o͘ 之圓點、ⁿ；
+  - 以【原輸入音標 + 轉換方式】為鍵，留存轉換結果（有上限之 LRU 快取）；
+  - convert() 可一次轉換整個音標清單，或以空白/連字號分隔之整句音標。
+
+韻母轉換增列 oonn → oonn（保持不變），令 o͘ⁿ（白話字）或 oonn 不再被 onn → oonn
+誤轉成 ooonn。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 Transliterator 類別；mod_標音、mod_帶調符音標、a121 之
+       音標轉換函式，改由本模組處理。
+v0.1.1 2026-10-18: 移除 bench_im_piau_tng_huan() 及舊版轉換函式之複本（_lib_音標轉換_舊版）；
+       與舊版相同之轉換結果，改由 test_mod_音標轉換 以固定之預期值核對。
+v0.1.2 2026-10-18: 恢復 bench_im_piau_tng_huan() 及 --bench：以【漢字庫】所有音節，比較
+       mod_標音、mod_帶調符音標 逐音節呼叫之轉換函式與 Transliterator.convert() 之處理量。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import re
+import sqlite3
+import time
+import unicodedata
+from functools import lru_cache
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+# 輸入音標之拼音系統
+TL = "TL"  # 台羅拼音
+POJ = "POJ"  # 白話字
+TLPA = "TLPA"  # 台語音標
+BP = "BP"  # 閩拼
+TIAU_HU = "帶調符"  # 帶調符之台羅拼音/白話字（輸入）；保持原拼寫，調號改為調符（輸出）
+
+# 輸出格式（TLPA 為【帶調號台語音標】）
+TIAU_HO = "帶調號"  # 保持原拼寫，調符改為調號
+TLPA_JI_BU = "TLPA字母"  # 拼音字母改為台語音標，調符（或調號）保持原樣
+
+SRC_LIST = (TL, POJ, TLPA, BP, TIAU_HU)
+DST_LIST = (TLPA, TLPA_JI_BU, TIAU_HO, TIAU_HU)
+
+# 快取筆數上限
+DEFAULT_CACHE_SIZE = 16384
+
+# 設定標點符號過濾
+PUNCTUATIONS = (",", ".", "?", "!", ":", ";", "\u200b")
+
+# 調號
+TIAU_HO_JI = "0123456789"
+
+# 上標數字調號 → 一般數字
+SUPERSCRIPT_TRANS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+
+# 入聲韻尾
+JIP_SIANN_BUE = "hptkHPTK"
+
+# 整句音標中之各音節：以空白、連字號或標點符號分隔
+IM_PIAU_PATTERN = re.compile(r"[^\s\-" + re.escape("".join(PUNCTUATIONS)) + "]+")
+
+# 聲調符號（NFD 解構後之結合字元）→ 調號
+TIAU_HU_TNG_TIAU_HO = {
+    "\u0301": "2",  # 2 陰上: ó
+    "\u0300": "3",  # 3 陰去: ò
+    "\u0302": "5",  # 5 陽平: ô
+    "\u030c": "6",  # 6 陽上: ǒ
+    "\u0304": "7",  # 7 陽去: ō
+    "\u030d": "8",  # 8 陽入: o̍
+    "\u030b": "9",  # 9 輕聲: ő
+    "\u0306": "9",  # 9 輕聲: ŏ
+}
+
+# 調號 → 聲調符號
+TIAU_HO_TNG_TIAU_HU = {
+    "2": "\u0301",
+    "3": "\u0300",
+    "5": "\u0302",
+    "6": "\u030c",
+    "7": "\u0304",
+    "8": "\u030d",
+    "9": "\u030b",
+}
+
+# 白話字 o͘ 之圓點（NFD 解構後之結合字元）
+O_TIAM = "\u0358"
+
+# 聲母轉換：台羅拼音（tsh/ts）、白話字（chh/ch）→ 台語音標（c/z）
+SIANN_BU_TNG_HUAN = {
+    "tsh": "c",
+    "ts": "z",
+    "chh": "c",
+    "ch": "z",
+}
+
+# 韻母轉換：於音標中以最長比對替換
+UN_BU_TNG_HUAN = {
+    "ee": "e",
+    "ei": "e",
+    "er": "e",
+    "erh": "eh",
+    "or": "o",
+    "ere": "ue",
+    "ereh": "ueh",
+    "ir": "i",
+    "eng": "ing",
+    "ek": "ik",
+    "oa": "ua",
+    "oe": "ue",
+    "oai": "uai",
+    "ou": "oo",
+    "onn": "oonn",
+    "oonn": "oonn",  # 已是台語音標，保持不變
+    "uei": "ue",
+    "ueinn": "uenn",
+    "ur": "u",
+}
+
+# 閩拼聲母 → 台語音標聲母（y、w 為零聲母之 i、u 介音）
+BP_SIANN_BU_TNG_HUAN = {
+    "b": "p",
+    "bb": "b",
+    "bbn": "m",
+    "p": "ph",
+    "d": "t",
+    "t": "th",
+    "ln": "n",
+    "l": "l",
+    "z": "z",
+    "zz": "j",
+    "c": "c",
+    "s": "s",
+    "g": "k",
+    "gg": "g",
+    "ggn": "ng",
+    "k": "kh",
+    "h": "h",
+    "y": "i",
+    "w": "u",
+}
+
+# 閩拼韻母 → 台語音標韻母（整個韻母相符者才轉換）
+BP_UN_BU_TNG_HUAN = {
+    "niao": "iaunn",
+    "nuai": "uainn",
+    "nua": "uann",
+    "niu": "iunn",
+    "nio": "ionn",
+    "nia": "iann",
+    "nai": "ainn",
+    "noo": "oonn",
+    "na": "ann",
+    "ne": "enn",
+    "ni": "inn",
+    "iao": "iau",
+    "ao": "au",
+}
+
+# 閩拼調號 → 台語音標調號（閩拼之陰上、陽上同為 3，轉為陰上）
+BP_TIAU_HO_TNG_TLPA = {
+    "0": "0",
+    "1": "1",
+    "2": "5",
+    "3": "2",
+    "5": "3",
+    "6": "7",
+    "7": "4",
+    "8": "8",
+}
+
+# 閩拼聲調符號 → 閩拼調號：(舒聲, 入聲)
+BP_TIAU_HU_TNG_TIAU_HO = {
+    "\u030a": ("0", "0"),
+    "\u0304": ("1", "7"),
+    "\u0301": ("2", "8"),
+    "\u030c": ("3", "3"),
+    "\u0300": ("5", "5"),
+    "\u0302": ("6", "6"),
+}
+
+
+# =========================================================================
+# 字首樹
+# =========================================================================
+def build_trie(mapping: dict) -> dict:
+    """
+    將轉換表編成字首樹：{字母: 子樹}，子樹以 None 為鍵存放轉換結果。
+    """
+    trie = {}
+    for key, value in mapping.items():
+        node = trie
+        for ji_bu in key:
+            node = node.setdefault(ji_bu, {})
+        node[None] = value
+    return trie
+
+
+def trie_pattern(trie: dict) -> str:
+    """
+    將字首樹編成正規表示式：各節點之子樹以貪婪比對優先，節點本身為鍵者列為
+    選用（?），故比對結果即為最長相符之鍵；比對作業由 re 模組（C 實作）執行。
+    """
+    branches = [re.escape(ji_bu) + trie_pattern(child) for ji_bu, child in trie.items() if ji_bu is not None]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if None in trie:
+        pattern = f"{pattern}?" if len(branches) > 1 or len(pattern) == 1 else f"(?:{pattern})?"
+    return pattern
+
+
+def compile_trie(mapping: dict):
+    """將轉換表編成【最長比對】之正規表示式"""
+    return re.compile(trie_pattern(build_trie(mapping)))
+
+
+def _tng_un_bu(u_hap) -> str:
+    return UN_BU_TNG_HUAN[u_hap.group()]
+
+
+SIANN_BU_PATTERN = compile_trie(SIANN_BU_TNG_HUAN)
+UN_BU_PATTERN = compile_trie(UN_BU_TNG_HUAN)
+BP_SIANN_BU_PATTERN = compile_trie(BP_SIANN_BU_TNG_HUAN)
+
+
+# =========================================================================
+# 調符處理
+# =========================================================================
+def separate_tone(im_piau):
+    """拆解帶調字母為無調字母與調號"""
+    decomposed = unicodedata.normalize("NFD", im_piau)
+    letters = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+    tones = "".join(c for c in decomposed if unicodedata.category(c) == "Mn" and c != O_TIAM)
+    return letters, tones
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def tiau_hu_ui_ti(im_piau: str) -> int:
+    """
+    依 TLPA 響度優先規則，找出【無調符音標】中應標示調符之字母位置。
+    """
+    tone_priority = ["a", "oo", "e", "o", "i", "u", "m"]
+    lower = im_piau.lower()
+
+    # 特例：ere → 最後 e
+    if "ere" in lower:
+        return lower.rindex("e")
+
+    # 特例：iu / ui 雙母音（不限定結尾）
+    for i in range(len(lower) - 1):
+        if lower[i : i + 2] in ("iu", "ui"):
+            return i + 1
+
+    # 特例：oo → 第一個 o
+    if "oo" in lower:
+        return lower.index("oo")
+
+    # 響度優先分析
+    best_idx = -1
+    best_priority = len(tone_priority) + 1
+    i = 0
+    while i < len(lower):
+        if lower[i] == "o" and i + 1 < len(lower) and lower[i + 1] == "o":
+            current = "oo"
+            idx = i
+            i += 1
+        else:
+            current = lower[i]
+            idx = i
+
+        if current in tone_priority:
+            pri = tone_priority.index(current)
+            if pri < best_priority:
+                best_idx = idx
+                best_priority = pri
+            elif pri == best_priority and current in ["i", "u"]:
+                best_idx = idx
+        i += 1
+
+    # 韻化輔音 ng：標於 n；其餘找不到者，標於首字母
+    if best_idx == -1 and "ng" in lower:
+        return lower.index("ng")
+    return best_idx if best_idx != -1 else 0
+
+
+def apply_tone(im_piau, tone):
+    """
+    根據 TLPA 響度優先規則，將聲調符號 tone 正確標示在母音上。
+    """
+    idx = tiau_hu_ui_ti(im_piau)
+    return unicodedata.normalize("NFC", im_piau[: idx + 1] + tone + im_piau[idx + 1 :])
+
+
+def handle_o_dot(im_piau):
+    """將白話字之 o͘（o 右上方帶圓點）轉換成 oo，並保留聲調符號"""
+    decomposed = unicodedata.normalize("NFD", im_piau)
+    # 找出 o + 聲調 + 圓點的特殊組合
+    match = re.search(r"(o)([\u0300\u0301\u0302\u0304\u030b\u030c\u030d]?)(\u0358)", decomposed, re.I)
+    if match:
+        letter, tone, _ = match.groups()
+        decomposed = decomposed.replace(match.group(), f"{letter}{tone}{letter}")
+    return unicodedata.normalize("NFC", decomposed)
+
+
+# =========================================================================
+# 音標轉換引擎
+# =========================================================================
+class Transliterator:
+    """
+    音標轉換引擎
+
+    Args:
+        maxsize: 轉換結果之快取筆數上限
+
+    範例:
+        >>> engine = Transliterator()
+        >>> engine.convert("Tsiânn-sī", TL, TLPA)
+        'Ziann5-si7'
+        >>> engine.convert(["chhù", "o͘"], POJ, TLPA)
+        ['cu3', 'oo1']
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self._tng_huan_im_ziat = lru_cache(maxsize=maxsize)(self._tng_huan)
+
+    # ---------------------------------------------------------------------
+    # 對外介面
+    # ---------------------------------------------------------------------
+    def convert(self, text_or_list, src: str = TIAU_HU, dst: str = TLPA, po_ci: bool = True, kan_hua: bool = False):
+        """
+        轉換音標。
+
+        Args:
+            text_or_list: 單一音標、以空白/連字號分隔之整句音標，或音標清單
+            src: 輸入之拼音系統：TL、POJ、TLPA、BP、帶調符（帶調符或帶調號音標皆可）
+            dst: 輸出格式：
+                 TLPA：帶調號台語音標；
+                 TLPA字母：拼音字母改為台語音標，調符（或調號）保持原樣；
+                 帶調號：保持原拼寫，調符改為調號；
+                 帶調符：保持原拼寫，調號改為調符
+            po_ci: 保留音標之首字母大寫；否則一律小寫
+            kan_hua: 簡化：帶調號之輸出，聲調為 1 或 4 者，略去調號
+
+        Returns:
+            與輸入同型態之轉換結果（str 或 list）
+        """
+        if src not in SRC_LIST:
+            raise ValueError(f"不支援之拼音系統：{src}")
+        if dst not in DST_LIST or (src == BP and dst not in (TLPA, TIAU_HO)):
+            raise ValueError(f"不支援之轉換：{src} → {dst}")
+
+        if isinstance(text_or_list, str):
+            return self._convert_text(text_or_list, src, dst, po_ci, kan_hua)
+        return [self._convert_text(text, src, dst, po_ci, kan_hua) for text in text_or_list]
+
+    def cache_info(self):
+        return self._tng_huan_im_ziat.cache_info()
+
+    def cache_clear(self) -> None:
+        self._tng_huan_im_ziat.cache_clear()
+
+    # ---------------------------------------------------------------------
+    # 轉換作業
+    # ---------------------------------------------------------------------
+    def _convert_text(self, text: str, src: str, dst: str, po_ci: bool, kan_hua: bool) -> str:
+        if not text:
+            return text
+        if " " in text or "-" in text:
+            return IM_PIAU_PATTERN.sub(lambda m: self._tng_huan_im_ziat(m.group(), src, dst, po_ci, kan_hua), text)
+        return self._tng_huan_im_ziat(text, src, dst, po_ci, kan_hua)
+
+    def _tng_huan(self, im_piau: str, src: str, dst: str, po_ci: bool, kan_hua: bool) -> str:
+        # 遇標點符號，不做轉換處理，直接回傳
+        if im_piau[-1] in PUNCTUATIONS:
+            return im_piau
+
+        body = im_piau if im_piau.isascii() else im_piau.translate(SUPERSCRIPT_TRANS)
+        tiau_ho = ""
+        if body[-1] in TIAU_HO_JI:
+            body, tiau_ho = body[:-1], body[-1]
+
+        if dst == TIAU_HO:
+            return self._tng_tiau_ho(im_piau, body, tiau_ho, src, kan_hua)
+        if dst == TIAU_HU:
+            return self._tng_tiau_hu(im_piau, body, tiau_ho)
+
+        letters, tiau_hu = self._kai_kau(body)
+        if not letters:
+            return im_piau
+        tai_sia = letters[0].isupper()
+        letters = letters.lower()
+
+        if src == BP:
+            letters, tiau_ho = self._bp_tng_tlpa(letters, tiau_hu, tiau_ho)
+        else:
+            # 聲母：僅比對音標起首之字母；韻母：全音標掃描
+            u_hap = SIANN_BU_PATTERN.match(letters)
+            if u_hap:
+                letters = SIANN_BU_TNG_HUAN[u_hap.group()] + letters[u_hap.end() :]
+            letters = UN_BU_PATTERN.sub(_tng_un_bu, letters)
+
+        if po_ci and tai_sia:
+            letters = letters[0].upper() + letters[1:]
+
+        if dst == TLPA_JI_BU:
+            if tiau_ho:
+                return letters + tiau_ho
+            return apply_tone(letters, tiau_hu) if tiau_hu else letters
+
+        # 傳入之音標已帶調號者，調號保持不變；否則依調符（無調符者依韻尾）定調號
+        if not tiau_ho:
+            tiau_ho = TIAU_HU_TNG_TIAU_HO.get(tiau_hu) or ("4" if letters[-1] in JIP_SIANN_BUE else "1")
+            if kan_hua and tiau_ho in ("1", "4"):
+                tiau_ho = ""
+        return letters + tiau_ho
+
+    @staticmethod
+    def _kai_kau(body: str):
+        """
+        解構音標：傳回 (拼音字母, 調符)。
+        o͘ 轉為 oo、ⁿ 轉為 nn，其餘結合字元（調符以外）一律略去。
+        """
+        if body.isascii():
+            return body, ""
+        letters = []
+        tiau_hu = ""
+        for ji_bu in unicodedata.normalize("NFD", body):
+            if ji_bu in TIAU_HU_TNG_TIAU_HO or ji_bu in BP_TIAU_HU_TNG_TIAU_HO:
+                tiau_hu = tiau_hu or ji_bu
+            elif ji_bu == O_TIAM:
+                letters.append("o")
+            elif ji_bu == "ⁿ":
+                letters.append("nn")
+            elif not unicodedata.combining(ji_bu):
+                letters.append(ji_bu)
+        return "".join(letters), tiau_hu
+
+    @staticmethod
+    def _tng_tiau_ho(im_piau: str, body: str, tiau_ho: str, src: str, kan_hua: bool) -> str:
+        """保持原拼寫，調符改為調號"""
+        # 已是帶調號音標，直接回傳
+        if tiau_ho:
+            return im_piau
+
+        tiau_hu = ""
+        if not body.isascii():
+            ji_bu_list = []
+            for ji_bu in unicodedata.normalize("NFD", body):
+                if ji_bu in TIAU_HU_TNG_TIAU_HO or ji_bu in BP_TIAU_HU_TNG_TIAU_HO:
+                    tiau_hu = tiau_hu or ji_bu
+                else:
+                    ji_bu_list.append(ji_bu)
+            body = unicodedata.normalize("NFC", "".join(ji_bu_list))
+
+        jip_siann = body[-1] in JIP_SIANN_BUE
+        if src == BP:
+            tiau_ho = BP_TIAU_HU_TNG_TIAU_HO[tiau_hu][jip_siann] if tiau_hu in BP_TIAU_HU_TNG_TIAU_HO else ""
+        else:
+            tiau_ho = TIAU_HU_TNG_TIAU_HO.get(tiau_hu, "")
+        if not tiau_ho:
+            tiau_ho = "4" if jip_siann else "1"
+        if kan_hua and tiau_ho in ("1", "4"):
+            tiau_ho = ""
+        return body + tiau_ho
+
+    @staticmethod
+    def _tng_tiau_hu(im_piau: str, body: str, tiau_ho: str) -> str:
+        """保持原拼寫，調號改為調符"""
+        if not tiau_ho:
+            return im_piau
+        tiau_hu = TIAU_HO_TNG_TIAU_HU.get(tiau_ho)
+        return apply_tone(body, tiau_hu) if tiau_hu else body
+
+    @staticmethod
+    def _bp_tng_tlpa(letters: str, tiau_hu: str, tiau_ho: str):
+        """閩拼（無調字母）→ 台語音標字母；閩拼調號/調符 → 台語音標調號"""
+        if letters in ("m", "ng"):
+            siann_bu, un_bu = "", letters
+        else:
+            u_hap = BP_SIANN_BU_PATTERN.match(letters)
+            siann_bu = BP_SIANN_BU_TNG_HUAN[u_hap.group()] if u_hap else ""
+            un_bu = letters[u_hap.end() :] if u_hap else letters
+
+        # 零聲母之 y/w：還原韻母首之 i/u 介音
+        if siann_bu in ("i", "u"):
+            un_bu = un_bu if un_bu.startswith(siann_bu) else siann_bu + un_bu
+            siann_bu = ""
+        un_bu = BP_UN_BU_TNG_HUAN.get(un_bu, un_bu)
+        letters = siann_bu + un_bu
+
+        if not tiau_ho:
+            jip_siann = letters[-1:] in ("h", "p", "t", "k")
+            tiau_ho = BP_TIAU_HU_TNG_TIAU_HO[tiau_hu][jip_siann] if tiau_hu in BP_TIAU_HU_TNG_TIAU_HO else "1"
+        return letters, BP_TIAU_HO_TNG_TLPA.get(tiau_ho, tiau_ho)
+
+
+# 共用之轉換引擎
+transliterator = Transliterator()
+
+
+def convert(text_or_list, src: str = TIAU_HU, dst: str = TLPA, po_ci: bool = True, kan_hua: bool = False):
+    """以共用之轉換引擎轉換音標；參數同 Transliterator.convert()"""
+    return transliterator.convert(text_or_list, src, dst, po_ci, kan_hua)
+
+
+# =========================================================================
+# 效能量測
+# =========================================================================
+def load_im_ziat_list(db_path: str = "Ho_Lok_Ue.db") -> list:
+    """自【漢字庫】取得所有不重複之【台羅音標】（帶調號）音節"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT DISTINCT 台羅音標 FROM 漢字庫").fetchall()
+    finally:
+        conn.close()
+    return sorted({row[0].strip() for row in rows if row[0] and re.fullmatch(r"[a-z]+\d", row[0].strip())})
+
+
+def bench_im_piau_tng_huan(db_path: str = "Ho_Lok_Ue.db", repeat: int = 3) -> list:
+    """
+    以【漢字庫】所有音節（帶調號及帶調符兩種寫法），比較各模組逐音節呼叫之轉換函式
+    （tng_tiau_ho(tng_im_piau(音標))），與 Transliterator.convert() 整批轉換之處理量。
+    逐音節呼叫者，每輪量測前先清除共用轉換引擎之快取。
+
+    Returns:
+        list: [(寫法, 音節數, mod_標音每秒音節數, mod_帶調符音標每秒音節數,
+                引擎首次每秒音節數, 引擎快取後每秒音節數, 結果不同之音節數), ...]
+    """
+    # 二模組皆載入本模組，於量測時才載入
+    import mod_帶調符音標
+    import mod_標音
+
+    tl_list = load_im_ziat_list(db_path)
+    corpora = {
+        "帶調號": tl_list,
+        "帶調符": Transliterator().convert(tl_list, TL, TIAU_HU),
+    }
+
+    def best_of(func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def tiok_im_ziat(module, corpus):
+        transliterator.cache_clear()
+        return [module.tng_tiau_ho(module.tng_im_piau(im_piau)) for im_piau in corpus]
+
+    results = []
+    for name, corpus in corpora.items():
+        piau_im_time, piau_im_result = best_of(lambda: tiok_im_ziat(mod_標音, corpus))
+        tiau_hu_time, _ = best_of(lambda: tiok_im_ziat(mod_帶調符音標, corpus))
+        cold_time, engine_result = best_of(lambda: Transliterator().convert(corpus, TIAU_HU, TLPA))
+        engine = Transliterator()
+        engine.convert(corpus, TIAU_HU, TLPA)
+        warm_time, _ = best_of(lambda: engine.convert(corpus, TIAU_HU, TLPA))
+        bo_siong_kang = sum(1 for kiu, sin in zip(piau_im_result, engine_result) if kiu != sin)
+        total = len(corpus)
+        results.append(
+            (name, total, total / piau_im_time, total / tiau_hu_time, total / cold_time, total / warm_time, bo_siong_kang)
+        )
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--bench" in sys.argv[1:]:
+        for name, total, piau_im, tiau_hu, cold, warm, diff in bench_im_piau_tng_huan():
+            print(
+                f"{name}：{total} 個音節；mod_標音 {piau_im:,.0f}/秒，mod_帶調符音標 {tiau_hu:,.0f}/秒，"
+                f"引擎首次 {cold:,.0f}/秒，引擎快取後 {warm:,.0f}/秒；結果不同：{diff}"
+            )
@@ -0,0 +1,201 @@
+"""
+mod_音節.py v0.1.0
+
+【音節】解析器（SyllableParser）：將【音標】拆解為【聲母】、【韻母】、【調號】。
+
+原 split_tai_gi_im_piau（mod_標音）、split_tlpa_im_piau（mod_帶調符音標）、
+split_tiau_ho（mod_TLPA_tng_huan）於每次呼叫時，重新編譯正規表示式，並對
+【帶調符音標】反覆進行 Unicode 標準化；而查字典（HanJiTian）逐筆、製作網頁
+（a400）逐儲存格呼叫，同一【音標】往往解析成千上萬次。
+
+SyllableParser 之改善：
+  - 正規表示式於模組載入時編譯一次；
+  - 以【原輸入音標】為鍵，留存解析結果（有上限之 LRU 快取）；
+  - 以數字調號結尾之音標（帶調號音標），不做調符判斷與 Unicode 標準化。
+
+各模組原有函式保留原名與傳回格式，改由本模組之解析器處理。
+
+更新紀錄：
+v0.1.0 2026-10-18: 新增 SyllableParser 類別。
+"""
+
+# =========================================================================
+# 載入程式所需套件/模組/函式庫
+# =========================================================================
+import re
+from functools import lru_cache
+
+# =========================================================================
+# 常數定義
+# =========================================================================
+# 快取筆數上限
+DEFAULT_CACHE_SIZE = 8192
+
+# 帶調號音標之調號
+TIAU_HO_JI = "123456789"
+
+# 上標數字調號 → 一般數字
+SUPERSCRIPT_TRANS = str.maketrans(
+    {
+        "⁰": "0",
+        "¹": "1",
+        "²": "2",
+        "³": "3",
+        "⁴": "4",
+        "⁵": "5",
+        "⁶": "6",
+        "⁷": "7",
+        "⁸": "8",
+        "⁹": "9",
+    }
+)
+
+# 聲母：包括常見的聲母，但不包括作為韻母（韻化輔音）之 m 和 ng
+SIANN_BU_PATTERN = re.compile(r"(b|c|z|g|h|j|kh|k|l|m(?!\d)|ng(?!\d)|n|ph|p|s|th|t|Ø)")
+# 韻化輔音：m 或 ng 當作韻母
+UN_BU_AS_M_OR_NG_PATTERN = re.compile(r"(m|ng)\d")
+# 無調音標 + 調號：羅馬拼音字母 + 數字
+BO_TIAU_IM_PIAU_TIAU_HO_PATTERN = re.compile(r"^([a-z]+)(\d+)$")
+
+# 聲母相容性轉換：台羅拼音（tsh/ts）、白話字（chh/ch）→ 台語音標（c/z）
+TL_SIANN_BU_TNG_HUAN = (("tsh", "c"), ("ts", "z"))
+POJ_SIANN_BU_TNG_HUAN = TL_SIANN_BU_TNG_HUAN + (("chh", "c"), ("ch", "z"))
+
+
+def bo_tng_huan(im_piau: str) -> str:
+    return im_piau
+
+
+# =========================================================================
+# 音節解析器
+# =========================================================================
+class SyllableParser:
+    """
+    【音節】解析器
+
+    Args:
+        tng_un_bu: 韻母轉換函數（如：mod_標音.un_bu_tng_huan）
+        tng_tiau_hu: 將【帶調符音標】轉換成【帶調號音標】之函數；
+                     傳入之音標若非帶調符音標，應原樣傳回
+        maxsize: 各解析方法之快取筆數上限
+    """
+
+    def __init__(self, tng_un_bu=None, tng_tiau_hu=None, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.tng_un_bu = tng_un_bu or bo_tng_huan
+        self.tng_tiau_hu = tng_tiau_hu or bo_tng_huan
+        self._split_tai_gi_im_piau = lru_cache(maxsize=maxsize)(self._parse_tai_gi_im_piau)
+        self._split_tlpa_im_piau = lru_cache(maxsize=maxsize)(self._parse_tlpa_im_piau)
+        self._split_tiau_ho = lru_cache(maxsize=maxsize)(self._parse_tiau_ho)
+
+    # ---------------------------------------------------------------------
+    # 對外介面：傳回格式與原函式相同（每次傳回新的 list）
+    # ---------------------------------------------------------------------
+    def split_tai_gi_im_piau(self, im_piau: str, po_ci: bool = False) -> list:
+        """
+        將【台語音標】（可為帶調符音標）分解為【聲母】、【韻母】、【調號】
+
+        :return: [聲母, 韻母, 調號]
+        """
+        return list(self._split_tai_gi_im_piau(im_piau, po_ci))
+
+    def split_tlpa_im_piau(self, im_piau: str, po_ci: bool = False):
+        """
+        將【無調號音標】分解為【聲母】、【韻母】、【調號】
+
+        :return: [聲母, 韻母, 調號]；傳入之音標已帶調號者，原樣傳回音標字串
+        """
+        result = self._split_tlpa_im_piau(im_piau, po_ci)
+        return result if isinstance(result, str) else list(result)
+
+    def split_tiau_ho(self, im_piau: str):
+        """
+        將【音標】分解為【無調音標】與【調號】
+
+        :return: (無調音標, 調號)；不符【羅馬拼音字母 + 數字】格式者，傳回 [音標, None]
+        """
+        result = self._split_tiau_ho(im_piau)
+        return list(result) if result[1] is None and result[0] is not None else result
+
+    def cache_info(self) -> dict:
+        return {
+            "split_tai_gi_im_piau": self._split_tai_gi_im_piau.cache_info(),
+            "split_tlpa_im_piau": self._split_tlpa_im_piau.cache_info(),
+            "split_tiau_ho": self._split_tiau_ho.cache_info(),
+        }
+
+    def cache_clear(self) -> None:
+        self._split_tai_gi_im_piau.cache_clear()
+        self._split_tlpa_im_piau.cache_clear()
+        self._split_tiau_ho.cache_clear()
+
+    # ---------------------------------------------------------------------
+    # 解析作業
+    # ---------------------------------------------------------------------
+    def _parse_tai_gi_im_piau(self, im_piau: str, po_ci: bool) -> tuple:
+        # 以數字調號結尾者，已是帶調號音標，不需判斷調符
+        if im_piau[-1] not in TIAU_HO_JI:
+            im_piau = self.tng_tiau_hu(im_piau)
+        return self._split(im_piau.lower(), po_ci, TL_SIANN_BU_TNG_HUAN)
+
+    def _parse_tlpa_im_piau(self, im_piau: str, po_ci: bool):
+        if im_piau[-1] in TIAU_HO_JI:
+            return im_piau
+        return self._split(im_piau.lower(), po_ci, POJ_SIANN_BU_TNG_HUAN)
+
+    def _split(self, im_piau: str, po_ci: bool, siann_bu_tng_huan) -> tuple:
+        tiau = im_piau[-1].translate(SUPERSCRIPT_TRANS)
+
+        # 矯正未標明陰平/陰入調號的情況
+        if tiau in "ptkh":
+            tiau = "4"
+            im_piau += tiau
+        elif tiau in "aeioumng":
+            tiau = "1"
+            im_piau += tiau
+
+        # 聲母相容性轉換
+        for old, new in siann_bu_tng_huan:
+            if im_piau.startswith(old):
+                im_piau = new + im_piau[len(old) :]
+                break
+
+        # 首先檢查是否是 m 或 ng 當作韻母的特殊情況
+        if UN_BU_AS_M_OR_NG_PATTERN.match(im_piau):
+            siann_bu = ""
+            un_bu = im_piau[:-1]
+            tiau = im_piau[-1]
+        else:
+            siann_bu_match = SIANN_BU_PATTERN.match(im_piau)
+            if siann_bu_match:
+                siann_bu = siann_bu_match.group()
+                un_bu = im_piau[len(siann_bu) : -1]
+            else:
+                siann_bu = ""
+                un_bu = im_piau[:-1]
+
+        # 轉換韻母
+        un_bu = self.tng_un_bu(un_bu)
+
+        # 調整聲母大小寫
+        if po_ci and siann_bu:
+            siann_bu = siann_bu[0].upper() + siann_bu[1:]
+
+        return siann_bu, un_bu, tiau
+
+    @staticmethod
+    def _parse_tiau_ho(im_piau: str) -> tuple:
+        if not im_piau:
+            return None, None
+
+        # 清除前後【空白】
+        im_piau = im_piau.strip()
+        if not im_piau:
+            return None, None
+
+        # 確認傳入之音標符合格式：羅馬拼音字母 + 數字（上標數字先轉成一般數字）
+        u_hap = BO_TIAU_IM_PIAU_TIAU_HO_PATTERN.match(im_piau.translate(SUPERSCRIPT_TRANS))
+        if not u_hap:
+            return im_piau, None
+
+        # 提取：【無調音標】（聲母+韻母）和【調號】
+        return u_hap.group(1), u_hap.group(2)
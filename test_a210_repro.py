@@ -9,7 +9,9 @@ if 'xlwings' not in sys.modules:
     sys.modules['xlwings'] = MagicMock()
 
 # Mock openpyxl since only part of mod_file_access is used or we want to avoid import errors
-if 'openpyxl' not in sys.modules:
+try:
+    import openpyxl  # noqa: F401
+except ImportError:
     sys.modules['openpyxl'] = MagicMock()
 
 # Ensure the module can be imported
@@ -66,6 +66,9 @@ def tearDownModule():
             sys.modules.pop(name, None)
         else:
             sys.modules[name] = module
+    # 以替身模組載入之模組，須自快取移除，令其他測試重新載入
+    for name in ("a400_製作標音網頁", "mod_標音網頁"):
+        sys.modules.pop(name, None)
 
 
 class FakeRange:
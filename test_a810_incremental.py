@@ -0,0 +1,86 @@
+import importlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+DB_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Ho_Lok_Ue.db")
+
+
+class TestIncrementalRimeExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # test_a400_title_author 於收集測試時，以假模組取代 mod_標音；故於執行時才載入
+        cls.a810 = importlib.import_module("a810_匯出製成中州韻字典檔【台羅拼音】")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "Ho_Lok_Ue.db")
+        shutil.copyfile(DB_NAME, self.db_path)
+        self.output = os.path.join(self.tmp_dir, "tl_ji_khoo_peh_ue.dict.yaml")
+        self.state = os.path.join(self.tmp_dir, "export_state.json")
+        self.dest_dir = os.path.join(self.tmp_dir, "rime")
+        os.mkdir(self.dest_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def row_count(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM 漢字庫").fetchone()[0]
+
+    def export(self, force=False):
+        return self.a810.export_database_to_rime_yaml(
+            force=force,
+            db_name=self.db_path,
+            output_filename=self.output,
+            state_filename=self.state,
+            dest_dirs=[self.dest_dir],
+        )
+
+    def test_unchanged_database_skips_rewrite(self):
+        self.assertEqual(self.export(), self.a810.EXIT_CODE_SUCCESS)
+        mtime = os.stat(self.output).st_mtime_ns
+        dest_file = os.path.join(self.dest_dir, os.path.basename(self.output))
+        self.assertEqual(self.a810.file_hash(dest_file), self.a810.file_hash(self.output))
+
+        os.utime(self.output, ns=(mtime - 10**9, mtime - 10**9))
+        self.assertEqual(self.export(), self.a810.EXIT_CODE_SUCCESS)
+        self.assertEqual(os.stat(self.output).st_mtime_ns, mtime - 10**9)
+        self.assertEqual(self.a810.load_export_state(self.state)["浮水印"]["筆數"], self.row_count())
+
+    def test_watermark_change_regenerates(self):
+        self.export()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT INTO 漢字庫 (漢字, 台羅音標, 常用度, 更新時間) VALUES ('𪜶', 'in1', 0.9, '2099-01-01 00:00:00')"
+            )
+        self.export()
+        with open(self.output, encoding="utf-8") as f:
+            self.assertIn("𪜶\tin1\t0.9\t", f.read())
+        self.assertEqual(self.a810.load_export_state(self.state)["浮水印"]["更新時間"], "2099-01-01 00:00:00")
+
+    def test_deleted_rows_regenerate(self):
+        self.export()
+        with sqlite3.connect(self.db_path) as conn:
+            han_ji = conn.execute("SELECT 漢字 FROM 漢字庫 ORDER BY 識別號 LIMIT 1").fetchone()[0]
+            conn.execute("DELETE FROM 漢字庫 WHERE 識別號 = (SELECT MIN(識別號) FROM 漢字庫)")
+        before = self.a810.load_export_state(self.state)["內容雜湊"]
+        self.export()
+        self.assertNotEqual(self.a810.load_export_state(self.state)["內容雜湊"], before)
+        self.assertIsNotNone(han_ji)
+
+    def test_modified_output_is_rewritten(self):
+        self.export()
+        with open(self.output, "a", encoding="utf-8") as f:
+            f.write("\n改動")
+        self.export()
+        self.assertEqual(
+            self.a810.file_hash(self.output),
+            self.a810.load_export_state(self.state)["內容雜湊"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from mod_ca_ji_tian import (
+    IM_PIAU_KIAN_COLUMNS,
+    HanJiTian,
+    ensure_im_piau_soo_in,
+    han_ji_ca_piau_im_list,
+    im_piau_ca_han_ji,
+)
+from mod_database import connection_manager
+
+ROWS = [
+    # (漢字, 台羅音標, 常用度, 最近揀用時間)
+    ("東", "tong1", 0.8, None),
+    ("東", "tang1", 0.6, None),
+    ("東", "tong2", 0.3, None),
+    ("行", "hing5", 1.0, None),
+    ("行", "hing7", 0.7, None),
+    ("行", "kiann5", 0.6, "2026-10-01 08:00:00"),
+    ("行", "hang5", 0.6, "2026-10-18 08:00:00"),
+    ("行", "hong7", 0.5, None),
+    ("丌", "ki1", None, None),
+]
+
+
+class HanJiTianTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "Ho_Lok_Ue.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE 漢字庫 (
+                識別號 INTEGER PRIMARY KEY AUTOINCREMENT,
+                漢字 TEXT, 台羅音標 TEXT, 常用度 REAL, 摘要說明 TEXT,
+                更新時間 TEXT, 最近揀用時間 TEXT
+            )
+            """
+        )
+        conn.executemany("INSERT INTO 漢字庫 (漢字, 台羅音標, 常用度, 最近揀用時間) VALUES (?, ?, ?, ?)", ROWS)
+        conn.commit()
+        conn.close()
+
+        self.sql_ji_tian = HanJiTian(self.db_path)
+        self.ji_tian = HanJiTian(self.db_path, preload=True)
+
+    def tearDown(self):
+        connection_manager.close(self.db_path)
+        self.tmp_dir.cleanup()
+
+
+class TestHanJiTianPreload(HanJiTianTestCase):
+    def test_results_match_sql_queries(self):
+        for han_ji in ("東", "行", "丌", "無"):
+            for ue_im_lui_piat in ("文讀音", "白話音", "其它", "全部"):
+                self.assertEqual(
+                    self.ji_tian.han_ji_ca_piau_im(han_ji, ue_im_lui_piat),
+                    self.sql_ji_tian.han_ji_ca_piau_im(han_ji, ue_im_lui_piat),
+                    f"{han_ji}／{ue_im_lui_piat}",
+                )
+            self.assertEqual(
+                self.ji_tian.han_ji_ca_piau_im(han_ji, display_all_piau_im=True),
+                self.sql_ji_tian.han_ji_ca_piau_im(han_ji, display_all_piau_im=True),
+            )
+        for tai_lo_im_piau in ("tong2", "tang1", "tsang1"):
+            self.assertEqual(
+                self.ji_tian.han_ji_ca_piau_im("東", "文讀音", tai_lo_im_piau=tai_lo_im_piau),
+                self.sql_ji_tian.han_ji_ca_piau_im("東", "文讀音", tai_lo_im_piau=tai_lo_im_piau),
+            )
+
+    def test_bai_ue_im_skips_bun_thok_im_band(self):
+        result = self.ji_tian.han_ji_ca_piau_im("行", "白話音")
+        # 通用音在前；同常用度者，最近揀用者優先
+        self.assertEqual([item["台語音標"] for item in result], ["hing5", "hang5", "kiann5", "hong7"])
+        result = self.ji_tian.han_ji_ca_piau_im("行", "文讀音")
+        self.assertEqual([item["台語音標"] for item in result], ["hing5", "hing7"])
+        self.assertEqual(result[0]["聲母"], "h")
+
+    def test_results_are_copies(self):
+        self.ji_tian.han_ji_ca_piau_im("東")[0]["台語音標"] = "xxx"
+        self.assertEqual(self.ji_tian.han_ji_ca_piau_im("東")[0]["台語音標"], "tong1")
+
+    def test_invalidate_reloads_table(self):
+        self.assertEqual(self.ji_tian.han_ji_ca_piau_im("東", "文讀音")[0]["台語音標"], "tong1")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE 漢字庫 SET 常用度 = 1.0 WHERE 台羅音標 = 'tang1'")
+        conn.commit()
+        conn.close()
+
+        # 未失效前，仍使用已載入之索引
+        self.assertEqual(self.ji_tian.han_ji_ca_piau_im("東", "文讀音")[0]["台語音標"], "tong1")
+        self.ji_tian.invalidate()
+        self.assertEqual(self.ji_tian.han_ji_ca_piau_im("東", "文讀音")[0]["台語音標"], "tang1")
+
+
+class TestHanJiTianBatch(HanJiTianTestCase):
+    def test_batch_uses_one_query(self):
+        ji_tian = HanJiTian(self.db_path)
+        with ji_tian.get_connection() as conn:
+            ji_tian._get_time_order_column(conn)
+        statements = []
+        conn.set_trace_callback(statements.append)
+
+        result = ji_tian.han_ji_ca_piau_im_batch(list("東行東丌無行"), "白話音")
+
+        self.assertEqual(len([sql for sql in statements if "SELECT" in sql]), 1)
+        self.assertEqual(list(result), ["東", "行", "丌", "無"])
+        self.assertIsNone(result["無"])
+        for han_ji in ("東", "行", "丌"):
+            self.assertEqual(result[han_ji], self.sql_ji_tian.han_ji_ca_piau_im(han_ji, "白話音"))
+        conn.set_trace_callback(None)
+
+    def test_list_function_matches_single_lookups(self):
+        result = han_ji_ca_piau_im_list(["東", "行"], "文讀音", db_path=self.db_path)
+        self.assertEqual(result["行"], self.sql_ji_tian.han_ji_ca_piau_im("行", "文讀音"))
+
+
+class TestImPiauCaHanJi(HanJiTianTestCase):
+    """未建立反查索引之資料庫：查詢時逐筆計算索引鍵"""
+
+    def table_columns(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return {row[1] for row in conn.execute("PRAGMA table_info(漢字庫)")}
+        finally:
+            conn.close()
+
+    def han_ji(self, im_piau, ca_huat="exact", **kwargs):
+        return [item["漢字"] for item in self.sql_ji_tian.im_piau_ca_han_ji(im_piau, ca_huat=ca_huat, **kwargs)]
+
+    def test_exact_and_toneless(self):
+        self.assertEqual(self.han_ji("hing5"), ["行"])
+        self.assertEqual(self.han_ji("tong1"), ["東"])
+        self.assertEqual(self.han_ji("tóng"), ["東"])
+        self.assertEqual(self.han_ji("tong", "toneless"), ["東", "東"])
+        self.assertEqual(self.han_ji("tong", "toneless", ue_im_lui_piat="其它"), ["東"])
+        self.assertEqual(self.han_ji("tsiann5"), [])
+
+    def test_prefix_and_un_bu(self):
+        result = self.sql_ji_tian.im_piau_ca_han_ji("h", ca_huat="prefix")
+        self.assertEqual([item["台語音標"] for item in result], ["hang5", "hing5", "hing7", "hong7"])
+        self.assertEqual(self.han_ji("ong", "un_bu"), ["行", "東", "東"])
+        with self.assertRaises(ValueError):
+            self.sql_ji_tian.im_piau_ca_han_ji("", ca_huat="prefix")
+
+    def test_keys_follow_new_and_changed_readings(self):
+        self.assertEqual(self.han_ji("kiann5"), ["行"])
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("INSERT INTO 漢字庫 (漢字, 台羅音標, 常用度) VALUES ('京', 'kiann1', 0.6)")
+            conn.execute("UPDATE 漢字庫 SET 台羅音標 = 'kiann2' WHERE 漢字 = '行' AND 台羅音標 = 'kiann5'")
+        conn.close()
+        self.assertEqual(self.han_ji("kiann5"), [])
+        self.assertEqual(self.han_ji("kiann", "toneless"), ["京", "行"])
+        self.assertEqual(self.han_ji("kiann", "toneless", limit=1), ["京"])
+        self.assertEqual(im_piau_ca_han_ji("kiann2", db_path=self.db_path)[0]["漢字"], "行")
+
+    def test_lookup_does_not_write(self):
+        columns = self.table_columns()
+        self.han_ji("tong", "toneless")
+        self.assertEqual(self.table_columns(), columns)
+
+
+class TestImPiauCaHanJiSoInn(TestImPiauCaHanJi):
+    """已以 ensure_im_piau_soo_in() 建立反查索引之資料庫"""
+
+    def setUp(self):
+        super().setUp()
+        self.assertEqual(ensure_im_piau_soo_in(self.db_path), len(ROWS))
+
+    def test_lookup_does_not_write(self):
+        self.assertLessEqual(set(IM_PIAU_KIAN_COLUMNS), self.table_columns())
+        super().test_lookup_does_not_write()
+        # 新增之讀音，查詢後其索引鍵仍待補算
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("INSERT INTO 漢字庫 (漢字, 台羅音標, 常用度) VALUES ('京', 'kiann1', 0.6)")
+        self.assertEqual(self.han_ji("kiann1"), ["京"])
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM 漢字庫 WHERE 台語音標鍵 IS NULL").fetchone()[0], 1)
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from mod_database import DatabaseManager, SQLiteConnectionManager
+
+
+class TestSQLiteConnectionManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "漢字庫.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE 漢字庫 (漢字 TEXT, 台羅音標 TEXT)")
+        conn.execute("INSERT INTO 漢字庫 VALUES ('東', 'tong1')")
+        conn.commit()
+        conn.close()
+        self.manager = SQLiteConnectionManager()
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_read_connection_is_shared_and_read_only(self):
+        conn = self.manager.read_connection(self.db_path)
+        self.assertIs(self.manager.read_connection(self.db_path), conn)
+        self.assertEqual(conn.execute("PRAGMA query_only").fetchone()[0], 1)
+        self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -self.manager.cache_size_kb)
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM 漢字庫")
+
+    def test_each_thread_has_its_own_read_connection(self):
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.manager.read_connection(self.db_path)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], self.manager.read_connection(self.db_path))
+
+    def test_write_connection_keeps_rollback_journal(self):
+        conn = self.manager.write_connection(self.db_path)
+        self.assertIs(self.manager.write_connection(self.db_path), conn)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+
+        with conn:
+            conn.execute("INSERT INTO 漢字庫 VALUES ('西', 'se1')")
+        reader = self.manager.read_connection(self.db_path)
+        self.assertEqual(self.manager.fetchone(reader, "SELECT COUNT(*) FROM 漢字庫")[0], 2)
+
+    def test_stats_by_call_site(self):
+        conn = self.manager.read_connection(self.db_path)
+        for _ in range(3):
+            self.manager.fetchall(conn, "SELECT * FROM 漢字庫")
+        self.manager.fetchone(conn, "SELECT 1", call_site="自訂")
+
+        stats = self.manager.stats()
+        self.assertEqual(stats["test_mod_database:test_stats_by_call_site"]["次數"], 3)
+        self.assertEqual(stats["自訂"]["次數"], 1)
+        self.manager.reset_stats()
+        self.assertEqual(self.manager.stats(), {})
+
+    def test_close_reopens_on_next_use(self):
+        conn = self.manager.read_connection(self.db_path)
+        self.manager.close(self.db_path)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        self.assertIsNot(self.manager.read_connection(self.db_path), conn)
+
+
+class TestDatabaseManager(unittest.TestCase):
+    def test_uses_shared_write_connection(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "Ho_Lok_Ue.db")
+            db_manager = DatabaseManager()
+            db_manager.disconnect()
+            db_manager.connect(db_path)
+            try:
+                with db_manager.transaction():
+                    db_manager.execute("CREATE TABLE t (a)")
+                    db_manager.execute("INSERT INTO t VALUES (?)", (1,))
+                self.assertEqual(db_manager.fetchone("SELECT COUNT(*) FROM t")[0], 1)
+                self.assertEqual(db_manager.fetchone("PRAGMA journal_mode")[0], "delete")
+            finally:
+                db_manager.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
+
+from mod_儲存格格式 import (
+    StyleJournal,
+    coalesce_cells,
+    excel_color_to_rgb,
+    union_addresses,
+)
+
+
+class FakeFont:
+    def __init__(self, rng):
+        self.rng = rng
+
+    def __setattr__(self, name, value):
+        if name == "rng":
+            object.__setattr__(self, name, value)
+            return
+        self.rng.sheet.calls.append((self.rng.address, f"font.{name}", value))
+
+
+class FakeRange:
+    def __init__(self, sheet, address):
+        self.sheet = sheet
+        self.address = address
+
+    @property
+    def color(self):
+        return None
+
+    @color.setter
+    def color(self, value):
+        self.sheet.calls.append((self.address, "color", value))
+
+    @property
+    def font(self):
+        return FakeFont(self)
+
+
+class FakeSheet:
+    def __init__(self):
+        self.calls = []
+
+    def range(self, address):
+        return FakeRange(self, address)
+
+
+class TestCoalesce(unittest.TestCase):
+    def test_rows_and_columns_merge_into_rectangles(self):
+        cells = [(r, c) for r in (4, 5, 6) for c in range(4, 8)] + [(9, 4), (9, 6)]
+        self.assertEqual(coalesce_cells(cells), [(4, 4, 6, 7), (9, 4, 9, 4), (9, 6, 9, 6)])
+
+    def test_union_addresses_respect_length_limit(self):
+        blocks = [(row, 4, row, 18) for row in range(3, 483, 4)]
+        addresses = union_addresses(blocks)
+        self.assertTrue(all(len(address) <= 255 for address in addresses))
+        self.assertEqual(sum(len(address.split(",")) for address in addresses), 120)
+        self.assertTrue(addresses[0].startswith("D3:R3,D7:R7"))
+
+    def test_excel_color_is_bgr(self):
+        self.assertEqual(excel_color_to_rgb(0x009900), (0, 153, 0))
+        self.assertEqual(excel_color_to_rgb(0xFF0000), (0, 0, 255))
+        self.assertEqual(excel_color_to_rgb((255, 0, 0)), (255, 0, 0))
+
+
+class TestStyleJournal(unittest.TestCase):
+    def test_flush_applies_each_style_once_per_union(self):
+        sheet = FakeSheet()
+        journal = StyleJournal(sheet)
+        for col in range(4, 19):
+            journal.set_style(5, col, color=None, font_color=(0, 0, 0))
+            journal.set_style(3, col, color=(255, 255, 204))
+        # 後設定者覆蓋先設定者：缺字標紅
+        journal.set_style(5, 7, color=(255, 0, 0))
+
+        total_calls = journal.flush()
+
+        self.assertEqual(total_calls, 4)
+        self.assertIn(("D3:R3", "color", (255, 255, 204)), sheet.calls)
+        self.assertIn(("D5:F5,H5:R5", "color", None), sheet.calls)
+        self.assertIn(("G5", "color", (255, 0, 0)), sheet.calls)
+        self.assertIn(("D5:R5", "font.color", (0, 0, 0)), sheet.calls)
+        self.assertFalse(journal.is_dirty)
+
+    def test_unknown_style_attribute_is_rejected(self):
+        with self.assertRaises(ValueError):
+            StyleJournal(FakeSheet()).set_style(1, 1, border=1)
+
+
+class TestResetCellsFormatInSheet(unittest.TestCase):
+    def test_reset_over_xlsx_workbook(self):
+        from mod_excel_access import reset_cells_format_in_sheet
+        from mod_活頁簿 import XlsxBook
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "reset.xlsx")
+            wb = Workbook()
+            wb.active.title = "漢字注音"
+            wb.active["D5"] = "天"
+            # 漢字列之填滿色（如缺字之紅色標記），重置時不清除
+            wb.active["E5"].fill = PatternFill(fill_type="solid", start_color="FFFF0000", end_color="FFFF0000")
+            wb.save(file_path)
+
+            book = XlsxBook(file_path)
+            reset_cells_format_in_sheet(book, total_lines=3, start_row=5, start_col=4, end_col=6)
+            sheet = book.sheets["漢字注音"]
+
+            self.assertIsNone(sheet.range("D5").value)
+            self.assertEqual(sheet.range("E3").color, (255, 255, 204))
+            self.assertEqual(sheet.range("F11").color, (255, 255, 204))
+            self.assertIsNone(sheet.range("D5").color)
+            self.assertEqual(sheet.range("E5").color, (255, 0, 0))
+            self.assertEqual(sheet.range("D5").font.size, 48)
+            self.assertEqual(sheet.range("D6").font.color, (0, 153, 0))
+            self.assertEqual(sheet.range("F14").font.name, "芫荽 0.94")
+            book.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
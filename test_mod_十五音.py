@@ -0,0 +1,80 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from mod_database import connection_manager
+from mod_十五音 import (
+    SipNgooImHuanCiat,
+    ensure_han_ji_piau_soo_in,
+    get_huan_ciat,
+    han_ji_ca_piau_im,
+    huan_ciat_ca_piau_im,
+)
+
+DB_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "雅俗通十五音字典.db")
+
+
+class TestSipNgooImHuanCiat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.conn = sqlite3.connect(DB_NAME)
+        cls.cursor = cls.conn.cursor()
+        cls.huan_ciat = SipNgooImHuanCiat(cls.cursor)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.conn.close()
+
+    def test_ca_ciat_gu(self):
+        result = self.huan_ciat.ca_ciat_gu("君五求")
+        self.assertEqual(result["台語音標"], "kun5")
+        self.assertEqual((result["聲母"], result["韻母"], result["調"]), ("k", "un", 5))
+        self.assertIn("群", [record["漢字"] for record in result["漢字"]])
+
+        # 入聲取【促聲】韻母
+        self.assertEqual(self.huan_ciat.ca_ciat_gu("君四求")["台語音標"], "kut4")
+        self.assertIsNone(self.huan_ciat.ca_ciat_gu("君九求"))
+        self.assertIsNone(self.huan_ciat.ca_ciat_gu("君五"))
+
+    def test_matches_sql_queries(self):
+        for 字韻, 聲調, 切音 in [("君", "下平", "求"), ("堅", "上平", "柳"), ("君", "上入", "求")]:
+            self.assertEqual(
+                self.huan_ciat.huan_ciat_ca_piau_im(字韻, 聲調, 切音),
+                huan_ciat_ca_piau_im(self.cursor, 字韻, 聲調, 切音),
+            )
+        self.assertEqual(self.huan_ciat.han_ji_ca_piau_im("君"), han_ji_ca_piau_im(self.cursor, "君"))
+
+    def test_batch(self):
+        results = self.huan_ciat.ca_ciat_gu_batch(["君五求", "君一求", "君五求"])
+        self.assertEqual(list(results), ["君五求", "君一求"])
+        self.assertEqual(results["君一求"]["台語音標"], "kun1")
+
+    def test_engine_is_loaded_once(self):
+        self.assertIs(get_huan_ciat(DB_NAME), get_huan_ciat(DB_NAME))
+        connection_manager.close(DB_NAME)
+
+
+class TestHanJiPiauSooIn(unittest.TestCase):
+    def test_covering_indexes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "雅俗通十五音字典.db")
+            shutil.copyfile(DB_NAME, db_path)
+            conn = sqlite3.connect(db_path)
+            cursor = conn.cursor()
+            ensure_han_ji_piau_soo_in(cursor)
+            ensure_han_ji_piau_soo_in(cursor)
+
+            plan = cursor.execute(
+                "EXPLAIN QUERY PLAN SELECT 漢字, 十五音標音 FROM 漢字表 WHERE 字韻 = ? AND 切音 = ? AND 聲調 = ?",
+                ("君", "求", "下平"),
+            ).fetchall()
+            self.assertIn("COVERING INDEX idx_漢字表_切語", plan[0][-1])
+            plan = cursor.execute("EXPLAIN QUERY PLAN SELECT 漢字標音 FROM 漢字表 WHERE 漢字 = ?", ("君",)).fetchall()
+            self.assertIn("COVERING INDEX idx_漢字表_漢字", plan[0][-1])
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import importlib
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from mod_database import connection_manager
+from mod_廣韻_v5 import KONG_UN_HAN_JI_FIELDS
+
+
+def kong_un_row(字號, 漢字, 上字, 下字, 聲母標音, 韻母標音, 台羅聲調, 常用度=0.5):
+    record = dict.fromkeys(KONG_UN_HAN_JI_FIELDS)
+    record.update(
+        字號=字號, 漢字=漢字, 標音=f"{聲母標音}{韻母標音}{台羅聲調}", 常用度=常用度, 上字=上字, 下字=下字,
+        聲母標音=聲母標音, 韻母標音=韻母標音, 台羅聲調=台羅聲調,
+    )
+    return tuple(record[field] for field in KONG_UN_HAN_JI_FIELDS)
+
+
+class TestTngTlpa(unittest.TestCase):
+    def test_normalize_dictionary_piau_im(self):
+        # mod_字典聯查 依賴 mod_標音，於執行時才載入（test_a400 於收集測試時替換 mod_標音）
+        tng_tlpa = importlib.import_module("mod_字典聯查").tng_tlpa
+        self.assertEqual(tng_tlpa("qun1"), "un1")
+        self.assertEqual(tng_tlpa("tsiânn"), "ziann5")
+        self.assertEqual(tng_tlpa("tong1"), "tong1")
+        self.assertEqual(tng_tlpa(None), "")
+
+
+class TestLianCaJiTian(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.lian_ca = importlib.import_module("mod_字典聯查")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.kong_un_db = os.path.join(self.tmp_dir.name, "Kong_Un.db")
+        conn = sqlite3.connect(self.kong_un_db)
+        conn.execute(f"CREATE TABLE 廣韻漢字庫 ({', '.join(KONG_UN_HAN_JI_FIELDS)})")
+        conn.executemany(
+            f"INSERT INTO 廣韻漢字庫 VALUES ({', '.join('?' * len(KONG_UN_HAN_JI_FIELDS))})",
+            [
+                kong_un_row(1, "東", "德", "紅", "t", "ong", 1, 0.9),
+                # 濁上（第 6 調）等同第 2 調；影母（Ø）無聲母
+                kong_un_row(2, "東", "烏", "動", "Ø", "ong", 6),
+            ],
+        )
+        conn.commit()
+        conn.close()
+        self.sources = {
+            "河洛話": "Ho_Lok_Ue.db",
+            "十五音": "雅俗通十五音字典.db",
+            "廣韻": self.kong_un_db,
+        }
+
+    def tearDown(self):
+        connection_manager.close(self.kong_un_db)
+        self.tmp_dir.cleanup()
+
+    def test_merge_with_provenance(self):
+        with self.lian_ca.LianCaJiTian(self.sources) as ji_tian:
+            candidates = ji_tian.ca("東")
+
+        top = candidates[0]
+        self.assertEqual(top["台語音標"], "tong1")
+        self.assertEqual([lai_goan["字典"] for lai_goan in top["來源"]], ["河洛話", "十五音", "廣韻"])
+        self.assertIn("德紅切", self.lian_ca.format_lai_goan(top))
+        self.assertIn("ong2", [candidate["台語音標"] for candidate in candidates])
+
+        scores = [candidate["分數"] for candidate in candidates]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_batch_queries_distinct_han_ji(self):
+        with self.lian_ca.LianCaJiTian(self.sources) as ji_tian:
+            results = ji_tian.ca_batch(list("東西東"))
+        self.assertEqual(list(results), ["東", "西"])
+        self.assertTrue(results["西"])
+        for candidate in results["西"]:
+            self.assertEqual(candidate["漢字"], "西")
+
+    def test_missing_source_is_skipped(self):
+        missing_db = os.path.join(self.tmp_dir.name, "不存在.db")
+        sources = dict(self.sources, **{"廣韻": missing_db})
+        with self.lian_ca.LianCaJiTian(sources) as ji_tian:
+            self.assertEqual(ji_tian.available_sources(), ["河洛話", "十五音"])
+            candidates = ji_tian.ca("東")
+        self.assertEqual(candidates[0]["台語音標"], "tong1")
+        self.assertFalse(os.path.exists(missing_db))
+
+    def test_unknown_source_rejected(self):
+        with self.assertRaises(ValueError):
+            self.lian_ca.LianCaJiTian({"康熙": "Khong_Hi.db"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from copy import deepcopy
+
+from openpyxl import Workbook
+
+from mod_字庫 import JiKhooDict, JiKhooEntry, bench_ji_khoo_dict
+
+
+class TestJiKhooEntry(unittest.TestCase):
+    def test_entry_behaves_like_dict(self):
+        entry = JiKhooEntry("雨", "hoo7", "N/A", [(5, 14), [5, 17]])
+        self.assertEqual(entry["tai_gi_im_piau"], "hoo7")
+        self.assertEqual(entry.get("coordinates"), [(5, 14), (5, 17)])
+        self.assertEqual(entry, {"tai_gi_im_piau": "hoo7", "hau_ziann_im_piau": "N/A", "coordinates": [(5, 14), (5, 17)]})
+        self.assertIn((5, 17), entry["coordinates"])
+        self.assertFalse(hasattr(entry, "__dict__"))
+
+        entry["coordinates"].append((5, 14))
+        self.assertEqual(len(entry["coordinates"]), 2)
+        with self.assertRaises(KeyError):
+            entry["常用度"] = 1
+
+
+class TestJiKhooDictIndex(unittest.TestCase):
+    def setUp(self):
+        self.ji_khoo = JiKhooDict("標音字庫")
+        self.ji_khoo.add_entry("雨", "hoo7", "N/A", (5, 14))
+        self.ji_khoo.add_entry("天", "thian1", "N/A", (5, 4))
+        self.ji_khoo.add_entry("雨", "u2", "N/A", (5, 18))
+        self.ji_khoo.add_entry("雨", "hoo7", "N/A", (9, 4))
+
+    def test_rows_follow_sheet_order(self):
+        # 寫入順序：雨/hoo7、雨/u2、天/thian1
+        self.assertEqual(self.ji_khoo.get_row_by_han_ji_and_coordinate("雨", (9, 4)), 2)
+        self.assertEqual(self.ji_khoo.get_row_by_han_ji_and_coordinate("雨", (5, 18)), 3)
+        self.assertEqual(self.ji_khoo.get_row_by_han_ji_and_tai_gi_im_piau("天", "thian1"), 4)
+        self.assertEqual(self.ji_khoo.get_row_by_han_ji_and_coordinate("天", (5, 14)), -1)
+        self.assertEqual(self.ji_khoo.get_entry_by_row_no(3)[1]["tai_gi_im_piau"], "u2")
+        self.assertIsNone(self.ji_khoo.get_entry_by_row_no(5))
+        self.assertEqual([row[0] for row in self.ji_khoo.to_sheet_rows()], ["雨", "雨", "天"])
+
+    def test_entries_without_coordinates_are_skipped(self):
+        self.ji_khoo.remove_coordinate_by_han_ji_and_tai_gi_im_piau("雨", "u2", (5, 18))
+        self.assertEqual(len(self.ji_khoo), 3)
+        self.assertEqual(self.ji_khoo.get_row_by_han_ji_and_tai_gi_im_piau("天", "thian1"), 3)
+        self.assertEqual(self.ji_khoo.get_entry_by_row_no(3)[0], "天")
+
+        self.ji_khoo.update_entry("雨", "u2", "", (13, 6))
+        self.assertEqual(self.ji_khoo.get_row_by_han_ji_and_coordinate("雨", (13, 6)), 3)
+
+    def test_reverse_index_after_removal(self):
+        self.assertEqual(self.ji_khoo.get_entry_by_coordinate((5, 4))[0], "天")
+        self.ji_khoo.remove_coordinate_by_han_ji_and_coordinate("天", (5, 4))
+        self.assertIsNone(self.ji_khoo.get_entry_by_coordinate((5, 4)))
+        self.assertEqual(self.ji_khoo.ji_khoo_dict["天"], [])
+        self.assertEqual(len(self.ji_khoo), 2)
+
+        self.ji_khoo.add_or_update_entry("天", "thinn1", "N/A", (5, 4))
+        self.assertEqual(self.ji_khoo.get_tai_gi_im_piau_by_han_ji_and_coordinate("天", (5, 4)), "thinn1")
+
+    def test_update_whole_entry_reindexes_coordinates(self):
+        self.ji_khoo.update_whole_entry(2, "hoo7", "u7", [(21, 4)])
+        self.assertIsNone(self.ji_khoo.get_entry_by_coordinate((5, 14)))
+        self.assertEqual(self.ji_khoo.get_entry_by_han_ji_and_coordinate("雨", (21, 4))["hau_ziann_im_piau"], "u7")
+
+    def test_iteration_and_copy_compatibility(self):
+        self.assertEqual(len(self.ji_khoo), 3)
+        self.assertEqual(self.ji_khoo[0]["座標"], "(5, 14); (9, 4)")
+        self.assertEqual(self.ji_khoo[-1]["漢字"], "天")
+        self.assertEqual(len(list(self.ji_khoo)), 3)
+
+        before = deepcopy(self.ji_khoo.ji_khoo_dict)
+        self.ji_khoo.remove_coordinate_by_han_ji_and_tai_gi_im_piau("雨", "hoo7", (99, 99))
+        self.assertEqual(before, self.ji_khoo.ji_khoo_dict)
+
+    def test_write_to_excel_sheet(self):
+        from mod_活頁簿 import XlsxBook
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "ji_khoo.xlsx")
+            Workbook().save(file_path)
+            book = XlsxBook(file_path)
+
+            self.ji_khoo.write_to_excel_sheet(book, "標音字庫")
+            reloaded = JiKhooDict.create_ji_khoo_dict_from_sheet(book, "標音字庫")
+
+            self.assertEqual(book.sheets["標音字庫"].range("D2").value, "(5, 14); (9, 4)")
+            self.assertEqual(reloaded.ji_khoo_dict, self.ji_khoo.ji_khoo_dict)
+            book.close()
+
+
+class TestJiKhooDictBenchmark(unittest.TestCase):
+    def test_lookup_cost_does_not_grow_with_size(self):
+        (_, small), (_, large) = bench_ji_khoo_dict(sizes=(2000, 16000))
+        # 舊版逐筆掃描時，每字耗時隨字數等比增加（8 倍）；索引版應大致不變
+        self.assertLess(large, small * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from mod_database import connection_manager
+from mod_廣韻_v5 import KONG_UN_HAN_JI_FIELDS, KongUnHuanCiat, get_huan_ciat, huan_ciat_ca_piau_im
+
+
+def kong_un_row(字號, 漢字, 上字, 下字, 聲母標音, 清濁, 韻母標音, 調, 常用度=0.5):
+    record = dict.fromkeys(KONG_UN_HAN_JI_FIELDS)
+    record.update(
+        字號=字號, 漢字=漢字, 常用度=常用度, 上字=上字, 下字=下字,
+        聲母=f"{聲母標音}母", 聲母標音=聲母標音, 清濁=清濁,
+        韻母=f"{韻母標音}韻", 韻母標音=韻母標音, 調=調,
+    )
+    return tuple(record[field] for field in KONG_UN_HAN_JI_FIELDS)
+
+
+ROWS = [
+    # 東：德紅切；端母（全清）、東韻平聲
+    kong_un_row(1, "東", "德", "紅", "t", "全清", "ong", "平", 0.9),
+    kong_un_row(2, "凍", "德", "紅", "t", "全清", "ong", "平"),
+    # 同：徒紅切；定母（全濁）
+    kong_un_row(3, "同", "徒", "紅", "t", "全濁", "ong", "平"),
+    # 董：多動切；端母、董韻上聲
+    kong_un_row(4, "董", "多", "動", "t", "全清", "ong", "上"),
+    # 翁：烏紅切；影母（無聲母）
+    kong_un_row(5, "翁", "烏", "紅", "Ø", "全清", "ong", "平"),
+]
+
+
+class TestKongUnHuanCiat(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "Kong_Un.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(f"CREATE TABLE 廣韻漢字庫 ({', '.join(KONG_UN_HAN_JI_FIELDS)})")
+        conn.executemany(f"INSERT INTO 廣韻漢字庫 VALUES ({', '.join('?' * len(KONG_UN_HAN_JI_FIELDS))})", ROWS)
+        conn.commit()
+        self.cursor = conn.cursor()
+        self.conn = conn
+        self.huan_ciat = KongUnHuanCiat(self.cursor)
+
+    def tearDown(self):
+        self.conn.close()
+        connection_manager.close(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_ciat_gu_in_kong_un(self):
+        (result,) = self.huan_ciat.ca_ciat_gu("德紅")
+        self.assertEqual(result["廣韻調名"], "清平")
+        self.assertEqual(result["台語音標"], "tong1")
+        self.assertEqual([record["漢字"] for record in result["漢字"]], ["東", "凍"])
+        self.assertEqual(self.huan_ciat.ca_ciat_gu("烏紅")[0]["台語音標"], "ong1")
+
+    def test_ciat_gu_not_in_kong_un(self):
+        # 徒（濁）＋ 動（上聲）：濁上（第 6 調）等同第 2 調
+        (result,) = self.huan_ciat.ca_ciat_gu("徒動")
+        self.assertEqual(result["廣韻調名"], "濁上")
+        self.assertEqual(result["台語音標"], "tong2")
+        self.assertEqual(result["漢字"], [])
+        self.assertEqual(self.huan_ciat.ca_ciat_gu("德無"), [])
+
+    def test_matches_sql_query_and_batch(self):
+        self.assertEqual(self.huan_ciat.huan_ciat_ca_piau_im("德", "紅"), huan_ciat_ca_piau_im(self.cursor, "德", "紅"))
+        results = self.huan_ciat.ca_ciat_gu_batch(["德紅", "徒紅", "德紅"])
+        self.assertEqual(list(results), ["德紅", "徒紅"])
+        self.assertEqual(results["徒紅"][0]["台語音標"], "tong5")
+        self.assertIs(get_huan_ciat(self.db_path), get_huan_ciat(self.db_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
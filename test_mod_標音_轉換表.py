@@ -0,0 +1,70 @@
+import importlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+TNG_HUAN_PIAU = "標音轉換表"
+
+
+class TestTngHuanPiau(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 其它測試模組於收集階段，會以假模組取代 mod_標音；故於執行時才載入
+        cls.piau_im_mod = importlib.import_module("mod_標音")
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.db_name = os.path.join(cls.tmp_dir, "Ho_Lok_Ue.db")
+        shutil.copy("Ho_Lok_Ue.db", cls.db_name)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def new_piau_im(self):
+        piau_im = self.piau_im_mod.PiauIm("河洛話")
+        piau_im.db_name = self.db_name
+        return piau_im
+
+    def test_table_matches_conversion_functions(self):
+        piau_im = self.new_piau_im()
+        total = self.piau_im_mod.save_tng_huan_piau(piau_im)
+        with sqlite3.connect(self.db_name) as conn:
+            self.assertEqual(conn.execute(f"SELECT COUNT(*) FROM {TNG_HUAN_PIAU}").fetchone()[0], total)
+
+        expected = self.piau_im_mod.build_tng_huan_piau(piau_im)
+        fresh = self.new_piau_im()
+        for (piau_im_huat, siann_bu, un_bu, tiau_ho), han_ji_piau_im in expected.items():
+            self.assertEqual(fresh.han_ji_piau_im_tng_huan(piau_im_huat, siann_bu, un_bu, tiau_ho), han_ji_piau_im)
+        # 每個標音方法只載入一次轉換表
+        self.assertEqual(set(fresh._tng_huan_piau), set(self.piau_im_mod.PIAU_IM_HUAT_LIST))
+
+    def test_unknown_syllable_falls_back(self):
+        piau_im = self.new_piau_im()
+        direct = piau_im.han_ji_piau_im_tng_huan_bo_tng_huan_piau("方音符號", "Ø", "a", 1)
+        self.assertEqual(piau_im.han_ji_piau_im_tng_huan("方音符號", "Ø", "a", 1), direct)
+        self.assertEqual(piau_im._tng_huan_piau["方音符號"][("Ø", "a", 1)], direct)
+        with self.assertRaises(KeyError):
+            piau_im.han_ji_piau_im_tng_huan("台語音標", "q", "a", "1")
+
+    def test_stale_table_is_ignored(self):
+        piau_im = self.new_piau_im()
+        self.piau_im_mod.save_tng_huan_piau(piau_im)
+        with sqlite3.connect(self.db_name) as conn:
+            conn.execute(f"UPDATE {TNG_HUAN_PIAU} SET 漢字標音 = 'X' WHERE 標音方法 = '台羅拼音'")
+        self.assertEqual(piau_im.han_ji_piau_im_tng_huan("台羅拼音", "k", "a", "1"), "X")
+
+        stale = self.new_piau_im()
+        stale.Un_Bu_Dict = dict(stale.Un_Bu_Dict)
+        stale.Un_Bu_Dict.pop(next(iter(stale.Un_Bu_Dict)))
+        self.assertEqual(stale.han_ji_piau_im_tng_huan("台羅拼音", "k", "a", "1"), "ka")
+
+    def test_all_syllables_enumerated(self):
+        piau_im = self.new_piau_im()
+        syllables = list(self.piau_im_mod.iter_im_ziat(piau_im))
+        self.assertIn(("", "a", "1"), syllables)
+        self.assertEqual(len(syllables), len(set(syllables)))
+
+
+if __name__ == "__main__":
+    unittest.main()
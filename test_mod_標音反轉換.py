@@ -0,0 +1,108 @@
+import importlib
+import unittest
+
+from mod_標音反轉換 import BP, BP_TIAU_HU, HONG_IM, MPS2, PiauImTngTLPA, verify_round_trip
+
+
+def siann_bu_row(方音符號, 閩拼方案):
+    return {"方音符號": 方音符號, "閩拼方案": 閩拼方案}
+
+
+def un_bu_row(方音符號, 閩拼方案, 十五音舒促聲="舒聲"):
+    return {"方音符號": 方音符號, "閩拼方案": 閩拼方案, "十五音舒促聲": 十五音舒促聲}
+
+
+SIANN_BU_DICT = {
+    "ø": siann_bu_row("", ""),
+    "p": siann_bu_row("ㄅ", "b"),
+    "b": siann_bu_row("ㆠ", "bb"),
+    "z": siann_bu_row("ㄗ", "z"),
+    "s": siann_bu_row("ㄙ", "s"),
+    "h": siann_bu_row("ㄏ", "h"),
+    "ng": siann_bu_row("ㄫ", "ggn"),
+}
+
+UN_BU_DICT = {
+    "i": un_bu_row("ㄧ", "i"),
+    "it": un_bu_row("ㄧㆵ", "it", "促聲"),
+    "iann": un_bu_row("ㄧㆩ", "nia"),
+    "iau": un_bu_row("ㄧㄠ", "iao"),
+    "au": un_bu_row("ㄠ", "ao"),
+    "uan": un_bu_row("ㄨㄢ", "uan"),
+    "ann": un_bu_row("ㆩ", "na"),
+    "ee": un_bu_row("ㄝ", "e"),
+    "e": un_bu_row("ㆤ", "e"),
+    "ng": un_bu_row("ㆭ", "ng"),
+    "inn": un_bu_row("ㆪ", "ni"),
+    "innh": un_bu_row("ㆪ", "nih", "促聲"),
+}
+
+
+class TestPiauImTngTLPA(unittest.TestCase):
+    def setUp(self):
+        self.tng_tlpa = PiauImTngTLPA(SIANN_BU_DICT, UN_BU_DICT)
+
+    def test_hong_im(self):
+        self.assertEqual(self.tng_tlpa.kai_sik("ㄐㄧㆩ", HONG_IM), ("z", "iann", "1"))
+        self.assertEqual(self.tng_tlpa.tng_tlpa("ㄒㄧㆵ", HONG_IM), "sit4")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("ㆭˊ", HONG_IM), "ng5")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("ㄫㆩ˫", HONG_IM), "ngann7")
+        # ㄐ 僅用於韻首 ㄧ、ㆪ 之前
+        self.assertIsNone(self.tng_tlpa.tng_tlpa("ㄐㄠ", HONG_IM))
+
+    def test_mps2(self):
+        self.assertEqual(self.tng_tlpa.tng_tlpa("jiann1", MPS2), "ziann1")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("shit4", MPS2), "sit4")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("ng5", MPS2), "ng5")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("e2", MPS2), "e2")
+
+    def test_bp(self):
+        self.assertEqual(self.tng_tlpa.tng_tlpa("znia1", BP), "ziann1")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("yao2", BP), "iau5")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("yi3", BP), "i2")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("wan6", BP), "uan7")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("bna5", BP), "pann3")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("zniā", BP_TIAU_HU), "ziann1")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("sīt", BP_TIAU_HU), "sit4")
+        self.assertIsNone(self.tng_tlpa.tng_tlpa("zzz9", BP))
+
+    def test_tiau_ho_selects_jip_siann_un_bu(self):
+        self.assertEqual(self.tng_tlpa.tng_tlpa("ㆪ˙", HONG_IM), "innh8")
+        self.assertEqual(self.tng_tlpa.tng_tlpa("ㆪˊ", HONG_IM), "inn5")
+
+    def test_sentence_and_list(self):
+        self.assertEqual(self.tng_tlpa.convert("ㄐㄧㆩ ㄏㄠˋ，ㄅㆩ˪", HONG_IM), "ziann1 hau2，pann3")
+        self.assertEqual(self.tng_tlpa.convert(["znia1-yao2", "xyz1"], BP), ["ziann1-iau5", "xyz1"])
+        self.tng_tlpa.convert("ㄏㄠˋ ㄏㄠˋ ㄏㄠˋ", HONG_IM)
+        self.assertGreaterEqual(self.tng_tlpa.cache_info().hits, 2)
+
+    def test_unknown_piau_im_huat(self):
+        with self.assertRaises(ValueError):
+            self.tng_tlpa.convert("ㄏㄠˋ", "十五音")
+
+
+class TestVerifyRoundTrip(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # mod_標音 於執行時才載入（test_a400 於收集測試時替換 mod_標音）
+        cls.piau_im = importlib.import_module("mod_標音").PiauIm("河洛話")
+
+    def test_every_syllable_round_trips_or_is_ambiguous(self):
+        for piau_im_huat, result in verify_round_trip(self.piau_im, (HONG_IM, MPS2, BP)).items():
+            with self.subTest(piau_im_huat=piau_im_huat):
+                self.assertEqual(result["不符"], [])
+                ki_gi = sum(len(tlpa_list) - 1 for _, tlpa_list in result["歧義"])
+                self.assertEqual(result["相符"] + ki_gi, result["音節數"])
+
+    def test_hong_im_tng_tai_gi_im_piau(self):
+        self.assertEqual(self.piau_im.hong_im_tng_tai_gi_im_piau("ㄐ", "ㄧㆩ", "1")["台語音標"], "ziann1")
+        self.assertEqual(self.piau_im.hong_im_tng_tai_gi_im_piau("", "ㄨㄣ", "5")["台語音標"], "un5")
+        # 韻母無效者，仍保留有效之聲母
+        result = self.piau_im.hong_im_tng_tai_gi_im_piau("ㄅ", "ㄨㄨ", "1")
+        self.assertEqual((result["聲母"], result["韻母"]), ("p", ""))
+        result = self.piau_im.hong_im_tng_tai_gi_im_piau("ㄨㄨ", "ㄨㄣ", "5")
+        self.assertEqual((result["聲母"], result["韻母"]), ("", "un"))
+
+
+if __name__ == "__main__":
+    unittest.main()
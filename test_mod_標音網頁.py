@@ -0,0 +1,157 @@
+import importlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+
+class FakePiauIm:
+    """記錄轉換次數之 PiauIm 替身：標音為【標音方法:聲母+韻母+調號】"""
+
+    def __init__(self):
+        self.calls = []
+
+    def han_ji_piau_im_tng_huan(self, piau_im_huat, siann_bu, un_bu, tiau_ho):
+        self.calls.append((piau_im_huat, siann_bu, un_bu, tiau_ho))
+        return f"{piau_im_huat}:{siann_bu}{un_bu}{tiau_ho}"
+
+
+LINES = [
+    [("《", ""), ("春", "cun1"), ("》", ""), ("李", "li2"), ("白", "pik8"), ("：", ""), ("\n", "")],
+    [("春", "cun1"), ("天", "thian1"), ("，", ""), ("", ""), ("春", "cun1"), ("\n", "")],
+    [("花", "hua1"), ("a", ""), ("開", ""), ("φ", "")],
+]
+
+
+class TestRubyRenderer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # mod_標音網頁 於執行時才載入（test_a400 於收集測試時替換 mod_標音）
+        cls.mod = importlib.import_module("mod_標音網頁")
+
+    def setUp(self):
+        self.piau_im = FakePiauIm()
+        self.renderer = self.mod.RubyRenderer(self.piau_im, "DBL", "台語音標", "方音符號")
+
+    def test_each_distinct_im_piau_converted_once(self):
+        html = self.renderer.render_article(LINES, io.StringIO()).getvalue()
+        # 不重複之音標：cun1、li2、pik8、thian1、hua1；雙排標音，每個音標轉換 2 次
+        self.assertEqual(len(self.piau_im.calls), 5 * 2)
+        self.assertEqual(html.count('data-tlpa="cun1"'), 3)
+        self.assertIn("<rt>台語音標:cun1</rt><rtc>方音符號:cun1</rtc>", html)
+
+    def test_article_layout(self):
+        html = self.renderer.render_article(LINES, io.StringIO()).getvalue()
+        title, rest = html.split("<p class='author'>")
+        author, body = rest.split("\t\t\t\t<p>\n")
+        self.assertIn('<span class="title_mark">《</span>', title)
+        self.assertIn("李", author)
+        self.assertNotIn("天", author)
+        self.assertIn("<span>，</span>", body)
+        self.assertIn("<span>　</span>", body)
+        self.assertIn("<span>a</span>", body)
+        self.assertIn("<span>開</span>", body)
+        self.assertEqual(body.count("</p><p>"), 1)
+        self.assertTrue(html.endswith("\t\t\t\t</p>\n\t\t\t</div>"))
+
+    def test_title_without_author_mark(self):
+        lines = [[("《", ""), ("春", "cun1"), ("》", ""), ("李", "li2"), ("\n", "")]]
+        title_cells, author_cells, total_lines = self.mod.split_title_and_author(lines)
+        self.assertEqual([han_ji for han_ji, _ in title_cells], ["《", "春", "》"])
+        self.assertEqual(author_cells, [])
+        self.assertEqual(total_lines, 1)
+        self.assertEqual(self.mod.split_title_and_author(LINES[1:]), ([], [], 0))
+
+    def test_piau_im_position_by_format(self):
+        self.assertEqual(self.mod.RubyRenderer(self.piau_im, "TPS", "台語音標", "方音符號").siong_pinn_huat, None)
+        self.assertEqual(self.mod.RubyRenderer(self.piau_im, "TL", "台羅拼音", "方音符號").zian_pinn_huat, None)
+        renderer = self.mod.RubyRenderer(self.piau_im, "無預設", "台語音標", "方音符號", piau_im_hong_sik="右邊")
+        self.assertEqual(renderer.ruby_tag("春", "cun1")[1:], ("", "方音符號:cun1"))
+
+    def test_read_lines_and_render_page(self):
+        rows = {
+            1: ["cun1", "thian1", None],
+            2: ["春", "天", "φ"],
+            5: ["無", "讀", "取"],
+        }
+        lines = list(self.mod.iter_han_ji_zu_im_lines(rows.get, start_row=2, end_row=6, rows_per_line=4))
+        self.assertEqual(lines, [[("春", "cun1"), ("天", "thian1"), ("φ", "")]])
+
+        out = io.StringIO()
+        self.renderer.total_chars_per_line = 1
+        self.renderer.render_page(lines, out, title="春天", web_page_stem="春天")
+        html = out.getvalue()
+        self.assertTrue(html.startswith("<!DOCTYPE html>"))
+        self.assertIn("./assets/images/king_tian.png", html)
+        self.assertEqual(html.count("</p><p>"), 2)
+        self.assertTrue(html.endswith("</html>"))
+        self.assertNotIn("piau-im-table", html)
+
+    def test_piau_im_table(self):
+        renderer = self.mod.RubyRenderer(self.piau_im, "TPS", None, "方音符號", piau_im_table=("白話字", "方音符號"))
+        html = renderer.render_to_string(LINES, title="春")
+        self.assertIn('<ruby data-tlpa="cun1" data-im="0">', html)
+        self.assertIn('<ruby data-tlpa="hua1" data-im="4">', html)
+        table = json.loads(html.split('id="piau-im-table">')[1].split("</script>")[0])
+        self.assertEqual(table["huat"], ["白話字", "方音符號"])
+        self.assertEqual(table["im"][3], ["白話字:thian1", "方音符號:thian1"])
+        # 方音符號兼為右邊標音及對照表之標音方法，僅轉換一次
+        self.assertEqual(len(self.piau_im.calls), 5 * 2)
+
+
+class TestRenderVariants(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mod = importlib.import_module("mod_標音網頁")
+
+    def make_tasks(self, out_dir):
+        variants = [("台語音標", "方音符號"), ("雅俗通", "方音符號"), ("台語音標", "雅俗通")]
+        return [
+            {
+                "output_path": os.path.join(out_dir, f"{up}+{right}.html"),
+                "renderer": {"han_ji_piau_im_format": "DBL", "siong_pinn_piau_im": up, "zian_pinn_piau_im": right},
+                "page": {"title": "春"},
+            }
+            for up, right in variants
+        ]
+
+    def test_each_piau_im_huat_converted_once(self):
+        piau_im = FakePiauIm()
+        with tempfile.TemporaryDirectory() as out_dir:
+            paths = self.mod.render_variants(piau_im, LINES, self.make_tasks(out_dir))
+            # 5 個不重複之音標 × 3 種標音方法（台語音標、方音符號、雅俗通）
+            self.assertEqual(len(piau_im.calls), 5 * 3)
+            with open(paths[1], encoding="utf-8") as f:
+                self.assertIn("<rt>雅俗通:cun1</rt><rtc>方音符號:cun1</rtc>", f.read())
+
+    def test_parallel_output_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as seq_dir, tempfile.TemporaryDirectory() as par_dir:
+            seq_paths = self.mod.render_variants(FakePiauIm(), LINES, self.make_tasks(seq_dir))
+            par_paths = self.mod.render_variants(FakePiauIm(), LINES, self.make_tasks(par_dir), jobs=2)
+            for seq_path, par_path in zip(seq_paths, par_paths):
+                with open(seq_path, encoding="utf-8") as f1, open(par_path, encoding="utf-8") as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+    def test_build_pages_skips_unchanged(self):
+        from mod_網站建置 import BuildManifest
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            manifest = BuildManifest(os.path.join(out_dir, "manifest.json"), out_dir)
+            tasks = self.make_tasks(out_dir)
+            self.assertEqual(len(self.mod.build_pages(FakePiauIm(), LINES, tasks, manifest)), 3)
+            piau_im = FakePiauIm()
+            self.assertEqual(self.mod.build_pages(piau_im, LINES, tasks, manifest), [])
+            self.assertEqual(piau_im.calls, [])
+
+            tasks[0]["page"]["title"] = "春天"
+            self.assertEqual(
+                self.mod.build_pages(FakePiauIm(), LINES, tasks, manifest, dry_run=True),
+                [(tasks[0]["output_path"], "製作設定變更")],
+            )
+            changed_lines = LINES[:1] + [[("花", "hua1"), ("φ", "")]]
+            self.assertEqual(len(self.mod.build_pages(FakePiauIm(), changed_lines, tasks, manifest)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
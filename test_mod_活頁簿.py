@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from mod_活頁簿 import (
+    BACKEND_OPENPYXL,
+    XlsxBook,
+    open_workbook,
+    parse_address,
+)
+from mod_漢字注音表 import HanJiZuImGrid
+
+
+class TestXlsxBook(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "Tai_Gi_Zu_Im_Bun.xlsx")
+
+        wb = Workbook()
+        env = wb.active
+        env.title = "env"
+        env["C2"] = "河洛話"
+        env["C3"] = 15
+        env["C4"] = "=C3*2"
+        wb.defined_names["漢字庫"] = DefinedName("漢字庫", attr_text="env!$C$2")
+        wb.defined_names["每列總字數"] = DefinedName("每列總字數", attr_text="env!$C$3")
+        sheet = wb.create_sheet("漢字注音")
+        sheet["D5"] = "天"
+        sheet["E5"] = "地"
+        sheet["D6"] = "ㄊㄧㄢ"
+        wb.save(self.file_path)
+
+        self.book = open_workbook(self.file_path, backend=BACKEND_OPENPYXL)
+
+    def tearDown(self):
+        self.book.close()
+        self.tmp_dir.cleanup()
+
+    def test_named_range_read_and_write(self):
+        self.assertIn("漢字庫", self.book.names)
+        self.assertEqual(self.book.names["漢字庫"].refers_to_range.value, "河洛話")
+        self.assertEqual(int(self.book.names["每列總字數"].refers_to_range.value), 15)
+
+        self.book.names["漢字庫"].refers_to_range.value = "廣韻"
+        self.assertEqual(self.book.sheets["env"].range("C2").value, "廣韻")
+
+    def test_range_value_shapes(self):
+        sheet = self.book.sheets["漢字注音"]
+        self.assertEqual(sheet.range((5, 4)).value, "天")
+        self.assertEqual(sheet.range("D5:E5").value, ["天", "地"])
+        self.assertEqual(sheet.range("D5:D6").value, ["天", "ㄊㄧㄢ"])
+        self.assertEqual(sheet.range((5, 4), (6, 5)).value, [["天", "地"], ["ㄊㄧㄢ", None]])
+        self.assertEqual(sheet.range("D5").options(ndim=2).value, [["天"]])
+        self.assertEqual(sheet.range((5, 4)).offset(1, 0).value, "ㄊㄧㄢ")
+
+    def test_range_value_write(self):
+        sheet = self.book.sheets["漢字注音"]
+        sheet.range("A1").value = ["漢字", "台語音標"]
+        sheet.range("A2").value = [["天", "thian1"], ["地", "te7"]]
+        self.assertEqual(sheet.range("A1:B3").value, [["漢字", "台語音標"], ["天", "thian1"], ["地", "te7"]])
+        self.assertEqual(sheet.range("A" + str(sheet.cells.last_cell.row)).end("up").row, 3)
+        self.assertEqual(sheet.range("A1").expand("table").address, "$A$1:$B$3")
+
+    def test_formula_cell_returns_cached_value(self):
+        # openpyxl 所建檔案無快取計算結果：與 Excel 未重算之檔案相同，傳回 None
+        self.assertIsNone(self.book.sheets["env"].range("C4").value)
+
+    def test_color_and_font(self):
+        cell = self.book.sheets["漢字注音"].range("D5")
+        self.assertIsNone(cell.color)
+        cell.color = (255, 0, 0)
+        cell.font.color = (0, 0, 255)
+        self.assertEqual(cell.color, (255, 0, 0))
+        self.assertEqual(cell.font.color, (0, 0, 255))
+        cell.color = None
+        self.assertIsNone(cell.color)
+
+    def test_sheets_add_and_save_as(self):
+        self.book.sheets.add("標音字庫")
+        self.assertIn("標音字庫", [sheet.name for sheet in self.book.sheets])
+
+        new_path = os.path.join(self.tmp_dir.name, "output", "new.xlsx")
+        self.book.save(new_path)
+        self.assertEqual(self.book.fullname, os.path.realpath(new_path))
+
+        reopened = XlsxBook(new_path)
+        self.assertEqual(reopened.sheets("漢字注音").range("D5").value, "天")
+        self.assertIn("標音字庫", reopened.sheets)
+        reopened.close()
+
+    def test_sheet_copy(self):
+        self.book.sheets.add("標音字庫", after="漢字注音")
+        source = self.book.sheets["漢字注音"]
+        source.range("D5").color = (255, 255, 0)
+
+        new_sheet = source.copy(name="漢字注音【十五音】", after=source)
+        self.assertEqual([sheet.name for sheet in self.book.sheets], ["env", "漢字注音", "漢字注音【十五音】", "標音字庫"])
+        self.assertEqual(new_sheet.range("D5:E5").value, ["天", "地"])
+        self.assertEqual(new_sheet.range("D5").color, (255, 255, 0))
+        new_sheet.range("D5").value = "日"
+        self.assertEqual(source.range("D5").value, "天")
+
+        self.assertEqual(source.copy(name="第一", before="env").index, 1)
+        self.assertEqual(source.copy().index, len(self.book.sheets))
+        with self.assertRaises(ValueError):
+            source.copy(name="env")
+
+    def test_han_ji_zu_im_grid_over_xlsx_sheet(self):
+        sheet = self.book.sheets["漢字注音"]
+        grid = HanJiZuImGrid(sheet, start_row=3, end_row=6, start_col=4, end_col=5).load()
+        self.assertEqual(grid.cell(5, 4).offset(1, 0).value, "ㄊㄧㄢ")
+        grid.cell(5, 5).offset(-1, 0).value = "te7"
+        self.assertEqual(grid.flush(), 1)
+        self.assertEqual(sheet.range("E4").value, "te7")
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("$C$3"), (3, 3, 3, 3))
+        self.assertEqual(parse_address("A2:D10"), (2, 1, 10, 4))
+        with self.assertRaises(ValueError):
+            parse_address("漢字")
+
+
+if __name__ == "__main__":
+    unittest.main()
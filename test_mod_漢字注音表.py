@@ -0,0 +1,113 @@
+import unittest
+
+from mod_漢字注音表 import HanJiZuImGrid
+
+
+class FakeRange:
+    def __init__(self, sheet, first, last=None):
+        self.sheet = sheet
+        self.first = first
+        self.last = last or first
+
+    def options(self, ndim=None):
+        return self
+
+    @property
+    def value(self):
+        self.sheet.reads += 1
+        (r1, c1), (r2, c2) = self.first, self.last
+        block = [[self.sheet.cells.get((r, c)) for c in range(c1, c2 + 1)] for r in range(r1, r2 + 1)]
+        if self.first == self.last:
+            return block[0][0]
+        return block
+
+    @value.setter
+    def value(self, data):
+        self.sheet.writes.append((self.first, self.last, data))
+        (r1, c1), (r2, c2) = self.first, self.last
+        if self.first == self.last:
+            self.sheet.cells[(r1, c1)] = data[0][0] if isinstance(data, list) else data
+            return
+        for i, r in enumerate(range(r1, r2 + 1)):
+            for j, c in enumerate(range(c1, c2 + 1)):
+                self.sheet.cells[(r, c)] = data[i][j]
+
+    @property
+    def color(self):
+        return None
+
+    @color.setter
+    def color(self, value):
+        self.sheet.styles.append((self.first, value))
+
+
+class FakeSheet:
+    def __init__(self, cells, name="漢字注音"):
+        self.name = name
+        self.cells = dict(cells)
+        self.reads = 0
+        self.writes = []
+        self.styles = []
+
+    def range(self, first, last=None):
+        return FakeRange(self, first, last)
+
+
+class TestHanJiZuImGrid(unittest.TestCase):
+    def setUp(self):
+        # 第 1 行：人工標音(3)、台語音標(4)、漢字(5)、漢字標音(6)
+        self.sheet = FakeSheet(
+            {
+                (3, 5): "=",
+                (5, 4): "天",
+                (5, 5): "地",
+                (5, 6): "φ",
+            }
+        )
+        self.grid = HanJiZuImGrid(self.sheet, start_row=3, end_row=10, start_col=4, end_col=6).load()
+
+    def test_load_reads_block_once(self):
+        self.assertEqual(self.sheet.reads, 1)
+        self.assertEqual(self.grid.get_value(5, 4), "天")
+        self.assertEqual(self.grid.cell(5, 5).offset(-2, 0).value, "=")
+        self.assertEqual(len(self.grid.values), 8)
+
+    def test_cell_writes_are_deferred_and_coalesced(self):
+        han_ji_cell = self.grid.cell(5, 4)
+        han_ji_cell.offset(-1, 0).value = "thian1"
+        self.grid.cell(5, 5).offset(-1, 0).value = "te7"
+        han_ji_cell.offset(1, 0).value = "ㄊㄧㄢ"
+        self.assertEqual(self.sheet.writes, [])
+
+        total_writes = self.grid.flush()
+
+        self.assertEqual(total_writes, 2)
+        self.assertEqual(self.sheet.writes[0], ((4, 4), (4, 5), [["thian1", "te7"]]))
+        self.assertEqual(self.sheet.cells[(6, 4)], "ㄊㄧㄢ")
+        self.assertFalse(self.grid.is_dirty)
+
+    def test_unchanged_values_are_not_written(self):
+        self.grid.cell(5, 4).value = "天"
+        self.grid.cell(4, 4).value = ""
+        self.assertEqual(self.grid.flush(), 0)
+
+    def test_cell_styles_are_deferred_and_coalesced(self):
+        for col in (4, 5, 6):
+            self.grid.cell(5, col).offset(-2, 0).color = (255, 255, 204)
+        self.grid.cell(5, 5).color = (255, 0, 0)
+        self.assertEqual(self.sheet.styles, [])
+        self.assertEqual(self.grid.cell(5, 5).color, (255, 0, 0))
+
+        self.assertEqual(self.grid.flush(), 2)
+        self.assertIn(("D3:F3", (255, 255, 204)), self.sheet.styles)
+        self.assertIn(("E5", (255, 0, 0)), self.sheet.styles)
+
+    def test_cells_outside_block_fall_through_to_sheet(self):
+        outside = self.grid.cell(20, 4)
+        self.assertIsInstance(outside, FakeRange)
+        self.grid.set_value(20, 4, "外")
+        self.assertEqual(self.sheet.cells[(20, 4)], "外")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from mod_ca_ji_tian import HanJiTian
+from mod_database import DatabaseManager, connection_manager
+
+DB_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Ho_Lok_Ue.db")
+
+
+class TestUpsertReadings(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # test_a400_title_author 於收集測試時，以假模組取代 mod_程式 所依賴之模組；
+        # 故於執行時才載入真正之 mod_程式
+        cls.mod_程式 = importlib.import_module("mod_程式")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "Ho_Lok_Ue.db")
+        shutil.copyfile(DB_NAME, self.db_path)
+
+        self.db_manager = DatabaseManager()
+        self.db_manager.disconnect()
+        self.db_manager.connect(self.db_path)
+
+        self.cell = self.mod_程式.ExcelCell.__new__(self.mod_程式.ExcelCell)
+        self.cell.program = SimpleNamespace(table_name="漢字庫", ji_tian=HanJiTian(self.db_path))
+        self.cell.db_manager = self.db_manager
+
+    def tearDown(self):
+        self.db_manager.disconnect()
+        connection_manager.close(self.db_path)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _reading(self, han_ji, tl_im_piau):
+        return self.db_manager.fetchall(
+            "SELECT 常用度, 最近揀用時間 FROM 漢字庫 WHERE 漢字 = ? AND 台羅音標 = ?",
+            (han_ji, tl_im_piau),
+        )
+
+    def test_counts_inserted_and_updated(self):
+        han_ji, tl_im_piau = self.db_manager.fetchone("SELECT 漢字, 台羅音標 FROM 漢字庫 LIMIT 1")
+        inserted, updated = self.cell.upsert_readings(
+            [
+                (han_ji, tl_im_piau, 0.9),  # 既有讀音
+                ("𪜶", "ang1", 0.6),  # 新讀音
+                ("𪜶", "ang1", 0.7),  # 同批重複：計為更新
+            ]
+        )
+        self.assertEqual((inserted, updated), (1, 2))
+
+        self.assertEqual(len(self._reading("𪜶", "ang1")), 1)
+        siong_iong_too, ciu_kin_king_iong = self._reading(han_ji, tl_im_piau)[0]
+        self.assertEqual(siong_iong_too, 0.9)
+        self.assertIsNotNone(ciu_kin_king_iong)
+        self.assertEqual(self._reading("𪜶", "ang1")[0][0], 0.7)
+
+    def test_tai_gi_im_piau_is_stored_as_tl(self):
+        self.cell.upsert_readings([("𪜶", "zing5", 0.6)])
+        self.assertEqual(len(self._reading("𪜶", "tsing5")), 1)
+        self.assertEqual(self.cell.upsert_readings([("𪜶", "tsîng", 0.8)]), (0, 1))
+        self.assertEqual(self._reading("𪜶", "tsing5")[0][0], 0.8)
+
+    def test_empty_rows(self):
+        self.assertEqual(self.cell.upsert_readings([]), (0, 0))
+
+    def test_insert_or_update_to_db(self):
+        self.cell.insert_or_update_to_db("漢字庫", "𪜶", "zing5", "白話音", None)
+        self.cell.insert_or_update_to_db("漢字庫", "𪜶", "zing5", "文讀音", None)
+        self.assertEqual(self._reading("𪜶", "tsing5")[0][0], 0.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+from mod_網站建置 import BuildManifest, iter_html_pages, run_post_processor
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+class TestBuildManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.docs_dir = os.path.join(self.tmp.name, "docs")
+        self.manifest_path = os.path.join(self.tmp.name, "manifest.json")
+        self.page_a = os.path.join(self.docs_dir, "《甲》【文讀音】台語音標.html")
+        self.page_b = os.path.join(self.docs_dir, "sub", "《乙》【文讀音】台語音標.html")
+        write(self.page_a, "<body>甲</body>")
+        write(self.page_b, "<body>乙</body>")
+        write(os.path.join(self.docs_dir, "index.html"), "index")
+        write(os.path.join(self.docs_dir, "assets", "x.html"), "asset")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def manifest(self):
+        return BuildManifest(self.manifest_path, self.docs_dir)
+
+    def test_iter_html_pages(self):
+        rel_paths = [rel_path for _, rel_path in iter_html_pages(self.docs_dir)]
+        self.assertEqual(rel_paths, ["《甲》【文讀音】台語音標.html", "sub/《乙》【文讀音】台語音標.html"])
+
+    def test_needs_render(self):
+        settings = {"up": "台語音標"}
+        with self.manifest() as manifest:
+            self.assertEqual(manifest.needs_render(self.page_a, "h1", settings), (True, "新網頁"))
+            manifest.record_render(self.page_a, "a.xlsx", "h1", settings)
+
+        manifest = self.manifest()
+        self.assertEqual(manifest.needs_render(self.page_a, "h1", settings), (False, "未變更"))
+        self.assertEqual(manifest.needs_render(self.page_a, "h1", settings, force=True), (True, "強制重建"))
+        self.assertEqual(manifest.needs_render(self.page_a, "h2", settings), (True, "來源內容變更"))
+        self.assertEqual(manifest.needs_render(self.page_a, "h1", {"up": "雅俗通"}), (True, "製作設定變更"))
+        write(self.page_a, "<body>改</body>")
+        self.assertEqual(manifest.needs_render(self.page_a, "h1", settings), (True, "網頁檔已被修改"))
+
+    def test_post_processor_only_touches_changed_pages(self):
+        def add_mark(html, rel_path):
+            return html.replace("<body>", "<body><!-- mark -->", 1) if "mark" not in html else html
+
+        manifest = self.manifest()
+        self.assertEqual(len(run_post_processor("mark", add_mark, manifest=manifest)), 2)
+        self.assertEqual(run_post_processor("mark", add_mark, manifest=self.manifest()), [])
+
+        write(self.page_b, "<body>乙改</body>")
+        self.assertEqual(run_post_processor("mark", add_mark, manifest=self.manifest(), dry_run=True), [self.page_b])
+        self.assertEqual(run_post_processor("mark", add_mark, manifest=self.manifest()), [self.page_b])
+        with open(self.page_b, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "<body><!-- mark -->乙改</body>")
+
+        # 變更後製步驟之版本者，所有網頁重新套用
+        self.assertEqual(len(run_post_processor("mark", add_mark, version="2", manifest=self.manifest())), 2)
+
+    def test_post_processor_keeps_earlier_steps(self):
+        run_post_processor("one", lambda html, _: html + "1", manifest=self.manifest())
+        run_post_processor("two", lambda html, _: html + "2", manifest=self.manifest())
+        manifest = self.manifest()
+        self.assertEqual(manifest.page(self.page_a)["steps"], {"one": "1", "two": "1"})
+        self.assertFalse(manifest.needs_step(self.page_a, "one"))
+
+    def test_needs_index(self):
+        index_path = os.path.join(self.docs_dir, "index.html")
+        pages = list(iter_html_pages(self.docs_dir))
+        with self.manifest() as manifest:
+            inputs = manifest.page_inputs(pages)
+            self.assertTrue(manifest.needs_index("index.html", index_path, inputs))
+            manifest.record_index("index.html", inputs, index_path)
+
+        manifest = self.manifest()
+        self.assertFalse(manifest.needs_index("index.html", index_path, manifest.page_inputs(pages)))
+        os.utime(self.page_a, (1, 1))
+        self.assertTrue(manifest.needs_index("index.html", index_path, manifest.page_inputs(pages)))
+
+
+if __name__ == "__main__":
+    unittest.main()
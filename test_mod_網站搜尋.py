@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mod_網站建置 import BuildManifest, run_post_processor
+from mod_網站搜尋 import build_postings, build_search_index, extract_page_text
+
+PAGE = """<html><head><title>春天</title></head><body>
+<article class="article_content">
+<p class='title'><span class="title_mark">《</span><ruby data-tlpa="cun1">春<rt>ㄘㄨㄣ</rt><rtc>cun1</rtc></ruby><span class="title_mark">》</span></p>
+<p><ruby data-tlpa="cun1">春<rt>ㄘㄨㄣ</rt></ruby><ruby data-tlpa="Thian1">天<rt>ㄊㄧㄢ</rt></ruby><span>，</span><ruby>花<rt>?</rt></ruby></p>
+</article>
+<script>var x = "不列入";</script>
+</body></html>"""
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.docs_dir = os.path.join(self.tmp.name, "docs")
+        self.cache_path = os.path.join(self.tmp.name, "cache.json")
+        self.page_a = os.path.join(self.docs_dir, "a.html")
+        self.page_b = os.path.join(self.docs_dir, "b.html")
+        write(self.page_a, PAGE)
+        write(self.page_b, PAGE.replace("天", "日"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, **kwargs):
+        manifest = BuildManifest(os.path.join(self.tmp.name, "manifest.json"), self.docs_dir)
+        return build_search_index(manifest, cache_path=self.cache_path, **kwargs)
+
+    def test_extract_page_text(self):
+        page_text = extract_page_text(PAGE)
+        self.assertEqual(page_text["title"], "春天")
+        self.assertEqual(page_text["text"], "《春》春天，花")
+        self.assertEqual(page_text["tlpa"], ["", "cun1", "", "cun1", "Thian1", "", ""])
+
+    def test_build_postings(self):
+        han_ji_shards, tlpa_shards = build_postings([extract_page_text(PAGE)])
+        # 「春」U+6625、「天」U+5929、「花」U+82B1
+        self.assertEqual(sorted(han_ji_shards), ["59", "66", "82"])
+        self.assertEqual(han_ji_shards["66"]["春"], [[0, 1, 3]])
+        self.assertNotIn("，", str(han_ji_shards))
+        self.assertEqual(tlpa_shards["t"], {"thian": [[0, 4]]})
+
+    def test_incremental_build(self):
+        self.assertEqual(len(self.build()), 2)
+        search_dir = os.path.join(self.docs_dir, "search")
+        self.assertEqual([page["path"] for page in read_json(os.path.join(search_dir, "pages.json"))], ["a.html", "b.html"])
+        self.assertEqual(read_json(os.path.join(search_dir, "han_ji", "59.json")), {"天": [[0, 4]]})
+        self.assertEqual(self.build(), [])
+
+        write(self.page_b, PAGE.replace("花", "草"))
+        self.assertEqual(self.build(dry_run=True), [self.page_b])
+        self.assertEqual(self.build(), [self.page_b])
+        self.assertEqual(read_json(os.path.join(search_dir, "han_ji", "59.json")), {"天": [[0, 4], [1, 4]]})
+        # 已無索引鍵之分片刪除
+        self.assertFalse(os.path.exists(os.path.join(search_dir, "han_ji", "65.json")))
+
+        os.remove(self.page_a)
+        self.assertEqual(self.build(), [])
+        self.assertEqual(read_json(os.path.join(search_dir, "tlpa", "c.json")), {"cun": [[0, 1, 3]]})
+
+    def test_rebuild_after_post_processing(self):
+        write(self.page_a, PAGE.replace(' data-tlpa="cun1"', ""))
+        write(self.page_b, PAGE.replace(' data-tlpa="cun1"', ""))
+        self.build()
+        search_dir = os.path.join(self.docs_dir, "search")
+        self.assertFalse(os.path.exists(os.path.join(search_dir, "tlpa", "c.json")))
+
+        # 後製步驟改寫網頁（建置清單保留 search_index 步驟），索引須重新擷取該網頁
+        manifest = BuildManifest(os.path.join(self.tmp.name, "manifest.json"), self.docs_dir)
+        add_tlpa = lambda html, _: html.replace("<ruby>春", '<ruby data-tlpa="cun1">春')
+        run_post_processor("add_tlpa", add_tlpa, manifest=manifest, pages=[(self.page_a, "a.html")])
+        self.assertEqual(self.build(), [self.page_a])
+        self.assertEqual(read_json(os.path.join(search_dir, "tlpa", "c.json")), {"cun": [[0, 1, 3]]})
+        self.assertEqual(self.build(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
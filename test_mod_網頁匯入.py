@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+
+from mod_網頁匯入 import (
+    P_END,
+    ROOT_CLASSES_TITLE_CONTENT,
+    RUBY,
+    SPAN,
+    HanJiZuImLayout,
+    RubyHtmlParser,
+    RubyItem,
+    iter_html_items,
+    parse_html_items,
+)
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta name="TITLE" content="春" />
+    <meta name="上邊標音" content="方音符號" />
+</head>
+<body>
+    <div class='Siang_Pai'>
+        <p class='title'><span class="title_mark">《</span>
+            <ruby data-tlpa="cun1">春<rt>ㄘㄨㄣ</rt><rtc>cun1</rtc></ruby>
+            <span class="title_mark">》</span>
+        </p>
+        <p>
+            <ruby data-tlpa="thinn1">天<rt>ㄊㆪ</rt><rtc>thinn1</rtc></ruby><span>，</span>
+            <script>var s = "<ruby>x</ruby>";</script>
+        </p>
+    </div>
+    <div class="footer"><p>頁尾</p></div>
+</body>
+</html>
+"""
+
+
+class TestRubyHtmlParser(unittest.TestCase):
+    def test_parse_a400_page(self):
+        parser = RubyHtmlParser(paragraphs_only=True)
+        items = parse_html_items(PAGE, parser)
+        self.assertEqual(parser.meta, {"TITLE": "春", "上邊標音": "方音符號"})
+        self.assertEqual(
+            items,
+            [
+                RubyItem(SPAN, "《"),
+                RubyItem(RUBY, "春", "ㄘㄨㄣ", "cun1", "cun1"),
+                RubyItem(SPAN, "》"),
+                RubyItem(P_END),
+                RubyItem(RUBY, "天", "ㄊㆪ", "thinn1", "thinn1"),
+                RubyItem(SPAN, "，"),
+                RubyItem(P_END),
+            ],
+        )
+
+    def test_parse_rb_and_rp(self):
+        html = (
+            '<div class="title-page"><h1><p>《<ruby><rb>前</rb><rp>(</rp><rt>堅五曾</rt><rp>)</rp></ruby>》</p></h1></div>'
+            '<div class="content-box"><!-- <p>註解</p> --><p><ruby>赤<rt>經四出</rt></ruby></p></div>'
+        )
+        items = parse_html_items(html, RubyHtmlParser(ROOT_CLASSES_TITLE_CONTENT))
+        rubies = [(item.text, item.rt) for item in items if item.kind == RUBY]
+        self.assertEqual(rubies, [("前", "堅五曾"), ("赤", "經四出")])
+        self.assertEqual([item.text for item in items if item.kind not in (RUBY, P_END)], ["《", "》"])
+
+    def test_chunked_read_matches_whole_parse(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(PAGE)
+            items = list(iter_html_items(path, RubyHtmlParser(), chunk_size=7))
+        self.assertEqual(items, parse_html_items(PAGE, RubyHtmlParser()))
+
+
+class TestHanJiZuImLayout(unittest.TestCase):
+    def test_layout_and_write(self):
+        items = parse_html_items(PAGE, RubyHtmlParser(paragraphs_only=True))
+        layout = HanJiZuImLayout(chars_per_row=2).extend(items)
+        layout.finish()
+        self.assertEqual(layout.count, 7)
+        # 第 1 行：《春；第 2 行：》=CHAR(10)；第 3 行：天，；第 4 行：=CHAR(10)；第 5 行：φ
+        self.assertEqual([line[1] for line in layout.lines], [["《", "春"], ["》", "=CHAR(10)"], ["天", "，"], ["=CHAR(10)", None], ["φ", None]])
+        self.assertEqual(layout.lines[0][0], [None, "cun1"])
+
+        from mod_活頁簿 import XlsxBook
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, "import.xlsx")
+            wb = Workbook()
+            wb.active.title = "漢字注音"
+            wb.active["E3"] = "人工"  # 人工標音列保留
+            wb.active["D9"] = "舊"  # 舊文章之漢字覆寫
+            wb.save(file_path)
+
+            book = XlsxBook(file_path)
+            sheet = book.sheets["漢字注音"]
+            layout.write(sheet)
+            self.assertEqual(sheet.range("E3").value, "人工")
+            self.assertEqual(sheet.range("E4").value, "cun1")
+            self.assertEqual(sheet.range("E5").value, "春")
+            self.assertEqual(sheet.range("E6").value, "cun1")
+            self.assertEqual(sheet.range("D9").value, "》")
+            self.assertEqual(sheet.range("D21").value, "φ")
+            book.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
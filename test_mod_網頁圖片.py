@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import unittest
+
+import mod_網頁圖片 as mod
+
+
+class TestPictureHtml(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.image_dir = self.tmp.name
+        variants = {
+            "webp": [[480, "responsive/春 天.abcd1234.480w.webp"], [800, "responsive/春 天.abcd1234.800w.webp"]],
+            "jpeg": [[480, "responsive/春 天.abcd1234.480w.jpg"], [800, "responsive/春 天.abcd1234.800w.jpg"]],
+        }
+        images = {"春 天.png": {"hash": "abcd1234", "width": 1600, "height": 900, "variants": variants}}
+        os.makedirs(os.path.join(self.image_dir, mod.RESPONSIVE_DIR))
+        with open(os.path.join(self.image_dir, mod.RESPONSIVE_DIR, mod.IMAGE_MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump({"version": mod.IMAGE_MANIFEST_VERSION, "images": images}, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_derivative_widths(self):
+        self.assertEqual(mod.derivative_widths(2000), [480, 800, 1200])
+        self.assertEqual(mod.derivative_widths(1000), [480, 800, 1000])
+        self.assertEqual(mod.derivative_widths(300), [300])
+
+    def test_picture_html(self):
+        html = mod.picture_html("春 天.png", self.image_dir, alt='《春》"天"')
+        self.assertTrue(html.startswith('<picture><source type="image/webp" srcset="./assets/images/responsive/'))
+        self.assertIn("%E6%98%A5%20%E5%A4%A9.abcd1234.480w.webp 480w, ", html)
+        self.assertIn('width="800" height="450" loading="lazy"', html)
+        self.assertIn('src="./assets/images/responsive/%E6%98%A5%20%E5%A4%A9.abcd1234.800w.jpg"', html)
+        self.assertIn('alt="《春》&quot;天&quot;"', html)
+        self.assertIsNone(mod.picture_html("無.png", self.image_dir))
+
+    def test_header_image_html_without_derivatives(self):
+        self.assertIsNone(mod.header_image_html("https://example.com/a.png", image_dir=self.image_dir))
+        self.assertIsNone(mod.header_image_html(None, image_dir=self.image_dir))
+        self.assertIsNotNone(mod.header_image_html("春 天.png", image_dir=self.image_dir, generate=False))
+
+    @unittest.skipUnless(mod.HAS_PILLOW, "未安裝 Pillow 套件")
+    def test_build_responsive_images(self):
+        from PIL import Image
+
+        Image.new("RGBA", (1000, 500), (255, 0, 0, 128)).save(os.path.join(self.image_dir, "a.png"))
+        self.assertEqual(mod.build_responsive_images(self.image_dir), ["a.png"])
+        entry = mod.load_image_manifest(self.image_dir)["a.png"]
+        self.assertEqual([w for w, _ in entry["variants"]["webp"]], [480, 800, 1000])
+        self.assertNotIn("春 天.png", mod.load_image_manifest(self.image_dir))
+        self.assertEqual(mod.build_responsive_images(self.image_dir), [])
+
+        Image.new("RGB", (600, 300)).save(os.path.join(self.image_dir, "a.png"))
+        self.assertEqual(mod.build_responsive_images(self.image_dir), ["a.png"])
+        files = os.listdir(os.path.join(self.image_dir, mod.RESPONSIVE_DIR))
+        self.assertEqual(len(files), 1 + 2 * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
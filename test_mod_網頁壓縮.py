@@ -0,0 +1,72 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from mod_網頁壓縮 import compact_html, refresh_precompressed, write_html
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        span { font-size: 24pt; }
+    </style>
+</head>
+<body>
+    <div class="Siang_Pai">
+        <p>
+                    <ruby data-tlpa="cun1">
+                        <rb>春</rb><rt>ㄘㄨㄣ</rt>
+                    </ruby>
+                    <span>，</span>
+                    <span>「</span>
+                    <span class="title_mark">《</span><span>天</span>
+        </p>
+    </div>
+    <script>
+        var s = "a  <b>";
+    </script>
+</body>
+</html>
+"""
+
+
+class TestCompactHtml(unittest.TestCase):
+    def test_compact_html(self):
+        html = compact_html(PAGE)
+        self.assertNotIn("\n        <p>", html)
+        # 行內標籤間之換行會顯示成空格：保留一個空格，併入合併之 <span>
+        self.assertIn('<ruby data-tlpa="cun1"><rb>春</rb><rt>ㄘㄨㄣ</rt></ruby><span>， 「</span>', html)
+        # 有屬性之 <span> 不合併
+        self.assertIn('<span>， 「</span> <span class="title_mark">《</span><span>天</span></p>', html)
+        # <style>、<script> 之內容不更動
+        self.assertIn("<style>\n        span { font-size: 24pt; }\n    </style>", html)
+        self.assertIn('var s = "a  <b>";', html)
+        self.assertEqual(compact_html(html), html)
+
+    def test_inline_whitespace_is_kept(self):
+        html = '<p class="title">\n    <b>春</b>  <i>天</i>\n    <span>作者</span>\n    <a href="index.html">首頁</a>\n</p>'
+        self.assertEqual(compact_html(html), '<p class="title"><b>春</b> <i>天</i> <span>作者</span> <a href="index.html">首頁</a></p>')
+
+    def test_write_html(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "《春》.html")
+            report = write_html(path, PAGE, compact=True, precompress=True)
+            with open(path, "rb") as f:
+                data = f.read()
+            self.assertEqual(report["output"], len(data))
+            self.assertLess(report["output"], report["original"])
+            with open(path + ".gz", "rb") as f:
+                self.assertEqual(gzip.decompress(f.read()), data)
+
+            # 網頁經改寫者，重新製作預先壓縮檔
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("<p>改</p>")
+            self.assertTrue(refresh_precompressed(path))
+            with open(path + ".gz", "rb") as f:
+                self.assertEqual(gzip.decompress(f.read()).decode("utf-8"), "<p>改</p>")
+            self.assertFalse(refresh_precompressed(os.path.join(tmp, "other.html")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+
+from mod_網站建置 import BuildManifest
+from mod_網頁後製 import (
+    PostProcessPipeline,
+    add_article_nav,
+    default_pipeline,
+    fingerprint_assets,
+    make_asset_fingerprint_pass,
+)
+
+PAGE = """<html>
+<head>
+    <link rel="stylesheet" href="./assets/styles/styles.css?v=9">
+    <script type="text/javascript" src="./assets/javascripts/phonetic_switcher.js"></script>
+</head>
+<body>
+    <ruby data-tlpa="cun1">春<rt>cun1</rt></ruby>
+    <a href="index.html" class="floating-home-btn">🏠</a>
+</body>
+</html>"""
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestPostProcess(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.docs_dir = os.path.join(self.tmp.name, "docs")
+        self.css = os.path.join(self.docs_dir, "assets", "styles", "styles.css")
+        self.page = os.path.join(self.docs_dir, "a.html")
+        self.sub_page = os.path.join(self.docs_dir, "sub", "b.html")
+        write(self.css, "body {}")
+        write(os.path.join(self.docs_dir, "assets", "javascripts", "phonetic_switcher.js"), "//")
+        write(self.page, PAGE)
+        write(self.sub_page, PAGE.replace("./assets", "../assets"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def manifest(self):
+        return BuildManifest(os.path.join(self.tmp.name, "manifest.json"), self.docs_dir)
+
+    def test_fingerprint_assets(self):
+        asset_map = fingerprint_assets(self.docs_dir)
+        fingerprinted = asset_map["styles/styles.css"]
+        self.assertRegex(fingerprinted, r"^styles/styles\.[0-9a-f]{8}\.css$")
+        self.assertTrue(os.path.exists(os.path.join(self.docs_dir, "assets", fingerprinted)))
+        self.assertEqual(fingerprint_assets(self.docs_dir), asset_map)
+
+        html = make_asset_fingerprint_pass(asset_map)(PAGE, "a.html")
+        self.assertIn(f'href="./assets/{fingerprinted}"', html)
+        self.assertNotIn("?v=9", html)
+        # 已帶指紋之引用，於資源變更後改指向新指紋檔；過時之指紋檔刪除
+        write(self.css, "body { color: red; }")
+        new_map = fingerprint_assets(self.docs_dir)
+        self.assertIn(new_map["styles/styles.css"], make_asset_fingerprint_pass(new_map)(html, "a.html"))
+        self.assertFalse(os.path.exists(os.path.join(self.docs_dir, "assets", fingerprinted)))
+
+    def test_pass_scope(self):
+        pipeline = PostProcessPipeline(self.docs_dir).register(
+            "mark", lambda html, rel_path: html + "<!-- mark -->", ignore_dirs=["sub"]
+        )
+        pipeline.run(self.manifest())
+        self.assertTrue(read(self.page).endswith("<!-- mark -->"))
+        self.assertFalse(read(self.sub_page).endswith("<!-- mark -->"))
+
+    def test_default_pipeline_is_incremental_and_idempotent(self):
+        self.assertEqual(len(default_pipeline(self.docs_dir).run(self.manifest())), 2)
+        html = read(self.sub_page)
+        self.assertIn('<a href="../index.html">回到首頁</a>', html)
+        self.assertNotIn("floating-home-btn", html)
+        self.assertEqual(html.count('<style id="nav-horizontal-fix">'), 1)
+
+        self.assertEqual(default_pipeline(self.docs_dir).run(self.manifest()), [])
+        default_pipeline(self.docs_dir).run(self.manifest(), force=True)
+        self.assertEqual(read(self.sub_page), html)
+        self.assertEqual(add_article_nav(html, "sub/b.html"), html)
+
+        # 資源變更者，所有網頁重新套用
+        write(self.css, "body { color: red; }")
+        self.assertEqual(len(default_pipeline(self.docs_dir).run(self.manifest())), 2)
+
+    def test_single_pass_pipeline(self):
+        pipeline = default_pipeline(self.docs_dir, passes=["nav_inline_style"])
+        self.assertEqual([p.name for p in pipeline.passes], ["nav_inline_style"])
+        self.assertEqual(len(pipeline.run(self.manifest())), 2)
+        html = read(self.page)
+        self.assertIn('<style id="nav-horizontal-fix">', html)
+        # 未製作指紋檔，資源引用及導覽列不變
+        self.assertIn("styles.css?v=9", html)
+        self.assertIn("floating-home-btn", html)
+        self.assertEqual(os.listdir(os.path.dirname(self.css)), ["styles.css"])
+        with self.assertRaises(ValueError):
+            default_pipeline(self.docs_dir, passes=["unknown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
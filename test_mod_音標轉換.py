@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from mod_音標轉換 import (
+    BP,
+    POJ,
+    TIAU_HO,
+    TIAU_HU,
+    TL,
+    TLPA,
+    TLPA_JI_BU,
+    Transliterator,
+    apply_tone,
+    bench_im_piau_tng_huan,
+    convert,
+)
+
+# 舊版 mod_標音 轉換函式之結果：(音標, tng_im_piau(), tng_tiau_ho(), tng_tiau_ho(tng_im_piau()))
+LEGACY_RESULTS = [
+    ("Tsiâu", "Ziâu", "Tsiau5", "Ziau5"),
+    ("tshiūnn", "ciūnn", "tshiunn7", "ciunn7"),
+    ("chhiūⁿ", "ciūnn", "chhiuⁿ7", "ciunn7"),
+    ("hó͘", "hóo", "ho͘2", "hoo2"),
+    ("oa̍h", "ua̍h", "oah8", "uah8"),
+    ("kheng", "khing", "kheng1", "khing1"),
+    ("ér", "é", "er2", "e2"),
+    ("tsit", "zit", "tsit4", "zit4"),
+    ("Guá", "Guá", "Gua2", "Gua2"),
+    ("ló͘", "lóo", "lo͘2", "loo2"),
+    ("tsuí", "zuí", "tsui2", "zui2"),
+    ("ke̍h", "ke̍h", "keh8", "keh8"),
+]
+
+
+class TestTransliterator(unittest.TestCase):
+    def setUp(self):
+        self.transliterator = Transliterator(maxsize=64)
+
+    def test_tai_lo_and_poj_to_tlpa(self):
+        self.assertEqual(convert("Tsiâu", TL, TLPA), "Ziau5")
+        self.assertEqual(convert("tshiūnn", TL, TLPA), "ciunn7")
+        self.assertEqual(convert("chhiūⁿ", POJ, TLPA), "ciunn7")
+        self.assertEqual(convert("hó͘", POJ, TLPA), "hoo2")
+        self.assertEqual(convert("oa̍h", POJ, TLPA), "uah8")
+        self.assertEqual(convert("tsit", TL, TLPA), "zit4")
+        self.assertEqual(convert("tsit", TL, TLPA, kan_hua=True), "zit")
+        self.assertEqual(convert("Tsiâu", TL, TLPA, po_ci=False), "ziau5")
+
+    def test_bp_to_tlpa(self):
+        self.assertEqual(convert("bbuan2", BP, TLPA), "buan5")
+        self.assertEqual(convert("ggnoo3", BP, TLPA), "ngoo2")
+        self.assertEqual(convert("lniu2", BP, TLPA), "niu5")
+        with self.assertRaises(ValueError):
+            convert("zuan2", BP, TIAU_HU)
+
+    def test_tiau_hu_outputs(self):
+        self.assertEqual(convert("Tsiâu", TIAU_HU, TLPA_JI_BU), "Ziâu")
+        self.assertEqual(convert("Tsiâu", TIAU_HU, TIAU_HO), "Tsiau5")
+        self.assertEqual(convert("ziau5", TLPA, TIAU_HU), "ziâu")
+        self.assertEqual(convert("hng2", TLPA, TIAU_HU), "hńg")
+        self.assertEqual(convert("hńg", TIAU_HU, TLPA), "hng2")
+
+    def test_list_and_sentence_input(self):
+        self.assertEqual(
+            self.transliterator.convert(["Tsiâu", ",", "hó͘", "​"], TIAU_HU, TLPA),
+            ["Ziau5", ",", "hoo2", "​"],
+        )
+        self.assertEqual(self.transliterator.convert("Guá ài lí.", TIAU_HU, TLPA), "Gua2 ai3 li2.")
+        self.assertEqual(self.transliterator.convert("tsa-bóo", TL, TLPA), "za1-boo2")
+
+    def test_cache_reuses_syllables(self):
+        self.transliterator.convert(["guá", "guá", "guá"], TIAU_HU, TLPA)
+        info = self.transliterator.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+    def test_unknown_src_or_dst(self):
+        with self.assertRaises(ValueError):
+            convert("a", "IPA", TLPA)
+        with self.assertRaises(ValueError):
+            convert("a", TLPA, "IPA")
+
+    def test_legacy_fixes(self):
+        # 舊版：onn → ooonn；調號 0 補成 a01；ng 之調符標於聲母
+        self.assertEqual(convert("ōnn", TIAU_HU, TLPA), "oonn7")
+        self.assertEqual(convert("a0", TIAU_HU, TIAU_HO), "a0")
+        self.assertEqual(apply_tone("hng", "́"), "hńg")
+
+    def test_parity_with_legacy(self):
+        for im_piau, ji_bu, tiau_ho, tlpa in LEGACY_RESULTS:
+            with self.subTest(im_piau=im_piau):
+                self.assertEqual(convert(im_piau, TIAU_HU, TLPA_JI_BU), ji_bu)
+                self.assertEqual(convert(im_piau, TIAU_HU, TIAU_HO), tiau_ho)
+                self.assertEqual(convert(im_piau, TIAU_HU, TLPA), tlpa)
+
+    def test_bench(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "bench.db")
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE 漢字庫 (漢字 TEXT, 台羅音標 TEXT)")
+            conn.executemany(
+                "INSERT INTO 漢字庫 VALUES (?, ?)",
+                [("春", "tshun1"), ("天", "thian1"), ("天", "thinn1"), ("日", "jit8"), ("？", "?")],
+            )
+            conn.commit()
+            conn.close()
+            results = bench_im_piau_tng_huan(db_path, repeat=1)
+        self.assertEqual([(name, total, diff) for name, total, *_, diff in results], [("帶調號", 4, 0), ("帶調符", 4, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
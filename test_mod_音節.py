@@ -0,0 +1,68 @@
+import importlib
+import unittest
+
+from mod_音節 import SyllableParser
+
+
+class TestSyllableParser(unittest.TestCase):
+    def setUp(self):
+        self.tng_tiau_hu_calls = []
+
+        def tng_tiau_hu(im_piau):
+            self.tng_tiau_hu_calls.append(im_piau)
+            return {"tsháu": "cau2"}.get(im_piau, im_piau)
+
+        self.parser = SyllableParser(tng_un_bu=lambda un_bu: un_bu.replace("or", "o"), tng_tiau_hu=tng_tiau_hu)
+
+    def test_split_tai_gi_im_piau(self):
+        self.assertEqual(self.parser.split_tai_gi_im_piau("khor3"), ["kh", "o", "3"])
+        self.assertEqual(self.parser.split_tai_gi_im_piau("ng5"), ["", "ng", "5"])
+        self.assertEqual(self.parser.split_tai_gi_im_piau("tsiah"), ["z", "iah", "4"])
+        self.assertEqual(self.parser.split_tai_gi_im_piau("tsháu"), ["c", "au", "2"])
+        self.assertEqual(self.parser.split_tai_gi_im_piau("kha²", po_ci=True), ["Kh", "a", "2"])
+
+    def test_tiau_ho_input_skips_tiau_hu_conversion(self):
+        self.parser.split_tai_gi_im_piau("ka1")
+        self.parser.split_tai_gi_im_piau("ka")
+        self.assertEqual(self.tng_tiau_hu_calls, ["ka"])
+
+    def test_split_tlpa_im_piau(self):
+        self.assertEqual(self.parser.split_tlpa_im_piau("ka7"), "ka7")
+        self.assertEqual(self.parser.split_tlpa_im_piau("chhiu"), ["c", "iu", "1"])
+        self.assertEqual(self.parser.split_tlpa_im_piau("chit", po_ci=True), ["Z", "it", "4"])
+
+    def test_split_tiau_ho(self):
+        self.assertEqual(self.parser.split_tiau_ho(" ka⁷ "), ("ka", "7"))
+        self.assertEqual(self.parser.split_tiau_ho("Ka7"), ["Ka7", None])
+        self.assertEqual(self.parser.split_tiau_ho(""), (None, None))
+
+    def test_results_are_cached_and_not_shared(self):
+        first = self.parser.split_tai_gi_im_piau("ka1")
+        first.append("x")
+        self.assertEqual(self.parser.split_tai_gi_im_piau("ka1"), ["k", "a", "1"])
+        self.assertEqual(self.parser.cache_info()["split_tai_gi_im_piau"].hits, 1)
+
+        self.parser.cache_clear()
+        self.assertEqual(self.parser.cache_info()["split_tai_gi_im_piau"].currsize, 0)
+
+    def test_cache_is_bounded(self):
+        parser = SyllableParser(maxsize=2)
+        for im_piau in ("ka1", "ki1", "ku1"):
+            parser.split_tai_gi_im_piau(im_piau)
+        self.assertEqual(parser.cache_info()["split_tai_gi_im_piau"].currsize, 2)
+
+    def test_mod_piau_im_drop_in(self):
+        # 其它測試模組於收集階段，會以假模組取代 mod_標音；故於執行時才載入
+        mod_piau_im = importlib.import_module("mod_標音")
+        cases = {
+            "Tsháu": ["c", "au", "2"],
+            "chhiú": ["c", "iu", "2"],
+            "kere1": ["k", "ue", "1"],
+            "oa̍h": ["", "uah", "8"],
+        }
+        for im_piau, expected in cases.items():
+            self.assertEqual(mod_piau_im.split_tai_gi_im_piau(im_piau), expected, im_piau)
+
+
+if __name__ == "__main__":
+    unittest.main()